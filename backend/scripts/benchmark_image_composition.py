@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Before/After Compositing Microbenchmark
+
+Times compose_before_after_image (src/lib/imageComposition.py) against the
+previous implementation (fonts loaded per call, full-size decode, RGBA
+overlay round trip) on synthetic images:
+
+- streetview: 640x640 JPEG before, 1024x1024 PNG after (holiday flow)
+- photo: 4032x3024 JPEG before and after (large uploads; draft decode applies)
+
+Usage (from backend/):
+    python scripts/benchmark_image_composition.py [--runs 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageFont
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.lib.imageComposition import compose_before_after_image  # noqa: E402
+
+
+def legacy_compose(before_image_bytes: bytes, after_image_bytes: bytes) -> bytes:
+    """The compositor before font/sprite caching and draft decoding (for comparison)."""
+    before_img = Image.open(BytesIO(before_image_bytes)).convert("RGB")
+    after_img = Image.open(BytesIO(after_image_bytes)).convert("RGB")
+    target_height = 800
+    before_width = int((target_height / before_img.height) * before_img.width)
+    after_width = int((target_height / after_img.height) * after_img.width)
+    before_img = before_img.resize((before_width, target_height), Image.Resampling.LANCZOS)
+    after_img = after_img.resize((after_width, target_height), Image.Resampling.LANCZOS)
+
+    total_width = before_width + after_width
+    canvas = Image.new("RGB", (total_width, target_height), color=(255, 255, 255))
+    canvas.paste(before_img, (0, 0))
+    canvas.paste(after_img, (before_width, 0))
+    canvas = canvas.convert("RGBA")
+    overlay = Image.new("RGBA", canvas.size, (255, 255, 255, 0))
+    draw = ImageDraw.Draw(overlay)
+
+    try:
+        label_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 48)
+        watermark_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 32)
+    except OSError:
+        try:
+            label_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 48)
+            watermark_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 32)
+        except OSError:
+            label_font = watermark_font = ImageFont.load_default()
+
+    for text, x in (("BEFORE", 30), ("AFTER", before_width + 30)):
+        bbox = draw.textbbox((0, 0), text, font=label_font)
+        draw.rectangle([x - 15, 20, x + bbox[2] - bbox[0] + 15, 30 + bbox[3] - bbox[1] + 10], fill=(0, 0, 0, 200))
+        draw.text((x, 30), text, font=label_font, fill=(255, 255, 255, 255))
+
+    text = "yarda.pro - transform your yard in seconds!"
+    bbox = draw.textbbox((0, 0), text, font=watermark_font)
+    width, height = bbox[2] - bbox[0], bbox[3] - bbox[1]
+    x, y = (total_width - width) // 2, target_height - height - 40
+    draw.rectangle([x - 25, y - 12, x + width + 25, y + height + 12], fill=(0, 0, 0, 220))
+    draw.text((x, y), text, font=watermark_font, fill=(255, 255, 255, 255))
+
+    canvas = Image.alpha_composite(canvas, overlay).convert("RGB")
+    output_buffer = BytesIO()
+    canvas.save(output_buffer, format="JPEG", quality=90)
+    return output_buffer.getvalue()
+
+
+def synthetic_image(size, image_format: str) -> bytes:
+    """Noisy gradient image (compresses like a photo, unlike a flat color)."""
+    noise = Image.effect_noise(size, 40)
+    gradient = Image.linear_gradient("L").resize(size)
+    image = Image.merge("RGB", (noise, gradient, noise.point(lambda v: v // 2)))
+    buffer = BytesIO()
+    image.save(buffer, format=image_format, quality=92)
+    return buffer.getvalue()
+
+
+def time_ms(fn, before: bytes, after: bytes, runs: int) -> float:
+    fn(before, after)  # warm-up (font loading, caches)
+    samples = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        fn(before, after)
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    cases = {
+        "streetview": (synthetic_image((640, 640), "JPEG"), synthetic_image((1024, 1024), "PNG")),
+        "photo": (synthetic_image((4032, 3024), "JPEG"), synthetic_image((4032, 3024), "JPEG")),
+    }
+
+    print(f"{'case':<12}{'legacy ms':>12}{'current ms':>12}{'speedup':>10}")
+    for name, (before, after) in cases.items():
+        legacy = time_ms(legacy_compose, before, after, args.runs)
+        current = time_ms(compose_before_after_image, before, after, args.runs)
+        print(f"{name:<12}{legacy:>12.1f}{current:>12.1f}{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Conditional GET helpers (ETag / If-None-Match).
+
+Polled endpoints build their ETag from row versions maintained by triggers
+(migration 026). When the client's If-None-Match still matches, they answer
+304 Not Modified after a one-row version lookup instead of loading and
+serializing the full resource.
+"""
+
+from fastapi import Request, Response, status
+
+# Responses are per user and must be revalidated on every poll
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(kind: str, *versions) -> str:
+    """Strong ETag for a resource kind and its version components."""
+    return '"' + "-".join([kind, *(str(v) for v in versions)]) + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match covers this ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach ETag and revalidation headers to a full response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for an unchanged resource."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
@@ -10,11 +10,12 @@ Endpoints:
 Feature: Credit Systems Consolidation (2025-11-11)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 import structlog
 
 from src.models.user import User
 from src.models.credits import UnifiedBalanceResponse, SimpleBalanceResponse
+from src.api.conditional import etag_matches, make_etag, not_modified, set_etag
 from src.api.dependencies import get_current_user
 from src.services.credit_service import CreditService
 from src.db.connection_pool import db_pool
@@ -39,6 +40,8 @@ def get_credit_service() -> CreditService:
 
 @router.get("/balance", response_model=UnifiedBalanceResponse)
 async def get_unified_balance(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     credit_service: CreditService = Depends(get_credit_service)
 ):
@@ -50,6 +53,8 @@ async def get_unified_balance(
     for better performance and consistency.
 
     **Performance:** Target <100ms response time with optimized LEFT JOIN query.
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified
+    after a one-row balance version lookup.
 
     **Response:**
     ```json
@@ -85,17 +90,29 @@ async def get_unified_balance(
     - Generation eligibility checks
 
     Args:
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (ETag headers)
         current_user: Authenticated user (injected by dependency)
         credit_service: Unified credit service (injected)
 
     Returns:
-        UnifiedBalanceResponse with detailed balances for all credit types
+        UnifiedBalanceResponse with detailed balances for all credit types,
+        or 304 if unchanged
 
     Raises:
         HTTPException 404: User not found in database
         HTTPException 500: Database query error
     """
     try:
+        # Read the version before the balances: if they change in between, the
+        # stale tag just costs the client one more full response
+        balance_version = await credit_service.get_balance_version(current_user.id)
+        if balance_version is not None:
+            etag = make_etag("credits", current_user.id, balance_version)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            set_etag(response, etag)
+
         # Fetch all balances with full details in single query
         detailed_balances = await credit_service.get_all_balances_detailed(current_user.id)
 
@@ -9,6 +9,13 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from src.models.user import User
 from src.api.dependencies import get_current_user
 from src.services.debug_service import get_debug_service
+from src.services.geocode_cache import get_geocode_cache
+from src.services.generation_result_cache import get_generation_result_cache
+from src.services.imagery_cache import get_imagery_cache
+from src.services.image_pool import get_image_pool
+from src.services.generation_events import get_generation_events
+from src.services.maps_service import MapsService
+from src.services.gemini_client import GeminiClient, get_gemini_client
 
 router = APIRouter(prefix="/debug", tags=["debug"])
 
@@ -85,3 +92,121 @@ async def clear_debug_logs(
         "message": f"Cleared logs for generation {generation_id}",
         "generation_id": generation_id
     }
+
+
+@router.get("/geocode-cache")
+async def get_geocode_cache_stats(user: User = Depends(require_admin)):
+    """
+    Get geocode cache hit/miss counters for this process.
+
+    Args:
+        user: Current authenticated user (must be admin)
+
+    Returns:
+        JSON with memory/database hits, misses and hit rate
+    """
+    return get_geocode_cache().get_stats()
+
+
+@router.get("/result-cache")
+async def get_result_cache_stats(user: User = Depends(require_admin)):
+    """
+    Get generation result cache hit/miss counters for this process.
+
+    Args:
+        user: Current authenticated user (must be admin)
+
+    Returns:
+        JSON with memory/database hits, misses, regenerate bypasses and hit rate
+    """
+    return get_generation_result_cache().get_stats()
+
+
+@router.get("/imagery-cache")
+async def get_imagery_cache_stats(user: User = Depends(require_admin)):
+    """
+    Get Street View / satellite disk cache counters for this process.
+
+    Args:
+        user: Current authenticated user (must be admin)
+
+    Returns:
+        JSON with hits, misses, hit rate and store size
+    """
+    return get_imagery_cache().get_stats()
+
+
+@router.get("/single-flight")
+async def get_single_flight_stats(user: User = Depends(require_admin)):
+    """
+    Get request coalescing counters for Google Maps and Gemini calls.
+
+    Args:
+        user: Current authenticated user (must be admin)
+
+    Returns:
+        JSON with calls, coalesced duplicates and in-flight requests per client
+    """
+    return {
+        "maps": MapsService._flights.get_stats(),
+        "gemini": GeminiClient._flights.get_stats()
+    }
+
+
+@router.get("/gemini")
+async def get_gemini_resilience_stats(user: User = Depends(require_admin)):
+    """
+    Get the adaptive concurrency limit and circuit breaker state for Gemini calls.
+
+    Args:
+        user: Current authenticated user (must be admin)
+
+    Returns:
+        JSON with current/min/max limit, in-flight and waiting calls, breaker
+        state, windowed failure rate and rejected call count
+    """
+    return GeminiClient.get_resilience_stats()
+
+
+@router.get("/gemini-keys")
+async def get_gemini_key_stats(user: User = Depends(require_admin)):
+    """
+    Get per-key usage of the Gemini API key pool.
+
+    Args:
+        user: Current authenticated user (must be admin)
+
+    Returns:
+        JSON with each (masked) key's in-flight calls, requests in the last
+        minute, 429 count and remaining cooldown
+    """
+    return get_gemini_client().key_pool.get_stats()
+
+
+@router.get("/generation-events")
+async def get_generation_events_stats(user: User = Depends(require_admin)):
+    """
+    Get LISTEN/NOTIFY progress stream counters.
+
+    Args:
+        user: Current authenticated user (must be admin)
+
+    Returns:
+        JSON with listener state, open SSE subscribers and event counters
+    """
+    return get_generation_events().get_stats()
+
+
+@router.get("/image-pool")
+async def get_image_pool_stats(user: User = Depends(require_admin)):
+    """
+    Get image worker pool counters (before/after compositing).
+
+    Args:
+        user: Current authenticated user (must be admin)
+
+    Returns:
+        JSON with in-flight and waiting jobs, completed/failed counts,
+        average queue wait and worker time, and jobs per second
+    """
+    return get_image_pool().get_stats()
@@ -5,6 +5,7 @@ Endpoints:
 - POST /generations: Create new landscape generation
 - GET /generations: List user's generation history
 - GET /generations/{id}: Get specific generation details
+- GET /generations/{id}/events: Server-Sent Events progress stream
 
 Requirements:
 - FR-034: Unlimited generations for active subscribers
@@ -12,23 +13,34 @@ Requirements:
 - T092: Update generation authorization hierarchy
 """
 
+from datetime import datetime
 from uuid import UUID
 from typing import List, Optional, Dict, Any, Tuple
 import asyncio
+import base64
+import json
 
-from fastapi import APIRouter, HTTPException, Depends, status, UploadFile, File, Form, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, Request, status, UploadFile, File, Form
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from src.models.user import User
+from src.api.conditional import etag_matches, make_etag, not_modified, set_etag
 from src.api.dependencies import get_current_user, require_verified_email
 from src.services.trial_service import get_trial_service, TrialService
-from src.services.token_service import TokenService
+from src.services.token_service import TokenService, get_token_service
 from src.services.subscription_service import SubscriptionService
 from src.services.generation_service import GenerationService
-from src.services.gemini_client import GeminiClient
-from src.services.storage_service import BlobStorageService
+from src.services.gemini_client import GeminiClient, get_gemini_client
+from src.services.storage_service import StorageService, get_storage_service
 from src.services.maps_service import MapsService, MapsServiceError
 from src.services.credit_service import CreditService
+from src.services.generation_job_queue import GenerationJobQueue
+from src.services.generation_events import (
+    GenerationEventBroker,
+    RESYNC_EVENT_TYPE,
+    TERMINAL_STATUSES,
+    get_generation_events
+)
 from src.models.generation import (
     ImageSource,
     CreateGenerationRequest,
@@ -38,10 +50,20 @@ from src.models.generation import (
     AreaStatus
 )
 from src.db.connection_pool import db_pool
+from src.config import settings
 import structlog
 
 logger = structlog.get_logger()
 
+# Shown for a source image while its Street View upload is still pending;
+# clients get the real URL on their next poll / SSE update
+STREET_VIEW_PLACEHOLDER_URL = (
+    'data:image/svg+xml,%3Csvg xmlns="http://www.w3.org/2000/svg" width="600" height="400"%3E'
+    '%3Crect width="600" height="400" fill="%23e5e7eb"/%3E%3Ctext x="50%25" y="50%25" '
+    'dominant-baseline="middle" text-anchor="middle" fill="%236b7280" font-size="16"%3E'
+    'Loading Street View...%3C/text%3E%3C/svg%3E'
+)
+
 router = APIRouter(prefix="/generations", tags=["generations"])
 
 
@@ -214,9 +236,11 @@ async def refund_payment(
 @router.post("/multi", response_model=MultiAreaGenerationResponse, status_code=status.HTTP_201_CREATED)
 async def create_multi_area_generation(
     request: CreateGenerationRequest,
-    background_tasks: BackgroundTasks,
     user: User = Depends(require_verified_email),
-    trial_service: TrialService = Depends(get_trial_service)
+    trial_service: TrialService = Depends(get_trial_service),
+    token_service: TokenService = Depends(get_token_service),
+    gemini_client: GeminiClient = Depends(get_gemini_client),
+    storage_service: StorageService = Depends(get_storage_service)
 ):
     """
     Create multi-area landscape generation request (Feature 004-generation-flow).
@@ -236,7 +260,7 @@ async def create_multi_area_generation(
     4. Retrieve Street View imagery (if available)
     5. Store source image metadata in generation_source_images
     6. Return generation ID with status='pending'
-    7. Background worker processes generation asynchronously
+    7. Enqueue one generation_jobs row per area; the generation worker processes them
 
     **Requirements**:
     - FR-008: Atomic payment deduction BEFORE generation
@@ -249,6 +273,9 @@ async def create_multi_area_generation(
         request: CreateGenerationRequest with address and areas list
         user: Current authenticated user
         trial_service: Trial service for checking trial balance
+        token_service: Shared token service
+        gemini_client: Shared Gemini client
+        storage_service: Shared blob storage service
 
     Returns:
         MultiAreaGenerationResponse with generation ID, status, and area details
@@ -282,11 +309,8 @@ async def create_multi_area_generation(
 
         # Step 2: Initialize services
         print(f"✅ STEP 1: Initializing services...")
-        token_service = TokenService(db_pool)
         subscription_service = SubscriptionService(db_pool)
         credit_service = CreditService(db_pool)
-        gemini_client = GeminiClient()
-        storage_service = BlobStorageService()
 
         generation_service = GenerationService(
             db_pool=db_pool,
@@ -296,11 +320,13 @@ async def create_multi_area_generation(
             token_service=token_service,
             subscription_service=subscription_service
         )
+        job_queue = GenerationJobQueue(db_pool, max_attempts=settings.generation_job_max_attempts)
 
         # Step 2.5: Geocode address to capture geocoding accuracy info for user
         print(f"✅ STEP 2a: Capturing geocoding information...")
         geocoded_address = None
         geocoding_accuracy = None
+        geocode_result = None
         try:
             geocode_result = await generation_service.maps_service.geocode_address(request.address)
             if geocode_result:
@@ -317,14 +343,13 @@ async def create_multi_area_generation(
         success, generation_id, error_message, generation_data = await generation_service.create_generation(
             user_id=user.id,
             address=request.address,
-            areas=areas_data
+            areas=areas_data,
+            geocode_result=geocode_result  # Reuse - don't geocode the same address twice
         )
         print(f"   Result - Success: {success}, Generation ID: {generation_id}")
         print(f"   Error: {error_message}")
         if generation_data:
             print(f"   Generation data keys: {list(generation_data.keys())}")
-            if 'street_view_bytes' in generation_data:
-                print(f"   Street View bytes: {len(generation_data['street_view_bytes'])} bytes")
 
         if not success:
             print(f"❌ STEP 2 FAILED: {error_message}")
@@ -340,175 +365,44 @@ async def create_multi_area_generation(
                 detail=error_message
             )
 
-        # Step 3.5: Start background task to process generation (Gemini API call)
-        # This runs async so we can return immediately with status='pending'
-        async def process_areas_background():
-            """Background task to process all areas for this generation with timeout wrapper"""
-            try:
-                # Wrap entire processing with 5-minute timeout (P0 fix)
-                async with asyncio.timeout(300):
-                    logger.info(
-                        "background_generation_started",
-                        generation_id=str(generation_id),
-                        num_areas=len(generation_data['area_ids'])
-                    )
-
-                    # Get Street View bytes from generation_data
-                    street_view_bytes = generation_data.get('street_view_bytes')
-                    if not street_view_bytes:
-                        logger.error("No street_view_bytes available for processing")
-                        return
-
-                    # Upload Street View image to Vercel Blob storage
-                    try:
-                        street_view_url = await storage_service.upload_image(
-                            image_data=street_view_bytes,
-                            filename=f"streetview_{generation_id}.jpg",
-                            content_type="image/jpeg"
-                        )
-
-                        # Update generation_source_images with actual URL
-                        await db_pool.execute("""
-                            UPDATE generation_source_images
-                            SET image_url = $1
-                            WHERE generation_id = $2 AND image_type = 'street_view'
-                        """, street_view_url, generation_id)
-
-                        logger.info(
-                            "street_view_uploaded",
-                            generation_id=str(generation_id),
-                            url=street_view_url
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "street_view_upload_failed",
-                            generation_id=str(generation_id),
-                            error=str(e)
-                        )
-                        # Continue processing even if Street View upload fails
-
-                    # Process each area sequentially
-                    for area_id_str in generation_data['area_ids']:
-                        area_id = UUID(area_id_str)
-
-                        # Fetch area details from database
-                        area_record = await db_pool.fetchrow("""
-                            SELECT area_type, style, custom_prompt
-                            FROM generation_areas
-                            WHERE id = $1
-                        """, area_id)
-
-                        if not area_record:
-                            logger.error(f"Area {area_id} not found")
-                            continue
-
-                        # Fetch the appropriate image for this area type
-                        # Front yard uses Street View, backyard/walkway use Satellite
-                        area_type = area_record['area_type']
-
-                        # Get area-specific image from maps service
-                        try:
-                            area_image_bytes, _, _, image_source = await generation_service.maps_service.get_property_images(
-                                address=request.address,
-                                area=area_type
-                            )
-                            logger.info(
-                                "area_image_retrieved",
-                                area_id=str(area_id),
-                                area_type=area_type,
-                                image_source=image_source,
-                                size_bytes=len(area_image_bytes) if area_image_bytes else 0
-                            )
-                        except Exception as e:
-                            logger.error(
-                                "area_image_retrieval_failed",
-                                area_id=str(area_id),
-                                area_type=area_type,
-                                error=str(e)
-                            )
-                            # Fallback to street_view_bytes if area-specific image fails
-                            area_image_bytes = street_view_bytes
-
-                        # Call process_generation for this area with area-specific image
-                        success, error = await generation_service.process_generation(
-                            generation_id=generation_id,
-                            area_id=area_id,
-                            user_id=user.id,
-                            input_image_bytes=area_image_bytes,  # Use area-specific image
-                            address=request.address,
-                            area_type=area_type,
-                            style=area_record['style'],
-                            custom_prompt=area_record['custom_prompt'],
-                            payment_method=generation_data['payment_method'],
-                            preservation_strength=0.5  # Default for now
-                        )
-
-                        if not success:
-                            logger.error(
-                                "area_generation_failed",
-                                area_id=str(area_id),
-                                error=error
-                            )
-                        else:
-                            logger.info(
-                                "area_generation_completed",
-                                area_id=str(area_id)
-                            )
-
-                    logger.info(
-                        "background_generation_completed",
-                        generation_id=str(generation_id)
-                    )
-            except asyncio.TimeoutError:
-                # Handle timeout - mark as failed and refund (P0 fix)
-                logger.error(
-                    "background_generation_timeout",
-                    generation_id=str(generation_id),
-                    message="Generation exceeded 5 minute timeout"
-                )
-                try:
-                    # Mark generation as failed
-                    await generation_service.update_generation_status(
-                        generation_id,
-                        "failed",
-                        error_message="Generation timeout - exceeded 5 minute limit"
-                    )
-                    # Refund user based on payment method
-                    await refund_payment(
-                        user.id,
-                        generation_data['payment_method'],
-                        trial_service,
-                        token_service
-                    )
-                    logger.info(
-                        "generation_timeout_refunded",
-                        generation_id=str(generation_id),
-                        user_id=str(user.id)
-                    )
-                except Exception as refund_error:
-                    logger.error(
-                        "generation_timeout_refund_failed",
-                        generation_id=str(generation_id),
-                        user_id=str(user.id),
-                        error=str(refund_error)
-                    )
-            except Exception as e:
-                logger.error(
-                    "background_generation_error",
-                    generation_id=str(generation_id),
-                    error=str(e),
-                    exc_info=True
-                )
-
-        # Spawn background task using FastAPI's BackgroundTasks
-        logger.info(
-            "about_to_spawn_background_task",
-            generation_id=str(generation_id),
-            has_street_view=bool(generation_data.get('street_view_bytes')),
-            num_areas=len(generation_data['area_ids'])
-        )
-        background_tasks.add_task(process_areas_background)
-        logger.info("background_task_added_to_fastapi_queue")
+        # Step 3.5: Enqueue one durable job per area for the generation worker (src/worker.py)
+        # The worker fetches imagery, calls Gemini and uploads results; we return immediately with status='pending'
+        try:
+            await job_queue.enqueue_generation(
+                generation_id=generation_id,
+                user_id=user.id,
+                area_ids=[UUID(area_id) for area_id in generation_data['area_ids']],
+                payload={
+                    'address': request.address,
+                    'payment_method': generation_data['payment_method'],
+                    'imagery': generation_data['imagery'].to_payload(),
+                    'regenerate': request.regenerate
+                }
+            )
+        except Exception as e:
+            logger.error(
+                "generation_enqueue_failed",
+                generation_id=str(generation_id),
+                error=str(e),
+                exc_info=True
+            )
+            # Nothing will process these areas - fail and refund them together
+            await generation_service.fail_areas(
+                [
+                    {
+                        'generation_id': generation_id,
+                        'area_id': UUID(area_id),
+                        'user_id': user.id,
+                        'payment_method': generation_data['payment_method']
+                    }
+                    for area_id in generation_data['area_ids']
+                ],
+                error_message="Failed to queue generation"
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Failed to queue generation. Your credits have been refunded."
+            )
 
         # Step 4: Fetch created generation_areas for response
         areas_response = []
@@ -597,7 +491,8 @@ async def create_generation(
     custom_prompt: Optional[str] = Form(None),
     image: Optional[UploadFile] = File(None),
     user: User = Depends(require_verified_email),
-    trial_service: TrialService = Depends(get_trial_service)
+    trial_service: TrialService = Depends(get_trial_service),
+    token_service: TokenService = Depends(get_token_service)
 ):
     """
     Create new landscape generation.
@@ -622,6 +517,7 @@ async def create_generation(
         image: Uploaded property image
         user: Current authenticated user
         trial_service: Trial service
+        token_service: Shared token service
 
     Returns:
         Generation object with status='pending'
@@ -631,9 +527,6 @@ async def create_generation(
         HTTPException 400: Invalid input
         HTTPException 500: Generation failed
     """
-    # Initialize token service
-    token_service = TokenService(db_pool)
-
     try:
         # DEBUG: Log generation request start
         print(f"\n{'='*80}")
@@ -860,10 +753,41 @@ async def create_generation(
         )
 
 
+# History sort options: (sort key expression, direction). Each key has a matching
+# (user_id, key, id) index in migration 025 - keep them in sync.
+HISTORY_SORTS = {
+    'newest': ("created_at", "DESC"),
+    'oldest': ("created_at", "ASC"),
+    'name_asc': ("COALESCE(address, '')", "ASC"),
+    'name_desc': ("COALESCE(address, '')", "DESC"),
+}
+
+
+def _encode_history_cursor(sort_value: Any, generation_id: UUID) -> str:
+    """Opaque cursor for the row after which the next page starts."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, str(generation_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_history_cursor(cursor: str, sort: str) -> Tuple[Any, UUID]:
+    """Inverse of _encode_history_cursor (raises ValueError if malformed)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, generation_id = json.loads(raw)
+        if HISTORY_SORTS[sort][0] == "created_at":
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, UUID(generation_id)
+    except (TypeError, KeyError, json.JSONDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
 @router.get("/")
 async def list_generations(
     limit: int = 20,
     page: int = 1,
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     sort: Optional[str] = None,
     user: User = Depends(get_current_user)
@@ -871,24 +795,35 @@ async def list_generations(
     """
     List user's generation history with pagination.
 
+    Uses keyset pagination on (sort key, id): pass ``next_cursor`` from the
+    previous response as ``cursor`` and every page costs the same, however
+    deep. ``page`` (OFFSET) is still accepted for older clients when no
+    cursor is given. Totals come from the trigger-maintained
+    generation_counts table and retention fields are computed in SQL.
+
     Requirements:
     - FR-041: View generation history
     - Feature 008: Proper history implementation with pagination
 
     Args:
         limit: Maximum number of generations to return (default: 20, max: 50)
-        page: Page number for pagination (1-indexed, default: 1)
+        page: Page number for OFFSET pagination (1-indexed, ignored with cursor)
+        cursor: Opaque cursor from a previous response's next_cursor
         status: Optional status filter (pending, processing, completed, failed)
-        sort: Optional sort field (default: created_at DESC)
+        sort: Optional sort (newest, oldest, name_asc, name_desc; default: newest)
         user: Current authenticated user
 
     Returns:
-        Paginated list of generations with metadata
+        Paginated list of generations with metadata and next_cursor
     """
     # Validate and normalize parameters
-    limit = min(int(limit), 50)  # Max 50 per page
+    limit = max(min(int(limit), 50), 1)  # Max 50 per page
     page = max(int(page), 1)  # Minimum page 1
-    offset = (page - 1) * limit
+    if sort in ('created_at:asc', 'oldest'):
+        sort = 'oldest'
+    elif sort not in HISTORY_SORTS:
+        sort = 'newest'
+    sort_key, direction = HISTORY_SORTS[sort]
 
     # Build query filters - include is_deleted check to exclude deleted generations
     where_clause = "WHERE user_id = $1 AND is_deleted = FALSE"
@@ -898,25 +833,36 @@ async def list_generations(
         where_clause += f" AND status = ${len(params) + 1}"
         params.append(status)
 
-    # Build sort clause (default: created_at DESC)
-    sort_clause = "created_at DESC"
-    if sort in ['oldest', 'name_asc', 'name_desc']:
-        if sort == 'oldest':
-            sort_clause = "created_at ASC"
-        elif sort == 'name_asc':
-            sort_clause = "address ASC"
-        elif sort == 'name_desc':
-            sort_clause = "address DESC"
-
-    # Get total count
+    # Total from the counter table (one indexed row per status, not COUNT(*))
+    count_params: list = [user.id]
+    count_filter = ""
+    if status:
+        count_filter = " AND status = $2"
+        count_params.append(status)
+
+    offset = 0
+    if cursor:
+        try:
+            cursor_value, cursor_id = _decode_history_cursor(cursor, sort)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,  # `status` is the query parameter here
+                detail="Invalid cursor"
+            )
+        comparison = "<" if direction == "DESC" else ">"
+        where_clause += f" AND ({sort_key}, id) {comparison} (${len(params) + 1}, ${len(params) + 2})"
+        params.extend([cursor_value, cursor_id])
+    else:
+        offset = (page - 1) * limit
+
     total_result = await db_pool.fetchval(f"""
-        SELECT COUNT(*)
-        FROM generations
-        {where_clause}
-    """, *params)
+        SELECT COALESCE(SUM(count), 0)
+        FROM generation_counts
+        WHERE user_id = $1{count_filter}
+    """, *count_params)
     total = total_result or 0
 
-    # Get paginated results with retention info
+    # Fetch one extra row to know whether another page exists
     generations = await db_pool.fetch(f"""
         SELECT
             id,
@@ -930,62 +876,66 @@ async def list_generations(
             created_at,
             completed_at,
             expires_at,
-            is_deleted
+            is_deleted,
+            {sort_key} AS sort_value,
+            retention.retention_days,
+            CASE
+                WHEN payment_type = 'subscription' THEN 'Saved permanently (Subscription)'
+                WHEN payment_type = 'trial' THEN 'Not saved (Trial)'
+                WHEN payment_type = 'token' AND expires_at IS NOT NULL THEN
+                    CASE
+                        WHEN retention.retention_days > 1
+                            THEN 'Saved for ' || retention.retention_days || ' more days'
+                        WHEN retention.retention_days = 1 THEN 'Expires tomorrow'
+                        ELSE 'Expires today'
+                    END
+                ELSE 'Saved for 7 days'
+            END AS retention_message
         FROM generations
+        CROSS JOIN LATERAL (
+            SELECT CASE
+                WHEN payment_type = 'subscription' THEN NULL
+                WHEN payment_type = 'trial' THEN 0
+                WHEN payment_type = 'token' AND expires_at IS NOT NULL THEN GREATEST(
+                    FLOOR(EXTRACT(EPOCH FROM (expires_at - NOW())) / 86400)::int,
+                    0
+                )
+                ELSE 7
+            END AS retention_days
+        ) AS retention
         {where_clause}
-        ORDER BY {sort_clause}
+        ORDER BY {sort_key} {direction}, id {direction}
         LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
-    """, *params, limit, offset)
+    """, *params, limit + 1, offset)
+
+    has_more = len(generations) > limit
+    generations = generations[:limit]
 
-    # Process results and add retention info
-    from datetime import datetime, timezone
     processed_data = []
     for g in generations:
         gen_dict = dict(g)
-
-        # Calculate retention information
-        payment_type = gen_dict.get("payment_type")
-        expires_at = gen_dict.get("expires_at")
-
-        if payment_type == "subscription":
-            gen_dict["retention_message"] = "Saved permanently (Subscription)"
-            gen_dict["retention_days"] = None
-        elif payment_type == "trial":
-            gen_dict["retention_message"] = "Not saved (Trial)"
-            gen_dict["retention_days"] = 0
-        elif payment_type == "token":
-            if expires_at:
-                days_remaining = (expires_at - datetime.now(timezone.utc)).days
-                if days_remaining > 1:
-                    gen_dict["retention_message"] = f"Saved for {days_remaining} more days"
-                    gen_dict["retention_days"] = days_remaining
-                elif days_remaining == 1:
-                    gen_dict["retention_message"] = "Expires tomorrow"
-                    gen_dict["retention_days"] = 1
-                else:
-                    gen_dict["retention_message"] = "Expires today"
-                    gen_dict["retention_days"] = 0
-            else:
-                gen_dict["retention_message"] = "Saved for 7 days"
-                gen_dict["retention_days"] = 7
-        else:
-            gen_dict["retention_message"] = "Saved for 7 days"
-            gen_dict["retention_days"] = 7
-
+        gen_dict.pop("sort_value")
         processed_data.append(gen_dict)
 
+    next_cursor = None
+    if has_more and generations:
+        last = generations[-1]
+        next_cursor = _encode_history_cursor(last["sort_value"], last["id"])
+
     return {
         "data": processed_data,
         "total": total,
         "page": page,
         "limit": limit,
-        "has_more": offset + len(generations) < total
+        "has_more": has_more,
+        "next_cursor": next_cursor
     }
 
 
 @router.get("/{generation_id}", response_model=MultiAreaGenerationResponse)
 async def get_generation(
     generation_id: UUID,
+    request: Request,
     user: User = Depends(get_current_user)
 ):
     """
@@ -998,6 +948,8 @@ async def get_generation(
     - Frontend polls every 2 seconds while status is 'pending' or 'processing'
     - Stops polling when status is 'completed', 'partial_failed', or 'failed'
     - Progress persists in localStorage via Zustand store
+    - Responses carry an ETag; a poll with a matching If-None-Match gets
+      304 Not Modified after a version lookup (no payload is built)
 
     **Status Values**:
     - pending: Payment deducted, generation queued
@@ -1013,158 +965,296 @@ async def get_generation(
 
     Args:
         generation_id: Generation UUID
+        request: Incoming request (for If-None-Match)
         user: Current authenticated user
 
     Returns:
-        MultiAreaGenerationResponse with generation status and area details
+        MultiAreaGenerationResponse JSON (built by Postgres in one query) with
+        generation status and area details, or 304 if unchanged
 
     Raises:
         HTTPException 404: Generation not found
         HTTPException 403: Not authorized to view generation
     """
-    # Initialize credit service for fetching remaining balances
-    credit_service = CreditService(db_pool)
-    # Fetch generation
-    generation = await db_pool.fetchrow("""
-        SELECT
-            id,
-            user_id,
-            status,
-            payment_type AS payment_method,
-            tokens_deducted AS total_cost,
-            address,
-            request_params,
-            error_message,
-            created_at,
-            start_processing_at,
-            completed_at
-        FROM generations
-        WHERE id = $1
-    """, generation_id)
+    if request.headers.get("if-none-match"):
+        # Revalidation: the generation and balance versions decide alone
+        versions = await db_pool.fetchrow("""
+            SELECT
+                g.user_id,
+                g.version,
+                u.balance_version + COALESCE(uta.version, 0) AS balance_version
+            FROM generations g
+            JOIN users u ON u.id = g.user_id
+            LEFT JOIN users_token_accounts uta ON uta.user_id = u.id
+            WHERE g.id = $1
+        """, generation_id)
+        if versions and versions["user_id"] == user.id:
+            etag = make_etag(
+                "generation", generation_id, versions["version"], versions["balance_version"]
+            )
+            if etag_matches(request, etag):
+                return not_modified(etag)
 
-    if not generation:
+    # One round trip: generation + areas + source images + balances, serialized
+    # to the MultiAreaGenerationResponse JSON shape by Postgres (this endpoint is
+    # polled every 2 seconds, so no per-area model building here)
+    row = await db_pool.fetchrow("""
+        SELECT
+            g.user_id,
+            g.version,
+            credits.balance_version,
+            json_build_object(
+                'id', g.id,
+                'user_id', g.user_id,
+                'status', g.status,
+                'address', g.address,
+                'geocoded_address', NULL,
+                'geocoding_accuracy', NULL,
+                'total_cost', COALESCE(NULLIF(g.tokens_deducted, 0), areas.total_count),
+                'payment_method', g.payment_type,
+                'credits_remaining', credits.balances,
+                'areas', areas.items,
+                'source_images', sources.items,
+                'created_at', g.created_at,
+                'start_processing_at', g.start_processing_at,
+                'completed_at', g.completed_at,
+                'estimated_completion', NULL,
+                'expires_at', NULL,
+                'retention_days', NULL,
+                'retention_message', NULL,
+                'error_message', g.error_message
+            )::text AS body
+        FROM generations g
+        CROSS JOIN LATERAL (
+            SELECT
+                COUNT(*) AS total_count,
+                COALESCE(
+                    json_agg(
+                        json_build_object(
+                            'id', a.id,
+                            'area', a.area_type,
+                            'style', a.style,
+                            'status', a.status,
+                            'progress', a.progress,
+                            'current_stage', a.current_stage,
+                            'status_message', a.status_message,
+                            'image_url', a.image_url,
+                            -- image_urls array for frontend compatibility
+                            'image_urls', CASE
+                                WHEN a.image_url <> '' THEN json_build_array(a.image_url)
+                            END,
+                            'error_message', a.error_message,
+                            'completed_at', a.completed_at
+                        )
+                        ORDER BY a.created_at
+                    ),
+                    '[]'::json
+                ) AS items
+            FROM generation_areas a
+            WHERE a.generation_id = g.id
+        ) AS areas
+        CROSS JOIN LATERAL (
+            SELECT json_agg(
+                json_build_object(
+                    'image_type', s.image_type,
+                    -- Placeholder while Street View uploads to blob storage
+                    'image_url', CASE
+                        WHEN s.image_url = 'pending_upload' THEN $2
+                        ELSE s.image_url
+                    END,
+                    'pano_id', s.pano_id
+                )
+                ORDER BY s.created_at
+            ) AS items
+            FROM generation_source_images s
+            WHERE s.generation_id = g.id
+              AND s.image_url <> ''
+        ) AS sources
+        LEFT JOIN LATERAL (
+            -- Remaining credits for frontend sync
+            SELECT json_build_object(
+                'trial', u.trial_remaining,
+                'token', COALESCE(uta.balance, 0),
+                'holiday', COALESCE(u.holiday_credits, 0)
+            ) AS balances,
+            u.balance_version + COALESCE(uta.version, 0) AS balance_version
+            FROM users u
+            LEFT JOIN users_token_accounts uta ON uta.user_id = u.id
+            WHERE u.id = g.user_id
+        ) AS credits ON TRUE
+        WHERE g.id = $1
+    """, generation_id, STREET_VIEW_PLACEHOLDER_URL)
+
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Generation not found"
         )
 
     # Check authorization
-    if generation["user_id"] != user.id:
+    if row["user_id"] != user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to view this generation"
         )
 
-    # Fetch generation areas with complete details
-    areas_records = await db_pool.fetch("""
+    response = Response(content=row["body"], media_type="application/json")
+    set_etag(response, make_etag("generation", generation_id, row["version"], row["balance_version"]))
+    return response
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _generation_event_snapshot(generation_id: UUID) -> Optional[Dict[str, Any]]:
+    """Current generation status and all areas for the event stream (None if gone)."""
+    snapshot = await db_pool.fetchrow("""
         SELECT
-            id,
-            area_type,
-            style,
-            status,
-            progress,
-            current_stage,
-            status_message,
-            image_url,
-            error_message,
-            completed_at
-        FROM generation_areas
-        WHERE generation_id = $1
-        ORDER BY created_at
+            g.status,
+            g.error_message,
+            COALESCE(
+                json_agg(
+                    json_build_object(
+                        'area_id', a.id,
+                        'area_type', a.area_type,
+                        'status', a.status,
+                        'progress', a.progress,
+                        'current_stage', a.current_stage,
+                        'status_message', a.status_message,
+                        'image_url', a.image_url,
+                        'error_message', a.error_message
+                    )
+                    ORDER BY a.created_at
+                ) FILTER (WHERE a.id IS NOT NULL),
+                '[]'
+            ) AS areas
+        FROM generations g
+        LEFT JOIN generation_areas a ON a.generation_id = g.id
+        WHERE g.id = $1
+        GROUP BY g.id
     """, generation_id)
 
-    # Convert to AreaStatusResponse models
-    areas_response = []
-    for area_record in areas_records:
-        # Convert image_url to image_urls array for frontend compatibility
-        image_urls = []
-        if area_record['image_url']:
-            image_urls.append(area_record['image_url'])
-
-        areas_response.append(AreaStatusResponse(
-            id=area_record['id'],
-            area=area_record['area_type'],
-            style=area_record['style'],
-            status=AreaStatus(area_record['status']),
-            progress=area_record['progress'],
-            current_stage=area_record['current_stage'],
-            status_message=area_record['status_message'],
-            image_url=area_record['image_url'],
-            image_urls=image_urls if image_urls else None,  # Add image_urls array for frontend
-            error_message=area_record['error_message'],
-            completed_at=area_record['completed_at']
-        ))
-
-    # Fetch source images (Street View/Satellite)
-    print(f"🔍 GET /generations/{generation_id}")
-    source_images_records = await db_pool.fetch("""
-        SELECT image_type, image_url, pano_id
-        FROM generation_source_images
-        WHERE generation_id = $1
-        ORDER BY created_at
+    if snapshot is None:
+        return None
+
+    return {
+        "generation_id": str(generation_id),
+        "status": snapshot["status"],
+        "error_message": snapshot["error_message"],
+        "areas": json.loads(snapshot["areas"]) if isinstance(snapshot["areas"], str) else snapshot["areas"]
+    }
+
+
+@router.get("/{generation_id}/events")
+async def stream_generation_events(
+    generation_id: UUID,
+    request: Request,
+    user: User = Depends(get_current_user),
+    events: GenerationEventBroker = Depends(get_generation_events)
+):
+    """
+    Stream generation progress as Server-Sent Events.
+
+    Replaces polling GET /generations/{id}: updates are pushed from Postgres
+    NOTIFY (generation_areas / generations triggers) through the process-wide
+    LISTEN connection.
+
+    **Events**:
+    - snapshot: Current generation status and all areas. Sent first, then
+      again on every heartbeat and whenever the LISTEN connection was
+      re-established (NOTIFYs sent while it was down are lost), so a client
+      never stays behind for longer than one heartbeat
+    - area: One area's status/progress changed
+    - generation: Generation status changed
+    - error: The generation disappeared while streaming
+
+    The stream ends after a terminal status (completed, partial_failed,
+    failed) in either a snapshot or a generation event.
+
+    **Client**: Authentication is the usual Bearer header, which the browser
+    EventSource API cannot send. Read the stream with fetch() instead
+    (Authorization header set, response.body.getReader() piped through a
+    TextDecoderStream, messages split on blank lines).
+
+    **Requirements**:
+    - FR-009: Real-time progress tracking
+    - FR-010: Progress persists across page refresh
+
+    Args:
+        generation_id: Generation UUID
+        request: Incoming request (for disconnect detection)
+        user: Current authenticated user
+        events: Generation event broker
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        HTTPException 404: Generation not found
+        HTTPException 403: Not authorized to view generation
+    """
+    generation = await db_pool.fetchrow("""
+        SELECT user_id
+        FROM generations
+        WHERE id = $1
     """, generation_id)
 
-    source_images = []
-    for record in source_images_records:
-        # Include all source images - even pending_upload
-        # For pending_upload, return placeholder that will auto-update when blob upload completes
-        image_url = record['image_url']
-        if image_url == 'pending_upload':
-            # Placeholder image while Street View uploads to Vercel Blob
-            # Client will re-poll and get the real URL once upload completes
-            image_url = 'data:image/svg+xml,%3Csvg xmlns="http://www.w3.org/2000/svg" width="600" height="400"%3E%3Crect width="600" height="400" fill="%23e5e7eb"/%3E%3Ctext x="50%25" y="50%25" dominant-baseline="middle" text-anchor="middle" fill="%236b7280" font-size="16"%3ELoading Street View...%3C/text%3E%3C/svg%3E'
-
-        if image_url:
-            source_images.append({
-                'image_type': record['image_type'],
-                'image_url': image_url,
-                'pano_id': record['pano_id']
-            })
-
-    print(f"   DB Records: {len(source_images_records)} source_images found")
-    print(f"   Returning: {len(source_images)} source_images in response")
-    if source_images:
-        for img in source_images:
-            print(f"     - {img['image_type']}: {img['image_url'][:50]}...")
-
-    # Fetch remaining credits for frontend sync (optional, non-blocking)
-    try:
-        credits_remaining = await credit_service.get_all_balances(user.id)
-    except Exception as e:
-        logger.warning(
-            "failed_to_fetch_credits_remaining_on_polling",
-            user_id=str(user.id),
-            generation_id=str(generation_id),
-            error=str(e)
+    if not generation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Generation not found"
         )
-        credits_remaining = None
-
-    # Return MultiAreaGenerationResponse with source_images
-    response = MultiAreaGenerationResponse(
-        id=generation['id'],
-        user_id=generation['user_id'],
-        status=GenerationStatus(generation['status']),
-        address=generation.get('address'),
-        total_cost=generation['total_cost'] if generation['total_cost'] else len(areas_response),
-        payment_method=generation['payment_method'],
-        credits_remaining=credits_remaining,
-        areas=areas_response,
-        source_images=source_images if source_images else None,
-        created_at=generation['created_at'],
-        start_processing_at=generation['start_processing_at'],
-        completed_at=generation['completed_at'],
-        estimated_completion=None,  # TODO: Calculate based on average processing time
-        error_message=generation['error_message']
-    )
 
-    # DEBUG: Log the actual response being sent to frontend
-    import json
-    try:
-        response_dict = response.model_dump(mode='json')
-        print(f"   ✅ RETURNING RESPONSE with source_images count: {len(response_dict.get('source_images') or [])}")
-        if response_dict.get('source_images'):
-            print(f"      Sample: {json.dumps(response_dict['source_images'][0], indent=2)}")
-    except Exception as e:
-        print(f"   ❌ Error serializing response: {e}")
+    if generation["user_id"] != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this generation"
+        )
 
-    return response
+    heartbeat_seconds = settings.generation_events_heartbeat_seconds
+
+    async def event_stream():
+        # Subscribe before reading the snapshot so no update falls in between
+        async with events.subscribe(generation_id) as queue:
+            resync = True
+            while not await request.is_disconnected():
+                if resync:
+                    snapshot = await _generation_event_snapshot(generation_id)
+                    if snapshot is None:
+                        # Deleted since the ownership check - the response has already started
+                        yield _sse("error", {
+                            "generation_id": str(generation_id),
+                            "detail": "Generation not found"
+                        })
+                        return
+
+                    yield _sse("snapshot", snapshot)
+                    if snapshot["status"] in TERMINAL_STATUSES:
+                        return
+
+                # Re-read on every heartbeat: doubles as the keep-alive and
+                # covers any NOTIFY the broker never received
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    resync = True
+                    continue
+
+                resync = event.get("type") == RESYNC_EVENT_TYPE
+                if resync:
+                    continue
+
+                yield _sse(event.get("type", "area"), event)
+                if event.get("type") == "generation" and event.get("status") in TERMINAL_STATUSES:
+                    return
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Disable proxy buffering (nginx)
+        }
+    )
@@ -35,11 +35,12 @@ from src.models.holiday import (
 from src.api.dependencies import get_current_user, require_verified_email
 from src.services.holiday_credit_service import HolidayCreditService
 from src.services.holiday_generation_service import HolidayGenerationService
-from src.services.token_service import TokenService
+from src.services.token_service import TokenService, get_token_service
 from src.services.maps_service import MapsService
-from src.services.gemini_client import GeminiClient
-from src.services.storage_service import BlobStorageService
+from src.services.gemini_client import GeminiClient, get_gemini_client
+from src.services.storage_service import StorageService, get_storage_service
 from src.services.share_service import ShareService
+from src.services.social_card_service import SocialCardService, card_for_platform
 from src.db.connection_pool import db_pool
 import structlog
 
@@ -62,13 +63,14 @@ def get_maps_service() -> MapsService:
     return MapsService()
 
 
-def get_generation_service() -> HolidayGenerationService:
+def get_generation_service(
+    token_service: TokenService = Depends(get_token_service),
+    gemini_client: GeminiClient = Depends(get_gemini_client),
+    storage_service: StorageService = Depends(get_storage_service)
+) -> HolidayGenerationService:
     """Get holiday generation service instance with all dependencies."""
     credit_service = HolidayCreditService(db_pool)
-    token_service = TokenService(db_pool)
     maps_service = MapsService()
-    gemini_client = GeminiClient()
-    storage_service = BlobStorageService()
 
     return HolidayGenerationService(
         db_pool=db_pool,
@@ -90,6 +92,13 @@ def get_share_service() -> ShareService:
     )
 
 
+def get_social_card_service(
+    storage_service: StorageService = Depends(get_storage_service)
+) -> SocialCardService:
+    """Get social card service instance."""
+    return SocialCardService(db_pool, storage_service)
+
+
 # ============================================================================
 # Generation Endpoints
 # ============================================================================
@@ -137,7 +146,8 @@ async def create_holiday_generation(
             address=request.address,
             heading=request.heading,
             pitch=request.pitch,
-            style=request.style
+            style=request.style,
+            regenerate=request.regenerate
         )
 
         logger.info(
@@ -479,7 +489,8 @@ async def get_street_view_preview(
 async def create_share(
     request: ShareRequest,
     current_user: User = Depends(require_verified_email),
-    share_service: ShareService = Depends(get_share_service)
+    share_service: ShareService = Depends(get_share_service),
+    social_card_service: SocialCardService = Depends(get_social_card_service)
 ):
     """
     Create a trackable social media share link.
@@ -491,6 +502,7 @@ async def create_share(
         request: Share request with generation_id and platform
         current_user: Authenticated user
         share_service: Share service instance
+        social_card_service: Stored platform cards (rendered with the generation)
 
     Returns:
         Share response with tracking link and platform share URL
@@ -502,7 +514,8 @@ async def create_share(
     try:
         # Verify generation exists and user owns it
         generation = await db_pool.fetchrow("""
-            SELECT id, user_id, before_after_image_url
+            SELECT id, user_id, before_after_image_url, social_card_urls,
+                   original_image_url, decorated_image_url
             FROM holiday_generations
             WHERE id = $1
         """, request.generation_id)
@@ -525,12 +538,29 @@ async def create_share(
                 detail={"error": "not_ready", "message": "Generation not complete yet"}
             )
 
+        # Cards are stored with the generation; only older generations render them (once)
+        try:
+            card_urls = await social_card_service.get_card_urls(
+                generation['id'],
+                generation['social_card_urls'],
+                generation['original_image_url'],
+                generation['decorated_image_url']
+            )
+        except Exception as e:
+            logger.warning(
+                "social_cards_unavailable",
+                generation_id=str(generation['id']),
+                error=str(e)
+            )
+            card_urls = None
+
         # Create share
         share_data = await share_service.create_share(
             user_id=current_user.id,
             generation_id=request.generation_id,
             platform=request.platform,
-            before_after_image_url=generation['before_after_image_url']
+            before_after_image_url=generation['before_after_image_url'],
+            card_image_url=card_for_platform(card_urls, request.platform)
         )
 
         return ShareResponse(**share_data)
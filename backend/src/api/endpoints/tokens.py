@@ -8,7 +8,7 @@ Requirements:
 - T051: Token balance endpoint (<100ms)
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List
 from uuid import UUID
 
@@ -23,8 +23,10 @@ from ...models.token_account import (
 )
 from ...models.user import User
 from ...services.stripe_service import StripeService
-from ...services.token_service import TokenService
+from ...services.token_service import TokenService, get_token_service
 from ...services.auto_reload_service import AutoReloadService
+from ...services.credit_service import CreditService
+from ..conditional import etag_matches, make_etag, not_modified, set_etag
 from ..dependencies import get_current_user, get_db_pool
 
 import asyncpg
@@ -103,8 +105,11 @@ async def create_checkout_session(
 
 @router.get("/balance", response_model=TokenAccountResponse)
 async def get_token_balance(
+    request: Request,
+    response: Response,
     user: User = Depends(get_current_user),
     db_pool: asyncpg.Pool = Depends(get_db_pool),
+    token_service: TokenService = Depends(get_token_service),
 ):
     """
     Get user's current token balance.
@@ -116,22 +121,33 @@ async def get_token_balance(
     Performance:
     - Single database query
     - Target response time: <100ms
-    - Future optimization: Redis caching
+    - ETag from the user's balance version; a matching If-None-Match gets
+      304 Not Modified without aggregating transactions
 
     Args:
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (ETag headers)
         user: Current authenticated user
         db_pool: Database connection pool
+        token_service: Shared token service
 
     Returns:
-        TokenAccountResponse with balance, total_purchased, total_spent
+        TokenAccountResponse with balance, total_purchased, total_spent,
+        or 304 if unchanged
 
     Raises:
         HTTPException 500: Database error
     """
-    token_service = TokenService(db_pool)
     auto_reload_service = AutoReloadService(db_pool)
 
     try:
+        balance_version = await CreditService(db_pool).get_balance_version(user.id)
+        if balance_version is not None:
+            etag = make_etag("tokens", user.id, balance_version)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+            set_etag(response, etag)
+
         balance, total_purchased, total_spent = await token_service.get_token_balance(
             user.id
         )
@@ -163,7 +179,7 @@ async def get_transaction_history(
     limit: int = 50,
     offset: int = 0,
     user: User = Depends(get_current_user),
-    db_pool: asyncpg.Pool = Depends(get_db_pool),
+    token_service: TokenService = Depends(get_token_service),
 ):
     """
     Get user's token transaction history.
@@ -172,7 +188,7 @@ async def get_transaction_history(
         limit: Number of transactions to return (default: 50, max: 100)
         offset: Pagination offset (default: 0)
         user: Current authenticated user
-        db_pool: Database connection pool
+        token_service: Shared token service
 
     Returns:
         List of TokenTransactionResponse
@@ -189,8 +205,6 @@ async def get_transaction_history(
     if offset < 0:
         raise HTTPException(status_code=400, detail="offset must be >= 0")
 
-    token_service = TokenService(db_pool)
-
     try:
         transactions = await token_service.get_transaction_history(
             user_id=user.id,
@@ -18,6 +18,7 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    database_listen_url: str = ""  # Direct (session-mode) connection for LISTEN; empty = database_url
 
     # Supabase Auth
     supabase_url: str
@@ -33,12 +34,41 @@ class Settings(BaseSettings):
 
     # Google Gemini AI
     gemini_api_key: str
+    gemini_max_concurrent_requests: int = 8  # In-flight Gemini calls per API key per process (adaptive limit ceiling)
+    gemini_min_concurrent_requests: int = 1  # Adaptive limit floor
+    gemini_slow_call_seconds: float = 120.0  # Successful calls slower than this shrink the limit
+    gemini_breaker_failure_rate: float = 0.5  # Upstream failure share that opens the circuit
+    gemini_breaker_min_calls: int = 10  # Calls in the window before the rate is trusted
+    gemini_breaker_window_seconds: float = 60.0
+    gemini_breaker_open_seconds: float = 30.0  # Fail fast for this long before probing again
+    gemini_key_cooldown_seconds: float = 60.0  # Key rest after a 429 without a RetryInfo delay
+    gemini_key_requests_per_minute: int = 0  # Per-key RPM quota to stay under (0 = only react to 429s)
 
     # Google Maps API
     google_maps_api_key: str
 
-    # Vercel Blob Storage
-    blob_read_write_token: str
+    # Image storage (src/services/storage_service.py)
+    storage_backend: str = "vercel"  # vercel | local | s3
+    storage_local_dir: str = ""  # local: empty = <system temp dir>/yarda-storage
+    storage_local_url_path: str = "/files"  # local: static route serving the files
+    storage_public_base_url: str = ""  # local: URL prefix for image links; empty = api_url
+    s3_endpoint_url: str = ""  # s3: e.g. https://s3.us-east-1.amazonaws.com, MinIO or R2 endpoint
+    s3_bucket: str = ""
+    s3_region: str = "us-east-1"  # "auto" for Cloudflare R2
+    s3_access_key_id: str = ""
+    s3_secret_access_key: str = ""
+    s3_public_base_url: str = ""  # s3: URL prefix for image links (e.g. CDN); empty = <endpoint>/<bucket>
+
+    # Vercel Blob Storage (also used for the HTTP client of the s3 backend)
+    blob_read_write_token: str = ""  # Required when storage_backend = "vercel"
+    blob_http2: bool = True  # Multiplex concurrent uploads over one connection
+    blob_max_connections: int = 50
+    blob_max_keepalive_connections: int = 20
+    blob_keepalive_seconds: float = 60.0
+    blob_upload_max_attempts: int = 3  # Tries per upload/delete (timeouts, connection errors, 429, 5xx)
+    blob_retry_backoff_seconds: float = 0.5  # Doubles per retry, with jitter
+    blob_stream_threshold_bytes: int = 1048576  # Images this large are streamed in chunks
+    blob_upload_chunk_bytes: int = 262144
 
     # Email Configuration
     skip_email_verification: bool = True
@@ -83,6 +113,46 @@ class Settings(BaseSettings):
     max_areas_per_generation: int = 5
     generation_timeout_seconds: int = 300  # 5 minutes
 
+    # Generation Worker (src/worker.py)
+    generation_worker_concurrency: int = 10  # Jobs processed at once per worker process
+    generation_max_concurrent_areas_per_generation: int = 5  # Areas of one generation running at once
+    generation_max_concurrent_areas_global: int = 20  # Running jobs across all workers
+    generation_worker_poll_interval_seconds: float = 1.0
+    generation_job_max_attempts: int = 3
+    generation_job_retry_delay_seconds: float = 30.0
+
+    # Google Maps HTTP connection pool (shared aiohttp session)
+    maps_http_pool_limit: int = 100  # Open connections in total
+    maps_http_pool_limit_per_host: int = 50
+    maps_http_dns_cache_ttl_seconds: int = 300
+    maps_http_keepalive_seconds: float = 30.0
+
+    # Geocode cache (src/services/geocode_cache.py)
+    geocode_cache_max_entries: int = 10000  # Addresses held in memory per process
+    geocode_cache_memory_ttl_seconds: float = 86400  # 24 hours
+    geocode_cache_db_ttl_days: int = 30  # Google Maps ToS allows caching coordinates up to 30 days
+
+    # Google Maps imagery disk cache (src/services/imagery_cache.py)
+    maps_imagery_cache_dir: str = ""  # Empty = <system temp dir>/yarda-maps-cache
+    maps_imagery_cache_max_mb: int = 500
+    maps_imagery_cache_ttl_seconds: float = 86400  # 24 hours
+
+    # Generation progress events (src/services/generation_events.py, SSE)
+    generation_events_queue_size: int = 100  # Buffered events per subscriber before dropping the oldest
+    generation_events_heartbeat_seconds: float = 15.0  # SSE snapshot re-send (and keep-alive) interval
+    generation_events_reconnect_seconds: float = 5.0  # Delay before re-opening a dropped LISTEN connection
+
+    # Generation result cache (src/services/generation_result_cache.py)
+    result_cache_enabled: bool = True
+    result_cache_max_entries: int = 5000  # Request keys held in memory per process
+    result_cache_memory_ttl_seconds: float = 3600  # 1 hour
+    result_cache_db_ttl_days: int = 30
+
+    # Image processing pool (src/services/image_pool.py)
+    image_pool_executor: str = "process"  # process | thread
+    image_pool_workers: int = 0  # 0 = min(4, CPU count)
+    image_pool_max_queue: int = 16  # Jobs queued beyond busy workers before callers wait
+
     # Rate Limiting
     rate_limit_per_minute: int = 60
     rate_limit_per_hour: int = 1000
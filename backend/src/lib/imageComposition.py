@@ -4,14 +4,25 @@ Image Composition Utilities
 Creates before/after comparison images for social sharing.
 Combines original and decorated images side-by-side with labels.
 
+The Pillow work runs in the image worker pool (src/services/image_pool.py),
+off the event loop. Fonts and the label / watermark overlays are rendered
+once per worker (warm_up() runs as the pool initializer) and pasted as
+sprites; JPEG sources are decoded at reduced scale (draft mode) when they
+are much larger than the output; the canvas stays RGB throughout.
+
+Benchmark: scripts/benchmark_image_composition.py
+
 Feature: 007-holiday-decorator (T027)
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 from io import BytesIO
-from typing import Optional
+from typing import Tuple
 import os
 
+from src.services.image_pool import get_image_pool
+
 
 async def create_before_after_image(
     before_image_bytes: bytes,
@@ -23,6 +34,9 @@ async def create_before_after_image(
     """
     Create side-by-side before/after comparison image.
 
+    Runs compose_before_after_image in the image worker pool, so the event
+    loop keeps serving requests while the image is built.
+
     Args:
         before_image_bytes: Original image bytes
         after_image_bytes: Decorated image bytes
@@ -38,114 +52,179 @@ async def create_before_after_image(
         >>> after_bytes = b"..."
         >>> comparison_bytes = await create_before_after_image(before_bytes, after_bytes)
     """
-    try:
-        # Load images
-        before_img = Image.open(BytesIO(before_image_bytes))
-        after_img = Image.open(BytesIO(after_image_bytes))
-
-        # Convert to RGB if needed (for JPEG compatibility)
-        if before_img.mode != "RGB":
-            before_img = before_img.convert("RGB")
-        if after_img.mode != "RGB":
-            after_img = after_img.convert("RGB")
-
-        # Resize to consistent height
-        target_height = 800
-        before_width = int((target_height / before_img.height) * before_img.width)
-        after_width = int((target_height / after_img.height) * after_img.width)
-
-        before_img = before_img.resize((before_width, target_height), Image.Resampling.LANCZOS)
-        after_img = after_img.resize((after_width, target_height), Image.Resampling.LANCZOS)
-
-        # Create new canvas
-        total_width = before_width + after_width
-        canvas = Image.new("RGB", (total_width, target_height), color=(255, 255, 255))
-
-        # Paste images side-by-side
-        canvas.paste(before_img, (0, 0))
-        canvas.paste(after_img, (before_width, 0))
-
-        # Convert to RGBA for transparency support
-        canvas = canvas.convert("RGBA")
-
-        # Create overlay for text with transparency
-        overlay = Image.new("RGBA", canvas.size, (255, 255, 255, 0))
-        draw = ImageDraw.Draw(overlay)
-
-        # Try to use a nice font, fall back to default if not available
-        try:
-            # Try to use system font
-            label_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 48)
-            watermark_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 32)
-        except:
-            try:
-                # Try DejaVu fonts (commonly available on Linux)
-                label_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 48)
-                watermark_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 32)
-            except:
-                # Fall back to PIL default font (will be small)
-                label_font = ImageFont.load_default()
-                watermark_font = ImageFont.load_default()
-
-        # Add BEFORE label with semi-transparent background
-        before_text = "BEFORE"
-        before_bbox = draw.textbbox((0, 0), before_text, font=label_font)
-        before_width_text = before_bbox[2] - before_bbox[0]
-        before_height_text = before_bbox[3] - before_bbox[1]
-        before_x = 30
-        before_y = 30
-
-        # Draw semi-transparent black background for BEFORE label
-        draw.rectangle(
-            [before_x - 15, before_y - 10, before_x + before_width_text + 15, before_y + before_height_text + 10],
-            fill=(0, 0, 0, 200)
-        )
-        draw.text((before_x, before_y), before_text, font=label_font, fill=(255, 255, 255, 255))
-
-        # Add AFTER label with semi-transparent background
-        after_text = "AFTER"
-        after_bbox = draw.textbbox((0, 0), after_text, font=label_font)
-        after_width_text = after_bbox[2] - after_bbox[0]
-        after_height_text = after_bbox[3] - after_bbox[1]
-        after_x = before_width + 30
-        after_y = 30
-
-        # Draw semi-transparent black background for AFTER label
-        draw.rectangle(
-            [after_x - 15, after_y - 10, after_x + after_width_text + 15, after_y + after_height_text + 10],
-            fill=(0, 0, 0, 200)
-        )
-        draw.text((after_x, after_y), after_text, font=label_font, fill=(255, 255, 255, 255))
-
-        # Add watermark at bottom center
-        watermark_text = "yarda.pro - transform your yard in seconds!"
-        watermark_bbox = draw.textbbox((0, 0), watermark_text, font=watermark_font)
-        watermark_width = watermark_bbox[2] - watermark_bbox[0]
-        watermark_height = watermark_bbox[3] - watermark_bbox[1]
-        watermark_x = (total_width - watermark_width) // 2
-        watermark_y = target_height - watermark_height - 40
-
-        # Draw semi-transparent black background for watermark
-        draw.rectangle(
-            [watermark_x - 25, watermark_y - 12, watermark_x + watermark_width + 25, watermark_y + watermark_height + 12],
-            fill=(0, 0, 0, 220)
-        )
+    return await get_image_pool().run(
+        compose_before_after_image,
+        before_image_bytes,
+        after_image_bytes,
+        label_before,
+        label_after,
+        output_format
+    )
 
-        # Draw watermark text in white
-        draw.text((watermark_x, watermark_y), watermark_text, font=watermark_font, fill=(255, 255, 255, 255))
 
-        # Composite overlay onto canvas
-        canvas = Image.alpha_composite(canvas, overlay)
+def compose_before_after_image(
+    before_image_bytes: bytes,
+    after_image_bytes: bytes,
+    label_before: str = "BEFORE",
+    label_after: str = "AFTER",
+    output_format: str = "JPEG"
+) -> bytes:
+    """
+    Build the before/after comparison image (blocking, CPU-bound).
 
-        # Convert back to RGB for JPEG
-        canvas = canvas.convert("RGB")
+    Module-level so the process pool can pickle it; call it through
+    create_before_after_image from async code.
 
-        # Convert to bytes
-        output_buffer = BytesIO()
-        canvas.save(output_buffer, format=output_format, quality=90)
-        output_buffer.seek(0)
+    Args:
+        before_image_bytes: Original image bytes
+        after_image_bytes: Decorated image bytes
+        label_before: Label for before image (default: "BEFORE")
+        label_after: Label for after image (default: "AFTER")
+        output_format: Output format (default: "JPEG")
 
-        return output_buffer.read()
+    Returns:
+        Composed image bytes
+    """
+    try:
+        # Decode straight to the output height (reduced-scale JPEG decode when possible)
+        canvas = render_before_after(
+            _load_scaled(before_image_bytes, TARGET_HEIGHT),
+            _load_scaled(after_image_bytes, TARGET_HEIGHT),
+            label_before,
+            label_after
+        )
+        return encode_image(canvas, output_format, quality=90)
 
     except Exception as e:
         raise RuntimeError(f"Failed to create before/after image: {str(e)}")
+
+
+def render_before_after(
+    before_img: Image.Image,
+    after_img: Image.Image,
+    label_before: str = "BEFORE",
+    label_after: str = "AFTER"
+) -> Image.Image:
+    """
+    Lay out decoded RGB images side-by-side at TARGET_HEIGHT with labels and watermark.
+
+    Also used by the social card renderer (src/lib/socialCards.py), which
+    decodes each source image once for every output.
+    """
+    before_img = scale_to_height(before_img, TARGET_HEIGHT)
+    after_img = scale_to_height(after_img, TARGET_HEIGHT)
+    before_width = before_img.width
+
+    # Paste images side-by-side on an RGB canvas (JPEG needs no alpha)
+    canvas = Image.new("RGB", (before_width + after_img.width, TARGET_HEIGHT), color=(255, 255, 255))
+    canvas.paste(before_img, (0, 0))
+    canvas.paste(after_img, (before_width, 0))
+
+    # Labels top-left of each half, watermark at bottom center
+    paste_label(canvas, label_before, (LABEL_MARGIN, LABEL_MARGIN))
+    paste_label(canvas, label_after, (before_width + LABEL_MARGIN, LABEL_MARGIN))
+    paste_watermark(canvas)
+    return canvas
+
+
+def paste_label(canvas: Image.Image, text: str, origin: Tuple[int, int]) -> None:
+    """Paste a white label on a semi-transparent black box; origin is the text position."""
+    sprite = _label_sprite(text, LABEL_FONT_SIZE, 15, 10, 200)
+    canvas.paste(sprite, (origin[0] - 15, origin[1] - 10), sprite)
+
+
+def paste_watermark(canvas: Image.Image) -> None:
+    """Paste the watermark at bottom center, its box ending 28 px above the bottom edge."""
+    watermark = _label_sprite(WATERMARK_TEXT, WATERMARK_FONT_SIZE, 25, 12, 220)
+    canvas.paste(
+        watermark,
+        ((canvas.width - watermark.width) // 2, canvas.height - 28 - watermark.height + 1),
+        watermark
+    )
+
+
+def decode_rgb(image_bytes: bytes, min_size: Tuple[int, int]) -> Image.Image:
+    """
+    Decode an image as RGB.
+
+    JPEGs at least twice min_size in both dimensions are decoded at 1/2, 1/4
+    or 1/8 scale (draft mode), staying at or above min_size.
+    """
+    img = Image.open(BytesIO(image_bytes))
+
+    if img.format == "JPEG" and img.width >= 2 * min_size[0] and img.height >= 2 * min_size[1]:
+        img.draft("RGB", min_size)
+
+    # Convert to RGB if needed (for JPEG compatibility)
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return img
+
+
+def scale_to_height(img: Image.Image, height: int) -> Image.Image:
+    """Resize to height, keeping the aspect ratio (no-op if already that height)."""
+    if img.height == height:
+        return img
+    width = int((height / img.height) * img.width)
+    return img.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+def encode_image(img: Image.Image, output_format: str = "JPEG", quality: int = 90) -> bytes:
+    """Encode an image to bytes."""
+    output_buffer = BytesIO()
+    img.save(output_buffer, format=output_format, quality=quality)
+    return output_buffer.getvalue()
+
+
+# Output layout
+TARGET_HEIGHT = 800
+LABEL_MARGIN = 30
+LABEL_FONT_SIZE = 48
+WATERMARK_FONT_SIZE = 32
+WATERMARK_TEXT = "yarda.pro - transform your yard in seconds!"
+
+# Tried in order; PIL's built-in font if none exist
+FONT_PATHS = (
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+)
+
+
+def warm_up() -> None:
+    """Load fonts and render the standard overlays (image pool worker initializer)."""
+    for text in ("BEFORE", "AFTER"):
+        _label_sprite(text, LABEL_FONT_SIZE, 15, 10, 200)
+    _label_sprite(WATERMARK_TEXT, WATERMARK_FONT_SIZE, 25, 12, 220)
+
+
+@lru_cache(maxsize=None)
+def _font(size: int) -> ImageFont.ImageFont:
+    """First available font at this size (probed once per process)."""
+    for path in FONT_PATHS:
+        if os.path.exists(path):
+            try:
+                return ImageFont.truetype(path, size)
+            except OSError:
+                continue
+    # Fall back to PIL default font (will be small)
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=64)
+def _label_sprite(text: str, font_size: int, pad_x: int, pad_y: int, alpha: int) -> Image.Image:
+    """
+    White text on a semi-transparent black box, as an RGBA sprite.
+
+    The box spans the text's ink bounds plus padding; the text's origin sits
+    at (pad_x, pad_y), as when drawing the box and text directly on the canvas.
+    """
+    font = _font(font_size)
+    left, top, right, bottom = ImageDraw.Draw(Image.new("RGBA", (1, 1))).textbbox((0, 0), text, font=font)
+    sprite = Image.new("RGBA", (right - left + 2 * pad_x + 1, bottom - top + 2 * pad_y + 1), (0, 0, 0, alpha))
+    ImageDraw.Draw(sprite).text((pad_x, pad_y), text, font=font, fill=(255, 255, 255, 255))
+    return sprite
+
+
+def _load_scaled(image_bytes: bytes, target_height: int) -> Image.Image:
+    """Decode an image as RGB and resize it to target_height, keeping the aspect ratio."""
+    return scale_to_height(decode_rgb(image_bytes, (1, target_height)), target_height)
@@ -0,0 +1,142 @@
+"""
+Social Card Rendering
+
+Renders every share image of a holiday generation from one decode of the
+before and after images: the side-by-side before/after image plus one card
+per platform aspect ratio and their thumbnails.
+
+- og (1200x630): Open Graph / link previews (Facebook, X), side-by-side
+- square (1080x1080): Instagram feed, stacked
+- story (1080x1920): Stories, TikTok, Pinterest, stacked
+- og_thumb / square_thumb: downscaled from the rendered cards
+
+Runs in the image worker pool (src/services/image_pool.py), like
+create_before_after_image.
+
+Feature: 007-holiday-decorator
+"""
+
+from typing import Dict, Tuple
+
+from PIL import Image, ImageOps
+
+from src.lib.imageComposition import (
+    LABEL_MARGIN,
+    decode_rgb,
+    encode_image,
+    paste_label,
+    paste_watermark,
+    render_before_after,
+)
+from src.services.image_pool import get_image_pool
+
+# Card name -> (width, height, layout)
+CARD_FORMATS: Dict[str, Tuple[int, int, str]] = {
+    "og": (1200, 630, "side_by_side"),
+    "square": (1080, 1080, "stacked"),
+    "story": (1080, 1920, "stacked"),
+}
+
+# Thumbnail name -> (source card, width, height)
+THUMBNAIL_FORMATS: Dict[str, Tuple[str, int, int]] = {
+    "og_thumb": ("og", 600, 315),
+    "square_thumb": ("square", 320, 320),
+}
+
+# Largest panel any card needs; sources are decoded at no less than this
+MAX_PANEL_SIZE = (1080, 960)
+
+CARD_QUALITY = 88
+
+
+async def create_share_images(
+    before_image_bytes: bytes,
+    after_image_bytes: bytes,
+    include_before_after: bool = True
+) -> Dict[str, bytes]:
+    """
+    Render the before/after image, all social cards and thumbnails off the event loop.
+
+    Args:
+        before_image_bytes: Original image bytes
+        after_image_bytes: Decorated image bytes
+        include_before_after: Also render the side-by-side before/after image
+
+    Returns:
+        Dict of JPEG bytes keyed by "before_after", card and thumbnail names
+    """
+    return await get_image_pool().run(
+        render_share_images, before_image_bytes, after_image_bytes, include_before_after
+    )
+
+
+def render_share_images(
+    before_image_bytes: bytes,
+    after_image_bytes: bytes,
+    include_before_after: bool = True
+) -> Dict[str, bytes]:
+    """
+    Render every share image from a single decode of each source (blocking, CPU-bound).
+
+    Module-level so the process pool can pickle it.
+
+    Returns:
+        Dict of JPEG bytes keyed by "before_after", card and thumbnail names
+    """
+    try:
+        before_img = decode_rgb(before_image_bytes, MAX_PANEL_SIZE)
+        after_img = decode_rgb(after_image_bytes, MAX_PANEL_SIZE)
+
+        images = {}
+        if include_before_after:
+            images["before_after"] = encode_image(render_before_after(before_img, after_img), quality=90)
+
+        cards = {
+            name: render_card(before_img, after_img, width, height, layout)
+            for name, (width, height, layout) in CARD_FORMATS.items()
+        }
+        for name, card in cards.items():
+            images[name] = encode_image(card, quality=CARD_QUALITY)
+
+        for name, (source, width, height) in THUMBNAIL_FORMATS.items():
+            thumbnail = cards[source].resize((width, height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+            images[name] = encode_image(thumbnail, quality=CARD_QUALITY)
+
+        return images
+
+    except Exception as e:
+        raise RuntimeError(f"Failed to render share images: {str(e)}")
+
+
+def render_card(
+    before_img: Image.Image,
+    after_img: Image.Image,
+    width: int,
+    height: int,
+    layout: str
+) -> Image.Image:
+    """
+    Lay out one card: before and after panels cropped to fill, labels and watermark.
+
+    Args:
+        before_img: Decoded original image (RGB)
+        after_img: Decoded decorated image (RGB)
+        width: Card width
+        height: Card height
+        layout: "side_by_side" (before left) or "stacked" (before on top)
+    """
+    if layout == "side_by_side":
+        panel = (width // 2, height)
+        after_origin = (panel[0], 0)
+    else:
+        panel = (width, height // 2)
+        after_origin = (0, panel[1])
+
+    canvas = Image.new("RGB", (width, height), color=(255, 255, 255))
+    canvas.paste(ImageOps.fit(before_img, panel, Image.Resampling.LANCZOS), (0, 0))
+    canvas.paste(ImageOps.fit(after_img, panel, Image.Resampling.LANCZOS), after_origin)
+
+    paste_label(canvas, "BEFORE", (LABEL_MARGIN, LABEL_MARGIN))
+    paste_label(canvas, "AFTER", (after_origin[0] + LABEL_MARGIN, after_origin[1] + LABEL_MARGIN))
+    paste_watermark(canvas)
+    return canvas
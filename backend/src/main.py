@@ -7,6 +7,7 @@ Main application setup with CORS, middleware, and route registration.
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 
 from src.config import settings
 from src.db.connection_pool import db_pool
@@ -14,6 +15,13 @@ from src.api.endpoints import auth, generations, tokens, webhooks, subscriptions
 from src.api.endpoints import debug
 from src.services.share_service import ShareService
 from src.services.holiday_credit_service import HolidayCreditService
+from src.services.maps_service import MapsService
+from src.services.gemini_client import get_gemini_client
+from src.services.storage_service import get_storage_service
+from src.services.token_service import get_token_service
+from src.services.generation_events import get_generation_events
+from src.services.image_pool import get_image_pool
+from src.lib.imageComposition import warm_up as warm_up_image_composition
 from fastapi import HTTPException
 from fastapi.responses import RedirectResponse
 
@@ -24,18 +32,47 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
 
     Handles startup and shutdown events:
-    - Startup: Initialize database connection pool
-    - Shutdown: Close database connections
+    - Startup: Initialize database connection pool, Google Maps HTTP session,
+      the shared Gemini / storage / token service instances, the image
+      worker pool and the generation progress LISTEN connection
+    - Shutdown: Close database connections, HTTP clients, the image worker
+      pool and the listener
     """
     # Startup
     print("Starting Yarda AI Landscape Studio API...")
     await db_pool.connect()
     print(f"Database connection pool initialized")
+    await MapsService.open_session(
+        limit=settings.maps_http_pool_limit,
+        limit_per_host=settings.maps_http_pool_limit_per_host,
+        dns_cache_ttl_seconds=settings.maps_http_dns_cache_ttl_seconds,
+        keepalive_timeout_seconds=settings.maps_http_keepalive_seconds
+    )
+    print("Google Maps HTTP session initialized")
+
+    # Create shared service instances once; endpoints receive them via Depends()
+    get_gemini_client()
+    await get_storage_service().open(
+        max_connections=settings.blob_max_connections,
+        max_keepalive_connections=settings.blob_max_keepalive_connections,
+        keepalive_expiry_seconds=settings.blob_keepalive_seconds,
+        http2=settings.blob_http2
+    )
+    get_token_service()
+    print("Gemini, storage and token services initialized")
+    get_image_pool().start(initializer=warm_up_image_composition)
+    print("Image worker pool started")
+    await get_generation_events().start()
+    print("Generation progress listener started")
 
     yield
 
     # Shutdown
     print("Shutting down...")
+    await get_generation_events().stop()
+    await get_storage_service().close()
+    await get_image_pool().close()
+    await MapsService.close_session()
     await db_pool.disconnect()
     print("Database connection pool closed")
 
@@ -72,6 +109,14 @@ app.include_router(holiday.router)  # NEW: Holiday decorator endpoints (Feature
 app.include_router(credits.router)  # NEW: Unified credit balance endpoint (Credit Systems Consolidation)
 app.include_router(debug.router)  # DEBUG: Admin debug logging endpoints
 
+# Local storage backend: serve stored images (content-addressed, so never stale)
+if settings.storage_backend == "local":
+    app.mount(
+        settings.storage_local_url_path,
+        StaticFiles(directory=get_storage_service().directory, check_dir=False),
+        name="storage"
+    )
+
 
 @app.get("/")
 async def root():
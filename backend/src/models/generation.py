@@ -192,6 +192,10 @@ class CreateGenerationRequest(BaseModel):
         max_items=5,
         description="List of yard areas to generate (1-5 areas)"
     )
+    regenerate: bool = Field(
+        default=False,
+        description="Always call the model, even if an identical request already has a stored result"
+    )
 
     @validator('areas')
     def validate_unique_areas(cls, areas):
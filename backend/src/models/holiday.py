@@ -44,6 +44,10 @@ class HolidayGenerationRequest(BaseModel):
     heading: int = Field(..., ge=0, lt=360, description="Street View heading (0-359 degrees)")
     pitch: Optional[int] = Field(default=0, ge=-90, le=90, description="Street View pitch (-90 to 90)")
     style: HolidayStyle = Field(..., description="Decoration style")
+    regenerate: bool = Field(
+        default=False,
+        description="Always call the model, even if this panorama and style already have a stored result"
+    )
 
     @field_validator('address')
     @classmethod
@@ -122,6 +126,7 @@ class ShareResponse(BaseModel):
     tracking_link: str = Field(..., description="Unique tracking URL (e.g., https://yarda.com/h/abc123xyz)")
     share_url: str = Field(..., description="Platform-specific share URL")
     before_after_image_url: str = Field(..., description="Image to share")
+    card_image_url: Optional[str] = Field(None, description="Pre-rendered card sized for the platform (OG, square or story)")
     can_earn_credit: bool = Field(..., description="False if daily limit reached")
     daily_shares_remaining: int = Field(..., description="How many more shares allowed today")
     created_at: datetime
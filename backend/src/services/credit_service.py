@@ -9,7 +9,7 @@ Feature: Credit Systems Consolidation (2025-11-11)
 """
 
 from enum import Enum
-from typing import Dict, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from uuid import UUID
 import logging
 
@@ -200,6 +200,27 @@ class CreditService:
             logger.error(f"Error fetching detailed balances for user {user_id}: {str(e)}")
             raise
 
+    async def get_balance_version(self, user_id: UUID) -> Optional[int]:
+        """
+        Get the user's balance version (changes whenever any balance does).
+
+        Sum of users.balance_version and users_token_accounts.version, both
+        maintained by triggers (migration 026) and only ever incremented, so
+        the sum changes whenever either does; used for ETags.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Current version, or None if the user does not exist
+        """
+        return await self.db_pool.fetchval("""
+            SELECT u.balance_version + COALESCE(uta.version, 0)
+            FROM users u
+            LEFT JOIN users_token_accounts uta ON uta.user_id = u.id
+            WHERE u.id = $1
+        """, user_id)
+
     # ========================================================================
     # Credit Deduction (Atomic)
     # ========================================================================
@@ -289,16 +310,9 @@ class CreditService:
 
                 case CreditType.TOKEN:
                     if amount == 1:
-                        success, balance, _ = await self.token_service.refund_token(user_id)
-                        return (success, balance)
+                        return await self.token_service.refund_token(user_id)
                     else:
-                        # Token service doesn't have batch refund yet
-                        # Implement as loop (can optimize later)
-                        for _ in range(amount):
-                            success, balance, _ = await self.token_service.refund_token(user_id)
-                            if not success:
-                                return (False, balance)
-                        return (True, balance)
+                        return await self.token_service.refund_tokens_batch(user_id, amount)
 
                 case CreditType.HOLIDAY:
                     new_balance = await self.holiday_service.grant_credit(
@@ -312,6 +326,52 @@ class CreditService:
             logger.error(f"Error refunding {credit_type.value} credits for user {user_id}: {str(e)}")
             raise
 
+    async def refund_bulk(
+        self,
+        refunds: List[Tuple[UUID, CreditType, int]],
+        description: str = "Generation failed - refund"
+    ) -> List[Dict[str, Any]]:
+        """
+        Refund many users in one statement (mass-failure events).
+
+        Entries for the same user and credit type are summed, so each user
+        gets one balance update per type and one token ledger row.
+
+        Args:
+            refunds: (user_id, credit_type, amount) entries
+            description: Ledger description for token refunds
+
+        Returns:
+            One dict per (user_id, credit_type) refunded with keys
+            user_id, credit_type, refunded, new_balance
+
+        Example:
+            ```python
+            await service.refund_bulk([
+                (user_a, CreditType.TRIAL, 3),
+                (user_b, CreditType.TOKEN, 2),
+            ])
+            ```
+        """
+        if not refunds:
+            return []
+
+        try:
+            rows = await self.db_pool.fetch("""
+                SELECT * FROM refund_credits_bulk($1::uuid[], $2::text[], $3::int[], $4)
+            """,
+                [user_id for user_id, _, _ in refunds],
+                [credit_type.value for _, credit_type, _ in refunds],
+                [amount for _, _, amount in refunds],
+                description
+            )
+        except Exception as e:
+            logger.error(f"Error bulk refunding {len(refunds)} entries: {str(e)}")
+            raise
+
+        logger.info(f"Bulk refunded {len(refunds)} entries across {len(rows)} balances")
+        return [dict(row) for row in rows]
+
     # ========================================================================
     # Validation Helpers
     # ========================================================================
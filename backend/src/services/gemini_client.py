@@ -11,41 +11,94 @@ Based on Yarda v2 implementation with enhancements:
 - Temperature configuration (0.7 for balanced creativity)
 """
 
-import os
+import hashlib
 from google import genai
 from google.genai import types
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 import base64
 import uuid
 from datetime import datetime
 import mimetypes
 import structlog
 import asyncio
+from contextlib import asynccontextmanager
+import httpx
+
+from src.config import settings
 
 # Import our prompt building system
 from src.services.prompt_builder import build_landscape_prompt
+from src.services.gemini_key_pool import GeminiKeyPool, configured_api_keys, mask_key
+from src.services.resilience import AIMDLimiter, CircuitBreaker, CircuitOpenError
+from src.services.single_flight import SingleFlight
 from src.services.usage_monitor import get_usage_monitor
 
 logger = structlog.get_logger(__name__)
 
+# Upstream answers meaning "back off": shrink the adaptive concurrency limit
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+# Upstream answers counted as failures by the circuit breaker (a 400 or a
+# safety block means Gemini itself is healthy)
+UPSTREAM_FAILURE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """HTTP status of a google-genai APIError (None for other errors)."""
+    code = getattr(error, "code", None)
+    return code if isinstance(code, int) else None
+
+
+def _is_overload(error: BaseException) -> bool:
+    return isinstance(error, TimeoutError) or _status_code(error) in OVERLOAD_STATUS_CODES
+
+
+def _is_upstream_failure(error: BaseException) -> bool:
+    return (
+        _is_overload(error)
+        or _status_code(error) in UPSTREAM_FAILURE_STATUS_CODES
+        or isinstance(error, (ConnectionError, httpx.TransportError))
+    )
+
 
 class GeminiClient:
     """Client for Google Gemini AI image generation."""
 
+    # Shared by all instances so identical requests coalesce process-wide
+    _flights = SingleFlight("gemini")
+
+    # Process-wide adaptive cap on in-flight Gemini calls and circuit breaker
+    # (created on first use, shared by every client)
+    _limiter: Optional[AIMDLimiter] = None
+    _breaker: Optional[CircuitBreaker] = None
+
+    REQUEST_TIMEOUT_SECONDS = 300  # 5 minutes
+
+    # Requested output size (ImageConfig); part of the request key
+    IMAGE_SIZE = "1K"  # 1024x1024 image output
+
     def __init__(self):
         # Force reload of environment variables from .env file
         from dotenv import load_dotenv
         load_dotenv(override=True)
 
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
+        api_keys = configured_api_keys()
+        if not api_keys:
             raise ValueError("GEMINI_API_KEY environment variable is required")
 
-        # Log which API key we're using for debugging
-        logger.info(f"[GeminiClient] Using API key: {api_key[:15]}...{api_key[-4:]}")
+        # Log which API keys we're using for debugging
+        logger.info(f"[GeminiClient] Using {len(api_keys)} API key(s): {', '.join(mask_key(k) for k in api_keys)}")
+
+        # One google-genai client per key; calls are spread over the pool
+        self.key_pool = GeminiKeyPool(
+            api_keys,
+            client_factory=lambda api_key: genai.Client(api_key=api_key),
+            cooldown_seconds=settings.gemini_key_cooldown_seconds,
+            requests_per_minute=settings.gemini_key_requests_per_minute
+        )
 
-        # Create Gemini client with google-genai SDK
-        self.client = genai.Client(api_key=api_key)
+        # GEMINI_API_KEY's client (callers that bypass the pool)
+        self.client = self.key_pool.primary.client
 
         # Use Gemini 2.5 Flash Image for image generation
         self.model_name = "gemini-2.5-flash-image"
@@ -82,10 +135,6 @@ class GeminiClient:
         Raises:
             Exception: If generation fails
         """
-        # Generate unique request ID for tracking
-        request_id = str(uuid.uuid4())[:8]
-        start_time = datetime.utcnow()
-
         # Build the prompt using our advanced prompt builder
         prompt = build_landscape_prompt(
             style=style,
@@ -95,6 +144,139 @@ class GeminiClient:
             address=address
         )
 
+        # Degraded upstream: fail now (the caller refunds) instead of queueing
+        self._get_breaker().raise_if_open()
+
+        # Identical concurrent requests (double-clicks, retries) share one API call
+        return await self._flights.do(
+            self._request_key(prompt, input_image),
+            lambda: self._generate_from_prompt(
+                prompt=prompt,
+                input_image=input_image,
+                address=address,
+                area_type=area_type,
+                style=style,
+                preservation_strength=preservation_strength
+            )
+        )
+
+    @classmethod
+    def _get_limiter(cls) -> AIMDLimiter:
+        if cls._limiter is None:
+            cls._limiter = AIMDLimiter(
+                "gemini",
+                max_limit=settings.gemini_max_concurrent_requests * max(1, len(configured_api_keys())),
+                min_limit=settings.gemini_min_concurrent_requests,
+                slow_call_seconds=settings.gemini_slow_call_seconds
+            )
+        return cls._limiter
+
+    @classmethod
+    def _get_breaker(cls) -> CircuitBreaker:
+        if cls._breaker is None:
+            cls._breaker = CircuitBreaker(
+                "gemini",
+                failure_rate_threshold=settings.gemini_breaker_failure_rate,
+                min_calls=settings.gemini_breaker_min_calls,
+                window_seconds=settings.gemini_breaker_window_seconds,
+                open_seconds=settings.gemini_breaker_open_seconds
+            )
+        return cls._breaker
+
+    @classmethod
+    def get_resilience_stats(cls) -> Dict[str, Any]:
+        """Adaptive limiter and circuit breaker state for monitoring."""
+        return {
+            "limiter": cls._get_limiter().get_stats(),
+            "breaker": cls._get_breaker().get_stats()
+        }
+
+    @classmethod
+    @asynccontextmanager
+    async def _concurrency_slot(cls):
+        """
+        Hold an adaptive concurrency slot shared by every client.
+
+        The call's outcome feeds the AIMD limit (throttling and timeouts halve
+        it, successes grow it back to gemini_max_concurrent_requests) and the
+        circuit breaker. Raises CircuitOpenError if the circuit opened while
+        waiting for the slot.
+        """
+        limiter = cls._get_limiter()
+        breaker = cls._get_breaker()
+
+        async with limiter.slot() as started_at:
+            breaker.check()
+            try:
+                yield
+            except asyncio.CancelledError:
+                # Do not leave a half-open probe hanging
+                if breaker.state == CircuitBreaker.HALF_OPEN:
+                    breaker.record_failure()
+                raise
+            except Exception as e:
+                if _is_overload(e):
+                    limiter.on_overload(started_at, reason=_status_code(e) or type(e).__name__)
+                if _is_upstream_failure(e):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                raise
+            else:
+                limiter.on_success(started_at)
+                breaker.record_success()
+
+    def result_cache_key(
+        self,
+        input_image: Optional[bytes],
+        address: Optional[str],
+        area_type: str,
+        style: str,
+        custom_prompt: Optional[str] = None,
+        preservation_strength: float = 0.5
+    ) -> str:
+        """
+        Request key for the generation result cache.
+
+        Takes the same arguments as generate_landscape_design and hashes what
+        the model would actually receive, so two requests share a key exactly
+        when they would produce the same Gemini call.
+        """
+        prompt = build_landscape_prompt(
+            style=style,
+            preservation_strength=preservation_strength,
+            custom_prompt=custom_prompt,
+            area=area_type,
+            address=address
+        )
+        return self._request_key(prompt, input_image)
+
+    def _request_key(self, prompt: str, input_image: Optional[bytes]) -> str:
+        """Content hash identifying a generation request (model + size + prompt + input image)."""
+        digest = hashlib.sha256()
+        digest.update(self.model_name.encode())
+        digest.update(b"\0")
+        digest.update(self.IMAGE_SIZE.encode())
+        digest.update(b"\0")
+        digest.update(prompt.encode())
+        digest.update(b"\0")
+        digest.update(input_image or b"")
+        return digest.hexdigest()
+
+    async def _generate_from_prompt(
+        self,
+        prompt: str,
+        input_image: Optional[bytes],
+        address: Optional[str],
+        area_type: str,
+        style: str,
+        preservation_strength: float
+    ) -> bytes:
+        """Call Gemini with a built prompt and return the generated image bytes."""
+        # Generate unique request ID for tracking
+        request_id = str(uuid.uuid4())[:8]
+        start_time = datetime.utcnow()
+
         # Estimate input tokens (rough approximation)
         input_tokens = len(prompt.split()) + (500 if input_image else 0)
 
@@ -125,7 +307,7 @@ class GeminiClient:
             # Add image_config only if ImageConfig is available (newer versions)
             if hasattr(types, 'ImageConfig'):
                 config_kwargs["image_config"] = types.ImageConfig(
-                    image_size="1K"  # 1024x1024 image output
+                    image_size=self.IMAGE_SIZE
                 )
 
             generate_content_config = types.GenerateContentConfig(**config_kwargs)
@@ -134,33 +316,15 @@ class GeminiClient:
             image_data = None
             text_response = ""
 
-            # Use generate_content_stream (NOT generate_content) for image generation
-            # Wrap with 5-minute timeout to prevent hanging
+            # Use generate_content_stream (NOT generate_content) for image generation.
+            # The async (client.aio) stream yields to the event loop between chunks,
+            # so other requests keep running and the 5-minute timeout can cancel it.
             try:
-                async with asyncio.timeout(300):  # 5 minute timeout
-                    for chunk in self.client.models.generate_content_stream(
-                        model=self.model_name,
-                        contents=[
-                            types.Content(
-                                role="user",
-                                parts=content_parts
-                            )
-                        ],
-                        config=generate_content_config
-                    ):
-                        # Extract image from streaming chunks
-                        if (
-                            chunk.candidates is not None
-                            and chunk.candidates[0].content is not None
-                            and chunk.candidates[0].content.parts is not None
-                        ):
-                            for part in chunk.candidates[0].content.parts:
-                                # Extract inline image data
-                                if part.inline_data and part.inline_data.data:
-                                    image_data = part.inline_data.data
-                                # Also capture any text response
-                                elif hasattr(part, 'text') and part.text:
-                                    text_response += part.text
+                async with self._concurrency_slot():
+                    async with asyncio.timeout(self.REQUEST_TIMEOUT_SECONDS):
+                        image_data, text_response = await self._stream_with_key_pool(
+                            content_parts, generate_content_config
+                        )
             except asyncio.TimeoutError:
                 response_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
                 self.usage_monitor.record_request(
@@ -204,6 +368,10 @@ class GeminiClient:
 
             return image_data
 
+        except CircuitOpenError:
+            # Rejected before calling Gemini - nothing to record
+            raise
+
         except Exception as e:
             # Record failure
             response_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
@@ -225,6 +393,67 @@ class GeminiClient:
 
             raise Exception(f"Gemini generation failed: {str(e)}")
 
+    async def _stream_with_key_pool(self, content_parts: list, config) -> Tuple[Optional[bytes], str]:
+        """
+        Run one generation on the best key in the pool.
+
+        A 429 rests that key and retries on the next key with quota left, so
+        one exhausted project quota does not fail the call while others have room.
+
+        Returns:
+            Tuple of (image bytes or None, concatenated text parts)
+        """
+        attempts = len(self.key_pool)
+        for attempt in range(attempts):
+            key = self.key_pool.acquire()
+            error: Optional[BaseException] = None
+            try:
+                return await self._stream_image(key.client, content_parts, config)
+            except BaseException as e:
+                error = e
+                if (
+                    _status_code(e) == 429
+                    and attempt + 1 < attempts
+                    and self.key_pool.has_available(exclude=key)
+                ):
+                    logger.info("gemini_key_failover", key=key.label)
+                    continue
+                raise
+            finally:
+                self.key_pool.release(key, error)
+
+    async def _stream_image(self, client, content_parts: list, config) -> Tuple[Optional[bytes], str]:
+        """Stream one generate_content call on a client and collect its image and text."""
+        image_data = None
+        text_response = ""
+
+        stream = await client.aio.models.generate_content_stream(
+            model=self.model_name,
+            contents=[
+                types.Content(
+                    role="user",
+                    parts=content_parts
+                )
+            ],
+            config=config
+        )
+        async for chunk in stream:
+            # Extract image from streaming chunks
+            if (
+                chunk.candidates is not None
+                and chunk.candidates[0].content is not None
+                and chunk.candidates[0].content.parts is not None
+            ):
+                for part in chunk.candidates[0].content.parts:
+                    # Extract inline image data
+                    if part.inline_data and part.inline_data.data:
+                        image_data = part.inline_data.data
+                    # Also capture any text response
+                    elif hasattr(part, 'text') and part.text:
+                        text_response += part.text
+
+        return image_data, text_response
+
     async def generate_landscape_design_streaming(
         self,
         input_image: Optional[bytes],
@@ -0,0 +1,214 @@
+"""
+Gemini API key pool.
+
+Each Gemini API key carries its own project quota (requests per minute and
+per day). The pool holds one genai client per key, sends each call to the
+least busy key that has quota left, and takes a key out of rotation when
+Gemini answers 429 until its quota window resets (the RetryInfo delay from
+the error, or gemini_key_cooldown_seconds). Aggregate throughput therefore
+grows with the number of configured keys.
+
+Keys come from GEMINI_API_KEY plus the comma-separated GEMINI_API_KEYS.
+
+Requirements:
+- FR-028: Landscape generation with Gemini 2.5 Flash
+"""
+
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Quota window for per-key requests-per-minute tracking
+RPM_WINDOW_SECONDS = 60.0
+
+
+def configured_api_keys() -> List[str]:
+    """GEMINI_API_KEY followed by GEMINI_API_KEYS entries (deduplicated, order kept)."""
+    keys = [os.getenv("GEMINI_API_KEY", "")]
+    keys += os.getenv("GEMINI_API_KEYS", "").split(",")
+    return list(dict.fromkeys(key.strip() for key in keys if key.strip()))
+
+
+def mask_key(api_key: str) -> str:
+    """Loggable form of an API key."""
+    return f"...{api_key[-4:]}"
+
+
+def retry_delay_seconds(error: BaseException) -> Optional[float]:
+    """
+    Read the RetryInfo delay (e.g. "37s") from a google-genai 429 error.
+
+    Returns:
+        Delay in seconds, or None if the error carries no RetryInfo
+    """
+    details = getattr(error, "details", None)
+    if not isinstance(details, dict):
+        return None
+    error_body = details.get("error", details)
+    for detail in error_body.get("details", []) or []:
+        if isinstance(detail, dict) and "retryDelay" in detail:
+            match = re.fullmatch(r"(\d+(?:\.\d+)?)s", str(detail["retryDelay"]))
+            if match:
+                return float(match.group(1))
+    return None
+
+
+@dataclass
+class ApiKeyState:
+    """One key's client and usage counters."""
+
+    api_key: str
+    client: Any
+    in_flight: int = 0
+    requests: int = 0
+    successes: int = 0
+    throttled: int = 0
+    errors: int = 0
+    cooldown_until: float = 0.0
+    recent: Deque[float] = field(default_factory=deque)
+
+    @property
+    def label(self) -> str:
+        return mask_key(self.api_key)
+
+
+class GeminiKeyPool:
+    """Spreads Gemini calls over API keys, skipping throttled or exhausted keys."""
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        client_factory: Callable[[str], Any],
+        cooldown_seconds: float = 60.0,
+        requests_per_minute: int = 0
+    ):
+        """
+        Args:
+            api_keys: Gemini API keys (at least one)
+            client_factory: Builds the genai client for a key
+            cooldown_seconds: How long a key rests after a 429 without RetryInfo
+            requests_per_minute: Per-key RPM quota to stay under (0 = only react to 429s)
+        """
+        if not api_keys:
+            raise ValueError("At least one Gemini API key is required")
+
+        self.cooldown_seconds = cooldown_seconds
+        self.requests_per_minute = requests_per_minute
+        self._keys = [ApiKeyState(api_key=key, client=client_factory(key)) for key in api_keys]
+        self._next = 0
+        self.exhausted = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def primary(self) -> ApiKeyState:
+        """The first configured key (GEMINI_API_KEY)."""
+        return self._keys[0]
+
+    def has_available(self, exclude: Optional[ApiKeyState] = None) -> bool:
+        """True if some key (other than ``exclude``) has quota left right now."""
+        now = time.monotonic()
+        for state in self._keys:
+            if state is not exclude:
+                self._prune(state, now)
+                if self._has_quota(state, now):
+                    return True
+        return False
+
+    def acquire(self) -> ApiKeyState:
+        """
+        Pick the key for the next call and count it as in flight.
+
+        Prefers keys that are not cooling down and are under their RPM quota,
+        then the fewest in-flight calls, rotating between equals. If every key
+        is out of quota the one that recovers first is used (its 429 then feeds
+        the limiter and circuit breaker).
+        """
+        now = time.monotonic()
+        count = len(self._keys)
+        # Rotation order starting after the last pick, so ties spread evenly
+        ordered = [self._keys[(self._next + i) % count] for i in range(count)]
+        for state in ordered:
+            self._prune(state, now)
+
+        available = [state for state in ordered if self._has_quota(state, now)]
+        if available:
+            chosen = min(available, key=lambda state: state.in_flight)
+        else:
+            self.exhausted += 1
+            chosen = min(ordered, key=lambda state: self._recovers_at(state))
+            logger.warning(
+                "gemini_key_pool_exhausted",
+                keys=count,
+                using=chosen.label,
+                wait_seconds=round(max(0.0, self._recovers_at(chosen) - now), 1)
+            )
+
+        self._next = (self._keys.index(chosen) + 1) % count
+        chosen.in_flight += 1
+        chosen.requests += 1
+        chosen.recent.append(now)
+        return chosen
+
+    def release(self, state: ApiKeyState, error: Optional[BaseException] = None) -> None:
+        """Record a call's outcome; a 429 rests the key until its window resets."""
+        state.in_flight -= 1
+
+        if error is None:
+            state.successes += 1
+        elif getattr(error, "code", None) == 429:
+            state.throttled += 1
+            delay = retry_delay_seconds(error) or self.cooldown_seconds
+            state.cooldown_until = max(state.cooldown_until, time.monotonic() + delay)
+            logger.warning("gemini_key_throttled", key=state.label, cooldown_seconds=delay)
+        else:
+            state.errors += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-key usage counters for monitoring (keys are masked)."""
+        now = time.monotonic()
+        keys = []
+        for state in self._keys:
+            self._prune(state, now)
+            keys.append({
+                "key": state.label,
+                "available": self._has_quota(state, now),
+                "in_flight": state.in_flight,
+                "requests": state.requests,
+                "requests_last_minute": len(state.recent),
+                "successes": state.successes,
+                "throttled": state.throttled,
+                "errors": state.errors,
+                "cooldown_seconds": round(max(0.0, state.cooldown_until - now), 1)
+            })
+        return {
+            "keys": keys,
+            "available": sum(1 for key in keys if key["available"]),
+            "requests_per_minute": self.requests_per_minute,
+            "exhausted": self.exhausted
+        }
+
+    def _has_quota(self, state: ApiKeyState, now: float) -> bool:
+        if state.cooldown_until > now:
+            return False
+        return not self.requests_per_minute or len(state.recent) < self.requests_per_minute
+
+    def _recovers_at(self, state: ApiKeyState) -> float:
+        recovers_at = state.cooldown_until
+        if self.requests_per_minute and len(state.recent) >= self.requests_per_minute:
+            recovers_at = max(recovers_at, state.recent[0] + RPM_WINDOW_SECONDS)
+        return recovers_at
+
+    @staticmethod
+    def _prune(state: ApiKeyState, now: float) -> None:
+        cutoff = now - RPM_WINDOW_SECONDS
+        while state.recent and state.recent[0] <= cutoff:
+            state.recent.popleft()
@@ -0,0 +1,197 @@
+"""
+Generation progress events over Postgres LISTEN/NOTIFY.
+
+Triggers on generations and generation_areas (migration 024) NOTIFY the
+generation_events channel whenever a status or progress value changes. Each
+API process holds ONE dedicated LISTEN connection and fans every notification
+out in-process to the SSE subscribers of that generation, so thousands of open
+progress streams cost one connection instead of a poll query every 2 seconds.
+
+Requirements:
+- FR-009: Real-time progress tracking
+- FR-010: Progress persists across page refresh
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+from uuid import UUID
+
+import asyncpg
+import structlog
+
+from src.config import settings
+
+logger = structlog.get_logger(__name__)
+
+CHANNEL = "generation_events"
+
+# Generation statuses after which no further events are sent
+TERMINAL_STATUSES = frozenset({"completed", "partial_failed", "failed"})
+
+# Queued to every subscriber when the LISTEN connection is (re)established:
+# NOTIFYs sent while it was down are lost, so streams must re-read the state
+RESYNC_EVENT_TYPE = "resync"
+
+
+class GenerationEventBroker:
+    """Single LISTEN connection fanned out to per-generation subscriber queues."""
+
+    def __init__(
+        self,
+        dsn: Optional[str] = None,
+        queue_size: int = 100,
+        reconnect_seconds: float = 5.0
+    ):
+        """
+        Args:
+            dsn: Postgres URL for the listener (must support LISTEN, i.e. not a
+                transaction-mode pooler)
+            queue_size: Buffered events per subscriber; the oldest is dropped
+                when a slow client falls behind
+            reconnect_seconds: Delay before re-opening a dropped connection
+        """
+        self.dsn = dsn
+        self.queue_size = queue_size
+        self.reconnect_seconds = reconnect_seconds
+        self._subscribers: Dict[UUID, Set[asyncio.Queue]] = {}
+        self._conn: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed: Optional[asyncio.Event] = None
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.resyncs = 0
+
+    async def start(self) -> None:
+        """Start listening (reconnects in the background if the connection drops)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        """Stop listening and close the dedicated connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_connection()
+
+    @asynccontextmanager
+    async def subscribe(self, generation_id: UUID) -> AsyncIterator[asyncio.Queue]:
+        """
+        Receive events for one generation while the context is open.
+
+        Subscribe BEFORE reading the initial state so no update is missed in
+        between.
+
+        Yields:
+            Queue of event dicts (as sent by the NOTIFY triggers)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(generation_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(generation_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[generation_id]
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """Deliver an event to every subscriber of its generation."""
+        try:
+            generation_id = UUID(str(event["generation_id"]))
+        except (KeyError, ValueError):
+            logger.warning("generation_event_invalid", generation_event=event)
+            return
+
+        for queue in self._subscribers.get(generation_id, ()):
+            self._put(queue, event)
+            self.delivered += 1
+
+    def resync(self) -> None:
+        """Tell every subscriber that events may have been missed."""
+        for generation_id, queues in self._subscribers.items():
+            for queue in queues:
+                self._put(queue, {"type": RESYNC_EVENT_TYPE, "generation_id": str(generation_id)})
+                self.resyncs += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        return {
+            "connected": self._conn is not None and not self._conn.is_closed(),
+            "generations": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "received": self.received,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "resyncs": self.resyncs
+        }
+
+    def _put(self, queue: asyncio.Queue, event: Dict[str, Any]) -> None:
+        if queue.full():
+            # Progress is a snapshot - losing an old one for a slow client is fine
+            queue.get_nowait()
+            self.dropped += 1
+        queue.put_nowait(event)
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        self.received += 1
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("generation_event_unparseable", payload=payload[:200])
+            return
+        self.publish(event)
+
+    def _on_terminate(self, connection) -> None:
+        if self._closed is not None:
+            self._closed.set()
+
+    async def _listen_forever(self) -> None:
+        while True:
+            try:
+                self._closed = asyncio.Event()
+                self._conn = await asyncpg.connect(
+                    self.dsn or settings.database_listen_url or settings.database_url,
+                    statement_cache_size=0
+                )
+                self._conn.add_termination_listener(self._on_terminate)
+                await self._conn.add_listener(CHANNEL, self._on_notify)
+                logger.info("generation_events_listening", channel=CHANNEL)
+                # Anything notified before this point (e.g. during the reconnect) is lost
+                self.resync()
+                await self._closed.wait()
+                logger.warning("generation_events_connection_lost")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("generation_events_listen_failed", error=str(e))
+            finally:
+                await self._close_connection()
+            await asyncio.sleep(self.reconnect_seconds)
+
+    async def _close_connection(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            try:
+                await conn.close()
+            except Exception:
+                conn.terminate()
+
+
+# Global instance
+generation_events = GenerationEventBroker(
+    queue_size=settings.generation_events_queue_size,
+    reconnect_seconds=settings.generation_events_reconnect_seconds
+)
+
+
+def get_generation_events() -> GenerationEventBroker:
+    """Get global generation event broker instance."""
+    return generation_events
@@ -0,0 +1,288 @@
+"""
+Durable generation job queue backed by the generation_jobs table.
+
+Each generation area becomes one job row. API nodes enqueue jobs right after
+payment is deducted; worker processes (src/worker.py) claim them with
+FOR UPDATE SKIP LOCKED so any number of workers can pull from the same table
+without double-processing an area.
+
+Job lifecycle:
+    pending -> running -> completed
+                       -> pending (retry with backoff, attempts < max_attempts)
+                       -> failed  (attempts exhausted)
+
+Requirements:
+- FR-014: Background processing continues across deploys/restarts
+- FR-070: Parallel processing of generation areas
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import structlog
+
+from src.db.connection_pool import DatabasePool
+
+logger = structlog.get_logger(__name__)
+
+
+class GenerationJobQueue:
+    """Postgres-backed queue of per-area generation jobs."""
+
+    def __init__(self, db_pool: DatabasePool, max_attempts: int = 3):
+        self.db = db_pool
+        self.max_attempts = max_attempts
+
+    async def enqueue_generation(
+        self,
+        generation_id: UUID,
+        user_id: UUID,
+        area_ids: List[UUID],
+        payload: Dict[str, Any]
+    ) -> int:
+        """
+        Enqueue one job per generation area in a single statement.
+
+        The first area's job is flagged with ``upload_source_image`` so exactly
+        one worker uploads the property's Street View source image.
+
+        Args:
+            generation_id: Generation UUID
+            user_id: User UUID (owner of the generation)
+            area_ids: generation_areas IDs to process
+            payload: Shared job parameters (address, payment_method, ...)
+
+        Returns:
+            Number of jobs enqueued (existing jobs for an area are left untouched)
+        """
+        result = await self.db.execute("""
+            INSERT INTO generation_jobs (
+                generation_id,
+                area_id,
+                user_id,
+                payload,
+                max_attempts
+            )
+            SELECT
+                $1,
+                area.id,
+                $2,
+                $4::jsonb || jsonb_build_object('upload_source_image', area.ord = 1),
+                $5
+            FROM unnest($3::uuid[]) WITH ORDINALITY AS area(id, ord)
+            ON CONFLICT (area_id) DO NOTHING
+        """,
+            generation_id,
+            user_id,
+            [UUID(str(area_id)) for area_id in area_ids],
+            json.dumps(payload),
+            self.max_attempts
+        )
+
+        enqueued = int(result.split()[-1]) if result else 0
+        logger.info(
+            "generation_jobs_enqueued",
+            generation_id=str(generation_id),
+            num_jobs=enqueued
+        )
+        return enqueued
+
+    async def claim(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        per_generation_limit: Optional[int] = None,
+        global_limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Claim up to ``limit`` runnable jobs for this worker.
+
+        Uses FOR UPDATE SKIP LOCKED so concurrent workers never claim the same
+        row and never block on each other's locks. Claims are serialized with a
+        transaction-scoped advisory lock so the running-job limits below hold
+        across all worker processes.
+
+        Args:
+            worker_id: Identifier of the claiming worker process
+            limit: Maximum number of jobs to claim
+            per_generation_limit: Maximum running jobs for any single generation
+                (None = unlimited)
+            global_limit: Maximum running jobs across all workers (None = unlimited)
+
+        Returns:
+            List of claimed jobs (id, generation_id, area_id, user_id, payload, attempts, max_attempts)
+        """
+        if limit < 1:
+            return []
+
+        async with self.db.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext('generation_jobs_claim'))"
+                )
+
+                rows = await conn.fetch("""
+                    WITH candidates AS (
+                        -- Look past the head of the queue so one generation at its
+                        -- limit (max 5 areas) cannot starve the ones behind it
+                        SELECT id, generation_id, run_after, created_at
+                        FROM generation_jobs
+                        WHERE status = 'pending'
+                          AND run_after <= NOW()
+                        ORDER BY run_after, created_at
+                        LIMIT $2 * 5
+                        FOR UPDATE SKIP LOCKED
+                    ),
+                    running AS (
+                        SELECT generation_id, COUNT(*) AS running_count
+                        FROM generation_jobs
+                        WHERE status = 'running'
+                        GROUP BY generation_id
+                    ),
+                    ranked AS (
+                        SELECT
+                            candidates.id,
+                            candidates.run_after,
+                            candidates.created_at,
+                            COALESCE(running.running_count, 0)
+                                + ROW_NUMBER() OVER (
+                                    PARTITION BY candidates.generation_id
+                                    ORDER BY candidates.run_after, candidates.created_at
+                                ) AS generation_slot
+                        FROM candidates
+                        LEFT JOIN running ON running.generation_id = candidates.generation_id
+                    ),
+                    next_jobs AS (
+                        SELECT id
+                        FROM ranked
+                        WHERE $3::int IS NULL OR generation_slot <= $3::int
+                        ORDER BY run_after, created_at
+                        LIMIT GREATEST(
+                            0,
+                            LEAST(
+                                $2::int,
+                                COALESCE(
+                                    $4::int - (SELECT COALESCE(SUM(running_count), 0) FROM running)::int,
+                                    $2::int
+                                )
+                            )
+                        )
+                    )
+                    UPDATE generation_jobs AS jobs
+                    SET status = 'running',
+                        attempts = jobs.attempts + 1,
+                        locked_at = NOW(),
+                        locked_by = $1
+                    FROM next_jobs
+                    WHERE jobs.id = next_jobs.id
+                    RETURNING
+                        jobs.id,
+                        jobs.generation_id,
+                        jobs.area_id,
+                        jobs.user_id,
+                        jobs.payload,
+                        jobs.attempts,
+                        jobs.max_attempts
+                """, worker_id, limit, per_generation_limit, global_limit)
+
+        return [self._to_job(row) for row in rows]
+
+    async def complete(self, job_id: UUID) -> None:
+        """Mark a job as completed and release its lock."""
+        await self.db.execute("""
+            UPDATE generation_jobs
+            SET status = 'completed',
+                locked_at = NULL,
+                locked_by = NULL,
+                completed_at = NOW()
+            WHERE id = $1
+        """, job_id)
+
+    async def fail(
+        self,
+        job_id: UUID,
+        error_message: str,
+        retry_delay_seconds: Optional[float] = None
+    ) -> bool:
+        """
+        Record a job failure, re-queueing it if attempts remain.
+
+        Args:
+            job_id: Job UUID
+            error_message: Error to store on the job
+            retry_delay_seconds: Delay before the job becomes claimable again.
+                None means do not retry.
+
+        Returns:
+            True if the job was re-queued, False if it is now permanently failed
+        """
+        status = await self.db.fetchval("""
+            UPDATE generation_jobs
+            SET status = CASE
+                    WHEN $3::float8 IS NOT NULL AND attempts < max_attempts THEN 'pending'
+                    ELSE 'failed'
+                END,
+                run_after = CASE
+                    WHEN $3::float8 IS NOT NULL AND attempts < max_attempts
+                        THEN NOW() + make_interval(secs => $3::float8)
+                    ELSE run_after
+                END,
+                last_error = $2,
+                locked_at = NULL,
+                locked_by = NULL,
+                completed_at = CASE
+                    WHEN $3::float8 IS NOT NULL AND attempts < max_attempts THEN NULL
+                    ELSE NOW()
+                END
+            WHERE id = $1
+            RETURNING status
+        """, job_id, error_message, retry_delay_seconds)
+
+        return status == 'pending'
+
+    async def recover_stale(self, stale_after_seconds: float) -> List[Dict[str, Any]]:
+        """
+        Release jobs whose worker died mid-processing.
+
+        Jobs locked longer than ``stale_after_seconds`` are put back to pending
+        when attempts remain; otherwise they are marked failed and returned so
+        the caller can refund the area.
+
+        Args:
+            stale_after_seconds: Lock age after which a running job is considered abandoned
+
+        Returns:
+            Jobs that were permanently failed by this call
+        """
+        rows = await self.db.fetch("""
+            UPDATE generation_jobs
+            SET status = CASE WHEN attempts < max_attempts THEN 'pending' ELSE 'failed' END,
+                last_error = 'Worker lock expired',
+                locked_at = NULL,
+                locked_by = NULL,
+                completed_at = CASE WHEN attempts < max_attempts THEN NULL ELSE NOW() END
+            WHERE status = 'running'
+              AND locked_at < NOW() - make_interval(secs => $1::float8)
+            RETURNING id, generation_id, area_id, user_id, payload, attempts, max_attempts, status
+        """, stale_after_seconds)
+
+        if rows:
+            logger.warning(
+                "generation_jobs_recovered",
+                num_jobs=len(rows),
+                job_ids=[str(row['id']) for row in rows]
+            )
+
+        return [self._to_job(row) for row in rows if row['status'] == 'failed']
+
+    @staticmethod
+    def _to_job(row) -> Dict[str, Any]:
+        """Convert a job record to a dict with a decoded payload."""
+        job = dict(row)
+        payload = job.get('payload')
+        if isinstance(payload, str):
+            job['payload'] = json.loads(payload)
+        elif payload is None:
+            job['payload'] = {}
+        return job
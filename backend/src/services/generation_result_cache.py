@@ -0,0 +1,210 @@
+"""
+Content-addressed cache of generation results.
+
+Maps a request key (GeminiClient.result_cache_key: model, image size, built
+prompt and input image bytes) to the blob URLs already stored for that exact
+request, so rerunning the same address/area/style/preservation strength - or
+retrying a holiday decoration on the same panorama - reuses the stored image
+instead of paying for another Gemini call.
+
+Two tiers (TwoTierCache, shared with the geocode cache):
+- In-process LRU with TTL (per process)
+- Postgres generation_result_cache table (shared by every API node and worker)
+
+Only successful results are stored. Callers skip the lookup for "regenerate"
+requests and overwrite the entry with the new result.
+
+A hit hands out URLs written for another generation, so an entry never
+outlives the source generation's retention (trial results are not cached,
+token results for at most 7 days), and callers pass their storage service to
+have the URLs checked on a hit - an entry whose image is gone is evicted and
+treated as a miss.
+
+Requirements:
+- FR-055 to FR-070: Design generation
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from src.config import settings
+from src.db.connection_pool import DatabasePool, db_pool
+from src.services.storage_service import StorageService
+from src.services.two_tier_cache import TwoTierCache, decode_jsonb
+
+logger = structlog.get_logger(__name__)
+
+
+def _stored_urls(value: Any) -> List[str]:
+    """Every URL in a cached entry (values may be nested, e.g. social_card_urls)."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [url for item in value.values() for url in _stored_urls(item)]
+    return []
+
+
+class GenerationResultCache(TwoTierCache):
+    """Two-tier (memory LRU + Postgres) map of request keys to stored result URLs."""
+
+    name = "result_cache"
+
+    def __init__(
+        self,
+        db: Optional[DatabasePool] = None,
+        enabled: bool = True,
+        max_entries: int = 5000,
+        memory_ttl_seconds: float = 3600,
+        db_ttl_days: int = 30
+    ):
+        """
+        Args:
+            db: Database pool for the shared tier (None = memory only)
+            enabled: False turns every lookup into a miss and every store into a no-op
+            max_entries: Maximum request keys held in memory
+            memory_ttl_seconds: How long an entry stays valid in memory
+            db_ttl_days: How long an entry stays valid in Postgres
+        """
+        super().__init__(
+            db=db,
+            max_entries=max_entries,
+            memory_ttl_seconds=memory_ttl_seconds,
+            db_ttl_days=db_ttl_days
+        )
+        self.enabled = enabled
+        self.bypassed = 0
+        self.evicted = 0
+
+    async def get(
+        self,
+        key: str,
+        storage: Optional[StorageService] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up the stored result URLs for a request key.
+
+        Args:
+            key: Request key (GeminiClient.result_cache_key)
+            storage: When given, every URL of a hit is checked and an entry
+                with a missing image is evicted
+
+        Returns:
+            Dict of named URLs (e.g. {"image_url": ...}), or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        urls = await self._lookup(key)
+        if urls is None or storage is None:
+            return urls
+
+        try:
+            exists = await asyncio.gather(*(storage.image_exists(url) for url in _stored_urls(urls)))
+        except Exception as e:
+            # Can't tell whether the images are still there - don't hand them out
+            logger.warning(f"{self.name}_check_failed", error=str(e))
+            return None
+
+        if not all(exists):
+            await self.evict(key)
+            return None
+        return urls
+
+    async def set(
+        self,
+        key: str,
+        urls: Dict[str, Any],
+        model: str,
+        retention_days: Optional[int] = None
+    ) -> None:
+        """
+        Store the URLs of a successful result in both tiers.
+
+        Args:
+            key: Request key (GeminiClient.result_cache_key)
+            urls: Named URLs of the stored result
+            model: Model that produced the result
+            retention_days: How long the source generation keeps its images
+                (None = indefinitely, 0 = not kept, so nothing is cached);
+                caps the entry's expiry
+        """
+        if not self.enabled or retention_days == 0:
+            return
+
+        ttl_days = self.db_ttl_days if retention_days is None else min(self.db_ttl_days, retention_days)
+        await self._store(key, urls, model, ttl_days)
+
+    async def evict(self, key: str) -> None:
+        """Remove an entry from both tiers (e.g. its images were deleted)."""
+        self._entries.pop(key, None)
+        self.evicted += 1
+
+        if self.db is None:
+            return
+
+        try:
+            await self.db.execute("""
+                DELETE FROM generation_result_cache
+                WHERE request_key = $1
+            """, key)
+        except Exception as e:
+            logger.warning(f"{self.name}_write_failed", error=str(e))
+
+    def record_bypass(self) -> None:
+        """Count a lookup skipped because the user asked to regenerate."""
+        self.bypassed += 1
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset counters."""
+        super().clear()
+        self.bypassed = 0
+        self.evicted = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        return {
+            "enabled": self.enabled,
+            "bypassed": self.bypassed,
+            "evicted": self.evicted,
+            **super().get_stats()
+        }
+
+    async def _read_from_db(self, key: str) -> Optional[Dict[str, Any]]:
+        # A plain read - hit counts live in get_stats(), not in a row write per lookup
+        row = await self.db.fetchrow("""
+            SELECT urls
+            FROM generation_result_cache
+            WHERE request_key = $1
+              AND expires_at > NOW()
+        """, key)
+        if not row:
+            return None
+        return decode_jsonb(row['urls'])
+
+    async def _write_to_db(self, key: str, urls: Dict[str, Any], model: str, ttl_days: int) -> None:
+        await self.db.execute("""
+            INSERT INTO generation_result_cache (request_key, urls, model, expires_at)
+            VALUES ($1, $2::jsonb, $3, NOW() + make_interval(days => $4))
+            ON CONFLICT (request_key) DO UPDATE
+            SET urls = EXCLUDED.urls,
+                model = EXCLUDED.model,
+                expires_at = EXCLUDED.expires_at
+        """, key, json.dumps(urls), model, ttl_days)
+
+
+# Global instance
+generation_result_cache = GenerationResultCache(
+    db=db_pool,
+    enabled=settings.result_cache_enabled,
+    max_entries=settings.result_cache_max_entries,
+    memory_ttl_seconds=settings.result_cache_memory_ttl_seconds,
+    db_ttl_days=settings.result_cache_db_ttl_days
+)
+
+
+def get_generation_result_cache() -> GenerationResultCache:
+    """Get global generation result cache instance."""
+    return generation_result_cache
@@ -24,11 +24,15 @@ import io
 
 from src.db.connection_pool import DatabasePool
 from src.services.gemini_client import GeminiClient
-from src.services.storage_service import BlobStorageService
+from src.services.generation_result_cache import GenerationResultCache, get_generation_result_cache
+from src.services.storage_service import StorageService
 from src.services.trial_service import TrialService
 from src.services.token_service import TokenService
 from src.services.subscription_service import SubscriptionService
 from src.services.debug_service import get_debug_service
+from src.services.maps_service import GeocodeResult
+from src.services.resilience import CircuitOpenError
+from src.services.retention_policy import retention_days
 from src.models.generation import PaymentType
 
 
@@ -39,11 +43,12 @@ class GenerationService:
         self,
         db_pool: DatabasePool,
         gemini_client: GeminiClient,
-        storage_service: BlobStorageService,
+        storage_service: StorageService,
         trial_service: TrialService,
         token_service: TokenService,
         subscription_service: SubscriptionService,
-        maps_service = None
+        maps_service = None,
+        result_cache: Optional[GenerationResultCache] = None
     ):
         self.db = db_pool
         self.gemini = gemini_client
@@ -59,6 +64,8 @@ class GenerationService:
         else:
             self.maps_service = maps_service
 
+        self.result_cache = result_cache if result_cache is not None else get_generation_result_cache()
+
     async def authorize_and_deduct_payment(
         self,
         user_id: UUID,
@@ -90,70 +97,55 @@ class GenerationService:
             - payment_details: Dict with balance info (optional)
         """
         try:
-            # Step 1: Check for active subscription (highest priority)
-            subscription_status = await self.subscription_service.get_subscription_status(user_id)
-            if subscription_status and subscription_status.status == 'active':
-                # Active subscription - no deduction needed
-                return (
-                    True,
-                    PaymentType.SUBSCRIPTION,
-                    None,
-                    {'subscription_status': 'active', 'unlimited': True}
+            # Whole hierarchy + deduction in one round trip (migration 022)
+            result = await self.db.fetchrow("""
+                SELECT * FROM authorize_and_deduct($1, $2)
+            """, user_id, num_areas)
+
+            if not result:
+                return (False, None, "Payment authorization error: authorize_and_deduct returned no result", None)
+
+            if not result['success']:
+                error_message = (
+                    f"Insufficient credits/tokens for {num_areas} area(s). "
+                    f"Available: {result['trial_remaining']} trial credits, {result['token_balance']} tokens. "
+                    f"Purchase tokens or upgrade to Pro subscription for unlimited generations."
                 )
+                return (False, None, error_message, None)
 
-            # Step 2: Check trial credits (second priority)
-            trial_balance, _ = await self.trial_service.get_trial_balance(user_id)
-            if trial_balance >= num_areas:
-                # CRITICAL: Use batch deduction to prevent negative balances (BUGFIX-2025-11-10)
-                # Previous loop-based approach caused race conditions resulting in negative trial_remaining
-                success, new_balance = await self.trial_service.deduct_trials_batch(user_id, num_areas)
-                if not success:
-                    return (
-                        False,
-                        None,
-                        f"Trial credit deduction failed (insufficient balance: {trial_balance} < {num_areas})",
-                        None
-                    )
+            payment_method = PaymentType(result['payment_method'])
 
+            if payment_method == PaymentType.SUBSCRIPTION:
+                # Active subscription - no deduction needed
                 return (
                     True,
-                    PaymentType.TRIAL,
+                    payment_method,
                     None,
-                    {'trial_remaining': new_balance, 'deducted': num_areas}
+                    {'subscription_status': 'active', 'unlimited': True}
                 )
 
-            # Step 3: Check token balance (lowest priority)
-            token_balance, _, _ = await self.token_service.get_token_balance(user_id)
-            if token_balance >= num_areas:
-                # CRITICAL: Use batch deduction to prevent negative balances (BUGFIX-2025-11-10)
-                # Previous loop-based approach caused race conditions resulting in negative token balance
-                success, new_balance, auto_reload_info = await self.token_service.deduct_tokens_batch(user_id, num_areas)
-                if not success:
-                    return (
-                        False,
-                        None,
-                        f"Token deduction failed (insufficient balance: {token_balance} < {num_areas})",
-                        None
-                    )
-
+            if payment_method == PaymentType.TRIAL:
                 return (
                     True,
-                    PaymentType.TOKEN,
+                    payment_method,
                     None,
-                    {
-                        'tokens_remaining': new_balance,
-                        'deducted': num_areas,
-                        'auto_reload_triggered': auto_reload_info is not None
-                    }
+                    {'trial_remaining': result['trial_remaining'], 'deducted': num_areas}
                 )
 
-            # No payment method available
-            error_message = (
-                f"Insufficient credits/tokens for {num_areas} area(s). "
-                f"Available: {trial_balance} trial credits, {token_balance} tokens. "
-                f"Purchase tokens or upgrade to Pro subscription for unlimited generations."
+            # Check for auto-reload trigger AFTER the deduction has committed
+            auto_reload_info = await self.token_service.check_and_trigger_auto_reload(
+                user_id, result['token_balance']
+            )
+            return (
+                True,
+                payment_method,
+                None,
+                {
+                    'tokens_remaining': result['token_balance'],
+                    'deducted': num_areas,
+                    'auto_reload_triggered': auto_reload_info is not None
+                }
             )
-            return (False, None, error_message, None)
 
         except Exception as e:
             return (
@@ -172,8 +164,7 @@ class GenerationService:
             amount: Number of trial credits to refund
         """
         try:
-            for _ in range(amount):
-                await self.trial_service.refund_trial(user_id)
+            await self.trial_service.refund_trials_batch(user_id, amount)
         except Exception as e:
             print(f"Error refunding {amount} trial credits to user {user_id}: {e}")
 
@@ -186,10 +177,10 @@ class GenerationService:
             amount: Number of tokens to refund
         """
         try:
-            for _ in range(amount):
-                await self.db.execute("""
-                    SELECT * FROM add_tokens($1, 1, 'refund', 'Partial generation rollback', NULL)
-                """, user_id)
+            # One balance update and one ledger row for all areas
+            await self.db.execute("""
+                SELECT * FROM add_tokens($1, $2, 'refund', 'Partial generation rollback', NULL)
+            """, user_id, amount)
         except Exception as e:
             print(f"Error refunding {amount} tokens to user {user_id}: {e}")
 
@@ -198,6 +189,7 @@ class GenerationService:
         user_id: UUID,
         address: str,
         areas: List[Dict[str, Any]],
+        geocode_result: Optional[GeocodeResult] = None,
     ) -> Tuple[bool, Optional[UUID], Optional[str], Optional[Dict[str, Any]]]:
         """
         Create a new multi-area generation request with atomic payment deduction.
@@ -219,13 +211,15 @@ class GenerationService:
                 - style: DesignStyle enum value
                 - custom_prompt: Optional custom prompt
                 - preservation_strength: Optional float (0.0-1.0, default 0.5)
+            geocode_result: Geocode already obtained by the caller (avoids geocoding twice)
 
         Returns:
             Tuple of (success, generation_id, error_message, generation_data)
             - success: True if generation created and payment deducted
             - generation_id: UUID of created generation request
             - error_message: Error message if creation failed
-            - generation_data: Dict with generation details (status, payment_method, areas)
+            - generation_data: Dict with generation details (status, payment_method, areas,
+              and the PropertyImagery bundle under 'imagery')
         """
         try:
             num_areas = len(areas)
@@ -301,18 +295,21 @@ class GenerationService:
                     f'Validating address via Google Maps API: {address}'
                 )
 
-                # Always fetch Street View for the property (needed for front_yard)
-                # Each area's process_generation will determine which image type to use
-                street_view_bytes, metadata, _, image_source = await self.maps_service.get_property_images(
-                    address, 'front_yard'  # Always use front_yard to ensure Street View is fetched
+                # Geocode + Street View availability (FREE) once for the whole generation.
+                # Images are downloaded once by the generation worker and shared by every area.
+                imagery = await self.maps_service.build_property_imagery(
+                    address,
+                    geocode_result=geocode_result,
+                    fetch_images=False
                 )
+                metadata = imagery.street_view_metadata if imagery.has_street_view else None
 
-                # Log: Street View retrieved successfully
+                # Log: Street View located successfully
                 debug_service.log(
                     generation_id,
                     'street_view_retrieved',
                     'success',
-                    f'Street View image retrieved successfully (pano_id: {metadata.pano_id if metadata else "unknown"})'
+                    f'Street View imagery located (pano_id: {metadata.pano_id if metadata else "unknown"})'
                 )
 
                 # Store source image metadata in generation_source_images table
@@ -328,7 +325,7 @@ class GenerationService:
                         ) VALUES ($1, $2, $3, $4, $5, NOW())
                     """,
                         generation_id,
-                        image_source,  # 'google_street_view'
+                        'street_view',
                         'pending_upload',  # Placeholder until blob upload
                         metadata.pano_id,
                         0.007  # $0.007 per Street View image
@@ -381,7 +378,7 @@ class GenerationService:
                 'payment_details': payment_details,
                 'area_ids': [str(aid) for aid in area_ids],
                 'created_at': datetime.utcnow().isoformat(),
-                'street_view_bytes': street_view_bytes  # Include for background processing
+                'imagery': imagery  # Shared by every area in the generation worker
             }
 
             return (True, generation_id, None, generation_data)
@@ -407,13 +404,16 @@ class GenerationService:
         style: str,
         custom_prompt: Optional[str],
         payment_method: str,
-        preservation_strength: float = 0.5
+        preservation_strength: float = 0.5,
+        regenerate: bool = False
     ) -> Tuple[bool, Optional[str]]:
         """
         Process complete generation workflow for a single area.
 
         This is the main orchestration method called asynchronously after
-        the generation record is created.
+        the generation record is created. An identical earlier request
+        (same input image and built prompt) reuses its stored image from the
+        result cache instead of calling Gemini, unless regenerate is set.
 
         Args:
             generation_id: Generation UUID
@@ -426,9 +426,15 @@ class GenerationService:
             custom_prompt: Optional custom instructions
             payment_method: Payment method used ('subscription', 'trial', 'token')
             preservation_strength: Control transformation intensity (0.0-1.0, default 0.5)
+            regenerate: Skip the result cache and always call Gemini
 
         Returns:
             Tuple of (success, error_message)
+
+        Raises:
+            CircuitOpenError: Gemini's circuit breaker is open. The area is
+                left unfinished so the caller can fail and refund every area
+                rejected by the outage together (fail_areas)
         """
         try:
             # Update area status to 'processing'
@@ -441,80 +447,123 @@ class GenerationService:
                 WHERE id = $1
             """, area_id)
 
-            # Generate landscape design with Gemini
+            # First area to start moves the generation to 'processing'
+            await self.db.execute("""
+                UPDATE generations
+                SET status = 'processing',
+                    start_processing_at = COALESCE(start_processing_at, NOW())
+                WHERE id = $1 AND status = 'pending'
+            """, generation_id)
+
             start_time = datetime.utcnow()
             debug_service = get_debug_service()
 
-            # Log: Starting Gemini API call
-            debug_service.log(
-                generation_id,
-                'gemini_api_call',
-                'info',
-                f'Starting Gemini image generation for {area_type}'
+            cache_key = self.gemini.result_cache_key(
+                input_image=input_image_bytes,
+                address=address,
+                area_type=area_type,
+                style=style,
+                custom_prompt=custom_prompt,
+                preservation_strength=preservation_strength
             )
+            output_url = None
+            if regenerate:
+                self.result_cache.record_bypass()
+            else:
+                cached = await self.result_cache.get(cache_key, storage=self.storage)
+                if cached:
+                    output_url = cached['image_url']
+                    debug_service.log(
+                        generation_id,
+                        'result_cache_hit',
+                        'success',
+                        f'Reused stored design for identical {area_type} request'
+                    )
 
-            try:
-                # Generate landscape design with Gemini
-                output_image_bytes = await self.gemini.generate_landscape_design(
-                    input_image=input_image_bytes,
-                    address=address,
-                    area_type=area_type,
-                    style=style,
-                    custom_prompt=custom_prompt,
-                    preservation_strength=preservation_strength
-                )
-
-                # Log: Gemini generation successful
-                debug_service.log(
-                    generation_id,
-                    'image_generation_complete',
-                    'success',
-                    f'Successfully generated image for {area_type}'
-                )
-
-            except Exception as gemini_error:
-                # Log: Gemini API failed
+            # Cache miss (or regenerate): generate with Gemini and upload
+            if output_url is None:
+                # Log: Starting Gemini API call
                 debug_service.log(
                     generation_id,
                     'gemini_api_call',
-                    'error',
-                    f'Gemini API failed: {str(gemini_error)}'
+                    'info',
+                    f'Starting Gemini image generation for {area_type}'
                 )
 
-                # Gemini API failed - refund payment
-                await self._handle_failure(
-                    generation_id,
-                    area_id,
-                    user_id,
-                    payment_method,
-                    f"Gemini API error: {str(gemini_error)}"
-                )
-                return False, str(gemini_error)
+                try:
+                    # Generate landscape design with Gemini
+                    output_image_bytes = await self.gemini.generate_landscape_design(
+                        input_image=input_image_bytes,
+                        address=address,
+                        area_type=area_type,
+                        style=style,
+                        custom_prompt=custom_prompt,
+                        preservation_strength=preservation_strength
+                    )
 
-            # Update progress
-            await self.db.execute("""
-                UPDATE generation_areas
-                SET progress = 50
-                WHERE id = $1
-            """, area_id)
+                    # Log: Gemini generation successful
+                    debug_service.log(
+                        generation_id,
+                        'image_generation_complete',
+                        'success',
+                        f'Successfully generated image for {area_type}'
+                    )
 
-            # Upload output image to Vercel Blob
-            try:
-                filename = f"generation_{generation_id}_{area_type}.jpg"
-                output_url = await self.storage.upload_image(
-                    image_data=output_image_bytes,
-                    filename=filename
-                )
-            except Exception as storage_error:
-                # Storage upload failed - refund payment
-                await self._handle_failure(
-                    generation_id,
-                    area_id,
-                    user_id,
-                    payment_method,
-                    f"Storage upload error: {str(storage_error)}"
+                except CircuitOpenError:
+                    # Gemini outage - refunded in bulk by the caller
+                    raise
+
+                except Exception as gemini_error:
+                    # Log: Gemini API failed
+                    debug_service.log(
+                        generation_id,
+                        'gemini_api_call',
+                        'error',
+                        f'Gemini API failed: {str(gemini_error)}'
+                    )
+
+                    # Gemini API failed - refund payment
+                    await self._handle_failure(
+                        generation_id,
+                        area_id,
+                        user_id,
+                        payment_method,
+                        f"Gemini API error: {str(gemini_error)}"
+                    )
+                    return False, str(gemini_error)
+
+                # Update progress
+                await self.db.execute("""
+                    UPDATE generation_areas
+                    SET progress = 50
+                    WHERE id = $1
+                """, area_id)
+
+                # Upload output image to Vercel Blob
+                try:
+                    filename = f"generation_{generation_id}_{area_type}.jpg"
+                    output_url = await self.storage.upload_image(
+                        image_data=output_image_bytes,
+                        filename=filename
+                    )
+                except Exception as storage_error:
+                    # Storage upload failed - refund payment
+                    await self._handle_failure(
+                        generation_id,
+                        area_id,
+                        user_id,
+                        payment_method,
+                        f"Storage upload error: {str(storage_error)}"
+                    )
+                    return False, str(storage_error)
+
+                # The entry hands this image to other users - it must not outlive it
+                await self.result_cache.set(
+                    cache_key,
+                    {'image_url': output_url},
+                    model=self.gemini.model_name,
+                    retention_days=retention_days(payment_method)
                 )
-                return False, str(storage_error)
 
             # Mark generation as completed
             await self.db.execute("""
@@ -526,12 +575,8 @@ class GenerationService:
                 WHERE id = $1
             """, area_id, output_url)
 
-            await self.db.execute("""
-                UPDATE generations
-                SET status = 'completed',
-                    completed_at = NOW()
-                WHERE id = $1
-            """, generation_id)
+            # Other areas may still be running - only finalize once all are done
+            await self._update_generation_status(generation_id)
 
             # Log: Image displayed to user
             debug_service.log(
@@ -541,87 +586,162 @@ class GenerationService:
                 f'Generated landscape design image displayed to user'
             )
 
-            # DEDUCT PAYMENT NOW THAT IMAGE IS SUCCESSFULLY SAVED
-            # This ensures we only charge users for successful generations
-            success, deduction_error = await self._deduct_payment(
-                user_id,
-                payment_method,
-                1  # 1 area processed
-            )
-
-            if not success:
-                print(f"Payment deduction failed for generation {generation_id}: {deduction_error}")
-                # Continue anyway - generation succeeded even if payment deduction has issues
-            else:
-                print(f"Payment deducted for generation {generation_id}")
-
-            print(f"Generation {generation_id} completed successfully")
             return True, None
 
+        except CircuitOpenError:
+            raise
+
         except Exception as e:
             # Unexpected error - refund payment
             await self._handle_failure(
                 generation_id,
-                None,
+                area_id,
                 user_id,
                 payment_method,
                 f"Unexpected error: {str(e)}"
             )
             return False, str(e)
 
-    async def _deduct_payment(
+    async def _update_generation_status(
         self,
+        generation_id: UUID,
+        error_message: Optional[str] = None,
+        conn=None
+    ) -> None:
+        """
+        Roll area statuses up into the generation status once every area is done.
+
+        Areas run concurrently, so the generation is finalized by whichever area
+        finishes last:
+        - all areas completed -> 'completed'
+        - all areas failed -> 'failed'
+        - mix of both -> 'partial_failed'
+
+        Args:
+            generation_id: Generation UUID
+            error_message: Error message to store if any area failed
+            conn: Connection to run on (inside the caller's transaction);
+                defaults to the pool
+        """
+        await (conn or self.db).execute("""
+            UPDATE generations
+            SET status = CASE
+                    WHEN areas.completed_count = areas.total_count THEN 'completed'
+                    WHEN areas.failed_count = areas.total_count THEN 'failed'
+                    ELSE 'partial_failed'
+                END,
+                error_message = CASE
+                    WHEN areas.failed_count > 0 THEN COALESCE($2, generations.error_message)
+                    ELSE generations.error_message
+                END,
+                completed_at = NOW()
+            FROM (
+                SELECT
+                    COUNT(*) AS total_count,
+                    COUNT(*) FILTER (WHERE status = 'completed') AS completed_count,
+                    COUNT(*) FILTER (WHERE status = 'failed') AS failed_count
+                FROM generation_areas
+                WHERE generation_id = $1
+            ) AS areas
+            WHERE generations.id = $1
+              AND areas.total_count > 0
+              AND areas.completed_count + areas.failed_count = areas.total_count
+        """, generation_id, error_message)
+
+    async def fail_area(
+        self,
+        generation_id: UUID,
+        area_id: UUID,
         user_id: UUID,
         payment_method: str,
-        num_areas: int = 1
-    ) -> Tuple[bool, Optional[str]]:
+        error_message: str
+    ) -> None:
         """
-        Deduct payment for successful generation.
+        Mark a generation area as failed and refund its payment.
 
-        This is called AFTER the image is successfully generated and saved.
-        This ensures we only charge users for successful generations.
-
-        Requirements:
-        - FR-034: No deduction for active subscriptions (unlimited)
-        - FR-013: Atomic trial deduction
-        - FR-026: Atomic token deduction with row-level locking
+        Used by the generation worker when an area cannot be processed at all
+        (timeout, imagery unavailable, job attempts exhausted).
 
         Args:
+            generation_id: Generation UUID
+            area_id: Generation area UUID
             user_id: User UUID
-            payment_method: Payment method ('subscription', 'trial', 'token')
-            num_areas: Number of areas processed (default 1)
-
-        Returns:
-            Tuple of (success, error_message)
+            payment_method: Payment method to refund
+            error_message: Error message to store
         """
-        try:
-            if payment_method == 'subscription':
-                # No deduction needed - subscription provides unlimited
-                return True, None
-
-            elif payment_method == 'trial':
-                # Deduct trial credit atomically
-                success, remaining = await self.trial_service.deduct_trial(user_id)
-                if not success:
-                    return False, "Trial credit deduction failed"
-                return True, None
+        await self._handle_failure(
+            generation_id,
+            area_id,
+            user_id,
+            payment_method,
+            error_message
+        )
 
-            elif payment_method == 'token':
-                # Deduct token(s) atomically
-                result = await self.db.fetchrow("""
-                    SELECT * FROM subtract_tokens($1, $2, 'generation', 'Landscape generation completed')
-                """, user_id, num_areas)
+    async def fail_areas(
+        self,
+        failures: List[Dict[str, Any]],
+        error_message: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Mark many generation areas as failed and refund them in bulk.
 
-                if not result or not result.get('success'):
-                    return False, "Token deduction failed"
+        For mass failures (a provider outage, a crashed worker's backlog, a
+        generation that could not be queued): one transaction with one UPDATE
+        for all areas, one status roll-up per generation, and one
+        refund_credits_bulk() call for every user instead of a transaction
+        per area.
 
-                return True, None
+        Args:
+            failures: Dicts with 'generation_id', 'area_id', 'user_id' and
+                'payment_method' (one per failed area)
+            error_message: Error message to store on every area
 
-            else:
-                return False, f"Unknown payment method: {payment_method}"
+        Returns:
+            Refund rows (user_id, credit_type, refunded, new_balance)
+        """
+        if not failures:
+            return []
+
+        # One transaction: areas are never left failed without their refund
+        async with self.db.acquire() as conn:
+            async with conn.transaction():
+                # Areas already completed or failed (and refunded) are left alone: a
+                # job recovered after its area finished must not be refunded again
+                failed_rows = await conn.fetch("""
+                    UPDATE generation_areas
+                    SET status = 'failed',
+                        error_message = $2
+                    WHERE id = ANY($1::uuid[])
+                      AND status NOT IN ('completed', 'failed')
+                    RETURNING id
+                """, [failure['area_id'] for failure in failures], error_message)
+                failed_ids = {row['id'] for row in failed_rows}
+                failures = [failure for failure in failures if failure['area_id'] in failed_ids]
+                if not failures:
+                    return []
+
+                for generation_id in dict.fromkeys(failure['generation_id'] for failure in failures):
+                    await self._update_generation_status(generation_id, error_message, conn=conn)
+
+                # Subscriptions deduct nothing, so there is nothing to refund
+                refunds = [
+                    failure for failure in failures
+                    if failure['payment_method'] in ('trial', 'token')
+                ]
+                if not refunds:
+                    return []
+
+                rows = await conn.fetch("""
+                    SELECT * FROM refund_credits_bulk($1::uuid[], $2::text[], $3::int[], $4)
+                """,
+                    [failure['user_id'] for failure in refunds],
+                    [failure['payment_method'] for failure in refunds],
+                    [1] * len(refunds),
+                    'Generation failed - refund'
+                )
 
-        except Exception as e:
-            return False, str(e)
+        print(f"Bulk refunded {len(refunds)} failed area(s) for {len(rows)} user balance(s)")
+        return [dict(row) for row in rows]
 
     async def _handle_failure(
         self,
@@ -646,24 +766,33 @@ class GenerationService:
             error_message: Error message to store
         """
         try:
-            # Update generation status to 'failed'
-            await self.db.execute("""
-                UPDATE generations
-                SET status = 'failed',
-                    error_message = $2,
-                    completed_at = NOW()
-                WHERE id = $1
-            """, generation_id, error_message)
-
-            # Update area status if area was created
             if area_id:
-                await self.db.execute("""
+                # Fail only this area; sibling areas keep running
+                failed_id = await self.db.fetchval("""
                     UPDATE generation_areas
                     SET status = 'failed',
                         error_message = $2
                     WHERE id = $1
+                      AND status NOT IN ('completed', 'failed')
+                    RETURNING id
                 """, area_id, error_message)
 
+                if failed_id is None:
+                    # Already completed, or failed and refunded
+                    print(f"Area {area_id} already finished - not failing or refunding it again")
+                    return
+
+                await self._update_generation_status(generation_id, error_message)
+            else:
+                # Update generation status to 'failed'
+                await self.db.execute("""
+                    UPDATE generations
+                    SET status = 'failed',
+                        error_message = $2,
+                        completed_at = NOW()
+                    WHERE id = $1
+                """, generation_id, error_message)
+
             # Refund payment
             if payment_method == 'subscription':
                 # No refund needed - subscription doesn't deduct anything
@@ -878,7 +1007,7 @@ _generation_service_instance = None
 async def get_generation_service(
     db_pool: DatabasePool = None,
     gemini_client: GeminiClient = None,
-    storage_service: BlobStorageService = None,
+    storage_service: StorageService = None,
     trial_service: TrialService = None,
     token_service: TokenService = None,
     subscription_service: SubscriptionService = None
@@ -901,17 +1030,20 @@ async def get_generation_service(
             db_pool = default_pool
 
         if gemini_client is None:
-            gemini_client = GeminiClient()
+            from src.services.gemini_client import get_gemini_client
+            gemini_client = get_gemini_client()
 
         if storage_service is None:
-            storage_service = BlobStorageService()
+            from src.services.storage_service import get_storage_service
+            storage_service = get_storage_service()
 
         if trial_service is None:
             from src.services.trial_service import get_trial_service
             trial_service = await get_trial_service(db_pool)
 
         if token_service is None:
-            token_service = TokenService(db_pool)
+            from src.services.token_service import get_token_service
+            token_service = get_token_service()
 
         if subscription_service is None:
             subscription_service = SubscriptionService(db_pool)
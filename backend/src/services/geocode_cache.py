@@ -0,0 +1,125 @@
+"""
+Geocode cache for Google Maps Geocoding API results.
+
+Two tiers sit in front of MapsService.geocode_address():
+- In-process LRU with TTL (microsecond hits, per process)
+- Postgres geocode_cache table (shared by every API node and worker)
+
+Keys are normalized addresses, so "123 Main St." and "123  main st" share an
+entry. Only successful lookups are cached; invalid addresses always go to
+Google so a later fix on their side is picked up.
+
+Requirements:
+- FR-012: Address geocoding for property imagery
+"""
+
+import json
+import re
+import unicodedata
+from dataclasses import asdict
+from typing import Any, Dict, Optional
+
+from src.config import settings
+from src.db.connection_pool import DatabasePool, db_pool
+from src.services.two_tier_cache import TwoTierCache, decode_jsonb
+
+
+def normalize_address(address: str) -> str:
+    """
+    Normalize an address into a cache key.
+
+    Unicode-normalizes, lowercases, drops punctuation that does not change the
+    location (periods, commas, '#') and collapses whitespace.
+    """
+    key = unicodedata.normalize("NFKC", address).lower()
+    key = re.sub(r"[.,#]", " ", key)
+    return " ".join(key.split())
+
+
+class GeocodeCache(TwoTierCache):
+    """Two-tier (memory LRU + Postgres) cache of GeocodeResults keyed by normalized address."""
+
+    name = "geocode_cache"
+
+    def __init__(
+        self,
+        db: Optional[DatabasePool] = None,
+        max_entries: int = 10000,
+        memory_ttl_seconds: float = 86400,
+        db_ttl_days: int = 30
+    ):
+        """
+        Args:
+            db: Database pool for the shared tier (None = memory only)
+            max_entries: Maximum addresses held in memory
+            memory_ttl_seconds: How long an entry stays valid in memory
+            db_ttl_days: How long an entry stays valid in Postgres
+        """
+        super().__init__(
+            db=db,
+            max_entries=max_entries,
+            memory_ttl_seconds=memory_ttl_seconds,
+            db_ttl_days=db_ttl_days
+        )
+
+    async def get(self, address: str):
+        """
+        Look up a cached GeocodeResult for an address.
+
+        Returns:
+            GeocodeResult, or None on a miss
+        """
+        return await self._lookup(normalize_address(address))
+
+    async def set(self, address: str, result) -> None:
+        """Store a successful GeocodeResult in both tiers."""
+        await self._store(normalize_address(address), result)
+
+    async def _read_from_db(self, key: str):
+        row = await self.db.fetchrow("""
+            SELECT result
+            FROM geocode_cache
+            WHERE address_key = $1
+              AND expires_at > NOW()
+        """, key)
+        if not row:
+            return None
+        return _geocode_result_from_dict(decode_jsonb(row['result']))
+
+    async def _write_to_db(self, key: str, result) -> None:
+        await self.db.execute("""
+            INSERT INTO geocode_cache (address_key, result, expires_at)
+            VALUES ($1, $2::jsonb, NOW() + make_interval(days => $3))
+            ON CONFLICT (address_key) DO UPDATE
+            SET result = EXCLUDED.result,
+                expires_at = EXCLUDED.expires_at
+        """, key, json.dumps(asdict(result)), self.db_ttl_days)
+
+
+def _geocode_result_from_dict(data: Dict[str, Any]):
+    """Rebuild a GeocodeResult from its asdict() form."""
+    # Imported here to avoid a circular import with maps_service
+    from src.services.maps_service import Coordinates, GeocodeResult
+
+    return GeocodeResult(
+        coordinates=Coordinates(**data["coordinates"]),
+        location_type=data["location_type"],
+        formatted_address=data["formatted_address"],
+        address_components=data.get("address_components", []),
+        place_id=data.get("place_id", ""),
+        has_street_number=data.get("has_street_number", False)
+    )
+
+
+# Global instance
+geocode_cache = GeocodeCache(
+    db=db_pool,
+    max_entries=settings.geocode_cache_max_entries,
+    memory_ttl_seconds=settings.geocode_cache_memory_ttl_seconds,
+    db_ttl_days=settings.geocode_cache_db_ttl_days
+)
+
+
+def get_geocode_cache() -> GeocodeCache:
+    """Get global geocode cache instance."""
+    return geocode_cache
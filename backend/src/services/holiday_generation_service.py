@@ -9,7 +9,7 @@ Workflow:
 3. Geocode address
 4. Fetch Street View image with user-selected heading
 5. Generate decorated image via Gemini
-6. Create before/after comparison image
+6. Create before/after comparison image and social share cards
 7. Upload results to storage
 8. Save generation record
 9. Refund credit if generation fails
@@ -19,9 +19,10 @@ User Story 1: New User Discovery & First Generation
 """
 
 import asyncio
+import json
 import logging
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID, uuid4
 
 from ..db.connection_pool import DatabasePool
@@ -29,8 +30,9 @@ from ..services.holiday_credit_service import HolidayCreditService
 from ..services.token_service import TokenService
 from ..services.maps_service import MapsService
 from ..services.gemini_client import GeminiClient
-from ..services.storage_service import BlobStorageService
-from ..lib.imageComposition import create_before_after_image
+from ..services.storage_service import StorageService
+from ..services.generation_result_cache import GenerationResultCache, get_generation_result_cache
+from ..services.social_card_service import SocialCardService
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +57,8 @@ class HolidayGenerationService:
         token_service: TokenService,
         maps_service: MapsService,
         gemini_client: GeminiClient,
-        storage_service: BlobStorageService,
+        storage_service: StorageService,
+        result_cache: Optional[GenerationResultCache] = None,
     ):
         """
         Initialize holiday generation service.
@@ -66,7 +69,8 @@ class HolidayGenerationService:
             token_service: Token service for fallback credit deductions
             maps_service: Google Maps service for geocoding/Street View
             gemini_client: Gemini AI client for image generation
-            storage_service: Vercel Blob storage service
+            storage_service: Image storage backend
+            result_cache: Stored results of identical requests (process-wide cache if not provided)
         """
         self.db = db_pool
         self.credit_service = credit_service
@@ -74,6 +78,8 @@ class HolidayGenerationService:
         self.maps_service = maps_service
         self.gemini = gemini_client
         self.storage = storage_service
+        self.result_cache = result_cache if result_cache is not None else get_generation_result_cache()
+        self.social_cards = SocialCardService(db_pool, storage_service)
 
     # ========================================================================
     # Main Generation Workflow
@@ -86,6 +92,7 @@ class HolidayGenerationService:
         heading: int,
         pitch: int,
         style: str,
+        regenerate: bool = False,
     ) -> Tuple[UUID, str]:
         """
         Create holiday decoration generation.
@@ -99,6 +106,7 @@ class HolidayGenerationService:
             heading: Street View heading (0-359 degrees, user-selected)
             pitch: Street View pitch (-90 to 90, default 0)
             style: Decoration style ('classic', 'modern', 'over_the_top')
+            regenerate: Skip the result cache and always call Gemini
 
         Returns:
             Tuple of (generation_id, status_message)
@@ -123,37 +131,32 @@ class HolidayGenerationService:
             # CRITICAL: Deduct first to prevent free generations on failure
             # Credit hierarchy: Holiday credits -> Token credits -> Fail
 
-            credit_type_used = None  # Track which credit type was used for refunds
+            # Holiday credit or token deducted in one round trip (migration 022)
+            deduction = await self.db.fetchrow(
+                "SELECT * FROM authorize_and_deduct($1, 1, TRUE)",
+                user_id
+            )
 
-            # Try holiday credits first
-            deduction_result = await self.credit_service.deduct_credit(user_id)
+            if not deduction or not deduction["success"]:
+                # Both credit types insufficient
+                raise ValueError(
+                    f"Insufficient credits. "
+                    f"Holiday credits: {deduction['holiday_credits'] if deduction else 0}, "
+                    f"Token balance: {deduction['token_balance'] if deduction else 0}"
+                )
 
-            if deduction_result.success:
-                credit_type_used = "holiday"
+            credit_type_used = deduction["payment_method"]  # Track which credit type was used for refunds
+            if credit_type_used == "holiday":
                 logger.info(
                     f"Holiday credit deducted for generation {generation_id}. "
-                    f"Remaining: {deduction_result.credits_remaining}"
+                    f"Remaining: {deduction['holiday_credits']}"
                 )
             else:
-                # Holiday credits insufficient, try token credits as fallback
-                logger.info(f"Holiday credits insufficient for user {user_id}, trying token credits")
-
-                token_result = await self.token_service.deduct_token_atomic(user_id)
-                success, token_balance, _ = token_result
-
-                if success:
-                    credit_type_used = "token"
-                    logger.info(
-                        f"Token credit deducted for holiday generation {generation_id}. "
-                        f"Token balance: {token_balance}"
-                    )
-                else:
-                    # Both credit types insufficient
-                    raise ValueError(
-                        f"Insufficient credits. "
-                        f"Holiday credits: {deduction_result.credits_remaining}, "
-                        f"Token balance: {token_balance}"
-                    )
+                logger.info(
+                    f"Token credit deducted for holiday generation {generation_id}. "
+                    f"Token balance: {deduction['token_balance']}"
+                )
+                await self.token_service.check_and_trigger_auto_reload(user_id, deduction["token_balance"])
 
             # Step 2: Geocode address with accuracy validation
             geocode_result = await self.maps_service.geocode_address(address)
@@ -245,6 +248,7 @@ class HolidayGenerationService:
                     original_image_url=original_image_url,
                     credit_type_used=credit_type_used,
                     is_easter_egg=is_easter_egg,
+                    regenerate=regenerate,
                 )
             )
 
@@ -268,12 +272,15 @@ class HolidayGenerationService:
         original_image_url: str,
         credit_type_used: str,
         is_easter_egg: bool = False,
+        regenerate: bool = False,
     ):
         """
         Generate decorated image via Gemini AI.
 
         Runs asynchronously after generation record is created.
         Updates status to 'processing' -> 'completed' or 'failed'.
+        A retry with the same panorama and style reuses the stored decorated
+        and before/after images from the result cache (unless regenerate).
 
         Args:
             generation_id: Generation UUID
@@ -283,6 +290,7 @@ class HolidayGenerationService:
             original_image_url: URL of original image
             credit_type_used: Type of credit used ('holiday' or 'token') for refunds
             is_easter_egg: Whether this is a special 25th+ generation easter egg
+            regenerate: Skip the result cache and always call Gemini
         """
         try:
             # Update status to processing
@@ -295,32 +303,57 @@ class HolidayGenerationService:
                 generation_id
             )
 
-            # Call Gemini AI to generate decorated image
-            # TODO: Implement actual Gemini prompt for holiday decoration
-            # For now, use placeholder
-            decorated_image_bytes = await self._call_gemini_for_decoration(
-                street_view_bytes,
-                style,
-                is_easter_egg=is_easter_egg
-            )
-
-            # Upload decorated image
-            decorated_image_url = await self.storage.upload_image(
-                image_data=decorated_image_bytes,
-                filename=f"holiday/{generation_id}/decorated.jpg"
+            cache_key = self.gemini.result_cache_key(
+                input_image=street_view_bytes,
+                **self._decoration_request(style, is_easter_egg=is_easter_egg)
             )
+            cached = None
+            if regenerate:
+                self.result_cache.record_bypass()
+            else:
+                cached = await self.result_cache.get(cache_key, storage=self.storage)
 
-            # Create before/after comparison image
-            before_after_bytes = await create_before_after_image(
-                before_image_bytes=street_view_bytes,
-                after_image_bytes=decorated_image_bytes
-            )
+            if cached:
+                logger.info(f"Generation {generation_id} reused a stored decoration (result cache hit)")
+                decorated_image_url = cached["decorated_image_url"]
+                before_after_url = cached["before_after_image_url"]
+                social_card_urls = cached.get("social_card_urls")
+            else:
+                # Call Gemini AI to generate decorated image
+                # TODO: Implement actual Gemini prompt for holiday decoration
+                # For now, use placeholder
+                decorated_image_bytes = await self._call_gemini_for_decoration(
+                    street_view_bytes,
+                    style,
+                    is_easter_egg=is_easter_egg
+                )
 
-            # Upload before/after image
-            before_after_url = await self.storage.upload_image(
-                image_data=before_after_bytes,
-                filename=f"holiday/{generation_id}/before-after.jpg"
-            )
+                # Upload decorated image while the before/after image and the
+                # social cards are rendered (one decode pass) and uploaded
+                decorated_image_url, social_card_urls = await asyncio.gather(
+                    self.storage.upload_image(
+                        image_data=decorated_image_bytes,
+                        filename=f"holiday/{generation_id}/decorated.jpg"
+                    ),
+                    self.social_cards.render_and_upload(
+                        generation_id,
+                        before_image_bytes=street_view_bytes,
+                        after_image_bytes=decorated_image_bytes
+                    )
+                )
+                before_after_url = social_card_urls.pop("before_after")
+
+                # The original image comes back when Gemini fails - never cache that
+                if decorated_image_bytes is not street_view_bytes:
+                    await self.result_cache.set(
+                        cache_key,
+                        {
+                            "decorated_image_url": decorated_image_url,
+                            "before_after_image_url": before_after_url,
+                            "social_card_urls": social_card_urls,
+                        },
+                        model=self.gemini.model_name
+                    )
 
             # Update generation record with results
             await self.db.execute(
@@ -330,12 +363,14 @@ class HolidayGenerationService:
                     status = 'completed',
                     decorated_image_url = $2,
                     before_after_image_url = $3,
+                    social_card_urls = $4::jsonb,
                     updated_at = NOW()
                 WHERE id = $1
                 """,
                 generation_id,
                 decorated_image_url,
-                before_after_url
+                before_after_url,
+                json.dumps(social_card_urls) if social_card_urls else None
             )
 
             logger.info(f"Generation {generation_id} completed successfully")
@@ -375,6 +410,79 @@ class HolidayGenerationService:
 
             logger.info(f"Refunded 1 credit to user {user_id} due to generation failure")
 
+    def _decoration_request(self, style: str, is_easter_egg: bool = False) -> Dict[str, Any]:
+        """
+        Build the generate_landscape_design arguments for a holiday decoration.
+
+        Shared by the Gemini call and the result cache key, so a retry on the
+        same panorama and style maps to the same cached result.
+
+        Args:
+            style: Decoration style ('classic', 'modern_minimalist', 'over_the_top')
+            is_easter_egg: Whether to include Labubu Santa easter egg
+
+        Returns:
+            Keyword arguments for GeminiClient.generate_landscape_design (minus input_image)
+        """
+        # Map style to custom prompt
+        style_prompts = {
+            "classic": (
+                "Classic traditional holiday decorations: "
+                "Red and green color scheme, wreaths on doors and windows, "
+                "warm white string lights along roofline and eaves, "
+                "traditional ornaments, garland on railings, "
+                "candy canes along walkway, classic red bow accents."
+            ),
+            "modern_minimalist": (
+                "Modern minimalist holiday decorations: "
+                "White and silver color palette, geometric light patterns, "
+                "minimal clean-lined LED lighting, elegant simple wreath, "
+                "understated sophistication, contemporary style."
+            ),
+            "over_the_top": (
+                "Maximum festive decorations (Clark Griswold style): "
+                "Colorful synchronized lights covering entire house, "
+                "inflatable Santa and reindeer on lawn, "
+                "animated light displays, massive light-up snowman, "
+                "candy cane path lining, projector effects, "
+                "every surface covered in lights and decorations."
+            )
+        }
+
+        custom_prompt = style_prompts.get(style, style_prompts["classic"])
+
+        # Easter egg: Every 25th generation gets a special Labubu Santa!
+        easter_egg_suffix = ""
+        if is_easter_egg:
+            easter_egg_suffix = (
+                "\n\n🎉 SPECIAL EASTER EGG:\n"
+                "Add a cute Labubu Santa character figure to the scene! "
+                "Labubu is a cute Pop Mart collectible character with a distinctive look. "
+                "Add it prominently on the lawn or porch, dressed as Santa Claus with a red suit and white fur trim. "
+                "Make it eye-catching and whimsical as a special easter egg for this lucky generation!"
+            )
+
+        # CRITICAL: preservation_strength=0.35 for VISIBLE decorations (0.0-0.4 = dramatic transformation)
+        # With 0.8+ the AI only does subtle refinement and decorations won't be visible!
+        return dict(
+            address=None,  # Not needed, we have the image
+            area_type="front_yard",
+            style="holiday_decorator",
+            custom_prompt=(
+                f"{custom_prompt}\n\n"
+                f"CRITICAL INSTRUCTIONS:\n"
+                f"1. Add VISIBLE, PROMINENT holiday decorations to the house exterior\n"
+                f"2. Make the decorations OBVIOUS and clearly visible in the image\n"
+                f"3. Keep the original house structure, walls, roof, and basic architecture intact\n"
+                f"4. Only modify the appearance by ADDING decorations on top of existing elements\n"
+                f"5. Do NOT remove or change structural elements - only ADD festive decorations\n"
+                f"6. Ensure decorations are bright, colorful, and eye-catching\n"
+                f"7. The decorated version should look dramatically more festive while keeping the same house"
+                f"{easter_egg_suffix}"
+            ),
+            preservation_strength=0.35  # Dramatic transformation (0.0-0.4 range) for VISIBLE decorations
+        )
+
     async def _call_gemini_for_decoration(
         self,
         image_bytes: bytes,
@@ -398,68 +506,16 @@ class HolidayGenerationService:
             Decorated image bytes (JPEG)
         """
         try:
-            # Map style to custom prompt
-            style_prompts = {
-                "classic": (
-                    "Classic traditional holiday decorations: "
-                    "Red and green color scheme, wreaths on doors and windows, "
-                    "warm white string lights along roofline and eaves, "
-                    "traditional ornaments, garland on railings, "
-                    "candy canes along walkway, classic red bow accents."
-                ),
-                "modern_minimalist": (
-                    "Modern minimalist holiday decorations: "
-                    "White and silver color palette, geometric light patterns, "
-                    "minimal clean-lined LED lighting, elegant simple wreath, "
-                    "understated sophistication, contemporary style."
-                ),
-                "over_the_top": (
-                    "Maximum festive decorations (Clark Griswold style): "
-                    "Colorful synchronized lights covering entire house, "
-                    "inflatable Santa and reindeer on lawn, "
-                    "animated light displays, massive light-up snowman, "
-                    "candy cane path lining, projector effects, "
-                    "every surface covered in lights and decorations."
-                )
-            }
-
-            custom_prompt = style_prompts.get(style, style_prompts["classic"])
-
-            # Easter egg: Every 25th generation gets a special Labubu Santa!
-            easter_egg_suffix = ""
+            request = self._decoration_request(style, is_easter_egg=is_easter_egg)
             if is_easter_egg:
                 logger.info("🎉 SPECIAL: This is a lucky 25th generation! Adding Labubu Santa easter egg!")
-                easter_egg_suffix = (
-                    "\n\n🎉 SPECIAL EASTER EGG:\n"
-                    "Add a cute Labubu Santa character figure to the scene! "
-                    "Labubu is a cute Pop Mart collectible character with a distinctive look. "
-                    "Add it prominently on the lawn or porch, dressed as Santa Claus with a red suit and white fur trim. "
-                    "Make it eye-catching and whimsical as a special easter egg for this lucky generation!"
-                )
 
             logger.info(f"Calling Gemini for holiday decoration with style: {style}")
 
             # Use Gemini to generate decorated version
-            # CRITICAL: preservation_strength=0.35 for VISIBLE decorations (0.0-0.4 = dramatic transformation)
-            # With 0.8+ the AI only does subtle refinement and decorations won't be visible!
             decorated_bytes = await self.gemini.generate_landscape_design(
                 input_image=image_bytes,
-                address=None,  # Not needed, we have the image
-                area_type="front_yard",
-                style="holiday_decorator",
-                custom_prompt=(
-                    f"{custom_prompt}\n\n"
-                    f"CRITICAL INSTRUCTIONS:\n"
-                    f"1. Add VISIBLE, PROMINENT holiday decorations to the house exterior\n"
-                    f"2. Make the decorations OBVIOUS and clearly visible in the image\n"
-                    f"3. Keep the original house structure, walls, roof, and basic architecture intact\n"
-                    f"4. Only modify the appearance by ADDING decorations on top of existing elements\n"
-                    f"5. Do NOT remove or change structural elements - only ADD festive decorations\n"
-                    f"6. Ensure decorations are bright, colorful, and eye-catching\n"
-                    f"7. The decorated version should look dramatically more festive while keeping the same house"
-                    f"{easter_egg_suffix}"
-                ),
-                preservation_strength=0.35  # Dramatic transformation (0.0-0.4 range) for VISIBLE decorations
+                **request
             )
 
             logger.info("Successfully generated holiday-decorated image")
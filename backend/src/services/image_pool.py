@@ -0,0 +1,215 @@
+"""
+Off-event-loop image processing.
+
+Pillow decode / resize / composite / encode work takes hundreds of
+milliseconds per image; run on the event loop it stalls every other request
+in the process. ImageWorkerPool runs such functions in a bounded executor:
+
+- "process" (default): a ProcessPoolExecutor, so CPU work scales across cores
+  and never competes with the event loop for the GIL
+- "thread": a ThreadPoolExecutor (Pillow releases the GIL in its C loops),
+  cheaper to start and useful where child processes are not allowed
+
+At most workers + max_queue jobs are handed to the executor; further callers
+wait (backpressure) instead of piling unbounded work and memory into the
+executor's internal queue. Queue wait, worker time and throughput are kept
+for monitoring.
+
+Functions passed to run() must be module-level (picklable) and take and
+return picklable values (bytes, str, numbers).
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+import structlog
+
+from src.config import settings
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Window for the jobs-per-second figure
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+
+def _timed(fn: Callable[..., T], *args: Any) -> Tuple[T, float]:
+    """Run fn in the worker and report how long it took there."""
+    started_at = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started_at
+
+
+class ImageWorkerPool:
+    """Bounded executor with backpressure for CPU-bound image work."""
+
+    def __init__(
+        self,
+        name: str = "image",
+        workers: int = 2,
+        max_queue: int = 16,
+        use_processes: bool = True
+    ):
+        """
+        Args:
+            name: Label for logs and stats
+            workers: Worker processes (or threads)
+            max_queue: Jobs accepted beyond the busy workers before callers wait
+            use_processes: ProcessPoolExecutor if True, ThreadPoolExecutor otherwise
+        """
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._initializer: Optional[Callable[[], None]] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._completed_at: Deque[float] = deque()
+        self.in_flight = 0
+        self.waiting = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.restarts = 0
+        self.queue_wait_seconds = 0.0
+        self.worker_seconds = 0.0
+
+    def start(self, initializer: Optional[Callable[[], None]] = None) -> None:
+        """
+        Create the executor (app startup). Called lazily by run() otherwise.
+
+        Args:
+            initializer: Module-level function run once in each worker
+                (e.g. loading fonts), so the first job does not pay for it
+        """
+        if self._executor is not None:
+            return
+        if initializer is not None:
+            self._initializer = initializer
+
+        if self.use_processes:
+            # spawn: children must not inherit the parent's event loop, sockets or threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self._initializer
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix=f"{self.name}-worker",
+                initializer=self._initializer
+            )
+        logger.info(
+            "image_pool_started",
+            pool=self.name,
+            workers=self.workers,
+            max_queue=self.max_queue,
+            executor="process" if self.use_processes else "thread"
+        )
+
+    async def close(self) -> None:
+        """Stop the executor, dropping queued jobs (app shutdown)."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``fn(*args)`` in the pool and return its result.
+
+        Waits for a slot when workers + max_queue jobs are already submitted.
+
+        Raises:
+            Whatever fn raises
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers + self.max_queue)
+
+        queued_at = time.monotonic()
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        self.queue_wait_seconds += time.monotonic() - queued_at
+
+        self.in_flight += 1
+        self.submitted += 1
+        executor = None
+        try:
+            self.start()
+            executor = self._executor
+            loop = asyncio.get_running_loop()
+            result, elapsed = await loop.run_in_executor(executor, _timed, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM kill); replace the pool so later jobs still run.
+            # Other jobs of the same broken pool fail too - only the first one to get
+            # here resets it, so a fresh pool started meanwhile is left alone.
+            self.failed += 1
+            if executor is not None and self._executor is executor:
+                self._executor = None
+                self.restarts += 1
+                logger.error("image_pool_broken", pool=self.name)
+                await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+            raise
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+        self.completed += 1
+        self.worker_seconds += elapsed
+        now = time.monotonic()
+        self._completed_at.append(now)
+        self._prune(now)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        self._prune(time.monotonic())
+        return {
+            "name": self.name,
+            "executor": "process" if self.use_processes else "thread",
+            "running": self._executor is not None,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "restarts": self.restarts,
+            "avg_queue_wait_ms": round(1000 * self.queue_wait_seconds / self.submitted, 1) if self.submitted else 0.0,
+            "avg_worker_ms": round(1000 * self.worker_seconds / self.completed, 1) if self.completed else 0.0,
+            "jobs_per_second": round(len(self._completed_at) / THROUGHPUT_WINDOW_SECONDS, 3),
+            "busy_workers": min(self.in_flight, self.workers)
+        }
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - THROUGHPUT_WINDOW_SECONDS
+        while self._completed_at and self._completed_at[0] < cutoff:
+            self._completed_at.popleft()
+
+
+# Global instance
+image_pool = ImageWorkerPool(
+    name="image",
+    workers=settings.image_pool_workers or min(4, os.cpu_count() or 1),
+    max_queue=settings.image_pool_max_queue,
+    use_processes=settings.image_pool_executor == "process"
+)
+
+
+def get_image_pool() -> ImageWorkerPool:
+    """Get global image worker pool instance."""
+    return image_pool
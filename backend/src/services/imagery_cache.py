@@ -0,0 +1,203 @@
+"""
+Local disk cache for Google Maps imagery.
+
+Content-addressed store used by MapsService so repeat views of a property
+never hit Google again within the TTL:
+- Street View metadata keyed by rounded coordinates + search radius
+- Street View images keyed by (pano_id, heading, pitch, size, fov)
+- Satellite images keyed by (rounded center, zoom, size, maptype)
+
+Entries are files named by the SHA-256 of their key. The store is bounded by
+total size (least recently used entries are evicted first) and by age.
+File I/O runs in a thread so cache reads never block the event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from src.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# 5 decimal places ~= 1.1 m, well inside Street View's 50 m search radius
+COORDINATE_PRECISION = 5
+
+
+def coordinate_key(lat: float, lng: float) -> str:
+    """Round coordinates so the same house always maps to the same key."""
+    return f"{round(lat, COORDINATE_PRECISION):.{COORDINATE_PRECISION}f},{round(lng, COORDINATE_PRECISION):.{COORDINATE_PRECISION}f}"
+
+
+class ImageryCache:
+    """Size-bounded, TTL-expiring disk store for Maps API responses."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = 500 * 1024 * 1024,
+        ttl_seconds: float = 86400
+    ):
+        """
+        Args:
+            directory: Directory for cache files (system temp dir if not provided)
+            max_bytes: Maximum total size of cached files
+            ttl_seconds: Maximum age of a cached entry
+        """
+        self.directory = Path(directory or os.path.join(tempfile.gettempdir(), "yarda-maps-cache"))
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # filename -> (size_bytes, written_at); ordered least -> most recently used
+        self._index: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def get_bytes(self, namespace: str, *key_parts: Any) -> Optional[bytes]:
+        """Return cached bytes for a key, or None on a miss."""
+        name = self._filename(namespace, key_parts)
+
+        async with self._lock:
+            await self._ensure_loaded()
+            entry = self._index.get(name)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            size, written_at = entry
+            if time.time() - written_at > self.ttl_seconds:
+                self._forget(name)
+                await asyncio.to_thread(self._unlink, name)
+                self.misses += 1
+                return None
+
+            self._index.move_to_end(name)
+
+        try:
+            data = await asyncio.to_thread((self.directory / name).read_bytes)
+        except OSError:
+            async with self._lock:
+                self._forget(name)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    async def set_bytes(self, namespace: str, *key_parts: Any, data: bytes) -> None:
+        """Store bytes for a key, evicting least recently used entries to stay under max_bytes."""
+        name = self._filename(namespace, key_parts)
+
+        try:
+            async with self._lock:
+                await self._ensure_loaded()
+                await asyncio.to_thread(self._write, name, data)
+                self._forget(name)
+                self._index[name] = (len(data), time.time())
+                self._total_bytes += len(data)
+
+                evicted = []
+                while self._total_bytes > self.max_bytes and len(self._index) > 1:
+                    oldest = next(iter(self._index))
+                    self._forget(oldest)
+                    evicted.append(oldest)
+                if evicted:
+                    await asyncio.to_thread(self._unlink, *evicted)
+        except OSError as e:
+            # The cache is an optimization - never fail a fetch because of it
+            logger.warning("imagery_cache_write_failed", namespace=namespace, error=str(e))
+
+    async def get_json(self, namespace: str, *key_parts: Any) -> Optional[Dict[str, Any]]:
+        """Return a cached JSON document for a key, or None on a miss."""
+        data = await self.get_bytes(namespace, *key_parts)
+        return json.loads(data) if data is not None else None
+
+    async def set_json(self, namespace: str, *key_parts: Any, value: Dict[str, Any]) -> None:
+        """Store a JSON document for a key."""
+        await self.set_bytes(namespace, *key_parts, data=json.dumps(value).encode())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and store size for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._index),
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes
+        }
+
+    def _filename(self, namespace: str, key_parts: Tuple[Any, ...]) -> str:
+        key = json.dumps([namespace, *key_parts], separators=(",", ":"))
+        return f"{namespace}-{hashlib.sha256(key.encode()).hexdigest()}"
+
+    def _forget(self, name: str) -> None:
+        entry = self._index.pop(name, None)
+        if entry is not None:
+            self._total_bytes -= entry[0]
+
+    async def _ensure_loaded(self) -> None:
+        """Index files left by earlier processes (oldest first) on first use."""
+        if self._loaded:
+            return
+        entries = await asyncio.to_thread(self._scan)
+        for name, size, written_at in entries:
+            self._index[name] = (size, written_at)
+            self._total_bytes += size
+        self._loaded = True
+
+    def _scan(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for path in self.directory.iterdir():
+            if path.name.startswith(".") or not path.is_file():
+                continue
+            stat = path.stat()
+            entries.append((path.name, stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda entry: entry[2])
+        return entries
+
+    def _write(self, name: str, data: bytes) -> None:
+        # Write-then-rename so readers (and other processes) never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.directory / name)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _unlink(self, *names: str) -> None:
+        for name in names:
+            try:
+                (self.directory / name).unlink()
+            except FileNotFoundError:
+                pass
+
+
+# Global instance
+imagery_cache = ImageryCache(
+    directory=settings.maps_imagery_cache_dir or None,
+    max_bytes=settings.maps_imagery_cache_max_mb * 1024 * 1024,
+    ttl_seconds=settings.maps_imagery_cache_ttl_seconds
+)
+
+
+def get_imagery_cache() -> ImageryCache:
+    """Get global imagery cache instance."""
+    return imagery_cache
@@ -7,11 +7,16 @@ Purpose: Integration with Google Maps Platform APIs for property image retrieval
 import asyncio
 import os
 import math
-from typing import Optional, Tuple
-from dataclasses import dataclass
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, Optional, Set, Tuple
+from dataclasses import asdict, dataclass, field
 import aiohttp
 import structlog
 
+from src.services.geocode_cache import GeocodeCache, get_geocode_cache, normalize_address
+from src.services.imagery_cache import ImageryCache, coordinate_key, get_imagery_cache
+from src.services.single_flight import SingleFlight
+
 logger = structlog.get_logger(__name__)
 
 
@@ -42,6 +47,136 @@ class StreetViewMetadata:
     location: Optional[Coordinates] = None
 
 
+@dataclass
+class PropertyImagery:
+    """
+    Geocode, Street View availability and images for one property.
+
+    Built once per generation and passed through the pipeline so the address is
+    geocoded, Street View checked and each image downloaded a single time no
+    matter how many areas are generated. Image bytes are not part of
+    to_payload(), so the location half can travel in a job payload and the
+    images be fetched by the worker that needs them.
+    """
+    address: str
+    geocode: GeocodeResult
+    street_view_metadata: Optional[StreetViewMetadata] = None
+    street_view_bytes: Optional[bytes] = None
+    satellite_bytes: Optional[bytes] = None
+    fetched_sources: Set[str] = field(default_factory=set)  # "street_view" / "satellite" already attempted
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def coordinates(self) -> Coordinates:
+        return self.geocode.coordinates
+
+    @property
+    def has_street_view(self) -> bool:
+        return self.street_view_metadata is not None and self.street_view_metadata.status == "OK"
+
+    @property
+    def images_fetched(self) -> bool:
+        return {"street_view", "satellite"} <= self.fetched_sources
+
+    def primary_source(self, area: str) -> str:
+        """Image source an area should try first: Street View for front yard (if available), else satellite."""
+        if area == "front_yard" and self.has_street_view:
+            return "street_view"
+        return "satellite"
+
+    def image_for_area(self, area: str) -> Tuple[bytes, str]:
+        """
+        Pick the input image for an area from the fetched images.
+
+        Front yard prefers Street View; other areas (backyard, walkway,
+        side_yard) prefer satellite. Each falls back to the other.
+
+        Args:
+            area: Landscape area type
+
+        Returns:
+            Tuple of (image_bytes, image_source)
+
+        Raises:
+            MapsServiceError: If neither image is available
+        """
+        if area == "front_yard":
+            if self.street_view_bytes:
+                return self.street_view_bytes, "street_view"
+            if self.satellite_bytes:
+                logger.warning(
+                    "street_view_unavailable_fallback_to_satellite",
+                    address=self.address,
+                    area=area
+                )
+                return self.satellite_bytes, "google_satellite"
+        else:
+            if self.satellite_bytes:
+                return self.satellite_bytes, "google_satellite"
+            if self.street_view_bytes:
+                logger.warning(
+                    "satellite_unavailable_fallback_to_street_view",
+                    address=self.address,
+                    area=area
+                )
+                return self.street_view_bytes, "street_view"
+
+        raise MapsServiceError(
+            "no_imagery_available",
+            f"No imagery available for address: {self.address}. "
+            "Please try a different address or upload a photo manually."
+        )
+
+    def to_payload(self) -> dict:
+        """Serialize geocode and Street View metadata (not image bytes) to a JSON-safe dict."""
+        metadata = self.street_view_metadata
+        return {
+            "address": self.address,
+            "lat": self.geocode.coordinates.lat,
+            "lng": self.geocode.coordinates.lng,
+            "location_type": self.geocode.location_type,
+            "formatted_address": self.geocode.formatted_address,
+            "place_id": self.geocode.place_id,
+            "has_street_number": self.geocode.has_street_number,
+            "street_view": {
+                "status": metadata.status,
+                "pano_id": metadata.pano_id,
+                "date": metadata.date,
+                "camera_lat": metadata.location.lat if metadata.location else None,
+                "camera_lng": metadata.location.lng if metadata.location else None,
+            } if metadata else None,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "PropertyImagery":
+        """Rebuild a PropertyImagery (without image bytes) from to_payload() output."""
+        street_view = payload.get("street_view")
+        metadata = None
+        if street_view:
+            camera = None
+            if street_view.get("camera_lat") is not None and street_view.get("camera_lng") is not None:
+                camera = Coordinates(lat=street_view["camera_lat"], lng=street_view["camera_lng"])
+            metadata = StreetViewMetadata(
+                status=street_view["status"],
+                pano_id=street_view.get("pano_id"),
+                date=street_view.get("date"),
+                location=camera
+            )
+
+        return cls(
+            address=payload["address"],
+            geocode=GeocodeResult(
+                coordinates=Coordinates(lat=payload["lat"], lng=payload["lng"]),
+                location_type=payload.get("location_type", "UNKNOWN"),
+                formatted_address=payload.get("formatted_address", ""),
+                address_components=[],
+                place_id=payload.get("place_id", ""),
+                has_street_number=payload.get("has_street_number", False)
+            ),
+            street_view_metadata=metadata
+        )
+
+
 class MapsServiceError(Exception):
     """Base exception for Maps Service errors"""
     def __init__(self, error_type: str, message: str, retry_after: Optional[int] = None):
@@ -128,18 +263,129 @@ class MapsService:
     STREET_VIEW_IMAGE_URL = "https://maps.googleapis.com/maps/api/streetview"
     STATIC_MAP_URL = "https://maps.googleapis.com/maps/api/staticmap"
 
-    def __init__(self, api_key: Optional[str] = None):
+    REQUEST_TIMEOUT_SECONDS = 30
+
+    # Process-wide pooled session shared by every MapsService instance.
+    # Opened in the app lifespan (src/main.py) and the worker (src/worker.py).
+    _session: Optional[aiohttp.ClientSession] = None
+
+    # Concurrent cache misses for the same address/view share one API call
+    _flights = SingleFlight("maps")
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        geocode_cache: Optional[GeocodeCache] = None,
+        imagery_cache: Optional[ImageryCache] = None
+    ):
         """
         Initialize MapsService with Google Maps API key.
 
         Args:
             api_key: Google Maps Platform API key (from environment variable if not provided)
+            geocode_cache: Cache for geocode results (process-wide cache if not provided)
+            imagery_cache: Disk cache for Street View metadata and images (process-wide cache if not provided)
         """
         self.api_key = api_key or os.getenv("GOOGLE_MAPS_API_KEY")
         if not self.api_key:
             raise ValueError("GOOGLE_MAPS_API_KEY environment variable not set")
+        self.geocode_cache = geocode_cache if geocode_cache is not None else get_geocode_cache()
+        self.imagery_cache = imagery_cache if imagery_cache is not None else get_imagery_cache()
+
+    @classmethod
+    async def open_session(
+        cls,
+        limit: int = 100,
+        limit_per_host: int = 50,
+        dns_cache_ttl_seconds: int = 300,
+        keepalive_timeout_seconds: float = 30.0
+    ) -> None:
+        """
+        Open the shared HTTP session used for all Google Maps API calls.
+
+        Connections to maps.googleapis.com are kept alive and reused, so calls
+        after the first skip TCP + TLS setup and DNS lookups.
+
+        Args:
+            limit: Maximum open connections in total
+            limit_per_host: Maximum open connections per host
+            dns_cache_ttl_seconds: How long resolved addresses are cached
+            keepalive_timeout_seconds: How long idle connections are kept open
+        """
+        if cls._session is not None and not cls._session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=dns_cache_ttl_seconds,
+            keepalive_timeout=keepalive_timeout_seconds
+        )
+        cls._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=cls.REQUEST_TIMEOUT_SECONDS)
+        )
+        logger.info(
+            "maps_http_session_opened",
+            limit=limit,
+            limit_per_host=limit_per_host,
+            dns_cache_ttl_seconds=dns_cache_ttl_seconds
+        )
+
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared HTTP session (app shutdown)."""
+        if cls._session is not None:
+            await cls._session.close()
+            cls._session = None
+            logger.info("maps_http_session_closed")
+
+    @asynccontextmanager
+    async def _get(self, url: str, params: dict) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        GET a Google Maps API URL over the shared session.
+
+        Falls back to a one-off session when the shared one is not open
+        (scripts and tests that never run the app lifespan).
+        """
+        session = MapsService._session
+        if session is not None and not session.closed:
+            async with session.get(url, params=params) as response:
+                yield response
+            return
+
+        timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT_SECONDS)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(url, params=params) as response:
+                yield response
 
     async def geocode_address(self, address: str) -> Optional[GeocodeResult]:
+        """
+        Convert address to coordinates, serving repeat addresses from the geocode cache.
+
+        Args:
+            address: Full street address
+
+        Returns:
+            GeocodeResult with coordinates and accuracy metadata, or None if address invalid
+
+        Raises:
+            MapsServiceError: If API quota exceeded or network error
+        """
+        cached = await self.geocode_cache.get(address)
+        if cached is not None:
+            logger.info("geocode_cache_hit", address=address)
+            return cached
+
+        async def fetch() -> Optional[GeocodeResult]:
+            result = await self._geocode_address_uncached(address)
+            if result is not None:
+                await self.geocode_cache.set(address, result)
+            return result
+
+        return await self._flights.do(("geocode", normalize_address(address)), fetch)
+
+    async def _geocode_address_uncached(self, address: str) -> Optional[GeocodeResult]:
         """
         Convert address to coordinates using Geocoding API with accuracy validation.
 
@@ -163,118 +409,116 @@ class MapsService:
                 "key": self.api_key
             }
 
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(self.GEOCODING_URL, params=params) as response:
-                    duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
-                    data = await response.json()
+            async with self._get(self.GEOCODING_URL, params) as response:
+                duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+                data = await response.json()
 
-                    status = data.get("status")
+                status = data.get("status")
 
-                    # Log API call
+                # Log API call
+                logger.info(
+                    "google_maps_api_call",
+                    api="geocoding",
+                    address=address,
+                    status=status,
+                    duration_ms=duration_ms
+                )
+
+                # Handle different status codes
+                if status == "OK":
+                    results = data.get("results", [])
+                    if not results:
+                        return None
+
+                    # CRITICAL FIX: Prefer ROOFTOP results for building-level precision
+                    # Try to find ROOFTOP result first (most accurate)
+                    rooftop_result = None
+                    for result in results:
+                        location_type = result.get("geometry", {}).get("location_type")
+                        if location_type == "ROOFTOP":
+                            rooftop_result = result
+                            break
+
+                    # Use ROOFTOP if available, otherwise fall back to first result
+                    best_result = rooftop_result if rooftop_result else results[0]
+
+                    # Extract location and metadata
+                    location = best_result["geometry"]["location"]
+                    location_type = best_result["geometry"].get("location_type", "UNKNOWN")
+                    formatted_address = best_result.get("formatted_address", "")
+                    address_components = best_result.get("address_components", [])
+                    place_id = best_result.get("place_id", "")
+
+                    # Validate address components
+                    validation = validate_address_components(address_components)
+
+                    # Log accuracy level for monitoring
                     logger.info(
-                        "google_maps_api_call",
-                        api="geocoding",
+                        "geocoding_accuracy",
                         address=address,
-                        status=status,
-                        duration_ms=duration_ms
+                        location_type=location_type,
+                        has_street_number=validation["has_street_number"],
+                        formatted_address=formatted_address,
+                        result_count=len(results),
+                        rooftop_available=rooftop_result is not None
                     )
 
-                    # Handle different status codes
-                    if status == "OK":
-                        results = data.get("results", [])
-                        if not results:
-                            return None
-
-                        # CRITICAL FIX: Prefer ROOFTOP results for building-level precision
-                        # Try to find ROOFTOP result first (most accurate)
-                        rooftop_result = None
-                        for result in results:
-                            location_type = result.get("geometry", {}).get("location_type")
-                            if location_type == "ROOFTOP":
-                                rooftop_result = result
-                                break
-
-                        # Use ROOFTOP if available, otherwise fall back to first result
-                        best_result = rooftop_result if rooftop_result else results[0]
-
-                        # Extract location and metadata
-                        location = best_result["geometry"]["location"]
-                        location_type = best_result["geometry"].get("location_type", "UNKNOWN")
-                        formatted_address = best_result.get("formatted_address", "")
-                        address_components = best_result.get("address_components", [])
-                        place_id = best_result.get("place_id", "")
-
-                        # Validate address components
-                        validation = validate_address_components(address_components)
-
-                        # Log accuracy level for monitoring
-                        logger.info(
-                            "geocoding_accuracy",
+                    # Warn if accuracy is poor
+                    if location_type in ["APPROXIMATE", "GEOMETRIC_CENTER"]:
+                        logger.warning(
+                            "geocoding_low_accuracy",
                             address=address,
                             location_type=location_type,
                             has_street_number=validation["has_street_number"],
-                            formatted_address=formatted_address,
-                            result_count=len(results),
-                            rooftop_available=rooftop_result is not None
+                            message="Low geocoding accuracy - Street View may show wrong house"
                         )
 
-                        # Warn if accuracy is poor
-                        if location_type in ["APPROXIMATE", "GEOMETRIC_CENTER"]:
-                            logger.warning(
-                                "geocoding_low_accuracy",
-                                address=address,
-                                location_type=location_type,
-                                has_street_number=validation["has_street_number"],
-                                message="Low geocoding accuracy - Street View may show wrong house"
-                            )
-
-                        # Warn if street number is missing
-                        if not validation["has_street_number"]:
-                            logger.warning(
-                                "missing_street_number",
-                                address=address,
-                                location_type=location_type,
-                                formatted_address=formatted_address,
-                                message="Street number not found in geocoding result"
-                            )
-
-                        return GeocodeResult(
-                            coordinates=Coordinates(lat=location["lat"], lng=location["lng"]),
+                    # Warn if street number is missing
+                    if not validation["has_street_number"]:
+                        logger.warning(
+                            "missing_street_number",
+                            address=address,
                             location_type=location_type,
                             formatted_address=formatted_address,
-                            address_components=address_components,
-                            place_id=place_id,
-                            has_street_number=validation["has_street_number"]
+                            message="Street number not found in geocoding result"
                         )
 
-                    elif status == "ZERO_RESULTS":
-                        return None
+                    return GeocodeResult(
+                        coordinates=Coordinates(lat=location["lat"], lng=location["lng"]),
+                        location_type=location_type,
+                        formatted_address=formatted_address,
+                        address_components=address_components,
+                        place_id=place_id,
+                        has_street_number=validation["has_street_number"]
+                    )
 
-                    elif status == "OVER_QUERY_LIMIT":
-                        raise MapsServiceError(
-                            error_type="QUOTA_EXCEEDED",
-                            message="Google Maps API quota exceeded",
-                            retry_after=60
-                        )
+                elif status == "ZERO_RESULTS":
+                    return None
 
-                    elif status == "REQUEST_DENIED":
-                        raise MapsServiceError(
-                            error_type="API_ERROR",
-                            message=f"API request denied: {data.get('error_message', 'Invalid API key or API not enabled')}"
-                        )
+                elif status == "OVER_QUERY_LIMIT":
+                    raise MapsServiceError(
+                        error_type="QUOTA_EXCEEDED",
+                        message="Google Maps API quota exceeded",
+                        retry_after=60
+                    )
 
-                    elif status == "INVALID_REQUEST":
-                        raise MapsServiceError(
-                            error_type="API_ERROR",
-                            message=f"Invalid request: {data.get('error_message', 'Missing or malformed parameters')}"
-                        )
+                elif status == "REQUEST_DENIED":
+                    raise MapsServiceError(
+                        error_type="API_ERROR",
+                        message=f"API request denied: {data.get('error_message', 'Invalid API key or API not enabled')}"
+                    )
 
-                    else:
-                        raise MapsServiceError(
-                            error_type="API_ERROR",
-                            message=f"Unexpected status: {status}"
-                        )
+                elif status == "INVALID_REQUEST":
+                    raise MapsServiceError(
+                        error_type="API_ERROR",
+                        message=f"Invalid request: {data.get('error_message', 'Missing or malformed parameters')}"
+                    )
+
+                else:
+                    raise MapsServiceError(
+                        error_type="API_ERROR",
+                        message=f"Unexpected status: {status}"
+                    )
 
         except aiohttp.ClientError as e:
             logger.error("google_maps_api_error", api="geocoding", error=str(e))
@@ -295,6 +539,43 @@ class MapsService:
         self,
         coords: Coordinates,
         radius: int = 50
+    ) -> StreetViewMetadata:
+        """
+        Check if Street View imagery is available, cached by rounded coordinates.
+
+        Args:
+            coords: Property coordinates
+            radius: Search radius in meters (default 50, recommend 50-100)
+
+        Returns:
+            StreetViewMetadata with status and panorama info
+
+        Raises:
+            MapsServiceError: If API quota exceeded or network error
+        """
+        cache_key = ("street_view_metadata", coordinate_key(coords.lat, coords.lng), radius)
+        cached = await self.imagery_cache.get_json(*cache_key)
+        if cached is not None:
+            location = cached.get("location")
+            return StreetViewMetadata(
+                status=cached["status"],
+                pano_id=cached.get("pano_id"),
+                date=cached.get("date"),
+                location=Coordinates(**location) if location else None
+            )
+
+        async def fetch() -> StreetViewMetadata:
+            metadata = await self._get_street_view_metadata_uncached(coords, radius)
+            if metadata.status in ("OK", "ZERO_RESULTS", "NOT_FOUND"):
+                await self.imagery_cache.set_json(*cache_key, value=asdict(metadata))
+            return metadata
+
+        return await self._flights.do(cache_key, fetch)
+
+    async def _get_street_view_metadata_uncached(
+        self,
+        coords: Coordinates,
+        radius: int = 50
     ) -> StreetViewMetadata:
         """
         Check if Street View imagery is available (FREE request).
@@ -321,63 +602,61 @@ class MapsService:
                 "key": self.api_key
             }
 
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(self.STREET_VIEW_METADATA_URL, params=params) as response:
-                    duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
-                    data = await response.json()
+            async with self._get(self.STREET_VIEW_METADATA_URL, params) as response:
+                duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+                data = await response.json()
 
-                    status = data.get("status")
+                status = data.get("status")
 
-                    # Log API call (FREE request)
-                    logger.info(
-                        "google_maps_api_call",
-                        api="street_view_metadata",
-                        lat=coords.lat,
-                        lng=coords.lng,
-                        radius=radius,
-                        status=status,
-                        duration_ms=duration_ms,
-                        cost="FREE"
-                    )
+                # Log API call (FREE request)
+                logger.info(
+                    "google_maps_api_call",
+                    api="street_view_metadata",
+                    lat=coords.lat,
+                    lng=coords.lng,
+                    radius=radius,
+                    status=status,
+                    duration_ms=duration_ms,
+                    cost="FREE"
+                )
 
-                    # Handle different status codes
-                    if status == "OK":
-                        location_data = data.get("location", {})
-
-                        # Only create Coordinates if API returned actual camera position data
-                        # that differs from the target coordinates
-                        camera_location = None
-                        if location_data:
-                            camera_lat = location_data.get("lat")
-                            camera_lng = location_data.get("lng")
-                            if camera_lat is not None and camera_lng is not None:
-                                # Check if camera position is different from target
-                                if camera_lat != coords.lat or camera_lng != coords.lng:
-                                    camera_location = Coordinates(lat=camera_lat, lng=camera_lng)
-
-                        return StreetViewMetadata(
-                            status="OK",
-                            pano_id=data.get("pano_id"),
-                            date=data.get("date"),
-                            location=camera_location
-                        )
+                # Handle different status codes
+                if status == "OK":
+                    location_data = data.get("location", {})
+
+                    # Only create Coordinates if API returned actual camera position data
+                    # that differs from the target coordinates
+                    camera_location = None
+                    if location_data:
+                        camera_lat = location_data.get("lat")
+                        camera_lng = location_data.get("lng")
+                        if camera_lat is not None and camera_lng is not None:
+                            # Check if camera position is different from target
+                            if camera_lat != coords.lat or camera_lng != coords.lng:
+                                camera_location = Coordinates(lat=camera_lat, lng=camera_lng)
+
+                    return StreetViewMetadata(
+                        status="OK",
+                        pano_id=data.get("pano_id"),
+                        date=data.get("date"),
+                        location=camera_location
+                    )
 
-                    elif status == "ZERO_RESULTS":
-                        return StreetViewMetadata(status="ZERO_RESULTS")
+                elif status == "ZERO_RESULTS":
+                    return StreetViewMetadata(status="ZERO_RESULTS")
 
-                    elif status == "NOT_FOUND":
-                        return StreetViewMetadata(status="NOT_FOUND")
+                elif status == "NOT_FOUND":
+                    return StreetViewMetadata(status="NOT_FOUND")
 
-                    elif status == "OVER_QUERY_LIMIT":
-                        raise MapsServiceError(
-                            error_type="QUOTA_EXCEEDED",
-                            message="Street View metadata API quota exceeded",
-                            retry_after=60
-                        )
+                elif status == "OVER_QUERY_LIMIT":
+                    raise MapsServiceError(
+                        error_type="QUOTA_EXCEEDED",
+                        message="Street View metadata API quota exceeded",
+                        retry_after=60
+                    )
 
-                    else:
-                        return StreetViewMetadata(status="ERROR")
+                else:
+                    return StreetViewMetadata(status="ERROR")
 
         except aiohttp.ClientError as e:
             logger.error("google_maps_api_error", api="street_view_metadata", error=str(e))
@@ -400,7 +679,52 @@ class MapsService:
         size: str = "600x400",
         fov: int = 90,
         heading: int = 0,
-        pitch: int = 0
+        pitch: int = 0,
+        pano_id: Optional[str] = None
+    ) -> Optional[bytes]:
+        """
+        Fetch Street View image, served from the imagery cache when this view was fetched before.
+
+        Images are keyed by (pano_id, heading, pitch, size, fov); without a
+        pano_id the rounded coordinates stand in for the panorama.
+
+        Args:
+            coords: Property coordinates
+            size: Image dimensions "WIDTHxHEIGHT" (max 640x640)
+            fov: Horizontal field of view 0-120 degrees (default 90)
+            heading: Compass direction 0-360 (0=N, 90=E, 180=S, 270=W)
+            pitch: Vertical angle -90 to 90 (0=straight, positive=up, negative=down)
+            pano_id: Panorama ID from get_street_view_metadata() (requests that exact panorama)
+
+        Returns:
+            Image bytes (JPEG), or None if not available
+
+        Raises:
+            MapsServiceError: If API quota exceeded or network error
+        """
+        panorama = pano_id or coordinate_key(coords.lat, coords.lng)
+        cache_key = ("street_view_image", panorama, heading, pitch, size, fov)
+        cached = await self.imagery_cache.get_bytes(*cache_key)
+        if cached is not None:
+            logger.info("street_view_image_cache_hit", panorama=panorama, heading=heading, pitch=pitch)
+            return cached
+
+        async def fetch() -> Optional[bytes]:
+            image_bytes = await self._fetch_street_view_image_uncached(coords, size, fov, heading, pitch, pano_id)
+            if image_bytes:
+                await self.imagery_cache.set_bytes(*cache_key, data=image_bytes)
+            return image_bytes
+
+        return await self._flights.do(cache_key, fetch)
+
+    async def _fetch_street_view_image_uncached(
+        self,
+        coords: Coordinates,
+        size: str = "600x400",
+        fov: int = 90,
+        heading: int = 0,
+        pitch: int = 0,
+        pano_id: Optional[str] = None
     ) -> Optional[bytes]:
         """
         Fetch Street View image (PAID: $0.007/image).
@@ -411,6 +735,7 @@ class MapsService:
             fov: Horizontal field of view 0-120 degrees (default 90)
             heading: Compass direction 0-360 (0=N, 90=E, 180=S, 270=W)
             pitch: Vertical angle -90 to 90 (0=straight, positive=up, negative=down)
+            pano_id: Panorama ID (takes precedence over coords)
 
         Returns:
             Image bytes (JPEG), or None if not available
@@ -422,7 +747,6 @@ class MapsService:
 
         try:
             params = {
-                "location": f"{coords.lat},{coords.lng}",
                 "size": size,
                 "fov": fov,
                 "heading": heading,
@@ -430,65 +754,67 @@ class MapsService:
                 "key": self.api_key,
                 "return_error_code": "true"  # Return 404 instead of gray placeholder
             }
+            if pano_id:
+                params["pano"] = pano_id
+            else:
+                params["location"] = f"{coords.lat},{coords.lng}"
 
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(self.STREET_VIEW_IMAGE_URL, params=params) as response:
-                    duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
+            async with self._get(self.STREET_VIEW_IMAGE_URL, params) as response:
+                duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
 
-                    # Log API call (PAID request)
+                # Log API call (PAID request)
+                logger.info(
+                    "google_maps_api_call",
+                    api="street_view_image",
+                    lat=coords.lat,
+                    lng=coords.lng,
+                    size=size,
+                    fov=fov,
+                    heading=heading,
+                    pitch=pitch,
+                    status_code=response.status,
+                    duration_ms=duration_ms,
+                    cost="PAID ($0.007)"
+                )
+
+                if response.status == 200:
+                    # Successfully retrieved image
+                    image_bytes = await response.read()
                     logger.info(
-                        "google_maps_api_call",
-                        api="street_view_image",
+                        "street_view_image_retrieved",
                         lat=coords.lat,
                         lng=coords.lng,
-                        size=size,
-                        fov=fov,
-                        heading=heading,
-                        pitch=pitch,
-                        status_code=response.status,
-                        duration_ms=duration_ms,
-                        cost="PAID ($0.007)"
+                        size_bytes=len(image_bytes)
                     )
+                    return image_bytes
 
-                    if response.status == 200:
-                        # Successfully retrieved image
-                        image_bytes = await response.read()
-                        logger.info(
-                            "street_view_image_retrieved",
-                            lat=coords.lat,
-                            lng=coords.lng,
-                            size_bytes=len(image_bytes)
-                        )
-                        return image_bytes
-
-                    elif response.status == 404:
-                        # No imagery available at this location
-                        logger.warning(
-                            "street_view_image_not_found",
-                            lat=coords.lat,
-                            lng=coords.lng
-                        )
-                        return None
+                elif response.status == 404:
+                    # No imagery available at this location
+                    logger.warning(
+                        "street_view_image_not_found",
+                        lat=coords.lat,
+                        lng=coords.lng
+                    )
+                    return None
 
-                    elif response.status == 429:
-                        raise MapsServiceError(
-                            error_type="QUOTA_EXCEEDED",
-                            message="Street View image API quota exceeded",
-                            retry_after=60
-                        )
+                elif response.status == 429:
+                    raise MapsServiceError(
+                        error_type="QUOTA_EXCEEDED",
+                        message="Street View image API quota exceeded",
+                        retry_after=60
+                    )
 
-                    elif response.status == 403:
-                        raise MapsServiceError(
-                            error_type="API_ERROR",
-                            message="Street View API access denied - check API key restrictions"
-                        )
+                elif response.status == 403:
+                    raise MapsServiceError(
+                        error_type="API_ERROR",
+                        message="Street View API access denied - check API key restrictions"
+                    )
 
-                    else:
-                        raise MapsServiceError(
-                            error_type="API_ERROR",
-                            message=f"Unexpected status code: {response.status}"
-                        )
+                else:
+                    raise MapsServiceError(
+                        error_type="API_ERROR",
+                        message=f"Unexpected status code: {response.status}"
+                    )
 
         except aiohttp.ClientError as e:
             logger.error("google_maps_api_error", api="street_view_image", error=str(e))
@@ -511,6 +837,42 @@ class MapsService:
         zoom: int = 18,
         size: str = "600x400",
         maptype: str = "satellite"
+    ) -> Optional[bytes]:
+        """
+        Fetch satellite image, served from the imagery cache when this view was fetched before.
+
+        Args:
+            coords: Property coordinates
+            zoom: Zoom level 0-21 (17-18 recommended for residential)
+            size: Image dimensions "WIDTHxHEIGHT" (max 640x640)
+            maptype: Map type (satellite, hybrid, roadmap, terrain)
+
+        Returns:
+            Image bytes (JPEG)
+
+        Raises:
+            MapsServiceError: If API quota exceeded or network error
+        """
+        cache_key = ("satellite_image", coordinate_key(coords.lat, coords.lng), zoom, size, maptype)
+        cached = await self.imagery_cache.get_bytes(*cache_key)
+        if cached is not None:
+            logger.info("satellite_image_cache_hit", lat=coords.lat, lng=coords.lng, zoom=zoom)
+            return cached
+
+        async def fetch() -> Optional[bytes]:
+            image_bytes = await self._fetch_satellite_image_uncached(coords, zoom, size, maptype)
+            if image_bytes:
+                await self.imagery_cache.set_bytes(*cache_key, data=image_bytes)
+            return image_bytes
+
+        return await self._flights.do(cache_key, fetch)
+
+    async def _fetch_satellite_image_uncached(
+        self,
+        coords: Coordinates,
+        zoom: int = 18,
+        size: str = "600x400",
+        maptype: str = "satellite"
     ) -> Optional[bytes]:
         """
         Fetch satellite image (PAID: $0.002/image).
@@ -538,34 +900,12 @@ class MapsService:
                 "key": self.api_key
             }
 
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(self.STATIC_MAP_URL, params=params) as response:
-                    duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
-
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(
-                            "google_maps_api_call",
-                            api="satellite_image",
-                            lat=coords.lat,
-                            lng=coords.lng,
-                            zoom=zoom,
-                            size=size,
-                            status_code=response.status,
-                            error=error_text,
-                            duration_ms=duration_ms,
-                            cost="PAID ($0.002)"
-                        )
-                        raise MapsServiceError(
-                            error_type="API_ERROR",
-                            message=f"Satellite image request failed: HTTP {response.status} - {error_text}"
-                        )
-
-                    image_bytes = await response.read()
+            async with self._get(self.STATIC_MAP_URL, params) as response:
+                duration_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
 
-                    # Log successful API call
-                    logger.info(
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(
                         "google_maps_api_call",
                         api="satellite_image",
                         lat=coords.lat,
@@ -573,18 +913,38 @@ class MapsService:
                         zoom=zoom,
                         size=size,
                         status_code=response.status,
+                        error=error_text,
                         duration_ms=duration_ms,
                         cost="PAID ($0.002)"
                     )
-
-                    logger.info(
-                        "satellite_image_retrieved",
-                        lat=coords.lat,
-                        lng=coords.lng,
-                        size_bytes=len(image_bytes)
+                    raise MapsServiceError(
+                        error_type="API_ERROR",
+                        message=f"Satellite image request failed: HTTP {response.status} - {error_text}"
                     )
 
-                    return image_bytes
+                image_bytes = await response.read()
+
+                # Log successful API call
+                logger.info(
+                    "google_maps_api_call",
+                    api="satellite_image",
+                    lat=coords.lat,
+                    lng=coords.lng,
+                    zoom=zoom,
+                    size=size,
+                    status_code=response.status,
+                    duration_ms=duration_ms,
+                    cost="PAID ($0.002)"
+                )
+
+                logger.info(
+                    "satellite_image_retrieved",
+                    lat=coords.lat,
+                    lng=coords.lng,
+                    size_bytes=len(image_bytes)
+                )
+
+                return image_bytes
 
         except aiohttp.ClientError as e:
             raise MapsServiceError(
@@ -597,49 +957,37 @@ class MapsService:
                 message=f"Unexpected error during satellite image fetch: {str(e)}"
             )
 
-    async def get_property_images(
+    async def build_property_imagery(
         self,
         address: str,
-        area: str,
+        geocode_result: Optional[GeocodeResult] = None,
+        fetch_images: bool = True,
         custom_heading: Optional[int] = None,
         custom_pitch: Optional[int] = None
-    ) -> Tuple[Optional[bytes], Optional[StreetViewMetadata], Optional[bytes], str]:
+    ) -> PropertyImagery:
         """
-        Main method: Get property images with automatic fallback.
-
-        Feature: 004-generation-flow (T011)
-        Extended for: 007-holiday-decorator (T017)
+        Geocode an address once and check Street View availability (FREE).
 
-        Workflow:
-        1. Geocode address → coordinates
-        2. Check Street View metadata (FREE)
-        3. If Street View available → fetch Street View (PAID)
-        4. Always fetch satellite as fallback (PAID)
-
-        For front_yard: Prioritize Street View
-        For other areas: Prioritize Satellite
+        Feature: 004-generation-flow
 
         Args:
             address: Full street address
-            area: Landscape area (front_yard, backyard, walkway, side_yard, patio, pool_area)
-            custom_heading: Optional Street View heading (0-359 degrees) - overrides automatic calculation
-            custom_pitch: Optional Street View pitch (-90 to 90 degrees) - overrides default 0
+            geocode_result: Geocode already obtained by the caller (skips the Geocoding API call)
+            fetch_images: Also download Street View and satellite images (PAID)
+            custom_heading: Optional Street View heading (0-359 degrees)
+            custom_pitch: Optional Street View pitch (-90 to 90 degrees)
 
         Returns:
-            Tuple of (street_view_bytes, street_view_metadata, satellite_bytes, image_source)
-            - street_view_bytes: Street View image bytes or None
-            - street_view_metadata: Metadata with pano_id or None
-            - satellite_bytes: Satellite image bytes or None
-            - image_source: 'google_street_view', 'google_satellite', or 'user_upload'
-            At least one image will be non-None, or raises error
+            PropertyImagery bundle (images populated only if fetch_images)
 
         Raises:
-            MapsServiceError: If no imagery available or API error
+            MapsServiceError: If the address cannot be geocoded or API error
         """
-        logger.info("get_property_images_start", address=address, area=area)
+        logger.info("build_property_imagery_start", address=address, reused_geocode=geocode_result is not None)
 
         # Step 1: Geocode address with accuracy validation
-        geocode_result = await self.geocode_address(address)
+        if geocode_result is None:
+            geocode_result = await self.geocode_address(address)
         if not geocode_result:
             raise MapsServiceError(
                 "invalid_address",
@@ -667,67 +1015,178 @@ class MapsService:
                 message=f"Geocoding accuracy is {geocode_result.location_type} (not ROOFTOP) - Street View may show wrong house"
             )
 
-        street_view_bytes = None
-        street_view_metadata = None
-        satellite_bytes = None
-        image_source = "google_satellite"  # Default fallback
+        imagery = PropertyImagery(address=address, geocode=geocode_result)
 
         # Step 2: Check Street View metadata (FREE API call)
         try:
-            metadata = await self.get_street_view_metadata(coords)
+            imagery.street_view_metadata = await self.get_street_view_metadata(coords)
+        except MapsServiceError as e:
+            logger.warning(
+                "street_view_retrieval_failed",
+                address=address,
+                error=str(e)
+            )
 
-            # Step 3: Fetch Street View if available (PAID: $0.007)
-            if metadata.status == "OK":
-                street_view_metadata = metadata
+        if fetch_images:
+            await self.fetch_property_images(imagery, custom_heading, custom_pitch)
 
-                # Use the Street View camera location from metadata for accurate positioning
-                camera_coords = metadata.location if metadata.location else coords
+        return imagery
 
-                # Determine heading: use custom_heading if provided, otherwise auto-calculate
-                if custom_heading is not None:
-                    # Holiday Decorator: Use user-selected heading from Street View preview
-                    heading = custom_heading
-                    logger.info(
-                        "street_view_custom_heading",
-                        heading=heading,
-                        source="user_selected"
-                    )
-                elif metadata.location:
-                    # Auto-calculate heading to ensure camera points at the target
-                    heading = calculate_heading(camera_coords, coords)
-                    logger.info(
-                        "street_view_heading_calculated",
-                        camera_lat=camera_coords.lat,
-                        camera_lng=camera_coords.lng,
-                        target_lat=coords.lat,
-                        target_lng=coords.lng,
-                        heading=heading,
-                        source="auto_calculated"
-                    )
-                else:
-                    # If no metadata location and no custom heading, use default
-                    heading = 0
+    async def fetch_property_images(
+        self,
+        imagery: PropertyImagery,
+        custom_heading: Optional[int] = None,
+        custom_pitch: Optional[int] = None,
+        areas: Optional[Iterable[str]] = None
+    ) -> PropertyImagery:
+        """
+        Download the images a set of areas needs into a PropertyImagery bundle.
+
+        Demand-driven: only each area's primary image is fetched (Street View
+        for front_yard when available, satellite otherwise), independent
+        fetches run concurrently, and the fallback image is fetched only if a
+        primary comes back empty. Images already in the bundle are never
+        fetched again, so every area of a generation can call this safely.
+
+        Args:
+            imagery: Bundle from build_property_imagery()
+            custom_heading: Optional Street View heading (0-359 degrees) - overrides automatic calculation
+            custom_pitch: Optional Street View pitch (-90 to 90 degrees) - overrides default 0
+            areas: Areas the images are for (None = fetch both Street View and satellite)
+
+        Returns:
+            The same bundle with street_view_bytes / satellite_bytes populated as needed
+        """
+        async with imagery._lock:
+            if areas is None:
+                wanted = {"street_view", "satellite"}
+            else:
+                areas = list(areas)
+                wanted = {imagery.primary_source(area) for area in areas}
+
+            await self._fetch_sources(imagery, wanted, custom_heading, custom_pitch)
+
+            if areas is not None:
+                # Lazy fallback: only when an area's primary image came back empty
+                for area in areas:
+                    try:
+                        imagery.image_for_area(area)
+                    except MapsServiceError:
+                        await self._fetch_sources(
+                            imagery,
+                            {"street_view", "satellite"},
+                            custom_heading,
+                            custom_pitch
+                        )
+                        break
+
+        return imagery
+
+    async def get_area_image(
+        self,
+        imagery: PropertyImagery,
+        area: str,
+        custom_heading: Optional[int] = None,
+        custom_pitch: Optional[int] = None
+    ) -> Tuple[bytes, str]:
+        """
+        Return the input image for an area, fetching it into the bundle on demand.
+
+        Args:
+            imagery: Bundle from build_property_imagery()
+            area: Landscape area type
+            custom_heading: Optional Street View heading (0-359 degrees)
+            custom_pitch: Optional Street View pitch (-90 to 90 degrees)
+
+        Returns:
+            Tuple of (image_bytes, image_source)
 
-                # Determine pitch: use custom_pitch if provided, otherwise default to 0
-                pitch = custom_pitch if custom_pitch is not None else 0
+        Raises:
+            MapsServiceError: If no imagery is available for the area
+        """
+        await self.fetch_property_images(imagery, custom_heading, custom_pitch, areas=[area])
+        return imagery.image_for_area(area)
+
+    async def _fetch_sources(
+        self,
+        imagery: PropertyImagery,
+        sources: Set[str],
+        custom_heading: Optional[int] = None,
+        custom_pitch: Optional[int] = None
+    ) -> None:
+        """Fetch the given image sources not yet attempted for this bundle, concurrently."""
+        pending = sources - imagery.fetched_sources
+        fetches = []
+        if "street_view" in pending and imagery.has_street_view:
+            fetches.append(self._fetch_street_view_into(imagery, custom_heading, custom_pitch))
+        if "satellite" in pending:
+            fetches.append(self._fetch_satellite_into(imagery))
+
+        # MapsServiceErrors are absorbed per image; anything else leaves the
+        # sources unmarked so a retry of the job fetches them again
+        await asyncio.gather(*fetches)
+        imagery.fetched_sources |= pending
+
+    async def _fetch_street_view_into(
+        self,
+        imagery: PropertyImagery,
+        custom_heading: Optional[int] = None,
+        custom_pitch: Optional[int] = None
+    ) -> None:
+        """Fetch Street View (PAID: $0.007) into the bundle; failures leave street_view_bytes None."""
+        address = imagery.address
+        coords = imagery.coordinates
+        metadata = imagery.street_view_metadata
+
+        try:
+            # Use the Street View camera location from metadata for accurate positioning
+            camera_coords = metadata.location if metadata.location else coords
 
-                street_view_bytes = await self.fetch_street_view_image(
-                    camera_coords,
+            # Determine heading: use custom_heading if provided, otherwise auto-calculate
+            if custom_heading is not None:
+                # Holiday Decorator: Use user-selected heading from Street View preview
+                heading = custom_heading
+                logger.info(
+                    "street_view_custom_heading",
+                    heading=heading,
+                    source="user_selected"
+                )
+            elif metadata.location:
+                # Auto-calculate heading to ensure camera points at the target
+                heading = calculate_heading(camera_coords, coords)
+                logger.info(
+                    "street_view_heading_calculated",
+                    camera_lat=camera_coords.lat,
+                    camera_lng=camera_coords.lng,
+                    target_lat=coords.lat,
+                    target_lng=coords.lng,
                     heading=heading,
-                    pitch=pitch
+                    source="auto_calculated"
                 )
+            else:
+                # If no metadata location and no custom heading, use default
+                heading = 0
+
+            # Determine pitch: use custom_pitch if provided, otherwise default to 0
+            pitch = custom_pitch if custom_pitch is not None else 0
+
+            imagery.street_view_bytes = await self.fetch_street_view_image(
+                camera_coords,
+                heading=heading,
+                pitch=pitch,
+                pano_id=metadata.pano_id
+            )
 
-                if street_view_bytes:
-                    image_source = "street_view"  # Changed from "google_street_view" to match DB constraint
-                    logger.info(
-                        "street_view_image_retrieved",
-                        address=address,
-                        pano_id=metadata.pano_id,
-                        camera_lat=camera_coords.lat,
-                        camera_lng=camera_coords.lng,
-                        heading=heading,
-                        size_bytes=len(street_view_bytes)
-                    )
+            if imagery.street_view_bytes:
+                logger.info(
+                    "street_view_image_retrieved",
+                    address=address,
+                    pano_id=metadata.pano_id,
+                    camera_lat=camera_coords.lat,
+                    camera_lng=camera_coords.lng,
+                    heading=heading,
+                    size_bytes=len(imagery.street_view_bytes)
+                )
 
         except MapsServiceError as e:
             logger.warning(
@@ -736,23 +1195,26 @@ class MapsService:
                 error=str(e)
             )
 
-        # Step 4: Fetch satellite image (PAID: $0.002)
-        # Always fetch satellite for backyard/walkway areas
+    async def _fetch_satellite_into(self, imagery: PropertyImagery) -> None:
+        """Fetch satellite (PAID: $0.002) into the bundle; failures leave satellite_bytes None."""
+        address = imagery.address
+        coords = imagery.coordinates
+
         try:
-            satellite_bytes = await self.fetch_satellite_image(
+            imagery.satellite_bytes = await self.fetch_satellite_image(
                 coords,
                 zoom=20,  # Close-up view for residential properties
                 size="600x400",
                 maptype="satellite"
             )
 
-            if satellite_bytes:
+            if imagery.satellite_bytes:
                 logger.info(
                     "satellite_image_retrieved",
                     address=address,
                     lat=coords.lat,
                     lng=coords.lng,
-                    size_bytes=len(satellite_bytes)
+                    size_bytes=len(imagery.satellite_bytes)
                 )
 
         except MapsServiceError as e:
@@ -762,45 +1224,61 @@ class MapsService:
                 error=str(e)
             )
 
-        # Step 5: Determine which image to return based on area type
-        # Front yard: Prioritize Street View
-        # Other areas (backyard, walkway, side_yard): Prioritize Satellite
-        if area == "front_yard":
-            # Front yard uses Street View
-            if street_view_bytes:
-                image_source = "street_view"
-                return (street_view_bytes, street_view_metadata, satellite_bytes, image_source)
-            elif satellite_bytes:
-                # Fallback to satellite if Street View unavailable
-                image_source = "google_satellite"
-                logger.warning(
-                    "street_view_unavailable_fallback_to_satellite",
-                    address=address,
-                    area=area
-                )
-                return (satellite_bytes, street_view_metadata, satellite_bytes, image_source)
-        else:
-            # Backyard, walkway, side_yard use Satellite
-            if satellite_bytes:
-                image_source = "google_satellite"
-                return (satellite_bytes, street_view_metadata, satellite_bytes, image_source)
-            elif street_view_bytes:
-                # Fallback to Street View if satellite unavailable
-                image_source = "street_view"
-                logger.warning(
-                    "satellite_unavailable_fallback_to_street_view",
-                    address=address,
-                    area=area
-                )
-                return (street_view_bytes, street_view_metadata, satellite_bytes, image_source)
+    async def get_property_images(
+        self,
+        address: str,
+        area: str,
+        custom_heading: Optional[int] = None,
+        custom_pitch: Optional[int] = None
+    ) -> Tuple[Optional[bytes], Optional[StreetViewMetadata], Optional[bytes], str]:
+        """
+        Main method: Get property images with automatic fallback.
 
-        # If we get here, no imagery is available
-        raise MapsServiceError(
-            "no_imagery_available",
-            f"No imagery available for address: {address}. "
-            "Please try a different address or upload a photo manually."
+        Feature: 004-generation-flow (T011)
+        Extended for: 007-holiday-decorator (T017)
+
+        Workflow:
+        1. Geocode address → coordinates
+        2. Check Street View metadata (FREE)
+        3. Fetch only the area's primary image (PAID)
+        4. Fetch the other image only if the primary is unavailable
+
+        For front_yard: Prioritize Street View
+        For other areas: Prioritize Satellite
+
+        Callers that need images for several areas of the same property should
+        use build_property_imagery(fetch_images=False) once and get_area_image() per area.
+
+        Args:
+            address: Full street address
+            area: Landscape area (front_yard, backyard, walkway, side_yard, patio, pool_area)
+            custom_heading: Optional Street View heading (0-359 degrees) - overrides automatic calculation
+            custom_pitch: Optional Street View pitch (-90 to 90 degrees) - overrides default 0
+
+        Returns:
+            Tuple of (street_view_bytes, street_view_metadata, satellite_bytes, image_source)
+            - street_view_bytes: Street View image bytes or None
+            - street_view_metadata: Metadata with pano_id or None
+            - satellite_bytes: Satellite image bytes, or None if the area didn't need it
+            - image_source: 'street_view' or 'google_satellite'
+            At least one image will be non-None, or raises error
+
+        Raises:
+            MapsServiceError: If no imagery available or API error
+        """
+        logger.info("get_property_images_start", address=address, area=area)
+
+        imagery = await self.build_property_imagery(address, fetch_images=False)
+        image_bytes, image_source = await self.get_area_image(
+            imagery,
+            area,
+            custom_heading=custom_heading,
+            custom_pitch=custom_pitch
         )
 
+        street_view_metadata = imagery.street_view_metadata if imagery.has_street_view else None
+        return (image_bytes, street_view_metadata, imagery.satellite_bytes, image_source)
+
     async def _retry_with_backoff(self, func, max_retries: int = 3, base_delay: int = 2):
         """
         Retry API call with exponential backoff.
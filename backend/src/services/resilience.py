@@ -0,0 +1,299 @@
+"""
+Adaptive concurrency limit and circuit breaker for upstream APIs.
+
+AIMDLimiter caps in-flight calls like a semaphore whose size follows the
+upstream's health: each success adds 1/limit (about +1 per "round" of calls)
+and an overload signal (429, 503, timeout, very slow success) halves it, so a
+throttled upstream sees fewer concurrent calls instead of every caller
+waiting out its full timeout.
+
+CircuitBreaker watches the failure rate over a sliding window and, above the
+threshold, rejects calls immediately for a cool-down period before letting a
+single probe call through. Callers turn the rejection into a fast failure
+(and refund) instead of queueing on a degraded upstream.
+
+Used by GeminiClient (one limiter and breaker per process).
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+    def __init__(self, name: str, retry_after_seconds: float):
+        self.name = name
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            f"{name} is temporarily unavailable (circuit open, retry in {retry_after_seconds:.0f}s)"
+        )
+
+
+class AIMDLimiter:
+    """Concurrency limit with additive increase / multiplicative decrease."""
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        min_limit: int = 1,
+        decrease_factor: float = 0.5,
+        slow_call_seconds: Optional[float] = None
+    ):
+        """
+        Args:
+            name: Label for logs and stats (e.g. "gemini")
+            max_limit: Starting and highest concurrency limit
+            min_limit: Lowest concurrency limit
+            decrease_factor: Multiplier applied to the limit on overload
+            slow_call_seconds: Successful calls slower than this count as overload
+        """
+        self.name = name
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.slow_call_seconds = slow_call_seconds
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._last_decrease = 0.0
+        self.waiting = 0
+        self.successes = 0
+        self.overloads = 0
+        self.decreases = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """
+        Hold one slot of the current limit.
+
+        Yields:
+            Monotonic start time of the call (pass it back to on_success/on_overload)
+        """
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        async with self._condition:
+            if self.in_flight >= int(self.limit):
+                logger.info(
+                    "adaptive_limit_wait",
+                    limiter=self.name,
+                    limit=int(self.limit),
+                    in_flight=self.in_flight
+                )
+            self.waiting += 1
+            try:
+                await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+
+        try:
+            yield time.monotonic()
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def on_success(self, started_at: float) -> None:
+        """Record a successful call; grows the limit unless the call was slow."""
+        latency = time.monotonic() - started_at
+        if self.slow_call_seconds is not None and latency > self.slow_call_seconds:
+            self.on_overload(started_at, reason="slow")
+            return
+
+        self.successes += 1
+        self._set_limit(self.limit + 1 / self.limit)
+
+    def on_overload(self, started_at: float, reason: str = "overload") -> None:
+        """
+        Record a throttled, timed-out or slow call; shrinks the limit.
+
+        Calls that started before the previous decrease were already running
+        under the old limit, so they do not shrink it again (one decrease per
+        round of calls, like TCP congestion control).
+        """
+        self.overloads += 1
+        if started_at < self._last_decrease:
+            return
+
+        self._last_decrease = time.monotonic()
+        self.decreases += 1
+        previous = int(self.limit)
+        self._set_limit(self.limit * self.decrease_factor)
+        logger.warning(
+            "adaptive_limit_decreased",
+            limiter=self.name,
+            reason=reason,
+            previous_limit=previous,
+            limit=int(self.limit)
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        return {
+            "name": self.name,
+            "limit": int(self.limit),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "successes": self.successes,
+            "overloads": self.overloads,
+            "decreases": self.decreases
+        }
+
+    def _set_limit(self, limit: float) -> None:
+        # Waiters re-check the limit whenever a slot is released
+        self.limit = min(float(self.max_limit), max(float(self.min_limit), limit))
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker (closed -> open -> half-open -> closed)."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        min_calls: int = 10,
+        window_seconds: float = 60.0,
+        open_seconds: float = 30.0
+    ):
+        """
+        Args:
+            name: Label for logs, stats and errors (e.g. "gemini")
+            failure_rate_threshold: Failure share (0-1) in the window that opens the circuit
+            min_calls: Calls needed in the window before the rate is trusted
+            window_seconds: Sliding window for the failure rate
+            open_seconds: How long the circuit rejects calls before a probe
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.state = self.CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+        self.opened = 0
+
+    def check(self) -> None:
+        """
+        Admit a call or raise CircuitOpenError.
+
+        After open_seconds one probe call is admitted (half-open); its outcome
+        closes or re-opens the circuit.
+        """
+        if self.state == self.CLOSED:
+            return
+
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self.open_seconds - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, remaining)
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+            logger.info("circuit_half_open", circuit=self.name)
+
+        if self._probe_in_flight:
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self.open_seconds)
+        self._probe_in_flight = True
+
+    def raise_if_open(self) -> None:
+        """
+        Fail fast while the circuit is open, without claiming the probe.
+
+        For callers about to queue for a slot; call check() once they hold it.
+        """
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self.open_seconds - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, remaining)
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self.state == self.HALF_OPEN:
+            self.state = self.CLOSED
+            self._probe_in_flight = False
+            self._outcomes.clear()
+            logger.info("circuit_closed", circuit=self.name)
+        self._record(True)
+
+    def record_failure(self) -> None:
+        """
+        Record a failed call.
+
+        Only upstream failures (throttling, 5xx, timeouts, connection errors)
+        count; a rejected request means the upstream answered, so record it
+        as a success.
+        """
+        if self.state == self.HALF_OPEN:
+            self._open()
+            return
+
+        self._record(False)
+        if self.state == self.CLOSED and len(self._outcomes) >= self.min_calls:
+            if self.failure_rate() >= self.failure_rate_threshold:
+                self._open()
+
+    def failure_rate(self) -> float:
+        """Failure share of the calls in the current window."""
+        self._prune()
+        if not self._outcomes:
+            return 0.0
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return failures / len(self._outcomes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        retry_after = 0.0
+        if self.state == self.OPEN:
+            retry_after = max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+        return {
+            "name": self.name,
+            "state": self.state,
+            "failure_rate": round(self.failure_rate(), 4),
+            "window_calls": len(self._outcomes),
+            "failure_rate_threshold": self.failure_rate_threshold,
+            "retry_after_seconds": round(retry_after, 1),
+            "opened": self.opened,
+            "rejected": self.rejected
+        }
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self.opened += 1
+        logger.error(
+            "circuit_opened",
+            circuit=self.name,
+            failure_rate=round(self.failure_rate(), 4),
+            open_seconds=self.open_seconds
+        )
+
+    def _record(self, ok: bool) -> None:
+        self._outcomes.append((time.monotonic(), ok))
+        self._prune()
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
@@ -13,6 +13,24 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 
 
+def retention_days(payment_type: str) -> Optional[int]:
+    """
+    How many days a generation is kept, by payment type.
+
+    Args:
+        payment_type: 'trial', 'token', or 'subscription'
+
+    Returns:
+        0 for trials (not saved), 7 for tokens and unknown types,
+        None for subscriptions (kept indefinitely)
+    """
+    if payment_type == "subscription":
+        return None
+    if payment_type == "trial":
+        return 0
+    return 7
+
+
 def calculate_expiry_timestamp(payment_type: str, created_at: datetime) -> Optional[datetime]:
     """
     Calculate when a generation should expire based on payment type.
@@ -29,15 +47,10 @@ def calculate_expiry_timestamp(payment_type: str, created_at: datetime) -> Optio
         - Token: Expires in 7 days (created_at + 7 days)
         - Subscription: Never expires (None)
     """
-    if payment_type == "subscription":
+    days = retention_days(payment_type)
+    if days is None:
         return None  # Never expires
-    elif payment_type == "trial":
-        return created_at  # Expires immediately, not saved
-    elif payment_type == "token":
-        return created_at + timedelta(days=7)  # Expires in 7 days
-    else:
-        # Default to 7 days for unknown types
-        return created_at + timedelta(days=7)
+    return created_at + timedelta(days=days)
 
 
 def get_retention_message_and_days(
@@ -18,6 +18,7 @@ import structlog
 from ..db.connection_pool import DatabasePool
 from ..services.holiday_credit_service import HolidayCreditService
 from ..models.holiday import SharePlatform
+from ..services.social_card_service import card_for_platform
 
 logger = structlog.get_logger(__name__)
 
@@ -57,7 +58,8 @@ class ShareService:
         user_id: UUID,
         generation_id: UUID,
         platform: SharePlatform,
-        before_after_image_url: str
+        before_after_image_url: str,
+        card_image_url: Optional[str] = None
     ) -> dict:
         """
         Create a new share tracking link.
@@ -67,6 +69,7 @@ class ShareService:
             generation_id: Holiday generation UUID
             platform: Social media platform
             before_after_image_url: URL of the image to share
+            card_image_url: Pre-rendered card sized for the platform, if available
 
         Returns:
             Dict with share details including tracking link and share URL
@@ -87,7 +90,7 @@ class ShareService:
             share_url = self._create_platform_share_url(
                 platform,
                 tracking_link,
-                before_after_image_url
+                card_image_url or before_after_image_url
             )
 
             # Create share record
@@ -113,6 +116,7 @@ class ShareService:
                 "tracking_link": tracking_link,
                 "share_url": share_url,
                 "before_after_image_url": before_after_image_url,
+                "card_image_url": card_image_url,
                 "can_earn_credit": can_earn_credit,
                 "daily_shares_remaining": daily_shares_remaining,
                 "created_at": datetime.now(timezone.utc).isoformat()
@@ -219,7 +223,7 @@ class ShareService:
                 s.tracking_link, s.tracking_code,
                 s.clicked, s.credit_granted,
                 s.created_at, s.clicked_at, s.credit_granted_at,
-                g.before_after_image_url
+                g.before_after_image_url, g.social_card_urls
             FROM social_shares s
             JOIN holiday_generations g ON s.generation_id = g.id
             WHERE s.user_id = $1
@@ -236,6 +240,11 @@ class ShareService:
         shares_today = await self._get_shares_today(user_id)
         daily_shares_remaining = max(0, self.max_shares_per_day - shares_today)
 
+        card_urls = {
+            s['id']: card_for_platform(s['social_card_urls'], s['platform'])
+            for s in shares
+        }
+
         return {
             "shares": [
                 {
@@ -246,9 +255,10 @@ class ShareService:
                     "share_url": self._create_platform_share_url(
                         SharePlatform(s['platform']),
                         s['tracking_link'],
-                        s['before_after_image_url']
+                        card_urls[s['id']] or s['before_after_image_url']
                     ),
                     "before_after_image_url": s['before_after_image_url'],
+                    "card_image_url": card_urls[s['id']],
                     "clicked": s['clicked'],
                     "credit_granted": s['credit_granted'],
                     "created_at": s['created_at'].isoformat(),
@@ -0,0 +1,76 @@
+"""
+Single-flight request coalescing.
+
+When several coroutines ask for the same thing at once (double-clicks, several
+tabs, sibling generation areas), only the first one does the work; the rest
+await the same shared task. Used by MapsService (geocoding and imagery) and
+GeminiClient (identical generation requests).
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one in-flight task."""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Label for logs and stats (e.g. "maps", "gemini")
+        """
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fn`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the request (callers with equal keys share a result)
+            fn: Zero-argument coroutine function doing the actual work
+
+        Returns:
+            The shared result (exceptions are raised to every caller)
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+            logger.info("single_flight_coalesced", flight=self.name)
+
+        # Shield so one caller being cancelled (e.g. a timeout) does not cancel
+        # the work the other callers are waiting on
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Number of distinct requests currently running."""
+        return len(self._calls)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls)
+        }
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
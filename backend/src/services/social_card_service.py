@@ -0,0 +1,168 @@
+"""
+Social Card Service
+
+Renders, uploads and stores the platform-sized share images of a holiday
+generation (see src/lib/socialCards.py), keyed by generation ID in
+holiday_generations.social_card_urls.
+
+Cards are rendered together with the before/after image when a generation
+completes, so creating a share only looks up stored URLs. Generations from
+before cards existed are backfilled once, on their first share; concurrent
+shares of the same generation share that one render.
+
+Feature: 007-holiday-decorator
+"""
+
+import json
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+import httpx
+import structlog
+
+from src.db.connection_pool import DatabasePool
+from src.lib.socialCards import create_share_images
+from src.services.single_flight import SingleFlight
+from src.services.storage_service import StorageService
+
+logger = structlog.get_logger(__name__)
+
+# Platform -> card that fits its share surface
+PLATFORM_CARDS: Dict[str, str] = {
+    "facebook": "og",
+    "x": "og",
+    "instagram": "square",
+    "pinterest": "story",
+    "tiktok": "story",
+}
+
+
+def card_for_platform(card_urls: Any, platform: str) -> Optional[str]:
+    """
+    Pick the card URL for a platform from stored card URLs.
+
+    Args:
+        card_urls: social_card_urls value (dict, JSON string or None)
+        platform: Social media platform
+
+    Returns:
+        Card URL, or None if cards have not been rendered
+    """
+    urls = _parse_card_urls(card_urls)
+    if not urls:
+        return None
+    return urls.get(PLATFORM_CARDS.get(platform, "og"))
+
+
+def _parse_card_urls(card_urls: Any) -> Optional[Dict[str, str]]:
+    """asyncpg returns JSONB as a string unless a codec is registered."""
+    if isinstance(card_urls, str):
+        card_urls = json.loads(card_urls)
+    return card_urls or None
+
+
+class SocialCardService:
+    """Renders share cards once per generation and keeps their URLs."""
+
+    # Process-wide, so backfills coalesce across service instances
+    _flights = SingleFlight("social_cards")
+
+    def __init__(self, db_pool: DatabasePool, storage_service: StorageService):
+        """
+        Args:
+            db_pool: Database connection pool
+            storage_service: Image storage backend
+        """
+        self.db = db_pool
+        self.storage = storage_service
+
+    async def render_and_upload(
+        self,
+        generation_id: UUID,
+        before_image_bytes: bytes,
+        after_image_bytes: bytes,
+        include_before_after: bool = True
+    ) -> Dict[str, str]:
+        """
+        Render every share image in one decode pass and upload them concurrently.
+
+        Args:
+            generation_id: Generation UUID (storage path prefix)
+            before_image_bytes: Original image bytes
+            after_image_bytes: Decorated image bytes
+            include_before_after: Also render the side-by-side before/after image
+
+        Returns:
+            Public URLs keyed by image name ("before_after", "og", "square", ...)
+        """
+        images = await create_share_images(before_image_bytes, after_image_bytes, include_before_after)
+
+        names = list(images)
+        urls = await self.storage.upload_multiple_images(
+            [
+                (images[name], f"holiday/{generation_id}/{name.replace('_', '-')}.jpg")
+                for name in names
+            ],
+            content_type="image/jpeg"
+        )
+        return dict(zip(names, urls))
+
+    async def get_card_urls(
+        self,
+        generation_id: UUID,
+        card_urls: Any,
+        original_image_url: Optional[str],
+        decorated_image_url: Optional[str]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Return a generation's card URLs, rendering them once if it predates cards.
+
+        Args:
+            generation_id: Generation UUID
+            card_urls: Stored social_card_urls value (dict, JSON string or None)
+            original_image_url: URL of the original image (for a backfill)
+            decorated_image_url: URL of the decorated image (for a backfill)
+
+        Returns:
+            Card URLs keyed by card name, or None if the generation has no images
+        """
+        urls = _parse_card_urls(card_urls)
+        if urls:
+            return urls
+        if not original_image_url or not decorated_image_url:
+            return None
+
+        return await self._flights.do(
+            generation_id,
+            lambda: self._backfill(generation_id, original_image_url, decorated_image_url)
+        )
+
+    async def _backfill(
+        self,
+        generation_id: UUID,
+        original_image_url: str,
+        decorated_image_url: str
+    ) -> Dict[str, str]:
+        """Render cards for a generation completed before they existed, and store them."""
+        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            before_response = await client.get(original_image_url)
+            before_response.raise_for_status()
+            after_response = await client.get(decorated_image_url)
+            after_response.raise_for_status()
+
+        urls = await self.render_and_upload(
+            generation_id,
+            before_response.content,
+            after_response.content,
+            include_before_after=False
+        )
+
+        await self.db.execute("""
+            UPDATE holiday_generations
+            SET social_card_urls = $2::jsonb,
+                updated_at = NOW()
+            WHERE id = $1
+        """, generation_id, json.dumps(urls))
+
+        logger.info("social_cards_backfilled", generation_id=str(generation_id), cards=len(urls))
+        return urls
@@ -1,26 +1,76 @@
 """
-Vercel Blob storage service for image uploads.
+Image storage service.
 
-Handles uploading generated landscape designs to Vercel Blob storage
-and generating public URLs for retrieval.
+Handles uploading generated landscape designs and returning public URLs for
+retrieval. The backend is chosen by settings.storage_backend:
+
+- "vercel": Vercel Blob (BLOB_READ_WRITE_TOKEN), the production default
+- "local": content-addressed files on disk, served by the API at
+  settings.storage_local_url_path (benchmarks, self-hosted deployments)
+- "s3": any S3-compatible bucket (AWS S3, MinIO, Cloudflare R2), signed
+  with AWS Signature V4
+
+The HTTP backends share one pooled HTTP/2 client (opened in the app
+lifespan), so the two to four uploads of a generation reuse one kept-alive
+TLS connection instead of a handshake each. Large images are sent as a
+chunked stream. Object names are derived from the image's SHA-256, which
+makes an upload idempotent: a retry after a timeout or 5xx writes the same
+bytes to the same URL rather than leaving a duplicate object behind.
 """
 
+import asyncio
+import hashlib
+import hmac
+import mimetypes
 import os
-from typing import BinaryIO, List
-from datetime import datetime
+import random
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional, Union
+from urllib.parse import quote
+
 import httpx
+import structlog
 
+from src.config import settings
 
-class BlobStorageService:
-    """Service for managing image uploads to Vercel Blob storage."""
+logger = structlog.get_logger(__name__)
 
-    def __init__(self):
-        self.token = os.getenv("BLOB_READ_WRITE_TOKEN")
-        if not self.token:
-            raise ValueError("BLOB_READ_WRITE_TOKEN environment variable is required")
+# Responses worth retrying (the request may not have been applied)
+RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
 
-        self.base_url = "https://blob.vercel-storage.com"
+STORAGE_BACKENDS = ("vercel", "local", "s3")
+
+
+def content_pathname(image_data: bytes, filename: str) -> str:
+    """Object pathname keyed by content hash, so re-uploading the same bytes is idempotent."""
+    digest = hashlib.sha256(image_data).hexdigest()[:32]
+    return f"{digest}_{filename}"
+
+
+async def iter_chunks(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    """Stream an in-memory body in fixed-size chunks."""
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield bytes(view[start:start + chunk_size])
+
+
+class StorageService(ABC):
+    """Interface shared by the storage backends (see create_storage_service)."""
+
+    backend = ""
 
+    async def open(self, **pool_options) -> None:
+        """Acquire long-lived resources (app startup). No-op by default."""
+
+    async def close(self) -> None:
+        """Release long-lived resources (app shutdown). No-op by default."""
+
+    @abstractmethod
     async def upload_image(
         self,
         image_data: bytes,
@@ -28,42 +78,19 @@ class BlobStorageService:
         content_type: str = "image/png"
     ) -> str:
         """
-        Upload an image to Vercel Blob storage.
+        Store an image.
 
         Args:
             image_data: Binary image data
-            filename: Desired filename (will be made unique)
+            filename: Desired filename (made unique by the content hash)
             content_type: MIME type of the image
 
         Returns:
-            Public URL of the uploaded image
+            Public URL of the stored image
 
         Raises:
             Exception: If upload fails
         """
-        # Generate unique filename with timestamp
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
-        unique_filename = f"{timestamp}_{filename}"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/{unique_filename}",
-                content=image_data,
-                headers={
-                    "Authorization": f"Bearer {self.token}",
-                    "Content-Type": content_type,
-                    "x-content-type": content_type,
-                },
-                timeout=30.0
-            )
-
-            if response.status_code != 200:
-                raise Exception(
-                    f"Failed to upload image to Vercel Blob: {response.status_code} - {response.text}"
-                )
-
-            result = response.json()
-            return result.get("url")
 
     async def upload_multiple_images(
         self,
@@ -83,8 +110,6 @@ class BlobStorageService:
         Raises:
             Exception: If any upload fails
         """
-        import asyncio
-
         tasks = [
             self.upload_image(image_data, filename, content_type)
             for image_data, filename in images
@@ -92,9 +117,10 @@ class BlobStorageService:
 
         return await asyncio.gather(*tasks)
 
+    @abstractmethod
     async def delete_image(self, url: str) -> bool:
         """
-        Delete an image from Vercel Blob storage.
+        Delete a stored image.
 
         Args:
             url: Public URL of the image to delete
@@ -102,30 +128,587 @@ class BlobStorageService:
         Returns:
             True if successful, False otherwise
         """
+
+    @abstractmethod
+    async def image_exists(self, url: str) -> bool:
+        """
+        Check that a stored image can still be fetched.
+
+        Args:
+            url: Public URL of the image
+
+        Returns:
+            True if the image exists, False if it is gone
+
+        Raises:
+            Exception: If the check itself fails (e.g. storage unreachable)
+        """
+
+
+class _HttpStorageService(StorageService):
+    """Pooled HTTP/2 client, chunked bodies and idempotent retries for HTTP backends."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 0.5,
+        stream_threshold_bytes: int = 1024 * 1024,
+        chunk_size_bytes: int = 256 * 1024
+    ):
+        """
+        Args:
+            max_attempts: Tries per upload/delete (timeouts, connection errors, 429, 5xx)
+            retry_backoff_seconds: First retry delay; doubles per attempt, with jitter
+            stream_threshold_bytes: Bodies at least this large are sent as a chunked stream
+            chunk_size_bytes: Chunk size for streamed bodies
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.stream_threshold_bytes = stream_threshold_bytes
+        self.chunk_size_bytes = chunk_size_bytes
+        self.retries = 0
+
+        # Pooled client opened in the app lifespan (src/main.py); see open()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def open(
+        self,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_seconds: float = 60.0,
+        http2: bool = True
+    ) -> None:
+        """
+        Open the pooled HTTP client reused by every upload and delete.
+
+        With HTTP/2, concurrent uploads are multiplexed over one connection.
+
+        Args:
+            max_connections: Maximum open connections
+            max_keepalive_connections: Idle connections kept alive for reuse
+            keepalive_expiry_seconds: How long an idle connection is kept open
+            http2: Negotiate HTTP/2 (falls back to HTTP/1.1 if the server declines)
+        """
+        if self._client is not None and not self._client.is_closed:
+            return
+
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry_seconds
+            ),
+            timeout=30.0
+        )
+        logger.info(
+            "storage_http_client_opened",
+            backend=self.backend,
+            http2=http2,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client (app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the pooled client, or a one-off client when open() was never called."""
+        if self._client is not None and not self._client.is_closed:
+            yield self._client
+            return
+
         async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                url,
-                headers={
-                    "Authorization": f"Bearer {self.token}",
-                },
-                timeout=10.0
+            yield client
+
+    async def image_exists(self, url: str) -> bool:
+        """
+        Check that a stored image can still be fetched (HEAD on its public URL).
+
+        Args:
+            url: Public URL of the image
+
+        Returns:
+            True if the image exists, False if it is gone
+
+        Raises:
+            Exception: If storage answers with anything but 200 or 404
+        """
+        response = await self._request("HEAD", url, headers={}, timeout=10.0)
+        if response.status_code == 404:
+            return False
+        if response.status_code != 200:
+            raise Exception(f"Failed to check image {url}: {response.status_code}")
+        return True
+
+    def _body(self, data: bytes) -> Union[bytes, AsyncIterator[bytes]]:
+        """Request body for one attempt (a fresh stream each time, so retries can resend it)."""
+        if len(data) >= self.stream_threshold_bytes:
+            return iter_chunks(data, self.chunk_size_bytes)
+        return data
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        timeout: float,
+        body: Optional[Callable[[], Union[bytes, AsyncIterator[bytes]]]] = None
+    ) -> httpx.Response:
+        """
+        Send an idempotent request, retrying timeouts, connection errors, 429 and 5xx.
+
+        Returns:
+            The last response (callers check its status)
+
+        Raises:
+            httpx.TransportError: If the final attempt fails without a response
+        """
+        async with self._http() as client:
+            attempt = 1
+            while True:
+                try:
+                    response = await client.request(
+                        method,
+                        url,
+                        content=body() if body else None,
+                        headers=headers,
+                        timeout=timeout
+                    )
+                except httpx.TransportError as e:
+                    if attempt == self.max_attempts:
+                        raise
+                    reason = type(e).__name__
+                else:
+                    if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_attempts:
+                        return response
+                    reason = response.status_code
+
+                delay = self.retry_backoff_seconds * 2 ** (attempt - 1)
+                delay += random.uniform(0, delay / 2)
+                self.retries += 1
+                logger.warning(
+                    "storage_request_retry",
+                    backend=self.backend,
+                    method=method,
+                    url=url,
+                    attempt=attempt,
+                    reason=reason,
+                    delay_seconds=round(delay, 2)
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+
+class BlobStorageService(_HttpStorageService):
+    """Service for managing image uploads to Vercel Blob storage."""
+
+    backend = "vercel"
+
+    def __init__(self, **http_options):
+        """
+        Args:
+            **http_options: Retry and streaming options (see _HttpStorageService)
+        """
+        super().__init__(**http_options)
+        self.token = os.getenv("BLOB_READ_WRITE_TOKEN")
+        if not self.token:
+            raise ValueError("BLOB_READ_WRITE_TOKEN environment variable is required")
+
+        self.base_url = "https://blob.vercel-storage.com"
+
+    async def upload_image(
+        self,
+        image_data: bytes,
+        filename: str,
+        content_type: str = "image/png"
+    ) -> str:
+        """
+        Upload an image to Vercel Blob storage.
+
+        Args:
+            image_data: Binary image data
+            filename: Desired filename (prefixed with the content hash)
+            content_type: MIME type of the image
+
+        Returns:
+            Public URL of the uploaded image
+
+        Raises:
+            Exception: If upload fails
+        """
+        pathname = content_pathname(image_data, filename)
+
+        response = await self._request(
+            "PUT",
+            f"{self.base_url}/{pathname}",
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": content_type,
+                "Content-Length": str(len(image_data)),
+                "x-content-type": content_type,
+                # Same content -> same URL; a retried or repeated upload overwrites identical bytes
+                "x-add-random-suffix": "0",
+                "x-allow-overwrite": "1",
+            },
+            timeout=30.0,
+            body=lambda: self._body(image_data)
+        )
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to upload image to Vercel Blob: {response.status_code} - {response.text}"
+            )
+
+        result = response.json()
+        return result.get("url")
+
+    async def delete_image(self, url: str) -> bool:
+        """
+        Delete an image from Vercel Blob storage.
+
+        Args:
+            url: Public URL of the image to delete
+
+        Returns:
+            True if successful, False otherwise
+        """
+        response = await self._request(
+            "DELETE",
+            url,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+            },
+            timeout=10.0
+        )
+
+        return response.status_code == 200
+
+
+class S3StorageService(_HttpStorageService):
+    """Image storage in an S3-compatible bucket (path-style requests, Signature V4)."""
+
+    backend = "s3"
+
+    def __init__(
+        self,
+        endpoint_url: str,
+        bucket: str,
+        access_key_id: str,
+        secret_access_key: str,
+        region: str = "us-east-1",
+        public_base_url: str = "",
+        **http_options
+    ):
+        """
+        Args:
+            endpoint_url: S3 API endpoint (e.g. https://s3.us-east-1.amazonaws.com)
+            bucket: Bucket holding the images (must allow public reads of the URLs returned)
+            access_key_id: Access key with PutObject/DeleteObject on the bucket
+            secret_access_key: Secret for access_key_id
+            region: Signing region ("auto" for Cloudflare R2)
+            public_base_url: URL prefix for returned image URLs (e.g. a CDN);
+                empty = <endpoint_url>/<bucket>
+            **http_options: Retry and streaming options (see _HttpStorageService)
+        """
+        super().__init__(**http_options)
+        if not (endpoint_url and bucket and access_key_id and secret_access_key):
+            raise ValueError(
+                "S3 storage requires S3_ENDPOINT_URL, S3_BUCKET, S3_ACCESS_KEY_ID and S3_SECRET_ACCESS_KEY"
             )
 
-            return response.status_code == 200
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.bucket = bucket
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.region = region
+        self.public_base_url = (public_base_url or f"{self.endpoint_url}/{bucket}").rstrip("/")
+
+    async def upload_image(
+        self,
+        image_data: bytes,
+        filename: str,
+        content_type: str = "image/png"
+    ) -> str:
+        """
+        Upload an image to the bucket.
+
+        Args:
+            image_data: Binary image data
+            filename: Desired filename (prefixed with the content hash)
+            content_type: MIME type of the image
+
+        Returns:
+            Public URL of the uploaded image
+
+        Raises:
+            Exception: If upload fails
+        """
+        key = quote(content_pathname(image_data, filename), safe="/-_.~")
+        url = f"{self.endpoint_url}/{self.bucket}/{key}"
+        headers = self._signed_headers(
+            "PUT",
+            url,
+            payload_hash=hashlib.sha256(image_data).hexdigest(),
+            headers={
+                "Content-Type": content_type,
+                "Content-Length": str(len(image_data)),
+            }
+        )
+
+        response = await self._request(
+            "PUT", url, headers=headers, timeout=30.0, body=lambda: self._body(image_data)
+        )
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to upload image to S3: {response.status_code} - {response.text}"
+            )
+
+        return f"{self.public_base_url}/{key}"
+
+    async def delete_image(self, url: str) -> bool:
+        """
+        Delete an image from the bucket.
+
+        Args:
+            url: Public URL of the image to delete
+
+        Returns:
+            True if successful, False otherwise (including URLs outside this bucket)
+        """
+        prefix = f"{self.public_base_url}/"
+        if not url.startswith(prefix):
+            return False
+
+        object_url = f"{self.endpoint_url}/{self.bucket}/{url[len(prefix):]}"
+        headers = self._signed_headers(
+            "DELETE", object_url, payload_hash=hashlib.sha256(b"").hexdigest(), headers={}
+        )
+        response = await self._request("DELETE", object_url, headers=headers, timeout=10.0)
+
+        return response.status_code in (200, 204)
+
+    def _signed_headers(
+        self,
+        method: str,
+        url: str,
+        payload_hash: str,
+        headers: Dict[str, str]
+    ) -> Dict[str, str]:
+        """Add AWS Signature V4 headers (host, x-amz-date, x-amz-content-sha256, Authorization)."""
+        parsed = httpx.URL(url)
+        now = datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        scope = f"{now.strftime('%Y%m%d')}/{self.region}/s3/aws4_request"
+
+        signed = {
+            "host": parsed.netloc.decode("ascii"),
+            "x-amz-content-sha256": payload_hash,
+            "x-amz-date": amz_date,
+        }
+        signed_names = ";".join(sorted(signed))
+        canonical_request = "\n".join([
+            method,
+            parsed.raw_path.decode("ascii").split("?", 1)[0],
+            "",
+            "".join(f"{name}:{signed[name]}\n" for name in sorted(signed)),
+            signed_names,
+            payload_hash,
+        ])
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ])
+
+        key = f"AWS4{self.secret_access_key}".encode()
+        for part in scope.split("/"):
+            key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+        signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+        return {
+            **headers,
+            "x-amz-content-sha256": payload_hash,
+            "x-amz-date": amz_date,
+            "Authorization": (
+                f"AWS4-HMAC-SHA256 Credential={self.access_key_id}/{scope}, "
+                f"SignedHeaders={signed_names}, Signature={signature}"
+            ),
+        }
+
+
+class LocalStorageService(StorageService):
+    """
+    Content-addressed image files on local disk.
+
+    Files are named <sha256><extension> and served by the API's static route
+    (mounted in src/main.py), so identical images are stored once.
+    """
+
+    backend = "local"
+
+    def __init__(self, base_url: str, directory: Optional[str] = None):
+        """
+        Args:
+            base_url: Public URL prefix of the static route (e.g. http://localhost:8000/files)
+            directory: Where files are written (None = <system temp dir>/yarda-storage)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.directory = Path(directory or os.path.join(tempfile.gettempdir(), "yarda-storage"))
+
+    async def open(self, **pool_options) -> None:
+        """Create the storage directory."""
+        await asyncio.to_thread(self.directory.mkdir, parents=True, exist_ok=True)
+
+    async def upload_image(
+        self,
+        image_data: bytes,
+        filename: str,
+        content_type: str = "image/png"
+    ) -> str:
+        """
+        Write an image to disk (skipped if the same content is already stored).
+
+        Args:
+            image_data: Binary image data
+            filename: Desired filename (only its extension is kept)
+            content_type: MIME type of the image (extension fallback)
+
+        Returns:
+            Public URL of the stored image
+        """
+        extension = Path(filename).suffix or mimetypes.guess_extension(content_type) or ""
+        name = f"{hashlib.sha256(image_data).hexdigest()}{extension.lower()}"
+
+        await asyncio.to_thread(self._write, name, image_data)
+        return f"{self.base_url}/{name}"
+
+    async def delete_image(self, url: str) -> bool:
+        """
+        Delete a stored image.
+
+        Args:
+            url: Public URL of the image to delete
+
+        Returns:
+            True if a file was removed, False otherwise
+        """
+        name = self._name(url)
+        if name is None:
+            return False
+
+        return await asyncio.to_thread(self._unlink, name)
+
+    async def image_exists(self, url: str) -> bool:
+        """
+        Check that a stored image is still on disk.
+
+        Args:
+            url: Public URL of the image
+
+        Returns:
+            True if the file exists, False otherwise
+        """
+        name = self._name(url)
+        if name is None:
+            return False
+
+        return await asyncio.to_thread((self.directory / name).is_file)
+
+    def _name(self, url: str) -> Optional[str]:
+        """File name behind a public URL, or None for URLs this backend did not produce."""
+        prefix = f"{self.base_url}/"
+        name = url[len(prefix):] if url.startswith(prefix) else ""
+        # Only plain content-addressed names, never paths outside the directory
+        if not re.fullmatch(r"[0-9a-f]{64}(\.[A-Za-z0-9]+)?", name):
+            return None
+        return name
+
+    def _write(self, name: str, data: bytes) -> None:
+        path = self.directory / name
+        if path.exists():
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so the static route never serves a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _unlink(self, name: str) -> bool:
+        try:
+            (self.directory / name).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+
+def create_storage_service(backend: str) -> StorageService:
+    """
+    Build the storage backend named by settings.storage_backend.
+
+    Raises:
+        ValueError: Unknown backend, or required credentials missing
+    """
+    http_options = dict(
+        max_attempts=settings.blob_upload_max_attempts,
+        retry_backoff_seconds=settings.blob_retry_backoff_seconds,
+        stream_threshold_bytes=settings.blob_stream_threshold_bytes,
+        chunk_size_bytes=settings.blob_upload_chunk_bytes
+    )
+
+    if backend == "vercel":
+        return BlobStorageService(**http_options)
+    if backend == "local":
+        base_url = settings.storage_public_base_url or settings.api_url
+        return LocalStorageService(
+            base_url=f"{base_url.rstrip('/')}{settings.storage_local_url_path}",
+            directory=settings.storage_local_dir or None
+        )
+    if backend == "s3":
+        return S3StorageService(
+            endpoint_url=settings.s3_endpoint_url,
+            bucket=settings.s3_bucket,
+            access_key_id=settings.s3_access_key_id,
+            secret_access_key=settings.s3_secret_access_key,
+            region=settings.s3_region,
+            public_base_url=settings.s3_public_base_url,
+            **http_options
+        )
+
+    raise ValueError(f"Unknown storage backend {backend!r} (expected one of {', '.join(STORAGE_BACKENDS)})")
 
 
-# Global storage service instance
-storage_service = BlobStorageService()
+# Global storage service instance (created on first use)
+_storage_service: Optional[StorageService] = None
 
 
-def get_storage_service() -> BlobStorageService:
+def get_storage_service() -> StorageService:
     """
     Dependency for FastAPI endpoints to access the storage service.
+    Uses lazy initialization so importing this module needs no storage credentials.
 
     Usage:
         @app.post("/upload")
-        async def upload(storage: BlobStorageService = Depends(get_storage_service)):
+        async def upload(storage: StorageService = Depends(get_storage_service)):
             url = await storage.upload_image(image_data, "design.png")
             return {"url": url}
     """
-    return storage_service
+    global _storage_service
+    if _storage_service is None:
+        _storage_service = create_storage_service(settings.storage_backend)
+    return _storage_service
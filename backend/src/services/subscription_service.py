@@ -32,6 +32,19 @@ from ..models.subscription import (
 logger = logging.getLogger(__name__)
 
 
+# Map Stripe statuses to our schema
+STRIPE_STATUS_MAP = {
+    'active': 'active',
+    'past_due': 'past_due',
+    'canceled': 'cancelled',
+    'cancelled': 'cancelled',
+    'unpaid': 'cancelled',
+    'incomplete': 'inactive',
+    'incomplete_expired': 'inactive',
+    'trialing': 'active',  # Treat trial as active
+}
+
+
 class SubscriptionService:
     """Service for subscription management with Stripe integration."""
 
@@ -220,17 +233,23 @@ class SubscriptionService:
         Returns:
             SubscriptionStatus with current state
         """
+        # Local read only (users + webhook-maintained subscriptions snapshot):
+        # authorization must not wait on Stripe. The snapshot's mapped status,
+        # period and cancellation flag win; users only covers subscriptions
+        # the snapshot has not seen yet.
         async with self.db_pool.acquire() as conn:
             user = await conn.fetchrow(
                 """
                 SELECT
-                    subscription_tier,
-                    subscription_status,
-                    stripe_subscription_id,
-                    current_period_end,
-                    cancel_at_period_end
-                FROM users
-                WHERE id = $1
+                    u.subscription_tier,
+                    COALESCE(s.status, u.subscription_status) AS subscription_status,
+                    u.stripe_subscription_id,
+                    COALESCE(s.current_period_end, u.current_period_end) AS current_period_end,
+                    COALESCE(s.cancel_at_period_end, u.cancel_at_period_end) AS cancel_at_period_end,
+                    s.current_period_start
+                FROM users u
+                LEFT JOIN subscriptions s ON s.stripe_subscription_id = u.stripe_subscription_id
+                WHERE u.id = $1
                 """,
                 user_id
             )
@@ -246,22 +265,10 @@ class SubscriptionService:
         if user['subscription_tier'] != 'free':
             plan = get_subscription_plan(user['subscription_tier'])
 
-        # Get period start from Stripe if we have subscription ID
-        current_period_start = None
-        if user['stripe_subscription_id']:
-            try:
-                stripe_sub = stripe.Subscription.retrieve(user['stripe_subscription_id'])
-                current_period_start = datetime.fromtimestamp(
-                    stripe_sub.current_period_start,
-                    tz=timezone.utc
-                )
-            except stripe.StripeError as e:
-                logger.warning(f"Failed to retrieve Stripe subscription: {e}")
-
         return SubscriptionStatus(
             is_active=is_active,
             plan=plan,
-            current_period_start=current_period_start,
+            current_period_start=user['current_period_start'],
             current_period_end=user['current_period_end'],
             cancel_at_period_end=user['cancel_at_period_end'],
             status=user['subscription_status']
@@ -477,19 +484,7 @@ class SubscriptionService:
         Returns:
             True if update successful
         """
-        # Map Stripe statuses to our schema
-        status_map = {
-            'active': 'active',
-            'past_due': 'past_due',
-            'canceled': 'cancelled',
-            'cancelled': 'cancelled',
-            'unpaid': 'cancelled',
-            'incomplete': 'inactive',
-            'incomplete_expired': 'inactive',
-            'trialing': 'active',  # Treat trial as active
-        }
-
-        mapped_status = status_map.get(status, 'inactive')
+        mapped_status = STRIPE_STATUS_MAP.get(status, 'inactive')
 
         async with self.db_pool.acquire() as conn:
             query_parts = ["UPDATE users SET subscription_status = $1, updated_at = NOW()"]
@@ -554,6 +549,95 @@ class SubscriptionService:
 
         return True
 
+    async def record_subscription_snapshot(
+        self,
+        user_id: UUID,
+        subscription_id: str,
+        event_created: Optional[int] = None,
+        customer_id: Optional[str] = None,
+        plan_id: Optional[str] = None,
+        stripe_status: Optional[str] = None,
+        current_period_start: Optional[datetime] = None,
+        current_period_end: Optional[datetime] = None,
+        cancel_at_period_end: Optional[bool] = None
+    ) -> bool:
+        """
+        Upsert the local snapshot of a Stripe subscription.
+
+        Called by webhook handlers so get_subscription_status() never has to
+        ask Stripe. Fields left as None keep their stored value. Events older
+        than the last applied one are ignored (Stripe does not guarantee
+        delivery order).
+
+        Args:
+            user_id: User UUID
+            subscription_id: Stripe subscription ID
+            event_created: Stripe event 'created' timestamp (seconds)
+            customer_id: Stripe customer ID
+            plan_id: Plan tier (e.g., 'monthly_pro')
+            stripe_status: Raw Stripe subscription status
+            current_period_start: Billing period start
+            current_period_end: Billing period end
+            cancel_at_period_end: Cancellation flag
+
+        Returns:
+            True if the snapshot was written, False if the event was stale
+        """
+        event_at = (
+            datetime.fromtimestamp(event_created, tz=timezone.utc)
+            if event_created else None
+        )
+        status = STRIPE_STATUS_MAP.get(stripe_status, 'inactive') if stripe_status else None
+
+        async with self.db_pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                INSERT INTO subscriptions (
+                    stripe_subscription_id,
+                    user_id,
+                    stripe_customer_id,
+                    plan_id,
+                    status,
+                    stripe_status,
+                    current_period_start,
+                    current_period_end,
+                    cancel_at_period_end,
+                    last_event_at
+                )
+                VALUES ($1, $2, $3, $4, COALESCE($5, 'active'), $6, $7, $8, COALESCE($9, false), $10)
+                ON CONFLICT (stripe_subscription_id) DO UPDATE
+                SET
+                    user_id = EXCLUDED.user_id,
+                    stripe_customer_id = COALESCE($3, subscriptions.stripe_customer_id),
+                    plan_id = COALESCE($4, subscriptions.plan_id),
+                    status = COALESCE($5, subscriptions.status),
+                    stripe_status = COALESCE($6, subscriptions.stripe_status),
+                    current_period_start = COALESCE($7, subscriptions.current_period_start),
+                    current_period_end = COALESCE($8, subscriptions.current_period_end),
+                    cancel_at_period_end = COALESCE($9, subscriptions.cancel_at_period_end),
+                    last_event_at = GREATEST(subscriptions.last_event_at, EXCLUDED.last_event_at)
+                WHERE $10::timestamptz IS NULL
+                   OR subscriptions.last_event_at IS NULL
+                   OR subscriptions.last_event_at <= $10::timestamptz
+                """,
+                subscription_id,
+                user_id,
+                customer_id,
+                plan_id,
+                status,
+                stripe_status,
+                current_period_start,
+                current_period_end,
+                cancel_at_period_end,
+                event_at
+            )
+
+        written = result is None or not result.endswith(" 0")
+        if not written:
+            logger.info(f"Ignored stale subscription event for {subscription_id}")
+
+        return written
+
     async def get_user_id_by_subscription_id(
         self,
         subscription_id: str
@@ -248,6 +248,49 @@ class TokenService:
 
                 return (True, new_balance)
 
+    async def refund_tokens_batch(
+        self,
+        user_id: UUID,
+        amount: int,
+        description: str = "Generation failed - refund"
+    ) -> Tuple[bool, int]:
+        """
+        Refund multiple tokens in one transaction with one ledger entry.
+
+        Requirements:
+        - FR-066: Refund tokens on generation failure
+        - FR-060: Multi-area cost calculation (1 credit per area)
+
+        Args:
+            user_id: User ID
+            amount: Number of tokens to refund (must be >= 1)
+            description: Transaction description
+
+        Returns:
+            Tuple of (success: bool, new_balance: int)
+            - success=False if no account exists
+
+        Raises:
+            ValueError: If amount < 1
+        """
+        if amount < 1:
+            raise ValueError("amount must be >= 1")
+
+        async with self.db_pool.acquire() as conn:
+            result = await conn.fetchrow(
+                """
+                SELECT * FROM add_tokens($1, $2, 'refund', $3, NULL)
+            """,
+                user_id,
+                amount,
+                description,
+            )
+
+        if result is None:
+            return (False, 0)
+
+        return (result["success"], result["new_balance"])
+
     async def create_token_account(
         self, user_id: UUID, initial_balance: int = 0
     ) -> bool:
@@ -529,3 +572,23 @@ class TokenService:
             return trigger_info
 
         return None
+
+
+# Global token service instance (created on first use or in the app lifespan)
+_token_service: Optional[TokenService] = None
+
+
+def get_token_service() -> TokenService:
+    """
+    Dependency for FastAPI endpoints to access the token service.
+
+    Usage:
+        @app.get("/balance")
+        async def balance(token_service: TokenService = Depends(get_token_service)):
+            return await token_service.get_token_balance(user.id)
+    """
+    global _token_service
+    if _token_service is None:
+        from src.db.connection_pool import db_pool
+        _token_service = TokenService(db_pool)
+    return _token_service
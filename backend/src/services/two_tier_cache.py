@@ -0,0 +1,137 @@
+"""
+Two-tier cache base: in-process LRU with TTL in front of a Postgres table.
+
+- Memory tier: microsecond hits, per process, least recently used evicted
+- Postgres tier: shared by every API node and worker, expires after days
+
+Subclasses (GeocodeCache, GenerationResultCache) supply only the table's SQL
+and the (de)serialization of their values. Both tiers are an optimization:
+database errors are logged and treated as misses, never raised.
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from src.db.connection_pool import DatabasePool
+
+logger = structlog.get_logger(__name__)
+
+
+def decode_jsonb(value: Any) -> Any:
+    """JSONB column value as Python data (asyncpg returns it as text without a codec)."""
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+class TwoTierCache(ABC):
+    """Memory LRU + Postgres cache; subclasses implement the Postgres reads and writes."""
+
+    # Prefix of the cache's log events ("<name>_read_failed", "<name>_write_failed")
+    name = "cache"
+
+    def __init__(
+        self,
+        db: Optional[DatabasePool] = None,
+        max_entries: int = 10000,
+        memory_ttl_seconds: float = 3600,
+        db_ttl_days: int = 30
+    ):
+        """
+        Args:
+            db: Database pool for the shared tier (None = memory only)
+            max_entries: Maximum keys held in memory
+            memory_ttl_seconds: How long an entry stays valid in memory
+            db_ttl_days: How long an entry stays valid in Postgres
+        """
+        self.db = db
+        self.max_entries = max_entries
+        self.memory_ttl_seconds = memory_ttl_seconds
+        self.db_ttl_days = db_ttl_days
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    async def _lookup(self, key: str) -> Optional[Any]:
+        """Memory tier, then Postgres (remembering a hit in memory); None on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return value
+            del self._entries[key]
+
+        value = await self._get_from_db(key)
+        if value is not None:
+            self.db_hits += 1
+            self._remember(key, value)
+            return value
+
+        self.misses += 1
+        return None
+
+    async def _store(self, key: str, value: Any, *db_args: Any) -> None:
+        """Store a value in both tiers (db_args are passed on to _write_to_db)."""
+        self._remember(key, value)
+
+        if self.db is None:
+            return
+
+        try:
+            await self._write_to_db(key, value, *db_args)
+        except Exception as e:
+            # The cache is an optimization - never fail the caller because of it
+            logger.warning(f"{self.name}_write_failed", error=str(e))
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset counters."""
+        self._entries.clear()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        lookups = self.memory_hits + self.db_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.db_hits) / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._entries),
+            "max_entries": self.max_entries
+        }
+
+    def _remember(self, key: str, value: Any) -> None:
+        """Insert into the memory tier, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.memory_ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _get_from_db(self, key: str) -> Optional[Any]:
+        """Read an unexpired entry from the Postgres tier (None on a miss or error)."""
+        if self.db is None:
+            return None
+
+        try:
+            return await self._read_from_db(key)
+        except Exception as e:
+            logger.warning(f"{self.name}_read_failed", error=str(e))
+            return None
+
+    @abstractmethod
+    async def _read_from_db(self, key: str) -> Optional[Any]:
+        """Fetch and deserialize the unexpired row for key, or None."""
+
+    @abstractmethod
+    async def _write_to_db(self, key: str, value: Any, *db_args: Any) -> None:
+        """Serialize and upsert value for key, expiring after db_ttl_days."""
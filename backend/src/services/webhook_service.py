@@ -31,6 +31,26 @@ from .subscription_service import SubscriptionService
 logger = logging.getLogger(__name__)
 
 
+def _invoice_period(invoice: dict) -> tuple:
+    """
+    Billing period covered by a subscription invoice.
+
+    Taken from the subscription line item (the invoice's own period_start /
+    period_end describe the previous period for renewals).
+
+    Returns:
+        (period_start, period_end) as datetimes, or (None, None) if absent
+    """
+    for line in invoice.get("lines", {}).get("data", []):
+        period = line.get("period") or {}
+        if period.get("start") and period.get("end"):
+            return (
+                datetime.fromtimestamp(period["start"], tz=timezone.utc),
+                datetime.fromtimestamp(period["end"], tz=timezone.utc),
+            )
+    return None, None
+
+
 class WebhookService:
     """Service for processing Stripe webhooks."""
 
@@ -300,6 +320,17 @@ class WebhookService:
             current_period_start=period_start,
             current_period_end=period_end
         )
+        await self.subscription_service.record_subscription_snapshot(
+            user_id=user_id,
+            subscription_id=subscription_id,
+            event_created=event.get("created"),
+            customer_id=customer_id,
+            plan_id=plan_id,
+            stripe_status=status,
+            current_period_start=period_start,
+            current_period_end=period_end,
+            cancel_at_period_end=subscription.get("cancel_at_period_end", False)
+        )
 
         logger.info(f"Subscription created and activated: user={user_id}, subscription={subscription_id}")
 
@@ -328,6 +359,7 @@ class WebhookService:
 
         subscription_id = subscription.get("id")
         status = subscription.get("status")
+        current_period_start = subscription.get("current_period_start")
         current_period_end = subscription.get("current_period_end")
         cancel_at_period_end = subscription.get("cancel_at_period_end", False)
 
@@ -351,6 +383,19 @@ class WebhookService:
             current_period_end=period_end,
             cancel_at_period_end=cancel_at_period_end
         )
+        await self.subscription_service.record_subscription_snapshot(
+            user_id=user_id,
+            subscription_id=subscription_id,
+            event_created=event.get("created"),
+            customer_id=subscription.get("customer"),
+            stripe_status=status,
+            current_period_start=(
+                datetime.fromtimestamp(current_period_start, tz=timezone.utc)
+                if current_period_start else None
+            ),
+            current_period_end=period_end,
+            cancel_at_period_end=cancel_at_period_end
+        )
 
         logger.info(
             f"Subscription updated: user={user_id}, subscription={subscription_id}, "
@@ -394,6 +439,12 @@ class WebhookService:
 
         # Deactivate subscription
         await self.subscription_service.deactivate_subscription(user_id)
+        await self.subscription_service.record_subscription_snapshot(
+            user_id=user_id,
+            subscription_id=subscription_id,
+            event_created=event.get("created"),
+            stripe_status=subscription.get("status") or "canceled"
+        )
 
         logger.info(f"Subscription deleted and deactivated: user={user_id}, subscription={subscription_id}")
 
@@ -445,6 +496,16 @@ class WebhookService:
             user_id=user_id,
             status='active'
         )
+        period_start, period_end = _invoice_period(invoice)
+        await self.subscription_service.record_subscription_snapshot(
+            user_id=user_id,
+            subscription_id=subscription_id,
+            event_created=event.get("created"),
+            customer_id=customer_id,
+            stripe_status='active',
+            current_period_start=period_start,
+            current_period_end=period_end
+        )
 
         logger.info(f"Invoice payment succeeded: user={user_id}, subscription={subscription_id}")
 
@@ -495,6 +556,13 @@ class WebhookService:
             user_id=user_id,
             status='past_due'
         )
+        await self.subscription_service.record_subscription_snapshot(
+            user_id=user_id,
+            subscription_id=subscription_id,
+            event_created=event.get("created"),
+            customer_id=invoice.get("customer"),
+            stripe_status='past_due'
+        )
 
         logger.warning(f"Invoice payment failed: user={user_id}, subscription={subscription_id}")
         # TODO: Send email notification about failed payment
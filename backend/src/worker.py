@@ -0,0 +1,457 @@
+"""
+Generation worker entry point.
+
+Claims per-area jobs from the generation_jobs table and runs them through
+GenerationService.process_generation. Runs as its own process so API nodes
+and generation workers can be deployed and scaled independently:
+
+    cd backend && python -m src.worker
+
+Any number of worker processes may run at once; jobs are claimed with
+FOR UPDATE SKIP LOCKED so each area is processed by exactly one worker.
+
+Requirements:
+- FR-014: Background processing continues across deploys/restarts
+- FR-011: Automatic refund on failure
+- FR-070: Parallel processing of generation areas
+"""
+
+import asyncio
+import os
+import signal
+import socket
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+
+import structlog
+
+from src.config import settings
+from src.db.connection_pool import db_pool
+from src.services.generation_job_queue import GenerationJobQueue
+from src.services.generation_service import GenerationService, get_generation_service
+from src.services.maps_service import MapsService, MapsServiceError, PropertyImagery
+from src.services.resilience import CircuitOpenError
+from src.services.storage_service import get_storage_service
+
+logger = structlog.get_logger(__name__)
+
+
+class GenerationWorker:
+    """
+    Polls the generation job queue and processes claimed areas concurrently.
+
+    Areas of the same generation run in parallel (up to ``per_generation_limit``),
+    so a multi-area request finishes in roughly the time of its slowest area.
+    ``global_limit`` caps running jobs across every worker process, and each
+    area fails and is refunded independently of its siblings. Areas rejected
+    by an open Gemini circuit (an outage) are failed and refunded together,
+    in one bulk call per poll.
+    """
+
+    def __init__(
+        self,
+        queue: GenerationJobQueue,
+        generation_service: GenerationService,
+        concurrency: int = 4,
+        per_generation_limit: Optional[int] = None,
+        global_limit: Optional[int] = None,
+        poll_interval_seconds: float = 1.0,
+        job_timeout_seconds: float = 300,
+        retry_delay_seconds: float = 30.0,
+        worker_id: Optional[str] = None
+    ):
+        self.queue = queue
+        self.generation_service = generation_service
+        self.concurrency = max(1, concurrency)
+        self.per_generation_limit = per_generation_limit
+        self.global_limit = global_limit
+        self.poll_interval_seconds = poll_interval_seconds
+        self.job_timeout_seconds = job_timeout_seconds
+        self.retry_delay_seconds = retry_delay_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: Set[asyncio.Task] = set()
+        self._imagery: Dict[UUID, asyncio.Task] = {}
+        self._generation_jobs: Dict[UUID, int] = {}
+        self._outage_jobs: List[Dict[str, Any]] = []
+        self._outage_error: Optional[str] = None
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """
+        Main loop: recover stale jobs, claim free slots' worth of jobs, repeat.
+
+        Returns once ``stop_event`` is set and in-flight jobs have finished.
+        """
+        logger.info(
+            "generation_worker_started",
+            worker_id=self.worker_id,
+            concurrency=self.concurrency
+        )
+
+        while not stop_event.is_set():
+            claimed = 0
+            try:
+                await self.fail_outage_jobs()
+                await self.recover_stale_jobs()
+
+                free_slots = self.concurrency - len(self._tasks)
+                if free_slots > 0:
+                    jobs = await self.queue.claim(
+                        self.worker_id,
+                        limit=free_slots,
+                        per_generation_limit=self.per_generation_limit,
+                        global_limit=self.global_limit
+                    )
+                    claimed = len(jobs)
+                    for job in jobs:
+                        task = asyncio.create_task(self.run_job(job))
+                        self._tasks.add(task)
+                        task.add_done_callback(self._tasks.discard)
+            except Exception as e:
+                logger.error(
+                    "generation_worker_poll_failed",
+                    worker_id=self.worker_id,
+                    error=str(e),
+                    exc_info=True
+                )
+
+            # Poll again immediately while there is backlog and capacity
+            if claimed and len(self._tasks) < self.concurrency:
+                continue
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+        if self._tasks:
+            logger.info(
+                "generation_worker_draining",
+                worker_id=self.worker_id,
+                in_flight=len(self._tasks)
+            )
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        try:
+            await self.fail_outage_jobs()
+        except Exception as e:
+            # Lock expiry will hand the jobs to recover_stale_jobs
+            logger.error(
+                "generation_outage_refund_failed",
+                worker_id=self.worker_id,
+                error=str(e)
+            )
+
+        logger.info("generation_worker_stopped", worker_id=self.worker_id)
+
+    async def recover_stale_jobs(self) -> None:
+        """Re-queue jobs abandoned by crashed workers; refund those out of attempts."""
+        # Allow the job's own timeout plus a grace period before declaring it abandoned
+        exhausted = await self.queue.recover_stale(self.job_timeout_seconds + 60)
+        if exhausted:
+            await self.generation_service.fail_areas(
+                [
+                    {
+                        'generation_id': job['generation_id'],
+                        'area_id': job['area_id'],
+                        'user_id': job['user_id'],
+                        'payment_method': job['payload'].get('payment_method')
+                    }
+                    for job in exhausted
+                ],
+                error_message="Generation worker stopped responding"
+            )
+
+    async def fail_outage_jobs(self) -> None:
+        """Fail and refund, in one bulk call, the areas an open Gemini circuit rejected."""
+        jobs, self._outage_jobs = self._outage_jobs, []
+        if not jobs:
+            return
+
+        error_message = f"Gemini API error: {self._outage_error}"
+        try:
+            await self.generation_service.fail_areas(
+                [
+                    {
+                        'generation_id': job['generation_id'],
+                        'area_id': job['area_id'],
+                        'user_id': job['user_id'],
+                        'payment_method': job['payload'].get('payment_method')
+                    }
+                    for job in jobs
+                ],
+                error_message=error_message
+            )
+        except Exception:
+            # Try again on the next poll
+            self._outage_jobs = jobs + self._outage_jobs
+            raise
+
+        for job in jobs:
+            await self.queue.fail(job['id'], error_message)
+
+        logger.warning(
+            "generation_outage_areas_refunded",
+            worker_id=self.worker_id,
+            areas=len(jobs)
+        )
+
+    async def run_job(self, job: Dict[str, Any]) -> None:
+        """
+        Process one claimed job and record its outcome on the queue.
+
+        process_generation handles its own failures (marks the area failed and
+        refunds), so only unexpected infrastructure errors are retried. Areas
+        rejected by an open Gemini circuit are left to fail_outage_jobs.
+        """
+        job_id = job['id']
+        payload = job['payload']
+        generation_id = job['generation_id']
+        self._generation_jobs[generation_id] = self._generation_jobs.get(generation_id, 0) + 1
+
+        try:
+            async with asyncio.timeout(self.job_timeout_seconds):
+                await self._process_area(job)
+            await self.queue.complete(job_id)
+
+        except asyncio.TimeoutError:
+            logger.error(
+                "generation_job_timeout",
+                job_id=str(job_id),
+                generation_id=str(job['generation_id']),
+                area_id=str(job['area_id']),
+                timeout_seconds=self.job_timeout_seconds
+            )
+            await self.generation_service.fail_area(
+                generation_id=job['generation_id'],
+                area_id=job['area_id'],
+                user_id=job['user_id'],
+                payment_method=payload.get('payment_method'),
+                error_message=f"Generation timeout - exceeded {int(self.job_timeout_seconds)} second limit"
+            )
+            await self.queue.fail(job_id, "Generation timeout")
+
+        except CircuitOpenError as e:
+            # Gemini outage: failed and refunded with every other rejected area
+            # by fail_outage_jobs on the next poll
+            logger.warning(
+                "generation_job_circuit_open",
+                job_id=str(job_id),
+                area_id=str(job['area_id']),
+                retry_after_seconds=e.retry_after_seconds
+            )
+            self._outage_error = str(e)
+            self._outage_jobs.append(job)
+
+        except Exception as e:
+            logger.error(
+                "generation_job_error",
+                job_id=str(job_id),
+                generation_id=str(job['generation_id']),
+                area_id=str(job['area_id']),
+                attempt=job['attempts'],
+                error=str(e),
+                exc_info=True
+            )
+            try:
+                requeued = await self.queue.fail(
+                    job_id,
+                    str(e),
+                    retry_delay_seconds=self.retry_delay_seconds
+                )
+                if not requeued:
+                    await self.generation_service.fail_area(
+                        generation_id=job['generation_id'],
+                        area_id=job['area_id'],
+                        user_id=job['user_id'],
+                        payment_method=payload.get('payment_method'),
+                        error_message=f"Generation failed: {str(e)}"
+                    )
+            except Exception as fail_error:
+                # Lock expiry will hand the job to recover_stale_jobs
+                logger.error(
+                    "generation_job_fail_record_failed",
+                    job_id=str(job_id),
+                    error=str(fail_error)
+                )
+
+        finally:
+            self._generation_jobs[generation_id] -= 1
+            if not self._generation_jobs[generation_id]:
+                # Last job of this generation in this worker - drop its imagery
+                del self._generation_jobs[generation_id]
+                self._imagery.pop(generation_id, None)
+
+    async def _process_area(self, job: Dict[str, Any]) -> None:
+        """Fetch the area's image into the generation's imagery bundle and run process_generation."""
+        generation_id = job['generation_id']
+        area_id = job['area_id']
+        payload = job['payload']
+        address = payload['address']
+
+        area_record = await self.generation_service.db.fetchrow("""
+            SELECT area_type, style, custom_prompt, status
+            FROM generation_areas
+            WHERE id = $1
+        """, area_id)
+
+        if not area_record:
+            logger.error("generation_job_area_not_found", area_id=str(area_id))
+            return
+
+        if area_record['status'] in ('completed', 'failed'):
+            # Already finished by a previous attempt
+            return
+
+        area_type = area_record['area_type']
+        imagery = await self._get_imagery(job)
+        maps_service = self.generation_service.maps_service
+
+        if payload.get('upload_source_image') and imagery.has_street_view:
+            await maps_service.fetch_property_images(imagery, areas=['front_yard'])
+            await self._upload_source_image(generation_id, imagery.street_view_bytes)
+
+        try:
+            # Fetches only this area's image (fallback lazily); siblings reuse the bundle
+            area_image_bytes, image_source = await maps_service.get_area_image(imagery, area_type)
+        except MapsServiceError as e:
+            # Not transient - no point retrying the job
+            await self.generation_service.fail_area(
+                generation_id=generation_id,
+                area_id=area_id,
+                user_id=job['user_id'],
+                payment_method=payload['payment_method'],
+                error_message=f"Failed to retrieve property imagery: {e.message}"
+            )
+            return
+
+        logger.info(
+            "area_image_retrieved",
+            area_id=str(area_id),
+            area_type=area_type,
+            image_source=image_source,
+            size_bytes=len(area_image_bytes)
+        )
+
+        success, error = await self.generation_service.process_generation(
+            generation_id=generation_id,
+            area_id=area_id,
+            user_id=job['user_id'],
+            input_image_bytes=area_image_bytes,
+            address=address,
+            area_type=area_type,
+            style=area_record['style'],
+            custom_prompt=area_record['custom_prompt'],
+            payment_method=payload['payment_method'],
+            preservation_strength=payload.get('preservation_strength', 0.5),
+            regenerate=payload.get('regenerate', False)
+        )
+
+        if success:
+            logger.info("area_generation_completed", area_id=str(area_id))
+        else:
+            logger.error("area_generation_failed", area_id=str(area_id), error=error)
+
+    async def _get_imagery(self, job: Dict[str, Any]) -> PropertyImagery:
+        """
+        Return the generation's shared PropertyImagery bundle.
+
+        Concurrent jobs of the same generation await the same bundle, so each
+        image is downloaded at most once no matter how many areas need it. The
+        bundle is kept while any job of that generation is running in this worker.
+        """
+        generation_id = job['generation_id']
+        fetch = self._imagery.get(generation_id)
+
+        if fetch is None or (fetch.done() and (fetch.cancelled() or fetch.exception())):
+            fetch = asyncio.create_task(self._fetch_imagery(job['payload']))
+            self._imagery[generation_id] = fetch
+
+        # Shield so one area timing out does not cancel the fetch its siblings are awaiting
+        return await asyncio.shield(fetch)
+
+    async def _fetch_imagery(self, payload: Dict[str, Any]) -> PropertyImagery:
+        """Rebuild the bundle from a job's imagery payload (geocoding only for legacy jobs without one)."""
+        if payload.get('imagery'):
+            return PropertyImagery.from_payload(payload['imagery'])
+
+        return await self.generation_service.maps_service.build_property_imagery(
+            payload['address'],
+            fetch_images=False
+        )
+
+    async def _upload_source_image(self, generation_id, street_view_bytes: Optional[bytes]) -> None:
+        """Upload the Street View source image and replace the 'pending_upload' placeholder."""
+        if not street_view_bytes:
+            return
+
+        try:
+            street_view_url = await self.generation_service.storage.upload_image(
+                image_data=street_view_bytes,
+                filename=f"streetview_{generation_id}.jpg",
+                content_type="image/jpeg"
+            )
+
+            await self.generation_service.db.execute("""
+                UPDATE generation_source_images
+                SET image_url = $1
+                WHERE generation_id = $2 AND image_type = 'street_view'
+            """, street_view_url, generation_id)
+
+            logger.info(
+                "street_view_uploaded",
+                generation_id=str(generation_id),
+                url=street_view_url
+            )
+        except Exception as e:
+            # Continue processing even if Street View upload fails
+            logger.error(
+                "street_view_upload_failed",
+                generation_id=str(generation_id),
+                error=str(e)
+            )
+
+
+async def main() -> None:
+    """Connect to the database and run a GenerationWorker until SIGINT/SIGTERM."""
+    await db_pool.connect()
+    await MapsService.open_session(
+        limit=settings.maps_http_pool_limit,
+        limit_per_host=settings.maps_http_pool_limit_per_host,
+        dns_cache_ttl_seconds=settings.maps_http_dns_cache_ttl_seconds,
+        keepalive_timeout_seconds=settings.maps_http_keepalive_seconds
+    )
+    await get_storage_service().open(
+        max_connections=settings.blob_max_connections,
+        max_keepalive_connections=settings.blob_max_keepalive_connections,
+        keepalive_expiry_seconds=settings.blob_keepalive_seconds,
+        http2=settings.blob_http2
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            pass
+
+    try:
+        worker = GenerationWorker(
+            queue=GenerationJobQueue(db_pool, max_attempts=settings.generation_job_max_attempts),
+            generation_service=await get_generation_service(db_pool),
+            concurrency=settings.generation_worker_concurrency,
+            per_generation_limit=settings.generation_max_concurrent_areas_per_generation,
+            global_limit=settings.generation_max_concurrent_areas_global,
+            poll_interval_seconds=settings.generation_worker_poll_interval_seconds,
+            job_timeout_seconds=settings.generation_timeout_seconds,
+            retry_delay_seconds=settings.generation_job_retry_delay_seconds
+        )
+        await worker.run(stop_event)
+    finally:
+        await get_storage_service().close()
+        await MapsService.close_session()
+        await db_pool.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
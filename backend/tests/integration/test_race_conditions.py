@@ -15,6 +15,7 @@ import pytest
 import pytest_asyncio
 import asyncio
 import asyncpg
+import os
 from typing import List
 from uuid import UUID
 
@@ -160,6 +161,66 @@ async def test_concurrent_token_deduction_prevents_negative_balance(db_connectio
     # Cleanup
     await db_connection.execute("DELETE FROM users WHERE id = $1", user_id)
 
+@pytest.mark.asyncio
+async def test_token_refund_concurrent_with_authorize_and_deduct(db_connection, token_user):
+    """
+    TC-RACE-2.2: Token Refund vs. Generation Request (Lock Order)
+
+    Scenario: refund_credits_bulk token refunds (failed areas) run at the same
+    time as authorize_and_deduct calls (new generations) for the same user
+    Expected: No deadlock - authorize_and_deduct locks users then the token
+    account, and neither the refund nor its ledger insert waits on users
+    while holding the token account
+    Assertion: Every call succeeds and the balance nets out
+    """
+    user_id = token_user
+    await db_connection.execute("""
+        INSERT INTO users_token_accounts (user_id, balance) VALUES ($1, 20)
+    """, user_id)
+    version_before = await db_connection.fetchval("""
+        SELECT version FROM users_token_accounts WHERE user_id = $1
+    """, user_id)
+
+    database_url = os.getenv("DATABASE_URL")
+
+    async def refund_token() -> int:
+        conn = await asyncpg.connect(database_url, statement_cache_size=0)
+        try:
+            row = await conn.fetchrow("""
+                SELECT * FROM refund_credits_bulk($1::UUID[], $2::TEXT[], $3::INTEGER[])
+            """, [user_id], ['token'], [1])
+            return row['refunded']
+        finally:
+            await conn.close()
+
+    async def authorize() -> bool:
+        conn = await asyncpg.connect(database_url, statement_cache_size=0)
+        try:
+            row = await conn.fetchrow("""
+                SELECT * FROM authorize_and_deduct($1, 1)
+            """, user_id)
+            return row['success']
+        finally:
+            await conn.close()
+
+    tasks = []
+    for _ in range(10):
+        tasks.append(refund_token())
+        tasks.append(authorize())
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    assert not errors, f"Concurrent refund/deduction failed: {errors!r}"
+    assert all(results)
+
+    balance, version_after = await db_connection.fetchrow("""
+        SELECT balance, version FROM users_token_accounts WHERE user_id = $1
+    """, user_id)
+    assert balance == 20, f"Expected balance=20 after 10 refunds and 10 deductions, got {balance}"
+    # Every refund and deduction bumps the token account's ETag version
+    assert version_after == version_before + 20
+
 @pytest.mark.asyncio
 async def test_check_constraint_prevents_negative_trial():
     """
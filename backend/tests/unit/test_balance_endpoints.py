@@ -0,0 +1,99 @@
+"""
+Unit Tests: Conditional GET on balance endpoints
+
+Tests for GET /v1/credits/balance and GET /tokens/balance:
+- Full responses carry an ETag built from the balance version (users plus token account)
+- A matching If-None-Match gets 304 without loading balances
+
+Requirements:
+- T051: Token balance endpoint (<100ms)
+- FR-015: Display token balance in UI
+"""
+
+import pytest
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import Response
+
+from src.api.endpoints import credits, tokens
+from src.api.conditional import etag_matches, make_etag
+
+
+class TestEtagMatching:
+
+    def test_weak_and_listed_tags_match(self):
+        etag = make_etag("credits", "u", 3)
+        request = MagicMock(headers={'if-none-match': f'"other", W/{etag}'})
+
+        assert etag == '"credits-u-3"'
+        assert etag_matches(request, etag)
+
+    def test_missing_or_different_tag_does_not_match(self):
+        etag = make_etag("credits", "u", 3)
+
+        assert not etag_matches(MagicMock(headers={}), etag)
+        assert not etag_matches(MagicMock(headers={'if-none-match': '"credits-u-2"'}), etag)
+
+
+class TestCreditsBalance:
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_skips_balance_queries(self):
+        user_id = uuid4()
+        credit_service = MagicMock()
+        credit_service.get_balance_version = AsyncMock(return_value=7)
+        credit_service.get_all_balances_detailed = AsyncMock()
+        request = MagicMock(headers={'if-none-match': f'"credits-{user_id}-7"'})
+
+        result = await credits.get_unified_balance(
+            request, Response(), current_user=MagicMock(id=user_id), credit_service=credit_service
+        )
+
+        assert result.status_code == 304
+        credit_service.get_all_balances_detailed.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_full_response_sets_etag(self):
+        user_id = uuid4()
+        credit_service = MagicMock()
+        credit_service.get_balance_version = AsyncMock(return_value=8)
+        credit_service.get_all_balances_detailed = AsyncMock(return_value={
+            'trial': {'remaining': 2, 'used': 1},
+            'token': {'balance': 5, 'total_purchased': 10, 'total_spent': 5},
+            'holiday': {
+                'credits': 1, 'earned': 1, 'can_generate': True,
+                'earnings_breakdown': {'signup_bonus': 1, 'social_shares': 0, 'other': 0}
+            }
+        })
+        response = Response()
+
+        result = await credits.get_unified_balance(
+            MagicMock(headers={'if-none-match': f'"credits-{user_id}-7"'}), response,
+            current_user=MagicMock(id=user_id), credit_service=credit_service
+        )
+
+        assert result.token.balance == 5
+        assert response.headers['etag'] == f'"credits-{user_id}-8"'
+        assert response.headers['cache-control'] == 'private, no-cache'
+
+
+class TestTokenBalance:
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_skips_transaction_aggregate(self):
+        user_id = uuid4()
+        db_pool = MagicMock()
+        db_pool.fetchval = AsyncMock(return_value=3)
+        token_service = MagicMock()
+        token_service.get_token_balance = AsyncMock()
+        request = MagicMock(headers={'if-none-match': f'"tokens-{user_id}-3"'})
+
+        with patch.object(tokens, 'AutoReloadService'):
+            result = await tokens.get_token_balance(
+                request, Response(), user=MagicMock(id=user_id),
+                db_pool=db_pool, token_service=token_service
+            )
+
+        assert result.status_code == 304
+        token_service.get_token_balance.assert_not_awaited()
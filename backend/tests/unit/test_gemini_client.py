@@ -0,0 +1,279 @@
+"""
+Unit Tests: GeminiClient
+
+Tests that image generation does not block the event loop:
+- The SDK's async stream (client.aio) is used, so other tasks keep running
+- A process-wide adaptive limit caps concurrent Gemini calls
+- The request timeout cancels a hung stream
+- Throttling shrinks the limit and an open circuit fails fast
+- A throttled API key fails over to the next key in the pool
+
+And that the result cache key covers everything the model receives.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.services.gemini_client import GeminiClient
+from src.services.resilience import CircuitOpenError
+
+
+def image_chunk(data: bytes = b"image"):
+    """Build a streamed response chunk carrying inline image data."""
+    part = SimpleNamespace(inline_data=SimpleNamespace(data=data), text=None)
+    return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+
+@pytest.fixture
+def gemini(monkeypatch):
+    with patch("src.services.gemini_client.genai.Client"):
+        client = GeminiClient()
+    # Fresh limiter and breaker per test (the limiter binds to the running event loop)
+    monkeypatch.setattr(GeminiClient, "_limiter", None)
+    monkeypatch.setattr(GeminiClient, "_breaker", None)
+    return client
+
+
+def stream_of(*chunks, delay: float = 0.01, on_start=None):
+    """Fake client.aio.models.generate_content_stream returning an async iterator."""
+    async def generate_content_stream(**kwargs):
+        async def iterate():
+            if on_start:
+                on_start()
+            for chunk in chunks:
+                await asyncio.sleep(delay)
+                yield chunk
+        return iterate()
+    return generate_content_stream
+
+
+class TestGenerateLandscapeDesign:
+
+    @pytest.mark.asyncio
+    async def test_uses_async_stream(self, gemini):
+        gemini.client.aio.models.generate_content_stream = stream_of(image_chunk(b"design"))
+
+        result = await gemini.generate_landscape_design(
+            input_image=b"yard",
+            address="1600 Amphitheatre Pkwy",
+            area_type="front_yard",
+            style="modern_minimalist"
+        )
+
+        assert result == b"design"
+        gemini.client.models.generate_content_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, gemini):
+        gemini.client.aio.models.generate_content_stream = stream_of(image_chunk(), delay=0.05)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        await gemini.generate_landscape_design(
+            input_image=b"yard",
+            address=None,
+            area_type="backyard",
+            style="modern_minimalist"
+        )
+        ticking.cancel()
+
+        assert ticks > 3
+
+    @pytest.mark.asyncio
+    async def test_limit_caps_concurrent_calls(self, gemini, monkeypatch):
+        monkeypatch.setattr("src.services.gemini_client.settings.gemini_max_concurrent_requests", 2)
+        in_flight = 0
+        max_in_flight = 0
+
+        def started():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+
+        base_stream = stream_of(image_chunk(), delay=0.02, on_start=started)
+
+        async def tracked_stream(**kwargs):
+            inner = await base_stream(**kwargs)
+
+            async def iterate():
+                nonlocal in_flight
+                async for chunk in inner:
+                    yield chunk
+                in_flight -= 1
+            return iterate()
+
+        gemini.client.aio.models.generate_content_stream = tracked_stream
+
+        await asyncio.gather(*[
+            gemini.generate_landscape_design(
+                input_image=f"yard {i}".encode(),
+                address=None,
+                area_type="backyard",
+                style="modern_minimalist"
+            )
+            for i in range(5)
+        ])
+
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_hung_stream(self, gemini, monkeypatch):
+        monkeypatch.setattr(GeminiClient, "REQUEST_TIMEOUT_SECONDS", 0.05)
+        gemini.client.aio.models.generate_content_stream = stream_of(image_chunk(), delay=10)
+        gemini.usage_monitor = MagicMock()
+
+        with pytest.raises(Exception, match="timeout"):
+            await asyncio.wait_for(
+                gemini.generate_landscape_design(
+                    input_image=b"yard",
+                    address=None,
+                    area_type="backyard",
+                    style="modern_minimalist"
+                ),
+                timeout=2
+            )
+
+        statuses = [call.kwargs["status"] for call in gemini.usage_monitor.record_request.call_args_list]
+        assert "timeout" in statuses
+
+
+class ThrottledError(Exception):
+    """Stand-in for google.genai.errors.ClientError with code 429."""
+    code = 429
+
+
+def failing_stream(error):
+    async def generate_content_stream(**kwargs):
+        raise error
+    return generate_content_stream
+
+
+class TestAdaptiveLimitAndBreaker:
+
+    @pytest.mark.asyncio
+    async def test_throttling_halves_limit_and_success_grows_it(self, gemini, monkeypatch):
+        monkeypatch.setattr("src.services.gemini_client.settings.gemini_max_concurrent_requests", 8)
+        gemini.usage_monitor = MagicMock()
+        gemini.client.aio.models.generate_content_stream = failing_stream(ThrottledError("429"))
+
+        with pytest.raises(Exception):
+            await gemini.generate_landscape_design(
+                input_image=b"yard", address=None, area_type="backyard", style="modern_minimalist"
+            )
+
+        limiter = GeminiClient._get_limiter()
+        assert int(limiter.limit) == 4
+
+        gemini.client.aio.models.generate_content_stream = stream_of(image_chunk(), delay=0)
+        # +1/limit per success: about one more slot per round of `limit` calls
+        for i in range(5):
+            await gemini.generate_landscape_design(
+                input_image=f"yard {i}".encode(), address=None,
+                area_type="backyard", style="modern_minimalist"
+            )
+        assert int(limiter.limit) == 5
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast_without_calling_gemini(self, gemini, monkeypatch):
+        monkeypatch.setattr("src.services.gemini_client.settings.gemini_breaker_min_calls", 2)
+        gemini.usage_monitor = MagicMock()
+        gemini.client.aio.models.generate_content_stream = failing_stream(ThrottledError("429"))
+
+        for i in range(2):
+            with pytest.raises(Exception):
+                await gemini.generate_landscape_design(
+                    input_image=f"yard {i}".encode(), address=None,
+                    area_type="backyard", style="modern_minimalist"
+                )
+
+        gemini.client.aio.models.generate_content_stream = MagicMock()
+        with pytest.raises(CircuitOpenError):
+            await gemini.generate_landscape_design(
+                input_image=b"yard", address=None, area_type="backyard", style="modern_minimalist"
+            )
+
+        gemini.client.aio.models.generate_content_stream.assert_not_called()
+        stats = GeminiClient.get_resilience_stats()
+        assert stats["breaker"]["state"] == "open"
+        assert stats["breaker"]["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bad_request_does_not_open_circuit(self, gemini, monkeypatch):
+        monkeypatch.setattr("src.services.gemini_client.settings.gemini_breaker_min_calls", 2)
+        gemini.usage_monitor = MagicMock()
+        bad_request = ThrottledError("400")
+        bad_request.code = 400
+        gemini.client.aio.models.generate_content_stream = failing_stream(bad_request)
+
+        for i in range(3):
+            with pytest.raises(Exception):
+                await gemini.generate_landscape_design(
+                    input_image=f"yard {i}".encode(), address=None,
+                    area_type="backyard", style="modern_minimalist"
+                )
+
+        assert GeminiClient.get_resilience_stats()["breaker"]["state"] == "closed"
+
+
+class TestKeyPoolFailover:
+
+    @pytest.fixture
+    def pooled(self, monkeypatch):
+        monkeypatch.setenv("GEMINI_API_KEYS", "second-key")
+        with patch("src.services.gemini_client.genai.Client", side_effect=lambda api_key: MagicMock()):
+            client = GeminiClient()
+        monkeypatch.setattr(GeminiClient, "_limiter", None)
+        monkeypatch.setattr(GeminiClient, "_breaker", None)
+        client.usage_monitor = MagicMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_throttled_key_fails_over_to_next_key(self, pooled):
+        first, second = pooled.key_pool._keys
+        first.client.aio.models.generate_content_stream = failing_stream(ThrottledError("429"))
+        second.client.aio.models.generate_content_stream = stream_of(image_chunk(b"design"), delay=0)
+
+        result = await pooled.generate_landscape_design(
+            input_image=b"yard", address=None, area_type="backyard", style="modern_minimalist"
+        )
+
+        assert result == b"design"
+        stats = pooled.key_pool.get_stats()["keys"]
+        assert stats[0]["throttled"] == 1
+        assert stats[1]["successes"] == 1
+        # The failed-over 429 never reached the caller, so the limit is untouched
+        assert GeminiClient.get_resilience_stats()["limiter"]["decreases"] == 0
+
+    @pytest.mark.asyncio
+    async def test_every_key_throttled_raises(self, pooled):
+        for state in pooled.key_pool._keys:
+            state.client.aio.models.generate_content_stream = failing_stream(ThrottledError("429"))
+
+        with pytest.raises(Exception):
+            await pooled.generate_landscape_design(
+                input_image=b"yard", address=None, area_type="backyard", style="modern_minimalist"
+            )
+
+        assert [key["throttled"] for key in pooled.key_pool.get_stats()["keys"]] == [1, 1]
+
+
+class TestResultCacheKey:
+
+    def test_key_changes_with_image_prompt_and_size(self, gemini, monkeypatch):
+        args = dict(address="1 Main St", area_type="front_yard", style="modern_minimalist")
+        key = gemini.result_cache_key(input_image=b"yard", **args)
+
+        assert key == gemini.result_cache_key(input_image=b"yard", **args)
+        assert key != gemini.result_cache_key(input_image=b"other yard", **args)
+        assert key != gemini.result_cache_key(input_image=b"yard", preservation_strength=0.8, **args)
+
+        monkeypatch.setattr(GeminiClient, "IMAGE_SIZE", "2K")
+        assert key != gemini.result_cache_key(input_image=b"yard", **args)
@@ -0,0 +1,172 @@
+"""
+Unit Tests: Gemini API key pool
+
+Tests for src/services/gemini_key_pool.py:
+- Calls rotate across keys and prefer the least busy key
+- A 429 rests the key for its RetryInfo delay (or the default cooldown)
+- The per-key RPM quota keeps a key out of rotation until its window resets
+- With every key exhausted the one that recovers first is still used
+"""
+
+import time
+import pytest
+
+from src.services.gemini_key_pool import (
+    GeminiKeyPool,
+    configured_api_keys,
+    mask_key,
+    retry_delay_seconds,
+)
+
+
+class QuotaError(Exception):
+    """Stand-in for google.genai.errors.ClientError with code 429."""
+    code = 429
+
+    def __init__(self, retry_delay=None):
+        super().__init__("RESOURCE_EXHAUSTED")
+        details = []
+        if retry_delay:
+            details.append({
+                "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                "retryDelay": retry_delay
+            })
+        self.details = {"error": {"code": 429, "details": details}}
+
+
+def make_pool(*keys, **kwargs):
+    return GeminiKeyPool(list(keys), client_factory=lambda key: f"client-{key}", **kwargs)
+
+
+class TestConfiguredKeys:
+
+    def test_combines_and_deduplicates_keys(self, monkeypatch):
+        monkeypatch.setenv("GEMINI_API_KEY", "key-a")
+        monkeypatch.setenv("GEMINI_API_KEYS", " key-b, key-a ,,key-c")
+
+        assert configured_api_keys() == ["key-a", "key-b", "key-c"]
+
+    def test_mask_key_keeps_last_four_characters(self):
+        assert mask_key("AIzaSyExample1234") == "...1234"
+
+
+class TestKeySelection:
+
+    def test_rotates_between_idle_keys(self):
+        pool = make_pool("key-a", "key-b", "key-c")
+
+        picks = []
+        for _ in range(6):
+            state = pool.acquire()
+            picks.append(state.api_key)
+            pool.release(state)
+
+        assert picks == ["key-a", "key-b", "key-c", "key-a", "key-b", "key-c"]
+
+    def test_prefers_key_with_fewest_in_flight_calls(self):
+        pool = make_pool("key-a", "key-b")
+
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.release(first)
+        third = pool.acquire()
+
+        assert second.api_key != first.api_key
+        assert third.api_key == first.api_key
+        assert third.client == "client-key-a"
+
+
+class TestThrottling:
+
+    def test_429_uses_retry_info_delay(self):
+        pool = make_pool("key-a", "key-b", cooldown_seconds=60)
+
+        state = pool.acquire()
+        pool.release(state, QuotaError(retry_delay="37s"))
+
+        stats = pool.get_stats()["keys"][0]
+        assert stats["throttled"] == 1
+        assert stats["available"] is False
+        assert 36 < stats["cooldown_seconds"] <= 37
+
+    def test_429_without_retry_info_uses_default_cooldown(self):
+        pool = make_pool("key-a", cooldown_seconds=5)
+
+        state = pool.acquire()
+        pool.release(state, QuotaError())
+
+        assert retry_delay_seconds(QuotaError()) is None
+        assert 4 < pool.get_stats()["keys"][0]["cooldown_seconds"] <= 5
+
+    def test_throttled_key_is_skipped_until_cooldown_ends(self, monkeypatch):
+        pool = make_pool("key-a", "key-b")
+        throttled = pool.acquire()
+        pool.release(throttled, QuotaError(retry_delay="30s"))
+
+        picks = []
+        for _ in range(3):
+            state = pool.acquire()
+            picks.append(state.api_key)
+            pool.release(state)
+        assert picks == ["key-b", "key-b", "key-b"]
+        assert not pool.has_available(exclude=pool._keys[1])
+
+        now = time.monotonic()
+        monkeypatch.setattr("src.services.gemini_key_pool.time.monotonic", lambda: now + 31)
+        assert pool.has_available(exclude=pool._keys[1])
+
+    def test_other_errors_do_not_rest_the_key(self):
+        pool = make_pool("key-a")
+
+        state = pool.acquire()
+        pool.release(state, ValueError("bad request"))
+
+        stats = pool.get_stats()
+        assert stats["keys"][0]["errors"] == 1
+        assert stats["available"] == 1
+
+
+class TestRequestsPerMinute:
+
+    def test_key_at_quota_is_skipped(self):
+        pool = make_pool("key-a", "key-b", requests_per_minute=2)
+
+        picks = []
+        for _ in range(4):
+            state = pool.acquire()
+            picks.append(state.api_key)
+            pool.release(state)
+
+        assert sorted(picks) == ["key-a", "key-a", "key-b", "key-b"]
+        assert pool.get_stats()["available"] == 0
+        assert pool.exhausted == 0
+
+    def test_exhausted_pool_uses_key_that_recovers_first(self, monkeypatch):
+        pool = make_pool("key-a", "key-b", requests_per_minute=1)
+        now = time.monotonic()
+        clock = iter([now, now + 10, now + 20])
+        monkeypatch.setattr("src.services.gemini_key_pool.time.monotonic", lambda: next(clock))
+
+        first = pool.acquire()
+        pool.acquire()
+        fallback = pool.acquire()
+
+        assert fallback is first
+        assert pool.exhausted == 1
+
+    def test_window_expiry_restores_quota(self, monkeypatch):
+        pool = make_pool("key-a", requests_per_minute=1)
+        state = pool.acquire()
+        pool.release(state)
+        assert pool.get_stats()["available"] == 0
+
+        now = time.monotonic()
+        monkeypatch.setattr("src.services.gemini_key_pool.time.monotonic", lambda: now + 61)
+        stats = pool.get_stats()
+        assert stats["available"] == 1
+        assert stats["keys"][0]["requests_last_minute"] == 0
+
+
+def test_requires_at_least_one_key():
+    with pytest.raises(ValueError):
+        make_pool()
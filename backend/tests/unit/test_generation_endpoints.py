@@ -0,0 +1,306 @@
+"""
+Unit Tests: Generation detail endpoint
+
+Tests for src/api/endpoints/generations.py:
+- GET /generations/{id}: full payload comes from one SQL statement and is
+  returned as-is; missing generation -> 404, someone else's -> 403;
+  matching If-None-Match -> 304 from the version lookup alone
+- GET /generations: keyset cursor pagination, counter-table totals
+- GET /generations/{id}/events: snapshot re-read on heartbeat and resync,
+  error event when the generation disappears mid-stream
+
+Requirements:
+- FR-010: Progress persists across page refresh
+- FR-041: View generation history
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import HTTPException
+
+from src.api.endpoints import generations
+from src.services.generation_events import GenerationEventBroker
+from src.models.generation import MultiAreaGenerationResponse
+
+
+def detail_body(generation_id, user_id):
+    """Payload in the shape json_build_object() produces."""
+    return json.dumps({
+        'id': str(generation_id),
+        'user_id': str(user_id),
+        'status': 'processing',
+        'address': '123 Main St',
+        'geocoded_address': None,
+        'geocoding_accuracy': None,
+        'total_cost': 1,
+        'payment_method': 'trial',
+        'credits_remaining': {'trial': 2, 'token': 0, 'holiday': 0},
+        'areas': [{
+            'id': str(uuid4()),
+            'area': 'front_yard',
+            'style': 'modern_minimalist',
+            'status': 'processing',
+            'progress': 40,
+            'current_stage': 'generating_design',
+            'status_message': None,
+            'image_url': None,
+            'image_urls': None,
+            'error_message': None,
+            'completed_at': None
+        }],
+        'source_images': None,
+        'created_at': '2025-11-10T12:00:00+00:00',
+        'start_processing_at': None,
+        'completed_at': None,
+        'estimated_completion': None,
+        'expires_at': None,
+        'retention_days': None,
+        'retention_message': None,
+        'error_message': None
+    })
+
+
+class TestGetGeneration:
+
+    @pytest.mark.asyncio
+    async def test_returns_sql_payload_in_one_query(self):
+        generation_id, user_id = uuid4(), uuid4()
+        body = detail_body(generation_id, user_id)
+        fetchrow = AsyncMock(return_value={
+            'user_id': user_id, 'version': 4, 'balance_version': 9, 'body': body
+        })
+
+        with patch.object(generations.db_pool, 'fetchrow', fetchrow), \
+                patch.object(generations.db_pool, 'fetch', AsyncMock()) as fetch:
+            response = await generations.get_generation(
+                generation_id, request=MagicMock(headers={}), user=MagicMock(id=user_id)
+            )
+
+        fetchrow.assert_awaited_once()
+        fetch.assert_not_awaited()
+        assert 'json_agg' in fetchrow.call_args.args[0]
+        assert response.body == body.encode()
+        assert response.media_type == 'application/json'
+        assert response.headers['etag'] == f'"generation-{generation_id}-4-9"'
+        # The SQL-built payload matches the documented response model
+        MultiAreaGenerationResponse.model_validate_json(response.body)
+
+    @pytest.mark.asyncio
+    async def test_missing_generation_is_404(self):
+        with patch.object(generations.db_pool, 'fetchrow', AsyncMock(return_value=None)):
+            with pytest.raises(HTTPException) as exc_info:
+                await generations.get_generation(
+                    uuid4(), request=MagicMock(headers={}), user=MagicMock(id=uuid4())
+                )
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_other_users_generation_is_403(self):
+        generation_id = uuid4()
+        row = {
+            'user_id': uuid4(), 'version': 1, 'balance_version': 1,
+            'body': detail_body(generation_id, uuid4())
+        }
+
+        with patch.object(generations.db_pool, 'fetchrow', AsyncMock(return_value=row)):
+            with pytest.raises(HTTPException) as exc_info:
+                await generations.get_generation(
+                    generation_id, request=MagicMock(headers={}), user=MagicMock(id=uuid4())
+                )
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_is_304_without_building_payload(self):
+        generation_id, user_id = uuid4(), uuid4()
+        versions = {'user_id': user_id, 'version': 4, 'balance_version': 9}
+        fetchrow = AsyncMock(return_value=versions)
+        request = MagicMock(headers={'if-none-match': f'W/"generation-{generation_id}-4-9"'})
+
+        with patch.object(generations.db_pool, 'fetchrow', fetchrow):
+            response = await generations.get_generation(
+                generation_id, request=request, user=MagicMock(id=user_id)
+            )
+
+        assert response.status_code == 304
+        assert response.body == b''
+        fetchrow.assert_awaited_once()
+        assert 'json_agg' not in fetchrow.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_gets_full_payload(self):
+        generation_id, user_id = uuid4(), uuid4()
+        body = detail_body(generation_id, user_id)
+        fetchrow = AsyncMock(side_effect=[
+            {'user_id': user_id, 'version': 5, 'balance_version': 9},
+            {'user_id': user_id, 'version': 5, 'balance_version': 9, 'body': body}
+        ])
+        request = MagicMock(headers={'if-none-match': f'"generation-{generation_id}-4-9"'})
+
+        with patch.object(generations.db_pool, 'fetchrow', fetchrow):
+            response = await generations.get_generation(
+                generation_id, request=request, user=MagicMock(id=user_id)
+            )
+
+        assert response.status_code == 200
+        assert response.body == body.encode()
+        assert response.headers['etag'] == f'"generation-{generation_id}-5-9"'
+
+
+def history_row(created_at, address='123 Main St'):
+    """Row in the shape the list query selects."""
+    return {
+        'id': uuid4(),
+        'status': 'completed',
+        'payment_type': 'token',
+        'tokens_deducted': 1,
+        'address': address,
+        'request_params': None,
+        'image_source': 'upload',
+        'error_message': None,
+        'created_at': created_at,
+        'completed_at': created_at,
+        'expires_at': created_at + timedelta(days=7),
+        'is_deleted': False,
+        'sort_value': created_at,
+        'retention_days': 6,
+        'retention_message': 'Saved for 6 more days'
+    }
+
+
+class TestListGenerations:
+
+    @pytest.mark.asyncio
+    async def test_first_page_returns_cursor_when_more_rows_exist(self):
+        now = datetime(2025, 11, 10, 12, 0, tzinfo=timezone.utc)
+        rows = [history_row(now - timedelta(minutes=i)) for i in range(3)]
+        fetch = AsyncMock(return_value=rows)
+        fetchval = AsyncMock(return_value=42)
+
+        with patch.object(generations.db_pool, 'fetch', fetch), \
+                patch.object(generations.db_pool, 'fetchval', fetchval):
+            result = await generations.list_generations(
+                limit=2, page=1, cursor=None, status=None, sort=None, user=MagicMock(id=uuid4())
+            )
+
+        assert result['total'] == 42
+        assert 'generation_counts' in fetchval.call_args.args[0]
+        assert result['has_more'] is True
+        assert [g['id'] for g in result['data']] == [rows[0]['id'], rows[1]['id']]
+        assert 'sort_value' not in result['data'][0]
+        assert result['data'][0]['retention_message'] == 'Saved for 6 more days'
+        # limit + 1 rows requested, no OFFSET on the first page
+        assert fetch.call_args.args[-2:] == (3, 0)
+
+        cursor_value, cursor_id = generations._decode_history_cursor(result['next_cursor'], 'newest')
+        assert (cursor_value, cursor_id) == (rows[1]['created_at'], rows[1]['id'])
+
+    @pytest.mark.asyncio
+    async def test_cursor_becomes_keyset_predicate(self):
+        now = datetime(2025, 11, 10, 12, 0, tzinfo=timezone.utc)
+        last_id = uuid4()
+        cursor = generations._encode_history_cursor(now, last_id)
+        fetch = AsyncMock(return_value=[history_row(now - timedelta(days=1))])
+
+        with patch.object(generations.db_pool, 'fetch', fetch), \
+                patch.object(generations.db_pool, 'fetchval', AsyncMock(return_value=5)):
+            result = await generations.list_generations(
+                limit=20, page=7, cursor=cursor, status='completed', sort='created_at:asc',
+                user=MagicMock(id=uuid4())
+            )
+
+        query, *params = fetch.call_args.args
+        assert '(created_at, id) > ($3, $4)' in query
+        assert 'ORDER BY created_at ASC, id ASC' in query
+        assert 'OFFSET' in query and params[-1] == 0  # page is ignored with a cursor
+        assert params[1:4] == ['completed', now, last_id]
+        assert result['has_more'] is False
+        assert result['next_cursor'] is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_is_400(self):
+        with patch.object(generations.db_pool, 'fetch', AsyncMock()) as fetch:
+            with pytest.raises(HTTPException) as exc_info:
+                await generations.list_generations(
+                    limit=20, page=1, cursor='not-a-cursor', status=None, sort=None,
+                    user=MagicMock(id=uuid4())
+                )
+
+        assert exc_info.value.status_code == 400
+        fetch.assert_not_awaited()
+
+
+def snapshot_row(status, areas='[]'):
+    return {'status': status, 'error_message': None, 'areas': areas}
+
+
+async def collect_stream(generation_id, snapshots, broker=None, heartbeat=0.01):
+    """Run the events endpoint; fetchrow returns the owner row, then each snapshot in turn."""
+    user_id = uuid4()
+    broker = broker or GenerationEventBroker()
+    rows = iter([{'user_id': user_id}, *snapshots])
+
+    def next_row(*args):
+        row = next(rows)
+        return row() if callable(row) else row
+
+    fetchrow = AsyncMock(side_effect=next_row)
+    request = MagicMock(is_disconnected=AsyncMock(return_value=False))
+
+    with patch.object(generations.db_pool, 'fetchrow', fetchrow), \
+            patch.object(generations.settings, 'generation_events_heartbeat_seconds', heartbeat):
+        response = await generations.stream_generation_events(
+            generation_id, request=request, user=MagicMock(id=user_id), events=broker
+        )
+        return [chunk async for chunk in response.body_iterator]
+
+
+def event_names(chunks):
+    return [chunk.split('\n')[0] for chunk in chunks]
+
+
+class TestStreamGenerationEvents:
+
+    @pytest.mark.asyncio
+    async def test_terminal_snapshot_ends_stream(self):
+        chunks = await collect_stream(uuid4(), [snapshot_row('completed')])
+
+        assert event_names(chunks) == ['event: snapshot']
+
+    @pytest.mark.asyncio
+    async def test_deleted_generation_sends_error_event(self):
+        chunks = await collect_stream(uuid4(), [None])
+
+        assert event_names(chunks) == ['event: error']
+        assert 'Generation not found' in chunks[0]
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_rereads_snapshot_until_terminal(self):
+        # No NOTIFY ever arrives (e.g. lost while LISTEN was down)
+        chunks = await collect_stream(
+            uuid4(), [snapshot_row('processing'), snapshot_row('processing'), snapshot_row('failed')]
+        )
+
+        assert event_names(chunks) == ['event: snapshot'] * 3
+        assert '"status": "failed"' in chunks[-1]
+
+    @pytest.mark.asyncio
+    async def test_resync_event_rereads_snapshot(self):
+        broker = GenerationEventBroker()
+
+        def first_snapshot(*args):
+            # LISTEN comes back while the client is waiting for events
+            broker.resync()
+            return snapshot_row('processing')
+
+        chunks = await collect_stream(
+            uuid4(), [first_snapshot, snapshot_row('completed')], broker=broker, heartbeat=60
+        )
+
+        assert event_names(chunks) == ['event: snapshot'] * 2
+        assert broker.get_stats()['resyncs'] == 1
@@ -0,0 +1,101 @@
+"""
+Unit Tests: Generation progress events
+
+Tests for src/services/generation_events.py:
+- NOTIFY payloads reach only the subscribers of their generation
+- Subscribers are removed when their stream closes
+- A slow subscriber drops its oldest event instead of blocking others
+- Every subscriber is told to resync when LISTEN is re-established
+
+Requirements:
+- FR-009: Real-time progress tracking
+"""
+
+import json
+import pytest
+from uuid import uuid4
+
+from src.services.generation_events import GenerationEventBroker, RESYNC_EVENT_TYPE
+
+
+def area_event(generation_id, progress=50):
+    return {
+        'type': 'area',
+        'generation_id': str(generation_id),
+        'area_id': str(uuid4()),
+        'status': 'processing',
+        'progress': progress
+    }
+
+
+class TestGenerationEventBroker:
+
+    @pytest.mark.asyncio
+    async def test_notify_fans_out_to_generation_subscribers(self):
+        broker = GenerationEventBroker()
+        generation_id = uuid4()
+        other_generation_id = uuid4()
+
+        async with broker.subscribe(generation_id) as first, \
+                broker.subscribe(generation_id) as second, \
+                broker.subscribe(other_generation_id) as other:
+            event = area_event(generation_id)
+            broker._on_notify(None, 1, 'generation_events', json.dumps(event))
+
+            assert first.get_nowait() == event
+            assert second.get_nowait() == event
+            assert other.empty()
+
+        stats = broker.get_stats()
+        assert stats['received'] == 1
+        assert stats['delivered'] == 2
+        assert stats['subscribers'] == 0
+
+    @pytest.mark.asyncio
+    async def test_closed_subscription_is_removed(self):
+        broker = GenerationEventBroker()
+        generation_id = uuid4()
+
+        async with broker.subscribe(generation_id):
+            assert broker.get_stats()['generations'] == 1
+
+        assert broker.get_stats()['generations'] == 0
+        # Publishing with no subscribers is a no-op
+        broker.publish(area_event(generation_id))
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest_event(self):
+        broker = GenerationEventBroker(queue_size=2)
+        generation_id = uuid4()
+
+        async with broker.subscribe(generation_id) as queue:
+            for progress in (10, 20, 30):
+                broker.publish(area_event(generation_id, progress=progress))
+
+            assert [queue.get_nowait()['progress'] for _ in range(2)] == [20, 30]
+
+        assert broker.get_stats()['dropped'] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_payload_is_ignored(self):
+        broker = GenerationEventBroker()
+
+        broker._on_notify(None, 1, 'generation_events', 'not json')
+        broker.publish({'type': 'area'})
+
+        assert broker.get_stats()['delivered'] == 0
+
+    @pytest.mark.asyncio
+    async def test_resync_reaches_every_subscriber(self):
+        broker = GenerationEventBroker()
+        generation_id = uuid4()
+        other_generation_id = uuid4()
+
+        async with broker.subscribe(generation_id) as first, \
+                broker.subscribe(other_generation_id) as other:
+            broker.resync()
+
+            assert first.get_nowait() == {'type': RESYNC_EVENT_TYPE, 'generation_id': str(generation_id)}
+            assert other.get_nowait()['type'] == RESYNC_EVENT_TYPE
+
+        assert broker.get_stats()['resyncs'] == 2
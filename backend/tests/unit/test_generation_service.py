@@ -0,0 +1,373 @@
+"""
+Unit Tests: GenerationService authorization and per-area failure isolation
+
+Payment is authorized and deducted by one authorize_and_deduct() call.
+
+Areas of a multi-area generation run concurrently, so a failing area must
+only fail (and refund) itself; the generation status is rolled up from its
+areas once every area has finished. An area that already finished is never
+failed or refunded a second time.
+
+Identical area requests reuse the stored image from the result cache unless
+the user asked to regenerate. Entries never outlive the source generation's
+retention, and an entry whose image is gone is evicted instead of reused.
+
+Requirements:
+- FR-007: Payment hierarchy (subscription > trial > token)
+- FR-057: Each area tracked separately
+- FR-066: Refund payment on generation failure
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.generation_service import GenerationService
+from src.services.generation_result_cache import GenerationResultCache
+from src.services.resilience import CircuitOpenError
+from src.models.generation import PaymentType
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.execute = AsyncMock()
+    db.fetchrow = AsyncMock(return_value={'success': True, 'new_balance': 5})
+    db.fetchval = AsyncMock(side_effect=lambda sql, *args: args[0])  # UPDATE ... RETURNING id
+
+    # acquire() hands out the mock itself, so statements run in a transaction
+    # are recorded on db.execute / db.fetch like pool-level ones
+    @asynccontextmanager
+    async def acquire():
+        yield db
+
+    db.acquire = acquire
+    db.transaction = MagicMock()
+    return db
+
+
+@pytest.fixture
+def generation_service(db):
+    trial_service = MagicMock()
+    trial_service.refund_trial = AsyncMock(return_value=(True, 2))
+    return GenerationService(
+        db_pool=db,
+        gemini_client=MagicMock(),
+        storage_service=MagicMock(),
+        trial_service=trial_service,
+        token_service=MagicMock(),
+        subscription_service=MagicMock(),
+        maps_service=MagicMock(),
+        result_cache=GenerationResultCache()  # Memory only
+    )
+
+
+def executed_sql(db):
+    return [call.args[0] for call in db.execute.call_args_list]
+
+
+def authorization_row(success=True, payment_method='trial', trial_remaining=0, token_balance=0):
+    """Row as returned by SELECT * FROM authorize_and_deduct(...)."""
+    return {
+        'success': success,
+        'payment_method': payment_method,
+        'trial_remaining': trial_remaining,
+        'holiday_credits': 0,
+        'token_balance': token_balance
+    }
+
+
+class TestAuthorizeAndDeductPayment:
+
+    @pytest.mark.asyncio
+    async def test_single_round_trip(self, generation_service, db):
+        db.fetchrow.return_value = authorization_row(payment_method='trial', trial_remaining=0)
+
+        success, method, error, details = await generation_service.authorize_and_deduct_payment(uuid4(), 3)
+
+        assert success is True
+        assert method == PaymentType.TRIAL
+        assert details == {'trial_remaining': 0, 'deducted': 3}
+        db.fetchrow.assert_awaited_once()
+        assert 'authorize_and_deduct' in db.fetchrow.call_args.args[0]
+        assert db.fetchrow.call_args.args[2] == 3
+
+    @pytest.mark.asyncio
+    async def test_subscription_is_unlimited(self, generation_service, db):
+        db.fetchrow.return_value = authorization_row(payment_method='subscription')
+
+        success, method, error, details = await generation_service.authorize_and_deduct_payment(uuid4(), 2)
+
+        assert success is True
+        assert method == PaymentType.SUBSCRIPTION
+        assert details['unlimited'] is True
+
+    @pytest.mark.asyncio
+    async def test_token_payment_checks_auto_reload(self, generation_service, db):
+        db.fetchrow.return_value = authorization_row(payment_method='token', token_balance=4)
+        generation_service.token_service.check_and_trigger_auto_reload = AsyncMock(return_value=None)
+        user_id = uuid4()
+
+        success, method, error, details = await generation_service.authorize_and_deduct_payment(user_id, 1)
+
+        assert method == PaymentType.TOKEN
+        assert details['tokens_remaining'] == 4
+        assert details['auto_reload_triggered'] is False
+        generation_service.token_service.check_and_trigger_auto_reload.assert_awaited_once_with(user_id, 4)
+
+    @pytest.mark.asyncio
+    async def test_insufficient_credits(self, generation_service, db):
+        db.fetchrow.return_value = authorization_row(
+            success=False, payment_method=None, trial_remaining=1, token_balance=2
+        )
+
+        success, method, error, details = await generation_service.authorize_and_deduct_payment(uuid4(), 3)
+
+        assert success is False
+        assert method is None
+        assert "1 trial credits, 2 tokens" in error
+
+
+class TestAreaFailureIsolation:
+
+    @pytest.mark.asyncio
+    async def test_area_failure_does_not_fail_whole_generation(self, generation_service, db):
+        await generation_service.fail_area(
+            generation_id=uuid4(),
+            area_id=uuid4(),
+            user_id=uuid4(),
+            payment_method='trial',
+            error_message='Gemini API error'
+        )
+
+        statements = executed_sql(db)
+        area_update = db.fetchval.call_args.args[0]
+        assert "UPDATE generation_areas" in area_update
+        assert "status NOT IN ('completed', 'failed')" in area_update
+        # Generation status is only rolled up once all areas are finished
+        rollup = [sql for sql in statements if "UPDATE generations" in sql]
+        assert len(rollup) == 1
+        assert "completed_count + areas.failed_count = areas.total_count" in rollup[0]
+        generation_service.trial_service.refund_trial.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_finished_area_is_not_failed_or_refunded_again(self, generation_service, db):
+        # A recovered job whose area already completed (or failed and was refunded)
+        db.fetchval = AsyncMock(return_value=None)
+
+        await generation_service.fail_area(
+            generation_id=uuid4(),
+            area_id=uuid4(),
+            user_id=uuid4(),
+            payment_method='trial',
+            error_message='Generation timeout'
+        )
+
+        assert not any("UPDATE generations" in sql for sql in executed_sql(db))
+        generation_service.trial_service.refund_trial.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_is_left_to_caller(self, generation_service, db):
+        generation_service.gemini.generate_landscape_design = AsyncMock(
+            side_effect=CircuitOpenError('gemini', 30)
+        )
+        generation_service.gemini.result_cache_key = MagicMock(return_value='key')
+
+        with pytest.raises(CircuitOpenError):
+            await generation_service.process_generation(
+                generation_id=uuid4(),
+                area_id=uuid4(),
+                user_id=uuid4(),
+                input_image_bytes=b'input',
+                address='123 Main St',
+                area_type='front_yard',
+                style='modern_minimalist',
+                custom_prompt=None,
+                payment_method='trial'
+            )
+
+        # Not failed or refunded here - the worker refunds the outage in bulk
+        db.fetchval.assert_not_awaited()
+        generation_service.trial_service.refund_trial.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_successful_area_rolls_up_generation_status(self, generation_service, db):
+        generation_service.gemini.generate_landscape_design = AsyncMock(return_value=b'design')
+        generation_service.storage.upload_image = AsyncMock(return_value='https://blob.example/a.jpg')
+        generation_service.trial_service.deduct_trial = AsyncMock(return_value=(True, 1))
+
+        success, error = await generation_service.process_generation(
+            generation_id=uuid4(),
+            area_id=uuid4(),
+            user_id=uuid4(),
+            input_image_bytes=b'input',
+            address='123 Main St',
+            area_type='front_yard',
+            style='modern_minimalist',
+            custom_prompt=None,
+            payment_method='trial'
+        )
+
+        assert success is True
+        statements = executed_sql(db)
+        assert not any("SET status = 'completed',\n                    completed_at" in sql for sql in statements)
+        assert any("partial_failed" in sql for sql in statements)
+        # Paid up front by authorize_and_deduct - nothing is charged on success
+        generation_service.trial_service.deduct_trial.assert_not_awaited()
+        db.fetchrow.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fail_areas_refunds_in_one_call(self, generation_service, db):
+        generation_id = uuid4()
+        user_a, user_b = uuid4(), uuid4()
+        failures = [
+            {'generation_id': generation_id, 'area_id': uuid4(), 'user_id': user_a, 'payment_method': 'trial'},
+            {'generation_id': generation_id, 'area_id': uuid4(), 'user_id': user_a, 'payment_method': 'trial'},
+            {'generation_id': uuid4(), 'area_id': uuid4(), 'user_id': user_b, 'payment_method': 'token'},
+            {'generation_id': uuid4(), 'area_id': uuid4(), 'user_id': user_b, 'payment_method': 'subscription'},
+        ]
+        db.fetch = AsyncMock(side_effect=[
+            [{'id': failure['area_id']} for failure in failures],
+            [
+                {'user_id': user_a, 'credit_type': 'trial', 'refunded': 2, 'new_balance': 3},
+                {'user_id': user_b, 'credit_type': 'token', 'refunded': 1, 'new_balance': 10},
+            ],
+        ])
+
+        refunds = await generation_service.fail_areas(failures, 'Gemini unavailable')
+
+        # One area update for all four areas, one roll-up per distinct generation
+        area_update = db.fetch.call_args_list[0].args
+        assert "UPDATE generation_areas" in area_update[0]
+        assert area_update[1] == [failure['area_id'] for failure in failures]
+        assert sum("UPDATE generations" in sql for sql in executed_sql(db)) == 3
+        # One bulk refund; the subscription area is not refunded
+        assert db.fetch.await_count == 2
+        args = db.fetch.call_args.args
+        assert 'refund_credits_bulk' in args[0]
+        assert args[1] == [user_a, user_a, user_b]
+        assert args[2] == ['trial', 'trial', 'token']
+        assert len(refunds) == 2
+        generation_service.trial_service.refund_trial.assert_not_awaited()
+        # Failing, rolling up and refunding commit together
+        db.transaction.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fail_areas_skips_finished_areas(self, generation_service, db):
+        user_id = uuid4()
+        pending = {'generation_id': uuid4(), 'area_id': uuid4(), 'user_id': user_id, 'payment_method': 'trial'}
+        finished = {'generation_id': uuid4(), 'area_id': uuid4(), 'user_id': user_id, 'payment_method': 'token'}
+        db.fetch = AsyncMock(side_effect=[
+            [{'id': pending['area_id']}],  # finished area was already completed or refunded
+            [{'user_id': user_id, 'credit_type': 'trial', 'refunded': 1, 'new_balance': 1}],
+        ])
+
+        await generation_service.fail_areas([pending, finished], 'Generation worker stopped responding')
+
+        assert "status NOT IN ('completed', 'failed')" in db.fetch.call_args_list[0].args[0]
+        # Only the area actually failed here is rolled up and refunded
+        assert sum("UPDATE generations" in sql for sql in executed_sql(db)) == 1
+        args = db.fetch.call_args.args
+        assert args[1] == [user_id]
+        assert args[2] == ['trial']
+
+    @pytest.mark.asyncio
+    async def test_fail_areas_all_finished_refunds_nothing(self, generation_service, db):
+        failures = [{'generation_id': uuid4(), 'area_id': uuid4(), 'user_id': uuid4(), 'payment_method': 'trial'}]
+        db.fetch = AsyncMock(return_value=[])
+
+        refunds = await generation_service.fail_areas(failures, 'Generation worker stopped responding')
+
+        assert refunds == []
+        db.fetch.assert_awaited_once()
+        db.execute.assert_not_awaited()
+
+
+class TestResultCache:
+
+    def area_kwargs(self, **overrides):
+        kwargs = dict(
+            generation_id=uuid4(),
+            area_id=uuid4(),
+            user_id=uuid4(),
+            input_image_bytes=b'input',
+            address='123 Main St',
+            area_type='front_yard',
+            style='modern_minimalist',
+            custom_prompt=None,
+            payment_method='subscription'
+        )
+        kwargs.update(overrides)
+        return kwargs
+
+    @pytest.fixture
+    def service(self, generation_service):
+        generation_service.gemini.result_cache_key = MagicMock(return_value='key-1')
+        generation_service.gemini.model_name = 'gemini-2.5-flash-image'
+        generation_service.gemini.generate_landscape_design = AsyncMock(return_value=b'design')
+        generation_service.storage.upload_image = AsyncMock(return_value='https://blob.example/a.jpg')
+        generation_service.storage.image_exists = AsyncMock(return_value=True)
+        return generation_service
+
+    @pytest.mark.asyncio
+    async def test_identical_request_reuses_stored_image(self, service, db):
+        await service.process_generation(**self.area_kwargs())
+        success, error = await service.process_generation(**self.area_kwargs())
+
+        assert success is True
+        service.gemini.generate_landscape_design.assert_awaited_once()
+        service.storage.upload_image.assert_awaited_once()
+        completed = [call.args for call in db.execute.call_args_list if "image_url = $2" in call.args[0]]
+        assert [args[2] for args in completed] == ['https://blob.example/a.jpg'] * 2
+        assert service.result_cache.get_stats()['memory_hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_regenerate_bypasses_cache(self, service):
+        await service.process_generation(**self.area_kwargs())
+        service.storage.upload_image.return_value = 'https://blob.example/b.jpg'
+
+        await service.process_generation(**self.area_kwargs(regenerate=True))
+
+        assert service.gemini.generate_landscape_design.await_count == 2
+        # The new result replaces the cached one
+        assert await service.result_cache.get('key-1') == {'image_url': 'https://blob.example/b.jpg'}
+        assert service.result_cache.get_stats()['bypassed'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_is_not_cached(self, service):
+        service.gemini.generate_landscape_design.side_effect = Exception('quota exceeded')
+
+        success, error = await service.process_generation(**self.area_kwargs())
+
+        assert success is False
+        assert await service.result_cache.get('key-1') is None
+
+    @pytest.mark.asyncio
+    async def test_trial_result_is_not_cached(self, service):
+        await service.process_generation(**self.area_kwargs(payment_method='trial'))
+
+        assert await service.result_cache.get('key-1') is None
+
+    @pytest.mark.asyncio
+    async def test_token_result_expires_with_its_generation(self, service):
+        service.result_cache.db = MagicMock(execute=AsyncMock())
+
+        await service.process_generation(**self.area_kwargs(payment_method='token'))
+
+        # Capped at the 7-day token retention instead of the 30-day default
+        assert service.result_cache.db.execute.call_args.args[-1] == 7
+
+    @pytest.mark.asyncio
+    async def test_entry_with_deleted_image_is_evicted(self, service):
+        await service.process_generation(**self.area_kwargs())
+        service.storage.image_exists.return_value = False
+        service.storage.upload_image.return_value = 'https://blob.example/b.jpg'
+
+        success, error = await service.process_generation(**self.area_kwargs())
+
+        assert success is True
+        assert service.gemini.generate_landscape_design.await_count == 2
+        service.storage.image_exists.assert_awaited_with('https://blob.example/a.jpg')
+        assert service.result_cache.get_stats()['evicted'] == 1
+        assert await service.result_cache.get('key-1') == {'image_url': 'https://blob.example/b.jpg'}
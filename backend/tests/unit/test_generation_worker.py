@@ -0,0 +1,371 @@
+"""
+Unit Tests: Generation job queue worker
+
+Tests for the durable generation worker (src/worker.py):
+- Claimed jobs run through GenerationService.process_generation
+- Only one job per generation uploads the Street View source image
+- Timeouts fail the area and refund
+- Unexpected errors are retried until attempts are exhausted, then refunded
+- Areas rejected by an open Gemini circuit are refunded in one bulk call
+
+Requirements:
+- FR-014: Background processing continues across deploys/restarts
+- FR-011: Automatic refund on failure
+"""
+
+import asyncio
+import pytest
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+
+from src.worker import GenerationWorker
+from src.services.resilience import CircuitOpenError
+from src.services.maps_service import (
+    Coordinates,
+    GeocodeResult,
+    MapsService,
+    MapsServiceError,
+    PropertyImagery,
+    StreetViewMetadata
+)
+
+
+ADDRESS = '1600 Amphitheatre Parkway, Mountain View, CA'
+
+
+def make_imagery(street_view_bytes=None, satellite_bytes=None):
+    """Build a PropertyImagery bundle as rebuilt from a job payload."""
+    return PropertyImagery(
+        address=ADDRESS,
+        geocode=GeocodeResult(
+            coordinates=Coordinates(lat=37.42, lng=-122.08),
+            location_type='ROOFTOP',
+            formatted_address=ADDRESS,
+            address_components=[],
+            place_id='place',
+            has_street_number=True
+        ),
+        street_view_metadata=StreetViewMetadata(status='OK', pano_id='pano'),
+        street_view_bytes=street_view_bytes,
+        satellite_bytes=satellite_bytes
+    )
+
+
+def make_job(upload_source_image: bool = False, attempts: int = 1):
+    """Build a claimed job dict as returned by GenerationJobQueue.claim()."""
+    return {
+        'id': uuid4(),
+        'generation_id': uuid4(),
+        'area_id': uuid4(),
+        'user_id': uuid4(),
+        'attempts': attempts,
+        'max_attempts': 3,
+        'payload': {
+            'address': ADDRESS,
+            'payment_method': 'trial',
+            'upload_source_image': upload_source_image,
+            'imagery': make_imagery().to_payload()
+        }
+    }
+
+
+@pytest.fixture
+def queue():
+    queue = MagicMock()
+    queue.claim = AsyncMock(return_value=[])
+    queue.complete = AsyncMock()
+    queue.fail = AsyncMock(return_value=True)
+    queue.recover_stale = AsyncMock(return_value=[])
+    return queue
+
+
+@pytest.fixture
+def generation_service():
+    service = MagicMock()
+    service.db.fetchrow = AsyncMock(return_value={
+        'area_type': 'backyard',
+        'style': 'modern_minimalist',
+        'custom_prompt': None,
+        'status': 'pending'
+    })
+    service.db.execute = AsyncMock()
+    service.maps_service = MapsService(api_key='test_api_key')
+    service.maps_service.fetch_street_view_image = AsyncMock(return_value=b'street_view')
+    service.maps_service.fetch_satellite_image = AsyncMock(return_value=b'satellite')
+    service.maps_service.build_property_imagery = AsyncMock(return_value=make_imagery())
+    service.storage.upload_image = AsyncMock(return_value='https://blob.example/sv.jpg')
+    service.process_generation = AsyncMock(return_value=(True, None))
+    service.fail_area = AsyncMock()
+    service.fail_areas = AsyncMock(return_value=[])
+    return service
+
+
+@pytest.fixture
+def worker(queue, generation_service):
+    return GenerationWorker(
+        queue=queue,
+        generation_service=generation_service,
+        concurrency=2,
+        poll_interval_seconds=0.01,
+        job_timeout_seconds=1,
+        worker_id='test-worker'
+    )
+
+
+class TestRunJob:
+
+    @pytest.mark.asyncio
+    async def test_job_runs_process_generation_and_completes(self, worker, queue, generation_service):
+        job = make_job()
+
+        await worker.run_job(job)
+
+        generation_service.process_generation.assert_awaited_once()
+        kwargs = generation_service.process_generation.call_args.kwargs
+        assert kwargs['area_id'] == job['area_id']
+        assert kwargs['input_image_bytes'] == b'satellite'
+        assert kwargs['payment_method'] == 'trial'
+        generation_service.storage.upload_image.assert_not_awaited()
+        # Backyard only needs satellite - Street View is never downloaded
+        generation_service.maps_service.fetch_street_view_image.assert_not_awaited()
+        queue.complete.assert_awaited_once_with(job['id'])
+
+    @pytest.mark.asyncio
+    async def test_flagged_job_uploads_source_image_once(self, worker, queue, generation_service):
+        generation_service.db.fetchrow.return_value = {
+            'area_type': 'front_yard',
+            'style': 'modern_minimalist',
+            'custom_prompt': None,
+            'status': 'pending'
+        }
+        job = make_job(upload_source_image=True)
+
+        await worker.run_job(job)
+
+        generation_service.storage.upload_image.assert_awaited_once()
+        assert generation_service.storage.upload_image.call_args.kwargs['image_data'] == b'street_view'
+        kwargs = generation_service.process_generation.call_args.kwargs
+        assert kwargs['input_image_bytes'] == b'street_view'
+        queue.complete.assert_awaited_once_with(job['id'])
+
+    @pytest.mark.asyncio
+    async def test_areas_share_one_imagery_fetch(self, worker, generation_service):
+        fetch_started = asyncio.Event()
+        release_fetch = asyncio.Event()
+
+        async def slow_fetch(*args, **kwargs):
+            fetch_started.set()
+            await release_fetch.wait()
+            return b'satellite'
+
+        generation_service.maps_service.fetch_satellite_image.side_effect = slow_fetch
+        generation_id = uuid4()
+        jobs = [make_job(), make_job(), make_job()]
+        for job in jobs:
+            job['generation_id'] = generation_id
+
+        runs = [asyncio.create_task(worker.run_job(job)) for job in jobs]
+        await fetch_started.wait()
+        release_fetch.set()
+        await asyncio.gather(*runs)
+
+        # Geocode came from the payload; images downloaded once for all three areas
+        generation_service.maps_service.build_property_imagery.assert_not_awaited()
+        generation_service.maps_service.fetch_satellite_image.assert_awaited_once()
+        generation_service.maps_service.fetch_street_view_image.assert_not_awaited()
+        assert generation_service.process_generation.await_count == 3
+        assert worker._imagery == {}
+
+    @pytest.mark.asyncio
+    async def test_missing_imagery_fails_area_without_retry(self, worker, queue, generation_service):
+        unavailable = MapsServiceError("api_error", "Imagery unavailable")
+        generation_service.maps_service.fetch_street_view_image.side_effect = unavailable
+        generation_service.maps_service.fetch_satellite_image.side_effect = unavailable
+        job = make_job()
+
+        await worker.run_job(job)
+
+        generation_service.fail_area.assert_awaited_once()
+        generation_service.process_generation.assert_not_awaited()
+        queue.fail.assert_not_awaited()
+        queue.complete.assert_awaited_once_with(job['id'])
+
+    @pytest.mark.asyncio
+    async def test_finished_area_is_not_reprocessed(self, worker, queue, generation_service):
+        generation_service.db.fetchrow.return_value = {
+            'area_type': 'backyard',
+            'style': 'modern_minimalist',
+            'custom_prompt': None,
+            'status': 'completed'
+        }
+        job = make_job()
+
+        await worker.run_job(job)
+
+        generation_service.process_generation.assert_not_awaited()
+        queue.complete.assert_awaited_once_with(job['id'])
+
+    @pytest.mark.asyncio
+    async def test_timeout_fails_area_and_refunds(self, worker, queue, generation_service):
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        generation_service.process_generation.side_effect = hang
+        job = make_job()
+
+        await worker.run_job(job)
+
+        generation_service.fail_area.assert_awaited_once()
+        assert generation_service.fail_area.call_args.kwargs['payment_method'] == 'trial'
+        queue.fail.assert_awaited_once()
+        queue.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_is_requeued_without_refund(self, worker, queue, generation_service):
+        generation_service.maps_service.fetch_satellite_image.side_effect = RuntimeError("connection reset")
+        job = make_job()
+
+        await worker.run_job(job)
+
+        queue.fail.assert_awaited_once()
+        assert queue.fail.call_args.kwargs['retry_delay_seconds'] == worker.retry_delay_seconds
+        generation_service.fail_area.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_exhausted_job_is_refunded(self, worker, queue, generation_service):
+        generation_service.maps_service.fetch_satellite_image.side_effect = RuntimeError("connection reset")
+        queue.fail.return_value = False
+        job = make_job(attempts=3)
+
+        await worker.run_job(job)
+
+        generation_service.fail_area.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_areas_are_refunded_in_bulk(self, worker, queue, generation_service):
+        generation_service.process_generation.side_effect = CircuitOpenError('gemini', 30)
+        jobs = [make_job(), make_job(), make_job()]
+
+        for job in jobs:
+            await worker.run_job(job)
+
+        # Nothing refunded per area; the next poll fails them all at once
+        generation_service.fail_area.assert_not_awaited()
+        generation_service.fail_areas.assert_not_awaited()
+        queue.complete.assert_not_awaited()
+
+        await worker.fail_outage_jobs()
+
+        generation_service.fail_areas.assert_awaited_once()
+        failures = generation_service.fail_areas.call_args.args[0]
+        assert [failure['area_id'] for failure in failures] == [job['area_id'] for job in jobs]
+        assert 'circuit open' in generation_service.fail_areas.call_args.kwargs['error_message']
+        assert [call.args[0] for call in queue.fail.call_args_list] == [job['id'] for job in jobs]
+        # Permanently failed, not re-queued
+        assert all('retry_delay_seconds' not in call.kwargs for call in queue.fail.call_args_list)
+
+        await worker.fail_outage_jobs()
+        generation_service.fail_areas.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_outage_refund_error_keeps_jobs_for_next_poll(self, worker, queue, generation_service):
+        generation_service.process_generation.side_effect = CircuitOpenError('gemini', 30)
+        generation_service.fail_areas.side_effect = [RuntimeError("connection reset"), []]
+        job = make_job()
+        await worker.run_job(job)
+
+        with pytest.raises(RuntimeError):
+            await worker.fail_outage_jobs()
+        queue.fail.assert_not_awaited()
+
+        await worker.fail_outage_jobs()
+
+        assert generation_service.fail_areas.await_count == 2
+        queue.fail.assert_awaited_once()
+
+
+class TestRunLoop:
+
+    @pytest.mark.asyncio
+    async def test_claims_up_to_concurrency_and_drains_on_stop(self, worker, queue, generation_service):
+        jobs = [make_job(), make_job()]
+        queue.claim.side_effect = [jobs] + [[]] * 50
+        stop_event = asyncio.Event()
+
+        async def stop_soon():
+            await asyncio.sleep(0.05)
+            stop_event.set()
+
+        await asyncio.gather(worker.run(stop_event), stop_soon())
+
+        assert queue.claim.call_args_list[0].kwargs['limit'] == 2
+        assert generation_service.process_generation.await_count == 2
+        assert queue.complete.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_areas_of_one_generation_run_concurrently(self, worker, queue, generation_service):
+        generation_id = uuid4()
+        jobs = [make_job(), make_job()]
+        for job in jobs:
+            job['generation_id'] = generation_id
+        queue.claim.side_effect = [jobs] + [[]] * 50
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_area(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return True, None
+
+        generation_service.process_generation.side_effect = slow_area
+        stop_event = asyncio.Event()
+
+        async def stop_soon():
+            await asyncio.sleep(0.02)
+            stop_event.set()
+
+        await asyncio.gather(worker.run(stop_event), stop_soon())
+
+        assert max_in_flight == 2
+        assert queue.complete.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_claim_passes_concurrency_limits(self, queue, generation_service):
+        worker = GenerationWorker(
+            queue=queue,
+            generation_service=generation_service,
+            concurrency=4,
+            per_generation_limit=2,
+            global_limit=10,
+            poll_interval_seconds=0.01,
+            worker_id='test-worker'
+        )
+        stop_event = asyncio.Event()
+
+        async def stop_soon():
+            await asyncio.sleep(0.02)
+            stop_event.set()
+
+        await asyncio.gather(worker.run(stop_event), stop_soon())
+
+        kwargs = queue.claim.call_args_list[0].kwargs
+        assert kwargs['per_generation_limit'] == 2
+        assert kwargs['global_limit'] == 10
+
+    @pytest.mark.asyncio
+    async def test_stale_jobs_out_of_attempts_are_refunded(self, worker, queue, generation_service):
+        stale_jobs = [make_job(attempts=3), make_job(attempts=3)]
+        queue.recover_stale.return_value = stale_jobs
+
+        await worker.recover_stale_jobs()
+
+        # All abandoned areas are failed and refunded in one bulk call
+        generation_service.fail_areas.assert_awaited_once()
+        failures = generation_service.fail_areas.call_args.args[0]
+        assert [failure['area_id'] for failure in failures] == [job['area_id'] for job in stale_jobs]
+        assert failures[0]['payment_method'] == 'trial'
+        generation_service.fail_area.assert_not_awaited()
@@ -0,0 +1,86 @@
+"""
+Unit Tests: Before/after image composition
+
+Tests for src/lib/imageComposition.py:
+- Fonts and label overlays are built once per process, not per image
+- Large JPEGs are decoded at reduced scale, small ones at full size
+- Output layout (height, widths, labels) is unchanged
+"""
+
+from io import BytesIO
+
+from PIL import Image, JpegImagePlugin
+
+from src.lib import imageComposition
+from src.lib.imageComposition import TARGET_HEIGHT, compose_before_after_image, warm_up
+
+
+def encoded(size, image_format="JPEG", color=(40, 120, 40)) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", size, color).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+class TestCachedOverlays:
+
+    def test_fonts_and_sprites_are_reused(self):
+        warm_up()
+        fonts_before = imageComposition._font.cache_info()
+        sprites_before = imageComposition._label_sprite.cache_info()
+
+        for _ in range(3):
+            compose_before_after_image(encoded((640, 640)), encoded((1024, 1024), "PNG"))
+
+        assert imageComposition._font.cache_info().misses == fonts_before.misses
+        sprites = imageComposition._label_sprite.cache_info()
+        assert sprites.misses == sprites_before.misses
+        assert sprites.hits >= sprites_before.hits + 9
+
+    def test_custom_labels_get_their_own_sprite(self):
+        default = imageComposition._label_sprite("BEFORE", 48, 15, 10, 200)
+        custom = imageComposition._label_sprite("ORIGINAL", 48, 15, 10, 200)
+
+        assert custom.width > default.width
+        assert custom.mode == "RGBA"
+
+
+class TestScaledDecode:
+
+    def test_large_jpeg_uses_draft_decode(self, monkeypatch):
+        drafts = []
+        original_draft = JpegImagePlugin.JpegImageFile.draft
+
+        def recording_draft(self, mode, size):
+            drafts.append(size)
+            return original_draft(self, mode, size)
+
+        monkeypatch.setattr(JpegImagePlugin.JpegImageFile, "draft", recording_draft)
+
+        large = imageComposition._load_scaled(encoded((4000, 3000)), TARGET_HEIGHT)
+        small = imageComposition._load_scaled(encoded((640, 640)), TARGET_HEIGHT)
+
+        assert drafts == [(1, TARGET_HEIGHT)]
+        assert large.size == (1066, TARGET_HEIGHT)
+        assert small.size == (TARGET_HEIGHT, TARGET_HEIGHT)
+        assert large.mode == small.mode == "RGB"
+
+    def test_transparent_png_is_flattened_to_rgb(self):
+        buffer = BytesIO()
+        Image.new("RGBA", (400, 400), (255, 0, 0, 128)).save(buffer, format="PNG")
+
+        image = imageComposition._load_scaled(buffer.getvalue(), TARGET_HEIGHT)
+
+        assert image.mode == "RGB"
+        assert image.size == (TARGET_HEIGHT, TARGET_HEIGHT)
+
+
+def test_output_is_side_by_side_jpeg_with_labels():
+    result = compose_before_after_image(encoded((640, 480)), encoded((1024, 1024), "PNG", color=(200, 30, 30)))
+
+    image = Image.open(BytesIO(result))
+    assert image.format == "JPEG"
+    assert image.size == (1066 + 800, TARGET_HEIGHT)
+    # Label box darkens the top-left corner; the middle of each half keeps its color
+    assert sum(image.getpixel((20, 25))) < sum(image.getpixel((500, 400)))
+    red, green, _ = image.getpixel((1066 + 400, 400))
+    assert red > 150 and green < 80
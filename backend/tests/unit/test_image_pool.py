@@ -0,0 +1,153 @@
+"""
+Unit Tests: Image worker pool and before/after compositing
+
+Tests for src/services/image_pool.py and src/lib/imageComposition.py:
+- Compositing runs in worker processes, off the event loop
+- No more than workers + max_queue jobs reach the executor (backpressure)
+- Failures and throughput are counted
+- A broken pool is replaced once, never the pool that replaced it
+"""
+
+import asyncio
+import time
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from src.lib import imageComposition
+from src.lib.imageComposition import compose_before_after_image, create_before_after_image
+from src.services.image_pool import ImageWorkerPool
+
+
+def jpeg(size=(1200, 900), color=(40, 120, 40)) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def slow_double(value: int) -> int:
+    time.sleep(0.05)
+    return value * 2
+
+
+def fail(message: str) -> None:
+    raise ValueError(message)
+
+
+def broken_after(delay: float) -> None:
+    time.sleep(delay)
+    raise BrokenProcessPool("worker died")
+
+
+class TestImageWorkerPool:
+
+    @pytest.mark.asyncio
+    async def test_backpressure_caps_submitted_jobs(self):
+        pool = ImageWorkerPool(workers=2, max_queue=1, use_processes=False)
+        max_in_flight = 0
+        max_waiting = 0
+
+        async def sample():
+            nonlocal max_in_flight, max_waiting
+            while True:
+                max_in_flight = max(max_in_flight, pool.in_flight)
+                max_waiting = max(max_waiting, pool.waiting)
+                await asyncio.sleep(0.005)
+
+        sampler = asyncio.create_task(sample())
+        try:
+            results = await asyncio.gather(*[pool.run(slow_double, i) for i in range(8)])
+        finally:
+            sampler.cancel()
+            await pool.close()
+
+        assert results == [i * 2 for i in range(8)]
+        assert max_in_flight == 3
+        assert max_waiting > 0
+
+        stats = pool.get_stats()
+        assert stats["completed"] == 8
+        assert stats["in_flight"] == 0
+        assert stats["avg_worker_ms"] >= 40
+        assert stats["jobs_per_second"] > 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_counted(self):
+        pool = ImageWorkerPool(workers=1, use_processes=False)
+        try:
+            with pytest.raises(ValueError, match="bad image"):
+                await pool.run(fail, "bad image")
+            assert await pool.run(slow_double, 2) == 4
+        finally:
+            await pool.close()
+
+        stats = pool.get_stats()
+        assert (stats["failed"], stats["completed"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_failures_do_not_close_its_replacement(self):
+        pool = ImageWorkerPool(workers=2, use_processes=False)
+        try:
+            slow_failure = asyncio.create_task(pool.run(broken_after, 0.2))
+            await asyncio.sleep(0.01)
+            broken = pool._executor
+
+            # First failure resets the pool (its shutdown waits for slow_failure)
+            fast_failure = asyncio.create_task(pool.run(broken_after, 0))
+            await asyncio.sleep(0.05)
+            assert pool._executor is None
+
+            healthy = asyncio.create_task(pool.run(slow_double, 3))
+            await asyncio.sleep(0.01)
+            replacement = pool._executor
+            assert replacement is not None and replacement is not broken
+
+            # The old pool's second failure must leave the replacement running
+            for task in (slow_failure, fast_failure):
+                with pytest.raises(BrokenProcessPool):
+                    await task
+            assert pool._executor is replacement
+            assert await healthy == 6
+        finally:
+            await pool.close()
+
+        stats = pool.get_stats()
+        assert (stats["failed"], stats["restarts"], stats["completed"]) == (2, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self):
+        pool = ImageWorkerPool(workers=1, use_processes=True)
+        try:
+            result = await pool.run(compose_before_after_image, jpeg(), jpeg(color=(200, 30, 30)))
+        finally:
+            await pool.close()
+
+        assert Image.open(BytesIO(result)).size == (2132, 800)
+        assert pool.get_stats()["running"] is False
+
+
+class TestCreateBeforeAfterImage:
+
+    @pytest.mark.asyncio
+    async def test_compositing_leaves_event_loop_free(self, monkeypatch):
+        pool = ImageWorkerPool(workers=1, use_processes=False)
+        monkeypatch.setattr(imageComposition, "get_image_pool", lambda: pool)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        try:
+            result = await create_before_after_image(jpeg((2400, 1800)), jpeg((2400, 1800)))
+        finally:
+            task.cancel()
+            await pool.close()
+
+        assert Image.open(BytesIO(result)).format == "JPEG"
+        assert ticks > 1
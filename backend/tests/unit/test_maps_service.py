@@ -14,11 +14,17 @@ from src.services.maps_service import (
     StreetViewMetadata,
     MapsServiceError
 )
+from src.services.geocode_cache import GeocodeCache, normalize_address
+from src.services.imagery_cache import ImageryCache
 
 @pytest.fixture
-def maps_service():
-    """Create MapsService instance with mock API key"""
-    return MapsService(api_key="test_api_key_12345")
+def maps_service(tmp_path):
+    """Create MapsService instance with mock API key and empty caches"""
+    return MapsService(
+        api_key="test_api_key_12345",
+        geocode_cache=GeocodeCache(),
+        imagery_cache=ImageryCache(directory=str(tmp_path / "imagery"))
+    )
 
 @pytest.fixture
 def mock_coordinates():
@@ -299,3 +305,366 @@ class TestFetchStreetViewImage:
 
             # Then: Should return None
             assert result is None
+
+
+class TestPropertyImagery:
+    """PropertyImagery bundle: built once per generation, shared by every area"""
+
+    @pytest.fixture
+    def geocode_result(self, mock_coordinates):
+        from src.services.maps_service import GeocodeResult
+        return GeocodeResult(
+            coordinates=mock_coordinates,
+            location_type="ROOFTOP",
+            formatted_address="1600 Amphitheatre Pkwy, Mountain View, CA 94043, USA",
+            address_components=[],
+            place_id="ChIJ2eUgeAK6j4ARbn5u_wAGqWA",
+            has_street_number=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_reuses_caller_geocode(self, maps_service, geocode_result):
+        """Test that a geocode from the caller skips the Geocoding API call"""
+        maps_service.geocode_address = AsyncMock()
+        maps_service.get_street_view_metadata = AsyncMock(
+            return_value=StreetViewMetadata(status="OK", pano_id="pano_123")
+        )
+        maps_service.fetch_street_view_image = AsyncMock()
+        maps_service.fetch_satellite_image = AsyncMock()
+
+        imagery = await maps_service.build_property_imagery(
+            "1600 Amphitheatre Parkway",
+            geocode_result=geocode_result,
+            fetch_images=False
+        )
+
+        maps_service.geocode_address.assert_not_awaited()
+        maps_service.fetch_street_view_image.assert_not_awaited()
+        maps_service.fetch_satellite_image.assert_not_awaited()
+        assert imagery.has_street_view
+        assert imagery.street_view_metadata.pano_id == "pano_123"
+
+    @pytest.mark.asyncio
+    async def test_images_fetched_once(self, maps_service, geocode_result):
+        """Test that fetch_property_images downloads each image only once"""
+        from src.services.maps_service import PropertyImagery
+        maps_service.fetch_street_view_image = AsyncMock(return_value=b"street_view")
+        maps_service.fetch_satellite_image = AsyncMock(return_value=b"satellite")
+        imagery = PropertyImagery(
+            address="1600 Amphitheatre Parkway",
+            geocode=geocode_result,
+            street_view_metadata=StreetViewMetadata(status="OK", pano_id="pano_123")
+        )
+
+        await maps_service.fetch_property_images(imagery)
+        await maps_service.fetch_property_images(imagery)
+
+        maps_service.fetch_street_view_image.assert_awaited_once()
+        maps_service.fetch_satellite_image.assert_awaited_once()
+        assert imagery.image_for_area("front_yard") == (b"street_view", "street_view")
+        assert imagery.image_for_area("backyard") == (b"satellite", "google_satellite")
+
+    def test_image_for_area_falls_back(self, geocode_result):
+        """Test fallback to the other image type, and error when neither exists"""
+        from src.services.maps_service import PropertyImagery
+        no_street_view = PropertyImagery(address="a", geocode=geocode_result, satellite_bytes=b"satellite")
+        no_satellite = PropertyImagery(address="a", geocode=geocode_result, street_view_bytes=b"street_view")
+        nothing = PropertyImagery(address="a", geocode=geocode_result)
+
+        assert no_street_view.image_for_area("front_yard") == (b"satellite", "google_satellite")
+        assert no_satellite.image_for_area("walkway") == (b"street_view", "street_view")
+        with pytest.raises(MapsServiceError):
+            nothing.image_for_area("front_yard")
+
+    def test_payload_round_trip_excludes_bytes(self, geocode_result):
+        """Test that to_payload()/from_payload() keep location data but not image bytes"""
+        import json
+        from src.services.maps_service import PropertyImagery
+        imagery = PropertyImagery(
+            address="1600 Amphitheatre Parkway",
+            geocode=geocode_result,
+            street_view_metadata=StreetViewMetadata(
+                status="OK",
+                pano_id="pano_123",
+                location=Coordinates(lat=37.4225, lng=-122.0843)
+            ),
+            street_view_bytes=b"street_view",
+            fetched_sources={"street_view", "satellite"}
+        )
+
+        restored = PropertyImagery.from_payload(json.loads(json.dumps(imagery.to_payload())))
+
+        assert restored.coordinates == geocode_result.coordinates
+        assert restored.street_view_metadata.pano_id == "pano_123"
+        assert restored.street_view_metadata.location == Coordinates(lat=37.4225, lng=-122.0843)
+        assert restored.street_view_bytes is None
+        assert restored.images_fetched is False
+
+    @pytest.mark.asyncio
+    async def test_front_yard_fetches_only_street_view(self, maps_service, geocode_result):
+        """Test that an area's primary image is fetched without the fallback"""
+        from src.services.maps_service import PropertyImagery
+        maps_service.fetch_street_view_image = AsyncMock(return_value=b"street_view")
+        maps_service.fetch_satellite_image = AsyncMock(return_value=b"satellite")
+        imagery = PropertyImagery(
+            address="1600 Amphitheatre Parkway",
+            geocode=geocode_result,
+            street_view_metadata=StreetViewMetadata(status="OK", pano_id="pano_123")
+        )
+
+        result = await maps_service.get_area_image(imagery, "front_yard")
+
+        assert result == (b"street_view", "street_view")
+        maps_service.fetch_satellite_image.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_no_street_view_skips_street_view_fetch(self, maps_service, geocode_result):
+        """Test that front_yard goes straight to satellite when metadata has no panorama"""
+        from src.services.maps_service import PropertyImagery
+        maps_service.fetch_street_view_image = AsyncMock()
+        maps_service.fetch_satellite_image = AsyncMock(return_value=b"satellite")
+        imagery = PropertyImagery(
+            address="1600 Amphitheatre Parkway",
+            geocode=geocode_result,
+            street_view_metadata=StreetViewMetadata(status="ZERO_RESULTS")
+        )
+
+        result = await maps_service.get_area_image(imagery, "front_yard")
+
+        assert result == (b"satellite", "google_satellite")
+        maps_service.fetch_street_view_image.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fallback_fetched_only_when_primary_fails(self, maps_service, geocode_result):
+        """Test lazy fallback: satellite failure triggers a Street View fetch"""
+        from src.services.maps_service import PropertyImagery
+        maps_service.fetch_street_view_image = AsyncMock(return_value=b"street_view")
+        maps_service.fetch_satellite_image = AsyncMock(
+            side_effect=MapsServiceError("api_error", "Satellite unavailable")
+        )
+        imagery = PropertyImagery(
+            address="1600 Amphitheatre Parkway",
+            geocode=geocode_result,
+            street_view_metadata=StreetViewMetadata(status="OK", pano_id="pano_123")
+        )
+
+        result = await maps_service.get_area_image(imagery, "backyard")
+
+        assert result == (b"street_view", "street_view")
+        maps_service.fetch_satellite_image.assert_awaited_once()
+        maps_service.fetch_street_view_image.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_independent_fetches_run_concurrently(self, maps_service, geocode_result):
+        """Test that Street View and satellite downloads overlap instead of running back to back"""
+        import asyncio
+        from src.services.maps_service import PropertyImagery
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_fetch(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return b"image"
+
+        maps_service.fetch_street_view_image = AsyncMock(side_effect=slow_fetch)
+        maps_service.fetch_satellite_image = AsyncMock(side_effect=slow_fetch)
+        imagery = PropertyImagery(
+            address="1600 Amphitheatre Parkway",
+            geocode=geocode_result,
+            street_view_metadata=StreetViewMetadata(status="OK", pano_id="pano_123")
+        )
+
+        await maps_service.fetch_property_images(imagery, areas=["front_yard", "backyard"])
+
+        assert max_in_flight == 2
+        assert imagery.images_fetched
+
+
+class TestSharedSession:
+    """Pooled aiohttp session shared by every MapsService instance"""
+
+    @pytest.mark.asyncio
+    async def test_open_session_is_idempotent_and_shared(self, maps_service):
+        """Test that one session is opened and used for API calls until closed"""
+        await MapsService.open_session(limit=10, limit_per_host=5)
+        try:
+            session = MapsService._session
+            await MapsService.open_session()
+            assert MapsService._session is session
+            assert session.connector.limit == 10
+
+            with patch.object(session, 'get') as mock_get:
+                mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+                    return_value={"status": "ZERO_RESULTS", "results": []}
+                )
+                await maps_service.geocode_address("nowhere")
+                mock_get.assert_called_once()
+        finally:
+            await MapsService.close_session()
+
+        assert MapsService._session is None
+
+
+class TestGeocodeCache:
+    """Geocode cache in front of MapsService.geocode_address()"""
+
+    @pytest.fixture
+    def geocode_result(self, mock_coordinates):
+        from src.services.maps_service import GeocodeResult
+        return GeocodeResult(
+            coordinates=mock_coordinates,
+            location_type="ROOFTOP",
+            formatted_address="1600 Amphitheatre Pkwy, Mountain View, CA 94043, USA",
+            address_components=[{"long_name": "1600", "types": ["street_number"]}],
+            place_id="ChIJ2eUgeAK6j4ARbn5u_wAGqWA",
+            has_street_number=True
+        )
+
+    def test_normalize_address(self):
+        """Test that case, punctuation and spacing differences share a key"""
+        assert normalize_address("1600 Amphitheatre Pkwy., Mountain View, CA") == \
+            normalize_address("  1600 amphitheatre pkwy  mountain view ca ")
+
+    @pytest.mark.asyncio
+    async def test_repeat_address_skips_api(self, maps_service, geocode_result):
+        """Test that a second lookup of the same address is served from memory"""
+        maps_service._geocode_address_uncached = AsyncMock(return_value=geocode_result)
+
+        first = await maps_service.geocode_address("1600 Amphitheatre Pkwy, Mountain View, CA")
+        second = await maps_service.geocode_address("1600 amphitheatre pkwy mountain view ca")
+
+        assert first == second == geocode_result
+        maps_service._geocode_address_uncached.assert_awaited_once()
+        stats = maps_service.geocode_cache.get_stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_address_not_cached(self, maps_service):
+        """Test that failed lookups always go back to the API"""
+        maps_service._geocode_address_uncached = AsyncMock(return_value=None)
+
+        await maps_service.geocode_address("nowhere")
+        await maps_service.geocode_address("nowhere")
+
+        assert maps_service._geocode_address_uncached.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_ttl(self, geocode_result):
+        """Test that the memory tier is bounded and entries expire"""
+        cache = GeocodeCache(max_entries=2)
+        await cache.set("a", geocode_result)
+        await cache.set("b", geocode_result)
+        await cache.get("a")  # "a" is now most recently used
+        await cache.set("c", geocode_result)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == geocode_result
+
+        expired = GeocodeCache(memory_ttl_seconds=0)
+        await expired.set("a", geocode_result)
+        assert await expired.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_database_tier_round_trip(self, geocode_result):
+        """Test that a result written by one process is read back by another"""
+        import json
+        stored = {}
+
+        async def execute(query, key, result_json, ttl_days):
+            stored[key] = result_json
+
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=execute)
+        await GeocodeCache(db=db).set("1600 Amphitheatre Pkwy", geocode_result)
+
+        key = normalize_address("1600 Amphitheatre Pkwy")
+        db.fetchrow = AsyncMock(return_value={"result": json.loads(stored[key])})
+        other_process = GeocodeCache(db=db)
+
+        assert await other_process.get("1600 AMPHITHEATRE PKWY") == geocode_result
+        assert other_process.get_stats()["db_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_database_errors_are_misses(self, geocode_result):
+        """Test that an unavailable database degrades to the memory tier"""
+        db = MagicMock()
+        db.fetchrow = AsyncMock(side_effect=RuntimeError("Database pool not initialized"))
+        db.execute = AsyncMock(side_effect=RuntimeError("Database pool not initialized"))
+        cache = GeocodeCache(db=db)
+
+        assert await cache.get("a") is None
+        await cache.set("a", geocode_result)
+        assert await cache.get("a") == geocode_result
+
+
+class TestImageryCache:
+    """Disk cache for Street View metadata and images"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_view_served_from_disk(self, maps_service, mock_coordinates):
+        """Test that the same panorama view is fetched from Google only once"""
+        maps_service._fetch_street_view_image_uncached = AsyncMock(return_value=b"jpeg")
+
+        first = await maps_service.fetch_street_view_image(mock_coordinates, heading=90, pano_id="pano_123")
+        second = await maps_service.fetch_street_view_image(mock_coordinates, heading=90, pano_id="pano_123")
+        other_heading = await maps_service.fetch_street_view_image(mock_coordinates, heading=180, pano_id="pano_123")
+
+        assert first == second == other_heading == b"jpeg"
+        assert maps_service._fetch_street_view_image_uncached.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_metadata_cached_by_rounded_coordinates(self, maps_service, mock_coordinates):
+        """Test that nearby coordinates of the same house share cached metadata"""
+        maps_service._get_street_view_metadata_uncached = AsyncMock(
+            return_value=StreetViewMetadata(
+                status="OK",
+                pano_id="pano_123",
+                location=Coordinates(lat=37.4225, lng=-122.0843)
+            )
+        )
+        nearby = Coordinates(lat=mock_coordinates.lat + 0.000001, lng=mock_coordinates.lng)
+
+        first = await maps_service.get_street_view_metadata(mock_coordinates)
+        second = await maps_service.get_street_view_metadata(nearby)
+
+        assert first == second
+        maps_service._get_street_view_metadata_uncached.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_image_not_cached(self, maps_service, mock_coordinates):
+        """Test that a 404 (None) is retried rather than cached"""
+        maps_service._fetch_street_view_image_uncached = AsyncMock(return_value=None)
+
+        await maps_service.fetch_street_view_image(mock_coordinates)
+        await maps_service.fetch_street_view_image(mock_coordinates)
+
+        assert maps_service._fetch_street_view_image_uncached.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_size_bound_evicts_least_recently_used(self, tmp_path):
+        """Test that the store stays under max_bytes and survives a restart"""
+        cache = ImageryCache(directory=str(tmp_path), max_bytes=10)
+        await cache.set_bytes("img", "a", data=b"aaaa")
+        await cache.set_bytes("img", "b", data=b"bbbb")
+        await cache.get_bytes("img", "a")  # "a" is now most recently used
+        await cache.set_bytes("img", "c", data=b"cccc")
+
+        assert await cache.get_bytes("img", "b") is None
+        assert await cache.get_bytes("img", "a") == b"aaaa"
+        assert cache.get_stats()["total_bytes"] <= 10
+
+        restarted = ImageryCache(directory=str(tmp_path), max_bytes=10)
+        assert await restarted.get_bytes("img", "c") == b"cccc"
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self, tmp_path):
+        """Test that entries older than the TTL are not served"""
+        cache = ImageryCache(directory=str(tmp_path), ttl_seconds=0)
+        await cache.set_bytes("img", "a", data=b"aaaa")
+
+        assert await cache.get_bytes("img", "a") is None
@@ -0,0 +1,99 @@
+"""
+Unit Tests: Adaptive concurrency limit and circuit breaker
+
+Tests for src/services/resilience.py:
+- AIMDLimiter never runs more calls than its current limit
+- Overload halves the limit once per round of calls
+- CircuitBreaker opens on failure rate, probes once, then closes or re-opens
+"""
+
+import asyncio
+import time
+import pytest
+
+from src.services.resilience import AIMDLimiter, CircuitBreaker, CircuitOpenError
+
+
+class TestAIMDLimiter:
+
+    @pytest.mark.asyncio
+    async def test_limit_caps_in_flight_calls(self):
+        limiter = AIMDLimiter("test", max_limit=2)
+        max_in_flight = 0
+
+        async def call():
+            nonlocal max_in_flight
+            async with limiter.slot():
+                max_in_flight = max(max_in_flight, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[call() for _ in range(6)])
+
+        assert max_in_flight == 2
+        assert limiter.in_flight == 0
+
+    def test_overloads_from_the_same_round_decrease_once(self):
+        limiter = AIMDLimiter("test", max_limit=16, min_limit=2)
+        started_at = time.monotonic()
+
+        for _ in range(5):
+            limiter.on_overload(started_at)
+
+        assert int(limiter.limit) == 8
+        assert limiter.decreases == 1
+
+        # A call started after the decrease can shrink it again, down to the floor
+        for _ in range(5):
+            limiter.on_overload(time.monotonic() + 1)
+        assert int(limiter.limit) == 2
+
+    def test_slow_success_counts_as_overload(self):
+        limiter = AIMDLimiter("test", max_limit=8, slow_call_seconds=0.0)
+
+        limiter.on_success(time.monotonic() - 1)
+
+        assert int(limiter.limit) == 4
+        assert limiter.successes == 0
+
+
+class TestCircuitBreaker:
+
+    def test_opens_at_failure_rate_and_rejects(self):
+        breaker = CircuitBreaker("test", failure_rate_threshold=0.5, min_calls=4)
+
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        with pytest.raises(CircuitOpenError):
+            breaker.raise_if_open()
+        assert breaker.get_stats()["rejected"] == 2
+
+    def test_half_open_admits_one_probe(self):
+        breaker = CircuitBreaker("test", min_calls=1, open_seconds=0)
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker.check()  # Probe admitted
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.check()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("test", min_calls=1, open_seconds=0)
+        breaker.record_failure()
+        breaker.check()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.get_stats()["opened"] == 2
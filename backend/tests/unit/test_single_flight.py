@@ -0,0 +1,141 @@
+"""
+Unit Tests: Single-flight request coalescing
+
+Tests for src/services/single_flight.py and its use in MapsService and
+GeminiClient:
+- Concurrent callers with the same key share one call
+- Errors reach every waiting caller and are not remembered
+- Cancelling one caller does not cancel the shared call
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.services.geocode_cache import GeocodeCache
+from src.services.maps_service import Coordinates, GeocodeResult, MapsService
+from src.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight("test")
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*[flights.do("key", work) for _ in range(5)])
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert flights.get_stats()["coalesced"] == 4
+        assert flights.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        flights = SingleFlight("test")
+        work = AsyncMock(return_value="result")
+
+        await asyncio.gather(flights.do("a", work), flights.do("b", work))
+
+        assert work.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller_and_are_not_cached(self):
+        flights = SingleFlight("test")
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flights.do("key", fail),
+            flights.do("key", fail),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await flights.do("key", AsyncMock(return_value="retried")) == "retried"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        flights = SingleFlight("test")
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(flights.do("key", work))
+        second = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "result"
+
+
+class TestMapsServiceCoalescing:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_geocodes_share_one_api_call(self):
+        maps_service = MapsService(api_key="test_api_key", geocode_cache=GeocodeCache())
+        result = GeocodeResult(
+            coordinates=Coordinates(lat=37.42, lng=-122.08),
+            location_type="ROOFTOP",
+            formatted_address="1600 Amphitheatre Pkwy",
+            address_components=[],
+            place_id="place"
+        )
+
+        async def slow_geocode(address):
+            await asyncio.sleep(0.01)
+            return result
+
+        maps_service._geocode_address_uncached = AsyncMock(side_effect=slow_geocode)
+
+        results = await asyncio.gather(
+            maps_service.geocode_address("1600 Amphitheatre Pkwy"),
+            maps_service.geocode_address("1600 amphitheatre pkwy."),
+            maps_service.geocode_address("1600 AMPHITHEATRE PKWY")
+        )
+
+        assert results == [result] * 3
+        maps_service._geocode_address_uncached.assert_awaited_once()
+
+
+class TestGeminiCoalescing:
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_generation(self):
+        from src.services.gemini_client import GeminiClient
+
+        with patch("src.services.gemini_client.genai.Client"):
+            gemini = GeminiClient()
+
+        async def slow_generate(**kwargs):
+            await asyncio.sleep(0.01)
+            return b"image"
+
+        gemini._generate_from_prompt = AsyncMock(side_effect=slow_generate)
+        request = dict(
+            input_image=b"yard",
+            address="1600 Amphitheatre Pkwy",
+            area_type="front_yard",
+            style="modern_minimalist"
+        )
+
+        results = await asyncio.gather(
+            gemini.generate_landscape_design(**request),
+            gemini.generate_landscape_design(**request),
+            gemini.generate_landscape_design(**{**request, "input_image": b"other yard"})
+        )
+
+        assert results == [b"image"] * 3
+        assert gemini._generate_from_prompt.await_count == 2
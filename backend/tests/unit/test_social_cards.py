@@ -0,0 +1,146 @@
+"""
+Unit Tests: Social share cards
+
+Tests for src/lib/socialCards.py and src/services/social_card_service.py:
+- One decode of each source yields the before/after image, every card and thumbnail
+- Cards have the platform sizes (OG 1200x630, square, story)
+- All images are uploaded together and returned by name
+- Stored card URLs are reused; older generations are rendered once
+"""
+
+import asyncio
+import json
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from PIL import Image
+
+from src.lib import socialCards
+from src.lib.socialCards import CARD_FORMATS, THUMBNAIL_FORMATS, render_share_images
+from src.services import social_card_service
+from src.services.image_pool import ImageWorkerPool
+from src.services.social_card_service import SocialCardService, card_for_platform
+
+
+def encoded(size, image_format="JPEG", color=(40, 120, 40)) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", size, color).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def upload_mock() -> AsyncMock:
+    storage = AsyncMock()
+    storage.upload_multiple_images.side_effect = lambda images, content_type: [
+        f"https://cdn.test/{filename}" for _, filename in images
+    ]
+    return storage
+
+
+class TestRenderShareImages:
+
+    def test_every_variant_from_one_decode_per_source(self, monkeypatch):
+        decodes = []
+        original_decode = socialCards.decode_rgb
+
+        def counting_decode(image_bytes, min_size):
+            decodes.append(min_size)
+            return original_decode(image_bytes, min_size)
+
+        monkeypatch.setattr(socialCards, "decode_rgb", counting_decode)
+
+        images = render_share_images(encoded((640, 640)), encoded((1024, 1024), "PNG", color=(200, 30, 30)))
+
+        assert len(decodes) == 2
+        assert set(images) == {"before_after", *CARD_FORMATS, *THUMBNAIL_FORMATS}
+        for name, (width, height, _) in CARD_FORMATS.items():
+            assert Image.open(BytesIO(images[name])).size == (width, height)
+        for name, (_, width, height) in THUMBNAIL_FORMATS.items():
+            assert Image.open(BytesIO(images[name])).size == (width, height)
+        assert Image.open(BytesIO(images["before_after"])).size == (1600, 800)
+
+    def test_og_card_is_side_by_side_and_story_is_stacked(self):
+        images = render_share_images(encoded((640, 640)), encoded((640, 640), color=(200, 30, 30)))
+
+        og = Image.open(BytesIO(images["og"]))
+        red, green, _ = og.getpixel((900, 315))
+        assert red > 150 and green < 80
+        assert og.getpixel((300, 315))[1] > 80
+
+        story = Image.open(BytesIO(images["story"]))
+        red, green, _ = story.getpixel((540, 1400))
+        assert red > 150 and green < 80
+        assert story.getpixel((540, 500))[1] > 80
+
+    def test_before_after_can_be_skipped(self):
+        images = render_share_images(encoded((640, 640)), encoded((640, 640)), include_before_after=False)
+
+        assert "before_after" not in images
+        assert set(CARD_FORMATS) <= set(images)
+
+
+class TestSocialCardService:
+
+    @pytest.mark.asyncio
+    async def test_render_and_upload_maps_names_to_urls(self, monkeypatch):
+        pool = ImageWorkerPool(workers=1, use_processes=False)
+        monkeypatch.setattr(socialCards, "get_image_pool", lambda: pool)
+        storage = upload_mock()
+        generation_id = uuid4()
+
+        try:
+            urls = await SocialCardService(MagicMock(), storage).render_and_upload(
+                generation_id, encoded((640, 640)), encoded((640, 640))
+            )
+        finally:
+            await pool.close()
+
+        storage.upload_multiple_images.assert_awaited_once()
+        assert urls["og"] == f"https://cdn.test/holiday/{generation_id}/og.jpg"
+        assert urls["square_thumb"] == f"https://cdn.test/holiday/{generation_id}/square-thumb.jpg"
+        assert urls["before_after"] == f"https://cdn.test/holiday/{generation_id}/before-after.jpg"
+
+    @pytest.mark.asyncio
+    async def test_stored_cards_are_not_rendered_again(self, monkeypatch):
+        render = AsyncMock()
+        monkeypatch.setattr(social_card_service, "create_share_images", render)
+        stored = json.dumps({"og": "https://cdn.test/og.jpg"})
+
+        urls = await SocialCardService(MagicMock(), upload_mock()).get_card_urls(
+            uuid4(), stored, "https://cdn.test/original.jpg", "https://cdn.test/decorated.jpg"
+        )
+
+        assert urls == {"og": "https://cdn.test/og.jpg"}
+        render.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_backfills_render_once(self, monkeypatch):
+        service = SocialCardService(AsyncMock(), upload_mock())
+        calls = 0
+
+        async def backfill(generation_id, original_image_url, decorated_image_url):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"og": "https://cdn.test/og.jpg"}
+
+        monkeypatch.setattr(service, "_backfill", backfill)
+        generation_id = uuid4()
+
+        results = await asyncio.gather(*[
+            service.get_card_urls(generation_id, None, "https://cdn.test/a.jpg", "https://cdn.test/b.jpg")
+            for _ in range(3)
+        ])
+
+        assert calls == 1
+        assert all(result == {"og": "https://cdn.test/og.jpg"} for result in results)
+
+
+def test_card_for_platform():
+    urls = {"og": "og.jpg", "square": "square.jpg", "story": "story.jpg"}
+
+    assert card_for_platform(urls, "facebook") == "og.jpg"
+    assert card_for_platform(urls, "instagram") == "square.jpg"
+    assert card_for_platform(json.dumps(urls), "pinterest") == "story.jpg"
+    assert card_for_platform(None, "x") is None
@@ -0,0 +1,305 @@
+"""
+Unit Tests: Storage backends
+
+Tests that uploads reuse the pooled HTTP client opened in the app lifespan
+instead of building a new client (and TLS connection) per request, that
+large images are streamed in chunks, and that retries are idempotent
+(content-hash pathnames). Also covers the local-disk and S3 backends and
+backend selection.
+"""
+
+import httpx
+import pytest
+
+from src.services.storage_service import (
+    BlobStorageService,
+    LocalStorageService,
+    S3StorageService,
+    StorageService,
+    content_pathname,
+    create_storage_service,
+)
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    monkeypatch.setenv("BLOB_READ_WRITE_TOKEN", "test-token")
+    return BlobStorageService(retry_backoff_seconds=0)
+
+
+def mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestPooledClient:
+
+    @pytest.mark.asyncio
+    async def test_open_is_idempotent_and_close_releases(self, storage):
+        await storage.open(http2=True)
+        client = storage._client
+        await storage.open()
+
+        assert storage._client is client
+
+        await storage.close()
+        assert storage._client is None
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_uploads_reuse_pooled_client(self, storage):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"url": f"https://blob.example/{len(requests)}.png"})
+
+        storage._client = mock_client(handler)
+        try:
+            first = await storage.upload_image(b"one", "a.png")
+            second = await storage.upload_image(b"two", "b.png")
+        finally:
+            await storage.close()
+
+        assert (first, second) == ("https://blob.example/1.png", "https://blob.example/2.png")
+        assert [request.method for request in requests] == ["PUT", "PUT"]
+        assert requests[0].headers["Authorization"].startswith("Bearer ")
+
+
+    @pytest.mark.asyncio
+    async def test_image_exists_heads_public_url(self, storage):
+        statuses = {"https://blob.example/a.png": 200, "https://blob.example/gone.png": 404}
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(statuses.get(str(request.url), 403))
+
+        storage._client = mock_client(handler)
+        try:
+            assert await storage.image_exists("https://blob.example/a.png") is True
+            assert await storage.image_exists("https://blob.example/gone.png") is False
+            with pytest.raises(Exception, match="403"):
+                await storage.image_exists("https://blob.example/private.png")
+        finally:
+            await storage.close()
+
+        assert {request.method for request in requests} == {"HEAD"}
+
+
+class TestStreamingUploads:
+
+    @pytest.mark.asyncio
+    async def test_large_image_is_streamed_in_chunks(self, monkeypatch):
+        monkeypatch.setenv("BLOB_READ_WRITE_TOKEN", "test-token")
+        storage = BlobStorageService(stream_threshold_bytes=10, chunk_size_bytes=4)
+        received = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            received.append((request.headers.get("Content-Length"), await request.aread()))
+            return httpx.Response(200, json={"url": "https://blob.example/a.png"})
+
+        storage._client = mock_client(handler)
+        try:
+            await storage.upload_image(b"0123456789abc", "a.png")
+        finally:
+            await storage.close()
+
+        assert received == [("13", b"0123456789abc")]
+        chunks = [chunk async for chunk in storage._body(b"0123456789abc")]
+        assert chunks == [b"0123", b"4567", b"89ab", b"c"]
+
+    def test_small_image_is_sent_as_one_buffer(self, storage):
+        assert storage._body(b"small") == b"small"
+
+
+class TestIdempotentRetries:
+
+    @pytest.mark.asyncio
+    async def test_retry_resends_to_the_same_content_addressed_path(self, storage):
+        requests = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request.url.path, await request.aread()))
+            if len(requests) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"url": f"https://blob.example{request.url.path}"})
+
+        storage._client = mock_client(handler)
+        try:
+            url = await storage.upload_image(b"design", "design.png")
+        finally:
+            await storage.close()
+
+        path = "/" + content_pathname(b"design", "design.png")
+        assert requests == [(path, b"design"), (path, b"design")]
+        assert url == f"https://blob.example{path}"
+        assert storage.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_are_retried_then_raised(self, storage):
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            raise httpx.ConnectError("connection refused", request=request)
+
+        storage._client = mock_client(handler)
+        try:
+            with pytest.raises(httpx.ConnectError):
+                await storage.upload_image(b"design", "design.png")
+        finally:
+            await storage.close()
+
+        assert attempts == storage.max_attempts
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, storage):
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(403, text="forbidden")
+
+        storage._client = mock_client(handler)
+        try:
+            with pytest.raises(Exception, match="403"):
+                await storage.upload_image(b"design", "design.png")
+        finally:
+            await storage.close()
+
+        assert attempts == 1
+
+    def test_same_content_maps_to_same_pathname(self):
+        assert content_pathname(b"a", "x.png") == content_pathname(b"a", "x.png")
+        assert content_pathname(b"a", "x.png") != content_pathname(b"b", "x.png")
+
+
+class TestLocalStorage:
+
+    @pytest.fixture
+    def local(self, tmp_path):
+        return LocalStorageService(base_url="http://api.test/files/", directory=str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_upload_is_content_addressed(self, local, tmp_path):
+        first = await local.upload_image(b"design", "holiday/1/decorated.JPG", "image/jpeg")
+        second = await local.upload_image(b"design", "other.jpg", "image/jpeg")
+
+        assert first == second
+        name = first.rsplit("/", 1)[-1]
+        assert first == f"http://api.test/files/{name}"
+        assert name.endswith(".jpg")
+        assert (tmp_path / name).read_bytes() == b"design"
+        assert [p.name for p in tmp_path.iterdir()] == [name]
+
+    @pytest.mark.asyncio
+    async def test_extension_falls_back_to_content_type(self, local):
+        url = await local.upload_image(b"design", "design", "image/png")
+        assert url.endswith(".png")
+
+    @pytest.mark.asyncio
+    async def test_delete_only_touches_stored_files(self, local, tmp_path):
+        url = await local.upload_image(b"design", "design.png")
+
+        assert await local.delete_image("http://api.test/files/../secret.png") is False
+        assert await local.delete_image("https://elsewhere.test/x.png") is False
+        assert await local.delete_image(url) is True
+        assert await local.delete_image(url) is False
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_image_exists_until_deleted(self, local):
+        url = await local.upload_image(b"design", "design.png")
+
+        assert await local.image_exists(url) is True
+        assert await local.image_exists("http://api.test/files/../secret.png") is False
+        await local.delete_image(url)
+        assert await local.image_exists(url) is False
+
+
+class TestS3Storage:
+
+    @pytest.fixture
+    def s3(self):
+        return S3StorageService(
+            endpoint_url="https://s3.example.com/",
+            bucket="images",
+            access_key_id="AKIDEXAMPLE",
+            secret_access_key="secret",
+            retry_backoff_seconds=0
+        )
+
+    @pytest.mark.asyncio
+    async def test_upload_signs_put_and_returns_public_url(self, s3):
+        requests = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request, await request.aread()))
+            return httpx.Response(200)
+
+        s3._client = mock_client(handler)
+        try:
+            url = await s3.upload_image(b"design", "holiday/1/decorated.jpg", "image/jpeg")
+        finally:
+            await s3.close()
+
+        key = content_pathname(b"design", "holiday/1/decorated.jpg")
+        assert url == f"https://s3.example.com/images/{key}"
+        request, body = requests[0]
+        assert request.method == "PUT"
+        assert request.url.path == f"/images/{key}"
+        assert body == b"design"
+        assert request.headers["Content-Type"] == "image/jpeg"
+        assert request.headers["Authorization"].startswith(
+            "AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/"
+        )
+        assert "SignedHeaders=host;x-amz-content-sha256;x-amz-date" in request.headers["Authorization"]
+
+    @pytest.mark.asyncio
+    async def test_delete_maps_public_url_back_to_object(self, s3):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(204)
+
+        s3._client = mock_client(handler)
+        try:
+            assert await s3.delete_image("https://s3.example.com/images/abc_design.png") is True
+            assert await s3.delete_image("https://blob.example/abc_design.png") is False
+        finally:
+            await s3.close()
+
+        assert [(r.method, r.url.path) for r in requests] == [("DELETE", "/images/abc_design.png")]
+
+    def test_missing_credentials_are_rejected(self):
+        with pytest.raises(ValueError):
+            S3StorageService(endpoint_url="https://s3.example.com", bucket="", access_key_id="", secret_access_key="")
+
+
+class TestBackendSelection:
+
+    def test_builds_configured_backend(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("src.services.storage_service.settings.storage_local_dir", str(tmp_path))
+        monkeypatch.setattr("src.services.storage_service.settings.api_url", "http://api.test")
+        monkeypatch.setenv("BLOB_READ_WRITE_TOKEN", "test-token")
+
+        local = create_storage_service("local")
+
+        assert isinstance(local, LocalStorageService)
+        assert local.base_url == "http://api.test/files"
+        assert isinstance(create_storage_service("vercel"), BlobStorageService)
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown storage backend"):
+            create_storage_service("ftp")
+
+    def test_backend_missing_a_method_fails_on_construction(self):
+        class UploadOnlyStorage(StorageService):
+            async def upload_image(self, image_data, filename, content_type="image/png"):
+                return "https://example.com/image.png"
+
+        with pytest.raises(TypeError, match="delete_image"):
+            UploadOnlyStorage()
@@ -42,6 +42,23 @@ async def db_pool(db_connection):
     pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
     return pool
 
+@pytest.fixture
+def mock_conn():
+    """Mock connection behind a pool for tests that never touch the database."""
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock()
+    conn.execute = AsyncMock(return_value='INSERT 0 1')
+    return conn
+
+
+@pytest.fixture
+def mock_pool(mock_conn):
+    """Mock pool whose acquire() yields mock_conn."""
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    return pool
+
 @pytest_asyncio.fixture
 async def subscribed_user(db_connection):
     """Create a test user with active subscription."""
@@ -274,6 +291,41 @@ class TestSubscriptionServiceStatus:
         with pytest.raises(ValueError, match="User not found"):
             await service.get_subscription_status(fake_user_id)
 
+    @pytest.mark.asyncio
+    async def test_get_subscription_status_reads_local_snapshot(self, mock_pool, mock_conn):
+        """
+        Test status comes from users + subscriptions snapshot only.
+
+        Expected:
+        - status, current_period_start and cancel_at_period_end taken from the snapshot
+        - Stripe is never called
+        """
+        period_start = datetime.now(timezone.utc)
+        period_end = period_start + timedelta(days=30)
+        mock_conn.fetchrow.return_value = {
+            'subscription_tier': 'monthly_pro',
+            'subscription_status': 'active',
+            'stripe_subscription_id': 'sub_test123',
+            'current_period_end': period_end,
+            'cancel_at_period_end': False,
+            'current_period_start': period_start,
+        }
+
+        with patch('stripe.Subscription.retrieve') as mock_retrieve:
+            service = SubscriptionService(mock_pool)
+            status = await service.get_subscription_status(uuid4())
+
+        mock_retrieve.assert_not_called()
+        assert mock_conn.fetchrow.await_count == 1
+        assert 'subscriptions' in mock_conn.fetchrow.call_args.args[0]
+        assert status.current_period_start == period_start
+        assert status.current_period_end == period_end
+        assert status.is_active is True
+        # Status and cancellation come from the snapshot, falling back to users
+        sql = mock_conn.fetchrow.call_args.args[0]
+        assert 'COALESCE(s.status, u.subscription_status)' in sql
+        assert 'COALESCE(s.cancel_at_period_end, u.cancel_at_period_end)' in sql
+
 class TestSubscriptionServiceCancellation:
     """Test subscription cancellation."""
 
@@ -590,6 +642,51 @@ class TestSubscriptionServiceWebhookHelpers:
 
         assert found_user_id == user_id
 
+    @pytest.mark.asyncio
+    async def test_record_subscription_snapshot_maps_status(self, mock_pool, mock_conn):
+        """
+        Test snapshot upsert stores mapped and raw Stripe status.
+
+        Expected:
+        - 'canceled' mapped to 'cancelled', raw status kept
+        - Event timestamp passed for ordering
+        """
+        service = SubscriptionService(mock_pool)
+
+        written = await service.record_subscription_snapshot(
+            user_id=uuid4(),
+            subscription_id='sub_test123',
+            event_created=1700000000,
+            stripe_status='canceled'
+        )
+
+        assert written is True
+        args = mock_conn.execute.call_args.args
+        assert 'ON CONFLICT (stripe_subscription_id)' in args[0]
+        assert args[5] == 'cancelled'
+        assert args[6] == 'canceled'
+        assert args[10] == datetime.fromtimestamp(1700000000, tz=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_record_subscription_snapshot_ignores_stale_event(self, mock_pool, mock_conn):
+        """
+        Test an event older than the stored one is not applied.
+
+        Expected:
+        - Returns False when the guarded upsert touches no rows
+        """
+        mock_conn.execute.return_value = 'INSERT 0 0'
+        service = SubscriptionService(mock_pool)
+
+        written = await service.record_subscription_snapshot(
+            user_id=uuid4(),
+            subscription_id='sub_test123',
+            event_created=1600000000,
+            stripe_status='active'
+        )
+
+        assert written is False
+
 class TestSubscriptionModels:
     """Test subscription models and helper functions."""
 
@@ -188,14 +188,16 @@ export const generationAPI = {
 
   list: async (params?: {
     page?: number;
+    cursor?: string;
     limit?: number;
     status?: string;
     sort?: string;
-  }): Promise<{ data: Generation[]; total: number; has_more: boolean; page: number; limit: number }> => {
-    const { page = 1, limit = 20, status, sort } = params || {};
+  }): Promise<{ data: Generation[]; total: number; has_more: boolean; page: number; limit: number; next_cursor: string | null }> => {
+    const { page = 1, cursor, limit = 20, status, sort } = params || {};
     const response = await apiClient.get('/generations/', {
       params: {
         page,
+        cursor,
         limit,
         status,
         sort,
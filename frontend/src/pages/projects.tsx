@@ -23,6 +23,7 @@ export default function ProjectsPage() {
   const [sortBy, setSortBy] = useState<'newest' | 'oldest'>('newest');
   const [page, setPage] = useState(1);
   const [hasMore, setHasMore] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
 
   useEffect(() => {
     if (!isAuthenticated) {
@@ -41,6 +42,8 @@ export default function ProjectsPage() {
       // Call real API endpoint
       const response = await generationAPI.list({
         page,
+        // Continue from the last row seen (keyset pagination) when loading more
+        cursor: page > 1 ? nextCursor ?? undefined : undefined,
         limit: 12,
         status: filter !== 'all' ? filter : undefined,
         sort: sortBy === 'newest' ? 'created_at:desc' : 'created_at:asc'
@@ -56,6 +59,7 @@ export default function ProjectsPage() {
       // Append for pagination or replace for new filter
       setProjects(prev => page === 1 ? transformedProjects : [...prev, ...transformedProjects]);
       setHasMore(response.has_more || false);
+      setNextCursor(response.next_cursor ?? null);
     } catch (err) {
       console.error('Failed to fetch projects:', err);
       setError('Failed to load projects. Please try again.');
@@ -0,0 +1,59 @@
+-- Migration 018: Create generation_jobs table
+-- Purpose: Durable queue for per-area generation work, claimed by workers with FOR UPDATE SKIP LOCKED
+-- Requirements: FR-014 (Background processing survives restarts), FR-070 (Parallel processing)
+
+-- Create generation_jobs table
+CREATE TABLE IF NOT EXISTS generation_jobs (
+    -- Identity
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    generation_id UUID NOT NULL REFERENCES generations(id) ON DELETE CASCADE,
+    area_id UUID NOT NULL REFERENCES generation_areas(id) ON DELETE CASCADE,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+
+    -- Work Description (address, payment_method, preservation_strength, ...)
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    -- Queue State
+    status VARCHAR(50) DEFAULT 'pending' NOT NULL CHECK (
+        status IN ('pending', 'running', 'completed', 'failed')
+    ),
+    attempts INTEGER DEFAULT 0 NOT NULL CHECK (attempts >= 0),
+    max_attempts INTEGER DEFAULT 3 NOT NULL CHECK (max_attempts >= 1),
+    run_after TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    locked_at TIMESTAMP WITH TIME ZONE,
+    locked_by VARCHAR(255),
+    last_error TEXT,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    completed_at TIMESTAMP WITH TIME ZONE
+);
+
+-- One job per generation area (enqueue is idempotent)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_generation_jobs_area_id ON generation_jobs(area_id);
+
+-- Claim path: oldest runnable job first
+CREATE INDEX IF NOT EXISTS idx_generation_jobs_claim ON generation_jobs(run_after, created_at)
+    WHERE status = 'pending';
+
+-- Stale lock recovery (worker crashed mid-job)
+CREATE INDEX IF NOT EXISTS idx_generation_jobs_running ON generation_jobs(locked_at)
+    WHERE status = 'running';
+
+CREATE INDEX IF NOT EXISTS idx_generation_jobs_generation_id ON generation_jobs(generation_id);
+
+-- Auto-update updated_at
+DROP TRIGGER IF EXISTS update_generation_jobs_updated_at ON generation_jobs;
+CREATE TRIGGER update_generation_jobs_updated_at
+    BEFORE UPDATE ON generation_jobs
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Add comments
+COMMENT ON TABLE generation_jobs IS 'Durable per-area generation work queue (claimed with FOR UPDATE SKIP LOCKED)';
+COMMENT ON COLUMN generation_jobs.payload IS 'Job parameters: address, payment_method, preservation_strength, upload_source_image';
+COMMENT ON COLUMN generation_jobs.attempts IS 'Number of times a worker has claimed this job';
+COMMENT ON COLUMN generation_jobs.run_after IS 'Job is not claimable before this timestamp (retry backoff)';
+COMMENT ON COLUMN generation_jobs.locked_at IS 'When the current worker claimed the job (used to recover stale locks)';
+COMMENT ON COLUMN generation_jobs.locked_by IS 'Identifier of the worker process holding the job';
@@ -0,0 +1,12 @@
+-- Migration 019: Allow 'partial_failed' generation status
+-- Purpose: Areas of a multi-area generation run concurrently and fail independently;
+--          a generation with some completed and some failed areas is 'partial_failed'
+-- Requirements: FR-057 (Each area tracked separately), FR-070 (Parallel processing)
+
+ALTER TABLE generations DROP CONSTRAINT IF EXISTS generations_status_check;
+
+ALTER TABLE generations ADD CONSTRAINT generations_status_check CHECK (
+    status IN ('pending', 'processing', 'completed', 'partial_failed', 'failed')
+);
+
+COMMENT ON COLUMN generations.status IS 'Rolled up from generation_areas once every area finishes: completed, partial_failed, or failed';
@@ -0,0 +1,31 @@
+-- Migration 020: Create geocode_cache table
+-- Purpose: Shared cache of Google Geocoding API results keyed by normalized address
+-- Requirements: FR-012 (Address geocoding for property imagery)
+
+CREATE TABLE IF NOT EXISTS geocode_cache (
+    -- Normalized address (see src/services/geocode_cache.py normalize_address)
+    address_key TEXT PRIMARY KEY,
+
+    -- Serialized GeocodeResult (coordinates, location_type, formatted_address, ...)
+    result JSONB NOT NULL,
+
+    -- Timestamps
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+-- Expired entry cleanup
+CREATE INDEX IF NOT EXISTS idx_geocode_cache_expires_at ON geocode_cache(expires_at);
+
+-- Auto-update updated_at
+DROP TRIGGER IF EXISTS update_geocode_cache_updated_at ON geocode_cache;
+CREATE TRIGGER update_geocode_cache_updated_at
+    BEFORE UPDATE ON geocode_cache
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Add comments
+COMMENT ON TABLE geocode_cache IS 'Cached Google Geocoding API results shared by all API nodes and workers';
+COMMENT ON COLUMN geocode_cache.address_key IS 'Lowercased address with punctuation stripped and whitespace collapsed';
+COMMENT ON COLUMN geocode_cache.expires_at IS 'Entry is ignored after this timestamp (Google Maps ToS: max 30 days)';
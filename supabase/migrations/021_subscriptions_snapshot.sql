@@ -0,0 +1,66 @@
+-- Migration 021: Create subscriptions table
+-- Purpose: Local snapshot of Stripe subscriptions, maintained by webhooks, so
+--          subscription status reads never call the Stripe API
+-- Requirements: FR-033 (Subscription status), FR-035 (Subscription webhooks update user status)
+
+CREATE TABLE IF NOT EXISTS subscriptions (
+    -- Stripe identifiers
+    stripe_subscription_id TEXT PRIMARY KEY,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    stripe_customer_id TEXT,
+
+    -- Plan and status
+    plan_id TEXT,
+    status TEXT NOT NULL DEFAULT 'active'
+        CHECK (status IN ('inactive', 'active', 'past_due', 'cancelled')),
+    stripe_status TEXT,
+
+    -- Billing period
+    current_period_start TIMESTAMPTZ,
+    current_period_end TIMESTAMPTZ,
+    cancel_at_period_end BOOLEAN NOT NULL DEFAULT false,
+
+    -- Creation time of the last applied Stripe event (out-of-order protection)
+    last_event_at TIMESTAMPTZ,
+
+    -- Timestamps
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_subscriptions_user_id ON subscriptions(user_id);
+
+-- Auto-update updated_at
+DROP TRIGGER IF EXISTS update_subscriptions_updated_at ON subscriptions;
+CREATE TRIGGER update_subscriptions_updated_at
+    BEFORE UPDATE ON subscriptions
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Backfill from users (current_period_start fills in on the next webhook)
+INSERT INTO subscriptions (
+    stripe_subscription_id,
+    user_id,
+    stripe_customer_id,
+    plan_id,
+    status,
+    current_period_end,
+    cancel_at_period_end
+)
+SELECT
+    stripe_subscription_id,
+    id,
+    stripe_customer_id,
+    subscription_tier,
+    COALESCE(subscription_status, 'inactive'),
+    current_period_end,
+    COALESCE(cancel_at_period_end, false)
+FROM users
+WHERE stripe_subscription_id IS NOT NULL
+ON CONFLICT (stripe_subscription_id) DO NOTHING;
+
+-- Add comments
+COMMENT ON TABLE subscriptions IS 'Webhook-maintained snapshot of Stripe subscriptions (read path never calls Stripe)';
+COMMENT ON COLUMN subscriptions.status IS 'Mapped status (see STRIPE_STATUS_MAP in subscription_service.py)';
+COMMENT ON COLUMN subscriptions.stripe_status IS 'Raw Stripe subscription status';
+COMMENT ON COLUMN subscriptions.last_event_at IS 'Stripe event created time; older events are ignored';
@@ -0,0 +1,154 @@
+-- Migration 022: Add authorize_and_deduct function
+-- Purpose: Apply the payment hierarchy and deduct credits in ONE round trip.
+--          Replaces the subscription lookup -> balance read -> batch deduction
+--          sequence (up to five pool acquires) in GenerationService and the
+--          holiday flow.
+-- Requirements: FR-007 (subscription > trial > token), FR-013, FR-026, FR-060,
+--               FR-HOL-002 (holiday > token)
+
+-- ==============================================================================
+-- FUNCTION: authorize_and_deduct
+-- ==============================================================================
+-- Atomically pick a payment method for p_n_areas credits and deduct it.
+--
+-- Hierarchy:
+--   Standard generations (p_holiday = FALSE):
+--     1. Active subscription (nothing deducted)
+--     2. Trial credits
+--     3. Tokens
+--   Holiday generations (p_holiday = TRUE):
+--     1. Holiday credits
+--     2. Tokens
+--
+-- The users row is locked first and the token account second (same order
+-- for every caller). Called on its own (autocommit), both locks are held for
+-- this single statement only. The users lock is FOR NO KEY UPDATE: token
+-- ledger inserts take FOR KEY SHARE on users (foreign key) while holding the
+-- token account, and FOR UPDATE would deadlock against them.
+--
+-- Args:
+--   p_user_id: User UUID
+--   p_n_areas: Number of credits needed (must be >= 1)
+--   p_holiday: Use the holiday hierarchy instead of the standard one
+--
+-- Returns:
+--   success: TRUE if authorized (and deducted)
+--   payment_method: 'subscription', 'trial', 'holiday', 'token' or NULL
+--   trial_remaining: Trial credits after the call
+--   holiday_credits: Holiday credits after the call
+--   token_balance: Token balance after the call
+--
+-- Example:
+--   SELECT * FROM authorize_and_deduct('user-uuid', 3);
+--   => { success: TRUE, payment_method: 'trial', trial_remaining: 0, ... }
+-- ==============================================================================
+CREATE OR REPLACE FUNCTION authorize_and_deduct(
+    p_user_id UUID,
+    p_n_areas INTEGER,
+    p_holiday BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE(
+    success BOOLEAN,
+    payment_method TEXT,
+    trial_remaining INTEGER,
+    holiday_credits INTEGER,
+    token_balance INTEGER
+) AS $$
+DECLARE
+    v_subscription_status TEXT;
+    v_trial_remaining INTEGER;
+    v_holiday_credits INTEGER;
+    v_token_balance INTEGER;
+BEGIN
+    -- Validate amount
+    IF p_n_areas < 1 THEN
+        RAISE EXCEPTION 'p_n_areas must be >= 1, got %', p_n_areas;
+    END IF;
+
+    -- Lock the user row with FOR NO KEY UPDATE (columns qualified: the OUT
+    -- parameters share their names)
+    SELECT
+        users.subscription_status,
+        users.trial_remaining,
+        COALESCE(users.holiday_credits, 0)
+    INTO v_subscription_status, v_trial_remaining, v_holiday_credits
+    FROM users
+    WHERE id = p_user_id
+    FOR NO KEY UPDATE;
+
+    -- Check if user exists
+    IF NOT FOUND THEN
+        RETURN QUERY SELECT FALSE, NULL::TEXT, 0, 0, 0;
+        RETURN;
+    END IF;
+
+    IF NOT p_holiday THEN
+        -- 1. Active subscription: unlimited, nothing to deduct
+        IF v_subscription_status = 'active' THEN
+            SELECT balance INTO v_token_balance
+            FROM users_token_accounts
+            WHERE user_id = p_user_id;
+
+            RETURN QUERY SELECT TRUE, 'subscription'::TEXT, v_trial_remaining,
+                v_holiday_credits, COALESCE(v_token_balance, 0);
+            RETURN;
+        END IF;
+
+        -- 2. Trial credits
+        IF v_trial_remaining >= p_n_areas THEN
+            UPDATE users u
+            SET trial_remaining = u.trial_remaining - p_n_areas,
+                trial_used = u.trial_used + p_n_areas,
+                updated_at = NOW()
+            WHERE u.id = p_user_id;
+
+            SELECT balance INTO v_token_balance
+            FROM users_token_accounts
+            WHERE user_id = p_user_id;
+
+            RETURN QUERY SELECT TRUE, 'trial'::TEXT, v_trial_remaining - p_n_areas,
+                v_holiday_credits, COALESCE(v_token_balance, 0);
+            RETURN;
+        END IF;
+    ELSE
+        -- 1. Holiday credits
+        IF v_holiday_credits >= p_n_areas THEN
+            UPDATE users u
+            SET holiday_credits = u.holiday_credits - p_n_areas,
+                updated_at = NOW()
+            WHERE u.id = p_user_id;
+
+            SELECT balance INTO v_token_balance
+            FROM users_token_accounts
+            WHERE user_id = p_user_id;
+
+            RETURN QUERY SELECT TRUE, 'holiday'::TEXT, v_trial_remaining,
+                v_holiday_credits - p_n_areas, COALESCE(v_token_balance, 0);
+            RETURN;
+        END IF;
+    END IF;
+
+    -- Last resort: tokens (lock the account row)
+    SELECT balance INTO v_token_balance
+    FROM users_token_accounts
+    WHERE user_id = p_user_id
+    FOR UPDATE;
+
+    IF v_token_balance IS NOT NULL AND v_token_balance >= p_n_areas THEN
+        UPDATE users_token_accounts
+        SET balance = balance - p_n_areas,
+            updated_at = NOW()
+        WHERE user_id = p_user_id;
+
+        RETURN QUERY SELECT TRUE, 'token'::TEXT, v_trial_remaining,
+            v_holiday_credits, v_token_balance - p_n_areas;
+        RETURN;
+    END IF;
+
+    -- No payment method available
+    RETURN QUERY SELECT FALSE, NULL::TEXT, v_trial_remaining,
+        v_holiday_credits, COALESCE(v_token_balance, 0);
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION authorize_and_deduct IS 'Apply payment hierarchy and deduct credits atomically in one call (subscription > trial > token, or holiday > token)';
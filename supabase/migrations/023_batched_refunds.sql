@@ -0,0 +1,146 @@
+-- Migration 023: Add set-based refund function
+-- Purpose: Refund trial credits, tokens and holiday credits for many users in
+--          one statement (one ledger row per user), so a mass failure such as
+--          a Gemini outage is refunded in one call instead of one transaction
+--          per failed area.
+-- Requirements: FR-011 (Automatic refund on failure), FR-013, FR-066, FR-HOL-005
+
+-- ==============================================================================
+-- FUNCTION: refund_credits_bulk
+-- ==============================================================================
+-- Refund credits to many users at once.
+--
+-- The three arrays are parallel: refund p_amounts[i] credits of type
+-- p_credit_types[i] ('trial', 'token' or 'holiday') to p_user_ids[i].
+-- Entries for the same user and type are summed first, so each user gets
+-- exactly one UPDATE per credit type and one token ledger row.
+--
+-- Rows are locked in user_id order, users before token accounts (the order
+-- authorize_and_deduct takes too), so concurrent bulk refunds and
+-- deductions cannot deadlock. users rows are locked FOR NO KEY UPDATE, which
+-- does not block the FOR KEY SHARE lock a token ledger insert takes.
+--
+-- Args:
+--   p_user_ids: User UUIDs
+--   p_credit_types: Credit type per entry
+--   p_amounts: Credits to refund per entry (entries < 1 are ignored)
+--   p_description: Ledger description for token refunds
+--
+-- Returns:
+--   One row per (user_id, credit_type) refunded:
+--   user_id, credit_type, refunded, new_balance
+--
+-- Example:
+--   SELECT * FROM refund_credits_bulk(
+--       ARRAY['uuid-1', 'uuid-2']::UUID[],
+--       ARRAY['trial', 'token'],
+--       ARRAY[3, 2],
+--       'Generation failed - refund'
+--   );
+-- ==============================================================================
+CREATE OR REPLACE FUNCTION refund_credits_bulk(
+    p_user_ids UUID[],
+    p_credit_types TEXT[],
+    p_amounts INTEGER[],
+    p_description TEXT DEFAULT 'Generation failed - refund'
+)
+RETURNS TABLE(user_id UUID, credit_type TEXT, refunded INTEGER, new_balance INTEGER) AS $$
+DECLARE
+    v_user_ids UUID[];
+    v_credit_types TEXT[];
+    v_amounts INTEGER[];
+BEGIN
+    IF cardinality(p_user_ids) <> cardinality(p_credit_types)
+        OR cardinality(p_user_ids) <> cardinality(p_amounts) THEN
+        RAISE EXCEPTION 'refund_credits_bulk arrays must have the same length';
+    END IF;
+
+    -- One entry per (user, credit type), ordered by user
+    SELECT
+        array_agg(g.user_id ORDER BY g.user_id, g.credit_type),
+        array_agg(g.credit_type ORDER BY g.user_id, g.credit_type),
+        array_agg(g.amount ORDER BY g.user_id, g.credit_type)
+    INTO v_user_ids, v_credit_types, v_amounts
+    FROM (
+        SELECT r.user_id, r.credit_type, SUM(r.amount)::INTEGER AS amount
+        FROM unnest(p_user_ids, p_credit_types, p_amounts) AS r(user_id, credit_type, amount)
+        WHERE r.amount >= 1
+          AND r.credit_type IN ('trial', 'token', 'holiday')
+        GROUP BY r.user_id, r.credit_type
+    ) g;
+
+    IF v_user_ids IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Lock in a deterministic order before updating
+    PERFORM 1
+    FROM users u
+    WHERE u.id IN (
+        SELECT r.user_id
+        FROM unnest(v_user_ids, v_credit_types) AS r(user_id, credit_type)
+        WHERE r.credit_type IN ('trial', 'holiday')
+    )
+    ORDER BY u.id
+    FOR NO KEY UPDATE;
+
+    PERFORM 1
+    FROM users_token_accounts a
+    WHERE a.user_id IN (
+        SELECT r.user_id
+        FROM unnest(v_user_ids, v_credit_types) AS r(user_id, credit_type)
+        WHERE r.credit_type = 'token'
+    )
+    ORDER BY a.user_id
+    FOR UPDATE;
+
+    -- Trial credits
+    RETURN QUERY
+    UPDATE users u
+    SET trial_remaining = u.trial_remaining + r.amount,
+        trial_used = GREATEST(u.trial_used - r.amount, 0),
+        updated_at = NOW()
+    FROM unnest(v_user_ids, v_credit_types, v_amounts) AS r(user_id, credit_type, amount)
+    WHERE r.credit_type = 'trial'
+      AND u.id = r.user_id
+    RETURNING u.id, 'trial'::TEXT, r.amount, u.trial_remaining;
+
+    -- Holiday credits (a refund is not a new earning: holiday_credits_earned unchanged)
+    RETURN QUERY
+    UPDATE users u
+    SET holiday_credits = u.holiday_credits + r.amount,
+        updated_at = NOW()
+    FROM unnest(v_user_ids, v_credit_types, v_amounts) AS r(user_id, credit_type, amount)
+    WHERE r.credit_type = 'holiday'
+      AND u.id = r.user_id
+    RETURNING u.id, 'holiday'::TEXT, r.amount, u.holiday_credits;
+
+    -- Tokens: balance update + one ledger row per user
+    RETURN QUERY
+    WITH updated AS (
+        UPDATE users_token_accounts a
+        SET balance = a.balance + r.amount,
+            updated_at = NOW()
+        FROM unnest(v_user_ids, v_credit_types, v_amounts) AS r(user_id, credit_type, amount)
+        WHERE r.credit_type = 'token'
+          AND a.user_id = r.user_id
+        RETURNING a.id AS account_id, a.user_id, a.balance, r.amount
+    ),
+    ledger AS (
+        INSERT INTO users_token_transactions (
+            user_id,
+            token_account_id,
+            amount,
+            type,
+            description,
+            balance_after
+        )
+        SELECT up.user_id, up.account_id, up.amount, 'refund', p_description, up.balance
+        FROM updated up
+    )
+    SELECT up.user_id, 'token'::TEXT, up.amount, up.balance
+    FROM updated up;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION refund_credits_bulk IS 'Set-based refund of trial/token/holiday credits for many users (one ledger row per user)';
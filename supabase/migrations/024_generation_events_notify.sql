@@ -0,0 +1,74 @@
+-- Migration 024: NOTIFY on generation progress
+-- Purpose: Push generation and per-area status/progress changes to API nodes
+--          (LISTEN generation_events) so GET /generations/{id}/events can
+--          stream updates instead of clients polling GET /generations/{id}
+-- Requirements: FR-009 (Real-time progress tracking), FR-010
+
+-- ==============================================================================
+-- FUNCTION: notify_generation_area_change
+-- ==============================================================================
+-- Payload (JSON, kept well under the 8000 byte NOTIFY limit):
+--   { "type": "area", "generation_id", "area_id", "status", "progress",
+--     "current_stage", "status_message", "image_url", "error_message" }
+-- ==============================================================================
+CREATE OR REPLACE FUNCTION notify_generation_area_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify(
+        'generation_events',
+        json_build_object(
+            'type', 'area',
+            'generation_id', NEW.generation_id,
+            'area_id', NEW.id,
+            'status', NEW.status,
+            'progress', NEW.progress,
+            'current_stage', NEW.current_stage,
+            'status_message', left(NEW.status_message, 500),
+            'image_url', left(NEW.image_url, 2000),
+            'error_message', left(NEW.error_message, 500)
+        )::text
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS notify_generation_area_change ON generation_areas;
+CREATE TRIGGER notify_generation_area_change
+    AFTER INSERT OR UPDATE OF status, progress, current_stage, status_message, image_url, error_message
+    ON generation_areas
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_generation_area_change();
+
+-- ==============================================================================
+-- FUNCTION: notify_generation_change
+-- ==============================================================================
+-- Payload: { "type": "generation", "generation_id", "status", "error_message" }
+-- Sent when the rolled-up generation status changes (terminal statuses end
+-- the client's stream).
+-- ==============================================================================
+CREATE OR REPLACE FUNCTION notify_generation_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.status IS DISTINCT FROM OLD.status THEN
+        PERFORM pg_notify(
+            'generation_events',
+            json_build_object(
+                'type', 'generation',
+                'generation_id', NEW.id,
+                'status', NEW.status,
+                'error_message', left(NEW.error_message, 500)
+            )::text
+        );
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS notify_generation_change ON generations;
+CREATE TRIGGER notify_generation_change
+    AFTER UPDATE OF status ON generations
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_generation_change();
+
+COMMENT ON FUNCTION notify_generation_area_change IS 'NOTIFY generation_events with area status/progress (consumed by GenerationEventBroker)';
+COMMENT ON FUNCTION notify_generation_change IS 'NOTIFY generation_events when a generation status changes';
@@ -0,0 +1,94 @@
+-- Migration 025: Keyset pagination and counters for generation history
+-- Purpose: Keep GET /generations page latency flat regardless of history depth
+--   - Composite indexes matching ORDER BY created_at, id and
+--     ORDER BY COALESCE(address, ''), id (cursor pagination)
+--   - Per-user, per-status counter table maintained by trigger (no COUNT(*) per page)
+-- Requirements: FR-041 (View generation history), Feature 008 (History pagination)
+
+-- ==============================================================================
+-- INDEX: history order (newest first; also walked backwards for oldest first)
+-- ==============================================================================
+CREATE INDEX IF NOT EXISTS idx_generations_user_created_id
+ON generations(user_id, created_at DESC, id DESC)
+WHERE is_deleted = FALSE;
+
+-- ==============================================================================
+-- INDEX: history order by address (name_asc / name_desc sorts)
+-- ==============================================================================
+-- The expression must match the ORDER BY and cursor comparison in
+-- GET /generations exactly (COALESCE(address, ''), id) for the planner to seek.
+CREATE INDEX IF NOT EXISTS idx_generations_user_address_id
+ON generations(user_id, (COALESCE(address, '')), id)
+WHERE is_deleted = FALSE;
+
+-- ==============================================================================
+-- TABLE: generation_counts
+-- ==============================================================================
+CREATE TABLE IF NOT EXISTS generation_counts (
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    status TEXT NOT NULL,
+
+    -- Visible (not soft-deleted) generations of this user with this status
+    count INTEGER NOT NULL DEFAULT 0 CHECK (count >= 0),
+
+    PRIMARY KEY (user_id, status)
+);
+
+COMMENT ON TABLE generation_counts IS 'Visible generation totals per user and status, maintained by trigger for history pagination';
+
+-- ==============================================================================
+-- FUNCTION: maintain_generation_counts
+-- ==============================================================================
+-- Moves a generation between (user_id, status) buckets when it is inserted,
+-- deleted, soft-deleted or changes status. Soft-deleted rows are not counted.
+-- ==============================================================================
+CREATE OR REPLACE FUNCTION maintain_generation_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF OLD.is_deleted IS FALSE THEN
+            UPDATE generation_counts
+            SET count = GREATEST(count - 1, 0)
+            WHERE user_id = OLD.user_id
+              AND status = OLD.status;
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF NEW.is_deleted IS FALSE THEN
+            INSERT INTO generation_counts (user_id, status, count)
+            VALUES (NEW.user_id, NEW.status, 1)
+            ON CONFLICT (user_id, status) DO UPDATE
+            SET count = generation_counts.count + 1;
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS maintain_generation_counts_insert_delete ON generations;
+CREATE TRIGGER maintain_generation_counts_insert_delete
+    AFTER INSERT OR DELETE ON generations
+    FOR EACH ROW
+    EXECUTE FUNCTION maintain_generation_counts();
+
+DROP TRIGGER IF EXISTS maintain_generation_counts_update ON generations;
+CREATE TRIGGER maintain_generation_counts_update
+    AFTER UPDATE OF status, is_deleted, user_id ON generations
+    FOR EACH ROW
+    WHEN (
+        OLD.status IS DISTINCT FROM NEW.status
+        OR OLD.is_deleted IS DISTINCT FROM NEW.is_deleted
+        OR OLD.user_id IS DISTINCT FROM NEW.user_id
+    )
+    EXECUTE FUNCTION maintain_generation_counts();
+
+-- Backfill
+INSERT INTO generation_counts (user_id, status, count)
+SELECT user_id, status, COUNT(*)
+FROM generations
+WHERE is_deleted = FALSE
+GROUP BY user_id, status
+ON CONFLICT (user_id, status) DO UPDATE
+SET count = EXCLUDED.count;
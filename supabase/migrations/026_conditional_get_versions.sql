@@ -0,0 +1,133 @@
+-- Migration 026: Row versions for conditional GET (ETag / 304)
+-- Purpose: Let polled endpoints answer If-None-Match from a one-row version
+--          lookup instead of rebuilding the whole response
+--   - generations.version: bumped on any change to the generation, its areas
+--     or its source images (GET /generations/{id})
+--   - users.balance_version: bumped on any change to trial or holiday
+--     balances
+--   - users_token_accounts.version: bumped on any change to the token
+--     balance or token account settings
+--   The balance ETag (GET /v1/credits/balance, GET /tokens/balance,
+--   credits_remaining in GET /generations/{id}) is the sum of the last two.
+-- Requirements: FR-010 (Progress persists across page refresh), T051, FR-015
+--
+-- Counters rather than updated_at: NOW() is the transaction start time, so a
+-- long transaction can commit a change with an older timestamp than one a
+-- client has already seen.
+
+ALTER TABLE generations
+ADD COLUMN IF NOT EXISTS version BIGINT DEFAULT 1 NOT NULL;
+
+ALTER TABLE users
+ADD COLUMN IF NOT EXISTS balance_version BIGINT DEFAULT 1 NOT NULL;
+
+COMMENT ON COLUMN generations.version IS 'Incremented on any change to the generation, its areas or source images (ETag)';
+COMMENT ON COLUMN users.balance_version IS 'Incremented on any change to trial or holiday balances (ETag, with users_token_accounts.version)';
+
+-- ==============================================================================
+-- FUNCTION: bump_generation_version
+-- ==============================================================================
+CREATE OR REPLACE FUNCTION bump_generation_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Child triggers already set version = version + 1
+    IF NEW.version = OLD.version THEN
+        NEW.version := OLD.version + 1;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bump_generation_version ON generations;
+CREATE TRIGGER bump_generation_version
+    BEFORE UPDATE ON generations
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_generation_version();
+
+-- ==============================================================================
+-- FUNCTION: bump_parent_generation_version
+-- ==============================================================================
+-- Shared by generation_areas and generation_source_images (both carry
+-- generation_id).
+-- ==============================================================================
+CREATE OR REPLACE FUNCTION bump_parent_generation_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE generations SET version = version + 1 WHERE id = OLD.generation_id;
+    ELSE
+        UPDATE generations SET version = version + 1 WHERE id = NEW.generation_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bump_generation_version_from_areas ON generation_areas;
+CREATE TRIGGER bump_generation_version_from_areas
+    AFTER INSERT OR UPDATE OR DELETE ON generation_areas
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_parent_generation_version();
+
+DROP TRIGGER IF EXISTS bump_generation_version_from_source_images ON generation_source_images;
+CREATE TRIGGER bump_generation_version_from_source_images
+    AFTER INSERT OR UPDATE OR DELETE ON generation_source_images
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_parent_generation_version();
+
+-- ==============================================================================
+-- FUNCTION: bump_user_balance_version
+-- ==============================================================================
+CREATE OR REPLACE FUNCTION bump_user_balance_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.balance_version = OLD.balance_version THEN
+        NEW.balance_version := OLD.balance_version + 1;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bump_user_balance_version ON users;
+CREATE TRIGGER bump_user_balance_version
+    BEFORE UPDATE OF trial_remaining, trial_used, holiday_credits, holiday_credits_earned ON users
+    FOR EACH ROW
+    WHEN (
+        OLD.trial_remaining IS DISTINCT FROM NEW.trial_remaining
+        OR OLD.trial_used IS DISTINCT FROM NEW.trial_used
+        OR OLD.holiday_credits IS DISTINCT FROM NEW.holiday_credits
+        OR OLD.holiday_credits_earned IS DISTINCT FROM NEW.holiday_credits_earned
+    )
+    EXECUTE FUNCTION bump_user_balance_version();
+
+-- ==============================================================================
+-- FUNCTION: bump_token_account_version
+-- ==============================================================================
+-- Token balance and auto-reload settings live in users_token_accounts, which
+-- carries its own counter: the balance ETag is users.balance_version plus
+-- users_token_accounts.version. Bumping users from here would lock the users
+-- row after the token account, the reverse of authorize_and_deduct (022), and
+-- deadlock a token refund against a concurrent generation request.
+--
+-- Ledger rows (users_token_transactions) are only written together with a
+-- token account UPDATE in the same transaction, so they need no trigger.
+-- ==============================================================================
+ALTER TABLE users_token_accounts
+ADD COLUMN IF NOT EXISTS version BIGINT DEFAULT 1 NOT NULL;
+
+COMMENT ON COLUMN users_token_accounts.version IS 'Incremented on any change to the token account (ETag, with users.balance_version)';
+
+CREATE OR REPLACE FUNCTION bump_token_account_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.version = OLD.version THEN
+        NEW.version := OLD.version + 1;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bump_token_account_version ON users_token_accounts;
+CREATE TRIGGER bump_token_account_version
+    BEFORE UPDATE ON users_token_accounts
+    FOR EACH ROW
+    EXECUTE FUNCTION bump_token_account_version();
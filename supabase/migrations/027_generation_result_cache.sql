@@ -0,0 +1,36 @@
+-- Migration 027: Create generation_result_cache table
+-- Purpose: Content-addressed cache of generation results so identical reruns
+--          (same input image, prompt, model and image size) reuse stored blob
+--          URLs instead of paying for another Gemini call
+-- Requirements: FR-055 to FR-070 (Design Generation)
+
+CREATE TABLE IF NOT EXISTS generation_result_cache (
+    -- SHA-256 of model, image size, built prompt and input image bytes
+    -- (see GeminiClient.result_cache_key)
+    request_key TEXT PRIMARY KEY,
+
+    -- Named blob URLs of the stored result, e.g. {"image_url": "..."} or
+    -- {"decorated_image_url": "...", "before_after_image_url": "..."}
+    urls JSONB NOT NULL,
+    model TEXT NOT NULL,
+
+    -- Timestamps
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+-- Expired entry cleanup
+CREATE INDEX IF NOT EXISTS idx_generation_result_cache_expires_at ON generation_result_cache(expires_at);
+
+-- Auto-update updated_at
+DROP TRIGGER IF EXISTS update_generation_result_cache_updated_at ON generation_result_cache;
+CREATE TRIGGER update_generation_result_cache_updated_at
+    BEFORE UPDATE ON generation_result_cache
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Add comments
+COMMENT ON TABLE generation_result_cache IS 'Stored generation results keyed by request content hash, shared by all API nodes and workers';
+COMMENT ON COLUMN generation_result_cache.request_key IS 'SHA-256 of model, image size, prompt and input image (GeminiClient.result_cache_key)';
+COMMENT ON COLUMN generation_result_cache.expires_at IS 'Entry is ignored after this timestamp';
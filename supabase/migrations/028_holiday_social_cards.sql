@@ -0,0 +1,11 @@
+-- Migration 028: Store social card URLs on holiday generations
+-- Purpose: Platform-sized share images (OG 1200x630, square, story and
+--          thumbnails) are rendered once per generation, in the same decode
+--          pass as the before/after image, and their URLs kept here so
+--          creating a share never decodes or encodes an image again
+-- Requirements: Feature 007 (Holiday Decorator - social sharing)
+
+ALTER TABLE holiday_generations
+ADD COLUMN IF NOT EXISTS social_card_urls JSONB;
+
+COMMENT ON COLUMN holiday_generations.social_card_urls IS 'Share image URLs keyed by card name (og, square, story, og_thumb, square_thumb); NULL until rendered';